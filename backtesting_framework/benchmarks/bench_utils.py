@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Shared Helpers for Backtesting Benchmarks
+
+Synthetic data generators and engine construction used by the benchmark
+scripts in this directory. Benchmarks run against in-memory frames, so
+the database only needs the schema the data loader validates.
+"""
+
+import os
+import sqlite3
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from backtesting_framework.core.backtesting_engine import BacktestingEngine, BacktestConfig
+from backtesting_framework.strategies.base_strategy import BaseWeatherStrategy
+
+
+class NoOpStrategy(BaseWeatherStrategy):
+    """Strategy that never trades, isolating engine overhead"""
+
+    def __init__(self, name: str = "NoOpStrategy", parameters=None):
+        super().__init__(name, parameters)
+
+    def generate_signals(self, market_data, weather_data, current_positions):
+        return []
+
+
+def create_schema_db() -> str:
+    """Create a temporary SQLite database with the tables the loader requires"""
+    fd, db_path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE polymarket_data (timestamp TEXT, market_id TEXT)")
+        conn.execute("CREATE TABLE weather_data (timestamp TEXT, location_name TEXT)")
+
+    return db_path
+
+
+def make_engine(start_date: datetime,
+                end_date: datetime,
+                **config_overrides) -> Tuple[BacktestingEngine, str]:
+    """Build an engine backed by a throwaway schema-only database"""
+    db_path = create_schema_db()
+    config = BacktestConfig(start_date=start_date, end_date=end_date, **config_overrides)
+    return BacktestingEngine(config, db_path=db_path), db_path
+
+
+def generate_market_frame(n_rows: int,
+                          n_markets: int = 50,
+                          start: str = '2024-01-01',
+                          freq: str = 'H',
+                          seed: int = 42) -> pd.DataFrame:
+    """Generate an aligned market frame with n_markets * 2 outcomes per timestamp"""
+    rng = np.random.default_rng(seed)
+    rows_per_tick = n_markets * 2
+    n_ticks = max(1, n_rows // rows_per_tick)
+
+    timestamps = pd.date_range(start, periods=n_ticks, freq=freq)
+    market_ids = np.array([f'market{i}' for i in range(n_markets)])
+
+    return pd.DataFrame({
+        'timestamp': np.repeat(timestamps.values, rows_per_tick),
+        'market_id': np.tile(np.repeat(market_ids, 2), n_ticks),
+        'outcome_name': np.tile(np.array(['Yes', 'No']), n_ticks * n_markets),
+        'probability': rng.uniform(0.01, 0.99, n_ticks * rows_per_tick),
+        'volume': rng.lognormal(6, 1, n_ticks * rows_per_tick),
+        'event_title': np.tile(np.repeat(market_ids, 2), n_ticks),
+    })
+
+
+def generate_weather_frame(timestamps: pd.DatetimeIndex,
+                           n_locations: int = 5,
+                           seed: int = 42) -> pd.DataFrame:
+    """Generate an aligned weather frame with one row per location per timestamp"""
+    rng = np.random.default_rng(seed)
+    n = len(timestamps) * n_locations
+    locations = np.array([f'City_{i}' for i in range(n_locations)])
+    day_of_year = np.repeat(timestamps.dayofyear.values, n_locations)
+    seasonal = 10 * np.sin(2 * np.pi * day_of_year / 365)
+
+    return pd.DataFrame({
+        'timestamp': np.repeat(timestamps.values, n_locations),
+        'location_name': np.tile(locations, len(timestamps)),
+        'temperature': 15 + seasonal + rng.normal(0, 5, n),
+        'temperature_min': 10 + seasonal + rng.normal(0, 3, n),
+        'temperature_max': 20 + seasonal + rng.normal(0, 3, n),
+        'humidity': np.clip(60 + 20 * rng.normal(size=n), 0, 100),
+        'wind_speed': rng.exponential(8, n),
+        'precipitation': rng.exponential(0.2, n),
+        'pressure': 1013 + rng.normal(0, 15, n),
+        'weather_code': rng.choice([800, 801, 802, 500, 300], n),
+        'source_name': 'synthetic',
+    })
+
+
+def time_call(func: Callable, repeat: int = 1) -> float:
+    """Best wall-clock time in seconds over `repeat` runs"""
+    timings: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
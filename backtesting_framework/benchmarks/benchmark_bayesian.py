@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Bayesian Optimization Convergence Benchmark
+
+Compares the best score found after each number of evaluations by
+Bayesian optimization and random search, averaged over seeds, with the
+same evaluation budget. The 'backtest' objective backtests a probability
+band strategy on synthetic hourly data; the 'analytic' objective scores
+parameters with a known function (optimum 1.0) so convergence can be
+compared without backtest cost or noise.
+
+Usage (from the repository root):
+    python -m backtesting_framework.benchmarks.benchmark_bayesian
+    python -m backtesting_framework.benchmarks.benchmark_bayesian --objective analytic --evaluations 60 --seeds 10
+    python -m backtesting_framework.benchmarks.benchmark_bayesian --n-jobs 4 --backend process
+"""
+
+import argparse
+import logging
+import os
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from backtesting_framework.benchmarks.bench_utils import (
+    generate_market_frame,
+    generate_weather_frame,
+    make_engine,
+    time_call
+)
+from backtesting_framework.optimization.strategy_optimizer import ParameterSpace, StrategyOptimizer
+from backtesting_framework.strategies.base_strategy import BaseWeatherStrategy, TradingSignal
+
+PARAMETER_SPACES = {
+    'entry_probability': ParameterSpace(name='entry_probability', param_type='continuous',
+                                        min_value=0.05, max_value=0.5),
+    'exit_probability': ParameterSpace(name='exit_probability', param_type='continuous',
+                                       min_value=0.5, max_value=0.95),
+    'min_temperature': ParameterSpace(name='min_temperature', param_type='continuous',
+                                      min_value=-5.0, max_value=35.0)
+}
+
+
+class ProbabilityBandStrategy(BaseWeatherStrategy):
+    """Buys market0 'Yes' below an entry probability and sells above an exit probability"""
+
+    def __init__(self, name: str = "ProbabilityBandStrategy", parameters=None):
+        super().__init__(name, parameters)
+        self.entry_probability = self.parameters.get('entry_probability', 0.3)
+        self.exit_probability = self.parameters.get('exit_probability', 0.7)
+        self.min_temperature = self.parameters.get('min_temperature', 10.0)
+
+    def generate_signals(self, market_data, weather_data, current_positions):
+        if market_data.empty or weather_data.empty:
+            return []
+        probability = self._current_price('market0', 'Yes', market_data)
+        if probability is None:
+            return []
+
+        temperature = weather_data['temperature'].to_numpy().mean()
+        if probability < self.entry_probability and temperature >= self.min_temperature:
+            signal_type = 'BUY'
+        elif probability > self.exit_probability and current_positions:
+            signal_type = 'SELL'
+        else:
+            return []
+
+        return [TradingSignal(market_data['timestamp'].iloc[-1], 'market0', 'Yes', signal_type, 0.9)]
+
+
+class AnalyticStrategy:
+    """Stand-in 'strategy' whose score is a known function of its parameters"""
+
+    def __init__(self, parameters=None):
+        self.parameters = parameters or {}
+
+    def score(self) -> float:
+        entry = (self.parameters['entry_probability'] - 0.18) / 0.45
+        exit_ = (self.parameters['exit_probability'] - 0.81) / 0.45
+        temperature = (self.parameters['min_temperature'] - 22.0) / 40.0
+        # A broad peak with a ripple, so random points rarely land near the optimum
+        return float(np.exp(-8 * (entry ** 2 + exit_ ** 2 + temperature ** 2))
+                     * (0.9 + 0.1 * np.cos(12 * entry)))
+
+
+class AnalyticEngine:
+    """Engine stand-in for the analytic objective"""
+
+    class _Result:
+        def __init__(self, total_return: float):
+            self.total_return = total_return
+
+    def run_backtest(self, strategy):
+        return self._Result(strategy.score())
+
+
+def convergence(optimizer: StrategyOptimizer,
+                strategy_class: type,
+                method: str,
+                evaluations: int,
+                seeds: int,
+                n_jobs: int,
+                backend: str) -> Dict[str, object]:
+    """Mean best-so-far score per evaluation over seeds, and the total time"""
+    traces: List[List[float]] = []
+
+    def run():
+        for seed in range(seeds):
+            np.random.seed(seed)
+            optimizer.clear_evaluation_cache()
+            result = optimizer.optimize_strategy(strategy_class, PARAMETER_SPACES, method,
+                                                 max_evaluations=evaluations, n_jobs=n_jobs,
+                                                 backend=backend)
+            scores = np.array([record['score'] for record in result.optimization_history], dtype=float)
+            traces.append(np.maximum.accumulate(np.nan_to_num(scores, nan=-np.inf)).tolist())
+
+    seconds = time_call(run)
+    length = min(len(trace) for trace in traces)
+    return {'trace': np.mean([trace[:length] for trace in traces], axis=0), 'seconds': seconds}
+
+
+def run_benchmark(objective: str,
+                  evaluations: int,
+                  seeds: int,
+                  n_jobs: int,
+                  backend: str,
+                  days: int) -> Dict[str, dict]:
+    """Convergence of random search and Bayesian optimization on one objective"""
+    db_path = None
+    if objective == 'analytic':
+        optimizer = StrategyOptimizer(AnalyticEngine(), optimization_target='total_return')
+        strategy_class = AnalyticStrategy
+    else:
+        market_data = generate_market_frame(days * 24 * 4, n_markets=2)
+        timestamps = pd.DatetimeIndex(market_data['timestamp'].unique())
+        weather_data = generate_weather_frame(timestamps, n_locations=2)
+
+        engine, db_path = make_engine(timestamps[0].to_pydatetime(), timestamps[-1].to_pydatetime())
+        # Serve the synthetic frames as the engine's aligned data
+        engine.load_aligned_data = lambda market_ids=None, locations=None: (market_data, weather_data)
+        optimizer = StrategyOptimizer(engine, optimization_target='total_return')
+        strategy_class = ProbabilityBandStrategy
+
+    try:
+        return {method: convergence(optimizer, strategy_class, method, evaluations, seeds, n_jobs, backend)
+                for method in ('random_search', 'bayesian')}
+    finally:
+        if db_path is not None:
+            os.remove(db_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Bayesian optimization against random search")
+    parser.add_argument('--objective', choices=['backtest', 'analytic'], default='backtest')
+    parser.add_argument('--evaluations', type=int, default=40, help='Evaluation budget per run')
+    parser.add_argument('--seeds', type=int, default=5, help='Runs averaged per method')
+    parser.add_argument('--n-jobs', type=int, default=1, help='Parallel jobs (Bayesian batch size)')
+    parser.add_argument('--backend', choices=['thread', 'process'], default='thread')
+    parser.add_argument('--days', type=int, default=14, help='Days of hourly data for the backtest objective')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    results = run_benchmark(args.objective, args.evaluations, args.seeds, args.n_jobs, args.backend,
+                            args.days)
+    length = min(len(result['trace']) for result in results.values())
+    checkpoints = sorted({n for n in (5, 10, 20, 40, 80, length) if n <= length})
+
+    print(f"mean best score after n evaluations ({args.objective}, {args.seeds} seeds)")
+    print(f"{'method':>14} " + ' '.join(f"{f'n={n}':>9}" for n in checkpoints) + f" {'time (s)':>9}")
+    for method, result in results.items():
+        print(f"{method:>14} " + ' '.join(f"{result['trace'][n - 1]:>9.4f}" for n in checkpoints)
+              + f" {result['seconds']:>9.2f}")
+
+    random_trace, bayesian_trace = results['random_search']['trace'], results['bayesian']['trace']
+    target = random_trace[length - 1]
+    reached = int(np.argmax(bayesian_trace >= target)) + 1 if np.any(bayesian_trace >= target) else None
+    if reached is not None:
+        print(f"Bayesian optimization reaches random search's final score after {reached} "
+              f"of {length} evaluations")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Multi-Strategy Benchmark
+
+Compares backtesting N strategies over the same data as separate runs
+(sequentially and on a thread pool, as run_multiple_strategies did) against
+the shared pass that walks the timeline once for all of them. Batch
+signals are disabled so every strategy goes through the per-tick loop.
+
+Usage (from the repository root):
+    python -m backtesting_framework.benchmarks.benchmark_multi_strategy
+    python -m backtesting_framework.benchmarks.benchmark_multi_strategy --strategies 5 20 --rows 100000
+"""
+
+import argparse
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from backtesting_framework.benchmarks.bench_utils import (
+    generate_market_frame,
+    generate_weather_frame,
+    make_engine,
+    time_call
+)
+from backtesting_framework.strategies.weather_strategies import TemperatureThresholdStrategy
+
+
+def make_strategies(n: int):
+    """Temperature strategies with staggered thresholds and lookbacks"""
+    return [
+        TemperatureThresholdStrategy(
+            name=f"Temperature_{i}",
+            parameters={'hot_threshold': 20.0 + i % 10, 'cold_threshold': 5.0 - i % 5,
+                        'lookback_period': 12 * (1 + i % 2)}
+        )
+        for i in range(n)
+    ]
+
+
+def run_benchmark(n_strategies: int, n_rows: int, workers: int = 4) -> dict:
+    """Time separate, threaded and shared-pass backtests of n_strategies"""
+    market_data = generate_market_frame(n_rows, n_markets=10)
+    timestamps = pd.DatetimeIndex(market_data['timestamp'].unique())
+    weather_data = generate_weather_frame(timestamps)
+
+    engine, db_path = make_engine(
+        timestamps[0].to_pydatetime(), timestamps[-1].to_pydatetime(), batch_signals=False
+    )
+
+    def separate():
+        for strategy in make_strategies(n_strategies):
+            engine.run_prepared_backtest(strategy, market_data, weather_data)
+
+    def threaded():
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda s: engine.run_prepared_backtest(s, market_data, weather_data),
+                              make_strategies(n_strategies)))
+
+    def shared():
+        engine.run_prepared_strategies(make_strategies(n_strategies), market_data, weather_data)
+
+    try:
+        return {
+            'strategies': n_strategies,
+            'ticks': len(timestamps),
+            'separate': time_call(separate),
+            'threaded': time_call(threaded),
+            'shared': time_call(shared)
+        }
+    finally:
+        os.remove(db_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark shared-pass multi-strategy backtests")
+    parser.add_argument('--strategies', nargs='+', type=int, default=[2, 5, 20],
+                        help='Numbers of strategies to backtest together')
+    parser.add_argument('--rows', type=int, default=20_000, help='Market data rows')
+    parser.add_argument('--workers', type=int, default=4, help='Thread pool size for the threaded baseline')
+    args = parser.parse_args()
+
+    # The synthetic markets don't list the strategies' outcomes; skip the per-signal warnings
+    logging.disable(logging.WARNING)
+
+    print(f"{'strategies':>10} {'ticks':>7} {'separate (s)':>13} {'threaded (s)':>13} "
+          f"{'shared (s)':>11} {'vs separate':>12} {'vs threaded':>12}")
+    for n in args.strategies:
+        timings = run_benchmark(n, args.rows, args.workers)
+        print(f"{timings['strategies']:>10} {timings['ticks']:>7} {timings['separate']:>13.3f} "
+              f"{timings['threaded']:>13.3f} {timings['shared']:>11.3f} "
+              f"{timings['separate'] / timings['shared']:>11.1f}x "
+              f"{timings['threaded'] / timings['shared']:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Simulation Loop Benchmark
+
+Compares the pre-grouped ('grouped') simulation loop against the original
+per-tick boolean mask ('masked') loop at increasing market data sizes.
+
+Usage (from the repository root):
+    python -m backtesting_framework.benchmarks.benchmark_simulation_loop
+    python -m backtesting_framework.benchmarks.benchmark_simulation_loop --sizes 10000 100000
+"""
+
+import argparse
+import os
+
+import pandas as pd
+
+from backtesting_framework.benchmarks.bench_utils import (
+    NoOpStrategy,
+    generate_market_frame,
+    generate_weather_frame,
+    make_engine,
+    time_call
+)
+
+
+def run_benchmark(n_rows: int, skip_masked: bool = False) -> dict:
+    """Time one backtest per simulation mode over n_rows of market data"""
+    market_data = generate_market_frame(n_rows)
+    timestamps = pd.DatetimeIndex(market_data['timestamp'].unique())
+    weather_data = generate_weather_frame(timestamps)
+
+    timings = {'rows': len(market_data), 'ticks': len(timestamps)}
+    modes = ['grouped'] if skip_masked else ['grouped', 'masked']
+
+    for mode in modes:
+        engine, db_path = make_engine(
+            timestamps[0].to_pydatetime(), timestamps[-1].to_pydatetime(),
+            simulation_mode=mode
+        )
+        try:
+            timings[mode] = time_call(
+                lambda: engine.run_prepared_backtest(NoOpStrategy(), market_data, weather_data)
+            )
+        finally:
+            os.remove(db_path)
+
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the backtest simulation loop")
+    parser.add_argument('--sizes', nargs='+', type=int, default=[10_000, 100_000, 1_000_000],
+                        help='Market data row counts to benchmark')
+    parser.add_argument('--masked-limit', type=int, default=1_000_000,
+                        help='Skip the masked baseline above this many rows')
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'ticks':>8} {'grouped (s)':>12} {'masked (s)':>12} {'speedup':>9}")
+    for size in args.sizes:
+        timings = run_benchmark(size, skip_masked=size > args.masked_limit)
+        masked = timings.get('masked')
+        speedup = f"{masked / timings['grouped']:.1f}x" if masked else 'n/a'
+        masked_str = f"{masked:.3f}" if masked else 'skipped'
+        print(f"{timings['rows']:>10} {timings['ticks']:>8} {timings['grouped']:>12.3f} "
+              f"{masked_str:>12} {speedup:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Snapshot Load Benchmark
+
+Times a cold load of market and weather data straight from SQLite against
+the same load served from the Parquet snapshot store, over synthetic
+hourly data written to a temporary database.
+
+Usage (from the repository root):
+    python -m backtesting_framework.benchmarks.benchmark_snapshot_load
+    python -m backtesting_framework.benchmarks.benchmark_snapshot_load --days 365 --markets 50
+"""
+
+import argparse
+import os
+import shutil
+import sqlite3
+import tempfile
+
+import pandas as pd
+
+from backtesting_framework.benchmarks.bench_utils import (
+    generate_market_frame,
+    generate_weather_frame,
+    time_call
+)
+from backtesting_framework.data.data_loader import BacktestingDataLoader
+from backtesting_framework.data.snapshot_store import SnapshotStore
+
+
+def create_populated_db(market_data: pd.DataFrame, weather_data: pd.DataFrame) -> str:
+    """Write synthetic frames to a temporary database with the loader's schema"""
+    fd, db_path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    market = market_data.assign(
+        timestamp=market_data['timestamp'].dt.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        scraped_at=None
+    )
+    weather = weather_data.drop(columns='source_name').assign(
+        timestamp=weather_data['timestamp'].dt.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        latitude=51.5, longitude=-0.1, weather_description='synthetic', source_id=1
+    )
+
+    with sqlite3.connect(db_path) as conn:
+        market.to_sql('polymarket_data', conn, index=False)
+        weather.to_sql('weather_data', conn, index=False)
+        conn.execute("CREATE TABLE weather_sources (id INTEGER PRIMARY KEY, source_name TEXT)")
+        conn.execute("INSERT INTO weather_sources (source_name) VALUES ('synthetic')")
+        conn.execute("CREATE INDEX idx_market_ts ON polymarket_data (timestamp)")
+        conn.execute("CREATE INDEX idx_weather_ts ON weather_data (timestamp)")
+
+    return db_path
+
+
+def load_all(loader: BacktestingDataLoader):
+    loader.load_market_data()
+    loader.load_weather_data()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark snapshot-backed data loading")
+    parser.add_argument('--days', type=int, default=90, help='Days of hourly data')
+    parser.add_argument('--markets', type=int, default=50, help='Number of markets')
+    args = parser.parse_args()
+
+    n_rows = args.days * 24 * args.markets * 2
+    market_data = generate_market_frame(n_rows, n_markets=args.markets)
+    timestamps = pd.DatetimeIndex(market_data['timestamp'].unique())
+    weather_data = generate_weather_frame(timestamps)
+
+    db_path = create_populated_db(market_data, weather_data)
+    snapshot_dir = tempfile.mkdtemp(prefix='climatetrade_snapshot_')
+
+    try:
+        sqlite_time = time_call(lambda: load_all(BacktestingDataLoader(db_path)))
+
+        store = SnapshotStore(db_path, snapshot_dir)
+        export_time = time_call(store.refresh)
+        refresh_time = time_call(store.refresh)
+
+        snapshot_loader = BacktestingDataLoader(db_path, snapshot_dir=snapshot_dir)
+        snapshot_time = time_call(lambda: load_all(snapshot_loader))
+
+        print(f"rows: {len(market_data)} market, {len(weather_data)} weather")
+        print(f"{'SQLite load':<28}{sqlite_time:>10.3f} s")
+        print(f"{'snapshot export (once)':<28}{export_time:>10.3f} s")
+        print(f"{'snapshot refresh (no-op)':<28}{refresh_time:>10.3f} s")
+        print(f"{'snapshot load':<28}{snapshot_time:>10.3f} s")
+        print(f"{'speedup':<28}{sqlite_time / snapshot_time:>10.1f}x")
+    finally:
+        os.remove(db_path)
+        shutil.rmtree(snapshot_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,11 +11,24 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
+import bisect
+import copy
+import dataclasses
+import hashlib
 import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from ..data.data_loader import BacktestingDataLoader
-from ..strategies.base_strategy import BaseWeatherStrategy, Position, TradingSignal
+from ..data.climatology import ClimatologyIndex
+from ..data.data_loader import BacktestingDataLoader, iter_time_windows
+from ..strategies.base_strategy import (
+    BaseWeatherStrategy, Position, PositionBook, PriceIndex, TradingSignal, signals_from_frame
+)
+from ..strategies.history import HistoryBuffers
+from ..strategies.indicators import IndicatorSet
 from ..metrics.performance_metrics import PerformanceMetrics
 from ..risk.risk_metrics import RiskMetrics
 
@@ -53,6 +66,211 @@ class BacktestConfig:
     data_frequency: str = 'H'  # Hourly
     enable_parallel: bool = False
     risk_free_rate: float = 0.02  # 2% annual risk-free rate
+    simulation_mode: str = 'grouped'  # 'grouped' (sorted slices) or 'masked' (per-tick filter)
+    data_cache_size: int = 4  # Aligned datasets kept in memory (0 disables caching)
+    stream_chunk_size: int = 0  # Rows per streamed chunk (0 loads the whole period at once)
+    compact_dtypes: bool = False  # Categorical identifiers and float32 measures in loaded data
+    snapshot_dir: Optional[str] = None  # Parquet snapshot directory (None reads SQLite directly)
+    use_rollups: bool = True  # Read hourly/daily data from materialized rollups when built
+    batch_signals: bool = True  # Use a strategy's generate_signals_batch when it provides one
+    shared_pass: bool = True  # run_multiple_strategies walks the data once for all strategies
+    checkpoint_dir: Optional[str] = None  # Directory for periodic simulation checkpoints (None disables)
+    checkpoint_interval: int = 1000  # Simulated ticks between checkpoints
+
+
+@dataclass
+class SimulationState:
+    """Mutable state carried across the ticks of one simulation"""
+    capital: float
+    equity_curve: List[Tuple[datetime, float]]
+    signals: List[TradingSignal] = field(default_factory=list)
+    positions: List[Position] = field(default_factory=list)
+    realized_pnl: float = 0.0
+    position_book: Optional[PositionBook] = None
+    history: Optional[HistoryBuffers] = None
+    indicators: Optional[IndicatorSet] = None
+    climatology: Optional[ClimatologyIndex] = None
+    prices: Optional[PriceIndex] = None
+
+
+class SimulationCheckpointer:
+    """
+    Periodic on-disk snapshots of one strategy's simulation
+
+    Every `interval` ticks, the strategy's attributes, its SimulationState
+    and the timestamp of the last simulated tick (the cursor) are pickled
+    together, so objects they share such as the position book, price index
+    and history buffers stay shared when restored. Files are replaced
+    atomically, so a process killed mid-write leaves the previous
+    checkpoint intact. A run that finds a checkpoint resumes after its
+    cursor; a finished run removes it.
+    """
+
+    def __init__(self, path: str, interval: int):
+        self.path = path
+        self.interval = max(int(interval), 1)
+        self.cursor: Optional[datetime] = None
+        self.saved = 0
+        self._strategy: Optional[BaseWeatherStrategy] = None
+        self._state: Optional[SimulationState] = None
+        self._ticks = 0
+
+    def restore(self, strategy: BaseWeatherStrategy) -> Optional[SimulationState]:
+        """State saved by an interrupted run, restoring the strategy's attributes in place"""
+        if not os.path.exists(self.path):
+            return None
+
+        try:
+            with open(self.path, 'rb') as f:
+                attributes, state, cursor = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checkpoint {self.path}: {e}")
+            return None
+
+        strategy.__dict__.update(attributes)
+        self.cursor = cursor
+        logger.info(f"Resuming {strategy.name} from checkpoint at {cursor}")
+        return state
+
+    def attach(self, strategy: BaseWeatherStrategy, state: SimulationState):
+        """Snapshot this run on later ticks"""
+        self._strategy, self._state = strategy, state
+
+    def tick(self, timestamp: datetime):
+        """Count a simulated tick, saving a checkpoint every interval ticks"""
+        self._ticks += 1
+        if self._strategy is not None and self._ticks % self.interval == 0:
+            self.save(timestamp)
+
+    def save(self, timestamp: datetime):
+        """Write the attached run as of the tick at timestamp"""
+        try:
+            payload = pickle.dumps((self._strategy.__dict__, self._state, timestamp),
+                                   protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            # Strategies holding unpicklable resources run without checkpoints
+            logger.warning(f"Checkpointing disabled for {self._strategy.name}: {e}")
+            self._strategy = None
+            return
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path + '.tmp', 'wb') as f:
+            f.write(payload)
+        os.replace(self.path + '.tmp', self.path)
+        self.cursor = timestamp
+        self.saved += 1
+
+    def clear(self):
+        """Remove the checkpoint once the run has finished"""
+        for path in (self.path, self.path + '.tmp'):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+class TimelineSlicer:
+    """
+    Per-timestamp access to a DataFrame along a simulation timeline
+
+    In 'grouped' mode the frame is stably sorted by timestamp once and the
+    row offsets of every timeline entry are located with searchsorted, so
+    each step is an O(1) positional slice instead of a boolean mask over
+    the whole frame. Row order within a timestamp matches the mask result.
+    'masked' mode keeps the original per-tick filter for comparison.
+
+    Categorical columns (from compact loading) are decoded back to plain
+    values in each slice, so strategies grouping on identifiers never see
+    unobserved categories.
+    """
+
+    def __init__(self,
+                 df: pd.DataFrame,
+                 timeline: List[datetime],
+                 time_col: str = 'timestamp',
+                 mode: str = 'grouped'):
+        if mode not in ('grouped', 'masked'):
+            raise ValueError(f"Unknown simulation mode: {mode}")
+
+        self.mode = mode
+        self.time_col = time_col
+        self.timeline = timeline
+        self.categorical_columns = [col for col in df.columns
+                                    if isinstance(df[col].dtype, pd.CategoricalDtype)]
+
+        if df.empty or time_col not in df.columns:
+            self.df = df
+            self.starts = np.zeros(len(timeline), dtype=np.int64)
+            self.ends = np.zeros(len(timeline), dtype=np.int64)
+            return
+
+        if mode == 'masked':
+            self.df = df
+            return
+
+        self.df = df.sort_values(time_col, kind='mergesort')
+        sorted_times = pd.Index(self.df[time_col])
+        self.starts = sorted_times.searchsorted(timeline, side='left')
+        self.ends = sorted_times.searchsorted(timeline, side='right')
+
+    def __len__(self) -> int:
+        return len(self.timeline)
+
+    def slice_at(self, step: int) -> pd.DataFrame:
+        """Rows whose timestamp equals timeline[step]"""
+        if self.mode == 'masked' and not self.df.empty and self.time_col in self.df.columns:
+            rows = self.df[self.df[self.time_col] == self.timeline[step]]
+        else:
+            rows = self.df.iloc[self.starts[step]:self.ends[step]]
+
+        if self.categorical_columns:
+            rows = rows.astype({col: rows[col].cat.categories.dtype for col in self.categorical_columns})
+        return rows
+
+
+class PeriodSlicer:
+    """
+    Contiguous sub-periods of aligned data by timeline offsets
+
+    Both frames are stably sorted by timestamp once, and the row offset of
+    every timeline entry is located up front, so any period of the
+    timeline [start, end) is an O(1) positional slice of each frame. Used
+    to backtest windows of a loaded dataset without reloading it.
+    """
+
+    def __init__(self,
+                 market_data: pd.DataFrame,
+                 weather_data: pd.DataFrame,
+                 time_col: str = 'timestamp'):
+        frames = [df for df in (market_data, weather_data) if not df.empty and time_col in df.columns]
+        timestamps = pd.concat([df[time_col] for df in frames], ignore_index=True) if frames else pd.Series([], dtype='datetime64[ns]')
+        self.timeline = pd.Index(timestamps.unique()).sort_values()
+
+        self.frames = []
+        self.offsets = []
+        for df in (market_data, weather_data):
+            if df.empty or time_col not in df.columns:
+                self.frames.append(df)
+                self.offsets.append(np.zeros(len(self.timeline) + 1, dtype=np.int64))
+                continue
+
+            df = df.sort_values(time_col, kind='mergesort')
+            starts = pd.Index(df[time_col]).searchsorted(self.timeline, side='left')
+            self.frames.append(df)
+            self.offsets.append(np.append(starts, len(df)))
+
+    def __len__(self) -> int:
+        return len(self.timeline)
+
+    def locate(self, timestamp) -> int:
+        """Offset of the first timeline entry at or after timestamp"""
+        return int(self.timeline.searchsorted(timestamp, side='left'))
+
+    def dates(self, start: int, end: int) -> Tuple[datetime, datetime]:
+        """First and last timestamps of the timeline period [start, end)"""
+        return self.timeline[start], self.timeline[end - 1]
+
+    def slice(self, start: int, end: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """(market_data, weather_data) rows of the timeline period [start, end)"""
+        return tuple(df.iloc[offsets[start]:offsets[end]] for df, offsets in zip(self.frames, self.offsets))
 
 
 class BacktestingEngine:
@@ -63,13 +281,24 @@ class BacktestingEngine:
     and results calculation across specified time periods.
     """
 
-    def __init__(self, config: BacktestConfig, db_path: str = "data/climatetrade.db"):
+    def __init__(self,
+                 config: BacktestConfig,
+                 db_path: str = "data/climatetrade.db",
+                 validate_connection: bool = True):
         self.config = config
-        self.data_loader = BacktestingDataLoader(db_path)
+        self.data_loader = BacktestingDataLoader(
+            db_path, compact=self.config.compact_dtypes, snapshot_dir=self.config.snapshot_dir,
+            validate_connection=validate_connection
+        )
         self.performance_metrics = PerformanceMetrics()
         self.risk_metrics = RiskMetrics()
         self.logger = logging.getLogger(__name__)
 
+        # LRU cache of aligned (market_data, weather_data) keyed by load arguments
+        self._data_cache: OrderedDict = OrderedDict()
+        self._data_cache_lock = threading.Lock()
+        self.cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
     def run_backtest(self,
                     strategy: BaseWeatherStrategy,
                     market_ids: Optional[List[str]] = None,
@@ -88,6 +317,82 @@ class BacktestingEngine:
         self.logger.info(f"Starting backtest for strategy: {strategy.name}")
         self.logger.info(f"Period: {self.config.start_date} to {self.config.end_date}")
 
+        scope = ('load', sorted(market_ids or []), sorted(locations or []))
+        if self.config.stream_chunk_size > 0:
+            return self._run_streaming_simulation(strategy, market_ids, locations, scope)
+
+        market_data, weather_data = self.load_aligned_data(market_ids, locations)
+
+        return self._run_simulation(strategy, market_data, weather_data, scope)
+
+    def load_aligned_data(self,
+                          market_ids: Optional[List[str]] = None,
+                          locations: Optional[List[str]] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Load market and weather data for the configured period and align them
+
+        Aligned datasets are cached per (markets, locations, period, frequency),
+        so repeated backtests over the same data, such as optimizer sweeps,
+        load and resample once. The cache holds at most
+        config.data_cache_size entries and evicts the least recently used.
+        Cached frames are shared between backtests and must not be mutated.
+
+        Args:
+            market_ids: Specific market IDs to load (None for all)
+            locations: Specific weather locations to load (None for all)
+
+        Returns:
+            Tuple of aligned (market_data, weather_data)
+        """
+        if self.config.data_cache_size <= 0:
+            return self._load_and_align(market_ids, locations)
+
+        key = (
+            tuple(sorted(market_ids)) if market_ids else None,
+            tuple(sorted(locations)) if locations else None,
+            self.config.start_date,
+            self.config.end_date,
+            self.config.data_frequency
+        )
+
+        with self._data_cache_lock:
+            if key in self._data_cache:
+                self._data_cache.move_to_end(key)
+                self.cache_stats['hits'] += 1
+                return self._data_cache[key]
+
+            self.cache_stats['misses'] += 1
+            aligned = self._load_and_align(market_ids, locations)
+            self._data_cache[key] = aligned
+
+            while len(self._data_cache) > self.config.data_cache_size:
+                self._data_cache.popitem(last=False)
+                self.cache_stats['evictions'] += 1
+
+            return aligned
+
+    def clear_data_cache(self):
+        """Drop all cached aligned datasets"""
+        with self._data_cache_lock:
+            self._data_cache.clear()
+
+    def _load_and_align(self,
+                        market_ids: Optional[List[str]],
+                        locations: Optional[List[str]]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Load data for the configured period from the database and align it"""
+        if self.config.use_rollups:
+            aligned = self.data_loader.load_rollup_data(
+                market_ids=market_ids,
+                locations=locations,
+                start_date=self.config.start_date,
+                end_date=self.config.end_date,
+                freq=self.config.data_frequency
+            )
+            if aligned is not None:
+                if aligned[0].empty or aligned[1].empty:
+                    raise ValueError("Insufficient data for backtesting period")
+                return aligned
+
         # Load historical data
         market_data = self.data_loader.load_market_data(
             market_ids=market_ids,
@@ -105,58 +410,490 @@ class BacktestingEngine:
             raise ValueError("Insufficient data for backtesting period")
 
         # Align data timelines
-        market_data, weather_data = self.data_loader.align_data_timeline(
+        return self.data_loader.align_data_timeline(
             market_data, weather_data, self.config.data_frequency
         )
 
-        # Initialize simulation state
-        capital = self.config.initial_capital
-        equity_curve = [(self.config.start_date, capital)]
-        all_signals = []
-        all_positions = []
+    def with_period(self, start_date: datetime, end_date: datetime) -> 'BacktestingEngine':
+        """
+        Engine configured for another period, sharing this one's loader and cache
 
-        # Process data in chronological order
+        Pair with PeriodSlicer to backtest windows of already aligned data:
+        results are then dated and annualized over the window.
+        """
+        engine = copy.copy(self)
+        engine.config = dataclasses.replace(self.config, start_date=start_date, end_date=end_date)
+        return engine
+
+    def run_prepared_backtest(self,
+                              strategy: BaseWeatherStrategy,
+                              market_data: pd.DataFrame,
+                              weather_data: pd.DataFrame) -> BacktestResult:
+        """
+        Run a backtest on data that has already been loaded and aligned
+
+        Args:
+            strategy: The trading strategy to test
+            market_data: Aligned market data, e.g. from load_aligned_data
+            weather_data: Aligned weather data, e.g. from load_aligned_data
+
+        Returns:
+            BacktestResult with complete performance data
+        """
+        if market_data.empty or weather_data.empty:
+            raise ValueError("Insufficient data for backtesting period")
+
+        self.logger.info(f"Starting backtest for strategy: {strategy.name} on prepared data")
+        scope = ('prepared', len(market_data), len(weather_data))
+        return self._run_simulation(strategy, market_data, weather_data, scope)
+
+    def _run_simulation(self,
+                        strategy: BaseWeatherStrategy,
+                        market_data: pd.DataFrame,
+                        weather_data: pd.DataFrame,
+                        scope: Tuple = ()) -> BacktestResult:
+        """Walk the aligned data timeline and execute the strategy tick by tick"""
+        state, checkpointer = self._start_simulation(strategy, scope)
+
+        # A resumed run has state the batch simulation can't continue from
+        signal_frame = None
+        if checkpointer is None or checkpointer.cursor is None:
+            signal_frame = self._batch_signals(strategy, state, market_data, weather_data)
+        if signal_frame is not None:
+            self._simulate_batch(strategy, state, signal_frame, market_data, weather_data)
+        else:
+            self._simulate_window(strategy, state, market_data, weather_data, checkpointer)
+
+        return self._finish_simulation(strategy, state, checkpointer)
+
+    def _start_simulation(self,
+                          strategy: BaseWeatherStrategy,
+                          scope: Tuple) -> Tuple[SimulationState, Optional[SimulationCheckpointer]]:
+        """
+        Simulation state for a single-strategy run, with its checkpointer
+
+        With config.checkpoint_dir set, a checkpoint left by an interrupted
+        run of the same backtest (strategy, parameters, period and data
+        scope) is restored instead of starting from the initial capital.
+        """
+        if not self.config.checkpoint_dir:
+            return self._init_simulation_state(strategy), None
+
+        checkpointer = SimulationCheckpointer(self._checkpoint_path(strategy, scope),
+                                              self.config.checkpoint_interval)
+        state = checkpointer.restore(strategy)
+        if state is None:
+            state = self._init_simulation_state(strategy)
+        checkpointer.attach(strategy, state)
+        return state, checkpointer
+
+    def _checkpoint_path(self, strategy: BaseWeatherStrategy, scope: Tuple) -> str:
+        """Checkpoint file identifying one backtest of one strategy"""
+        parameters = getattr(strategy, 'parameters', None) or {}
+        identity = repr((
+            type(strategy).__module__, type(strategy).__qualname__, strategy.name,
+            sorted((str(name), repr(value)) for name, value in parameters.items()),
+            self.config.start_date, self.config.end_date, self.config.data_frequency,
+            self.config.initial_capital, self.config.stream_chunk_size, scope
+        ))
+        digest = hashlib.sha1(identity.encode()).hexdigest()[:16]
+        return os.path.join(self.config.checkpoint_dir, f"{type(strategy).__name__}-{digest}.ckpt")
+
+    def _batch_signals(self,
+                       strategy: BaseWeatherStrategy,
+                       state: SimulationState,
+                       market_data: pd.DataFrame,
+                       weather_data: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Signals for the whole dataset if the strategy can generate them in one batch"""
+        generate_batch = getattr(strategy, 'generate_signals_batch', None)
+        if not self.config.batch_signals or not callable(generate_batch):
+            return None
+
+        # Positions left open by an earlier run could be closed by this one,
+        # which the batch fill simulation doesn't model
+        if state.position_book is None or state.position_book.open_positions():
+            return None
+
+        return generate_batch(market_data, weather_data)
+
+    def _simulate_batch(self,
+                        strategy: BaseWeatherStrategy,
+                        state: SimulationState,
+                        signal_frame: pd.DataFrame,
+                        market_data: pd.DataFrame,
+                        weather_data: pd.DataFrame):
+        """
+        Simulate fills and P&L for a precomputed signal frame
+
+        Reproduces the per-tick execution rules in vectorized form: a BUY
+        opens a position at the outcome's last price on its timestep, and a
+        SELL closes every position on that outcome opened before it. Signals
+        for outcomes without a price on their timestep don't fill.
+        """
         timeline = self._create_simulation_timeline(market_data, weather_data)
+        if signal_frame.empty:
+            state.equity_curve.extend((timestamp, state.capital) for timestamp in timeline)
+            return
+
+        signals = signal_frame.reset_index(drop=True)
+        signals['seq'] = np.arange(len(signals))
+
+        keys = ['timestamp', 'market_id', 'outcome_name']
+        prices = market_data[keys + ['probability']].astype({'market_id': object, 'outcome_name': object})
+        prices = prices.drop_duplicates(subset=keys, keep='last').rename(columns={'probability': 'fill_price'})
+        fills = signals.merge(prices, on=keys, how='inner').sort_values('seq')
+
+        buys = fills[fills['signal_type'] == 'BUY']
+        sells = fills[fills['signal_type'] == 'SELL'][['market_id', 'outcome_name', 'seq', 'fill_price', 'timestamp']]
+        sells = sells.rename(columns={'seq': 'close_seq', 'fill_price': 'exit_price', 'timestamp': 'exit_time'})
+
+        # Each BUY is closed by the first later SELL on the same outcome
+        trades = pd.merge_asof(
+            buys, sells, left_on='seq', right_on='close_seq', by=['market_id', 'outcome_name'],
+            direction='forward', allow_exact_matches=False
+        ) if not buys.empty else buys.assign(close_seq=np.nan, exit_price=np.nan, exit_time=pd.NaT)
+
+        quantity = trades['quantity'].astype(float)
+        trades['fill_quantity'] = quantity.where(quantity.notna() & (quantity != 0), 1.0)
+        closed = trades['close_seq'].notna()
+        trades['trade_pnl'] = np.where(closed, (trades['exit_price'] - trades['fill_price']) * trades['fill_quantity'],
+                                       0.0)
+
+        position_book = state.position_book
+        for trade in trades.itertuples(index=False):
+            is_closed = not pd.isna(trade.close_seq)
+            position_book.add(Position(
+                market_id=trade.market_id,
+                outcome_name=trade.outcome_name,
+                quantity=trade.fill_quantity,
+                entry_price=trade.fill_price,
+                entry_time=trade.timestamp,
+                current_price=trade.fill_price,
+                exit_price=trade.exit_price if is_closed else None,
+                exit_time=trade.exit_time if is_closed else None,
+                pnl=trade.trade_pnl,
+                status='CLOSED' if is_closed else 'OPEN'
+            ))
+
+        # Signals the strategy would have recorded: filled BUYs and every SELL
+        recorded = signals['seq'].isin(buys['seq']) | (signals['signal_type'] == 'SELL')
+        strategy.signals_history.extend(signals_from_frame(signals[recorded]))
+        state.signals.extend(signals_from_frame(signals))
+        if state.signals:
+            state.positions = strategy.positions
+
+        # Capital after each timestep from the P&L realized on it
+        realized = pd.Series(trades['trade_pnl'][closed].to_numpy(), index=trades['exit_time'][closed])
+        realized = realized.groupby(level=0).sum().reindex(timeline, fill_value=0.0)
+        capital = state.capital + realized.cumsum()
+
+        state.capital = float(capital.iloc[-1]) if len(capital) else state.capital
+        state.realized_pnl = position_book.realized_pnl
+        state.equity_curve.extend(zip(timeline, capital.tolist()))
+
+    def _run_streaming_simulation(self,
+                                  strategy: BaseWeatherStrategy,
+                                  market_ids: Optional[List[str]],
+                                  locations: Optional[List[str]],
+                                  scope: Tuple = ()) -> BacktestResult:
+        """Simulate over time-ordered chunks so memory is bounded by the chunk size"""
+        state, checkpointer = self._start_simulation(strategy, scope)
+        self._stream_windows([(strategy, state)], market_ids, locations, checkpointer=checkpointer)
+        return self._finish_simulation(strategy, state, checkpointer)
+
+    def _stream_windows(self,
+                        runs: List[Tuple[BaseWeatherStrategy, SimulationState]],
+                        market_ids: Optional[List[str]],
+                        locations: Optional[List[str]],
+                        isolate_errors: bool = False,
+                        checkpointer: Optional[SimulationCheckpointer] = None):
+        """Stream the configured period in chunks and advance every run over each window"""
+        freq = self.config.data_frequency
+        chunk_size = self.config.stream_chunk_size
+
+        market_chunks = self.data_loader.iter_market_data(
+            market_ids=market_ids,
+            start_date=self.config.start_date,
+            end_date=self.config.end_date,
+            chunk_size=chunk_size
+        )
+        weather_chunks = self.data_loader.iter_weather_data(
+            locations=locations,
+            start_date=self.config.start_date,
+            end_date=self.config.end_date,
+            chunk_size=chunk_size
+        )
+
+        has_market = has_weather = False
+
+        for market_window, weather_window in iter_time_windows(market_chunks, weather_chunks, freq):
+            has_market = has_market or not market_window.empty
+            has_weather = has_weather or not weather_window.empty
+
+            market_window, weather_window = self.data_loader.align_data_timeline(
+                market_window, weather_window, freq
+            )
+            self._simulate_shared_window(runs, market_window, weather_window, isolate_errors, checkpointer)
 
-        for timestamp in timeline:
+        if not (has_market and has_weather):
+            raise ValueError("Insufficient data for backtesting period")
+
+    def _init_simulation_state(self,
+                               strategy: BaseWeatherStrategy,
+                               prices: Optional[PriceIndex] = None,
+                               histories: Optional[Dict[int, HistoryBuffers]] = None) -> SimulationState:
+        """
+        Fresh simulation state at the configured initial capital
+
+        Strategies backtested together share `prices` and, through
+        `histories` (keyed by lookback), the history buffers of any other
+        strategy declaring the same lookback.
+        """
+        # Strategies built on BaseWeatherStrategy expose an indexed position book;
+        # anything else falls back to scanning the returned position list
+        position_book = getattr(strategy, 'position_book', None)
+        if not isinstance(position_book, PositionBook):
+            position_book = None
+
+        # Rolling history sized from the lookback the strategy declares
+        required_history = getattr(strategy, 'required_history', None)
+        lookback = required_history() if callable(required_history) else 0
+        history = None
+        if isinstance(lookback, int) and lookback > 0:
+            if histories is None:
+                history = HistoryBuffers(lookback)
+            else:
+                history = histories.setdefault(lookback, HistoryBuffers(lookback))
+        # Per-tick quotes for opening and closing positions without masking market data
+        if isinstance(strategy, BaseWeatherStrategy):
+            strategy.history = history
+            prices = strategy.prices = prices if prices is not None else PriceIndex()
+        else:
+            prices = None
+
+        # Incremental indicators the strategy registered, restarted for this run
+        indicators = getattr(strategy, 'indicators', None)
+        if isinstance(indicators, IndicatorSet) and indicators:
+            indicators.reset()
+        else:
+            indicators = None
+
+        # Climatology normals start from their baseline and grow with each tick
+        climatology = getattr(strategy, 'climatology', None)
+        if isinstance(climatology, ClimatologyIndex):
+            climatology.reset()
+        else:
+            climatology = None
+
+        return SimulationState(
+            capital=self.config.initial_capital,
+            equity_curve=[(self.config.start_date, self.config.initial_capital)],
+            position_book=position_book,
+            realized_pnl=position_book.realized_pnl if position_book else 0.0,
+            history=history,
+            indicators=indicators,
+            climatology=climatology,
+            prices=prices
+        )
+
+    def _simulate_window(self,
+                         strategy: BaseWeatherStrategy,
+                         state: SimulationState,
+                         market_data: pd.DataFrame,
+                         weather_data: pd.DataFrame,
+                         checkpointer: Optional[SimulationCheckpointer] = None):
+        """Advance the simulation over every timestamp in the given aligned data"""
+        self._simulate_shared_window([(strategy, state)], market_data, weather_data,
+                                     checkpointer=checkpointer)
+
+    def _simulate_shared_window(self,
+                                runs: List[Tuple[BaseWeatherStrategy, SimulationState]],
+                                market_data: pd.DataFrame,
+                                weather_data: pd.DataFrame,
+                                isolate_errors: bool = False,
+                                checkpointer: Optional[SimulationCheckpointer] = None):
+        """
+        Advance several simulations over the given aligned data in one pass
+
+        Each timestamp is sliced once and fed to every (strategy, state) run.
+        With isolate_errors, a strategy that raises is logged and removed
+        from runs while the others carry on; otherwise the error propagates.
+        A checkpointer counts the simulated ticks, and timestamps up to its
+        cursor (already simulated before a restart) are skipped.
+        """
+        # Process data in chronological order
+        timeline = self._create_simulation_timeline(market_data, weather_data)
+        first_step = 0
+        if checkpointer is not None and checkpointer.cursor is not None:
+            first_step = bisect.bisect_right(timeline, pd.Timestamp(checkpointer.cursor))
+        market_slices = TimelineSlicer(market_data, timeline, mode=self.config.simulation_mode)
+        weather_slices = TimelineSlicer(weather_data, timeline, mode=self.config.simulation_mode)
+
+        # Runs may share price indexes and history buffers; update each once per tick
+        price_indexes = list({id(state.prices): state.prices
+                              for _, state in runs if state.prices is not None}.values())
+        histories = list({id(state.history): state.history
+                          for _, state in runs if state.history is not None}.values())
+
+        for step in range(first_step, len(timeline)):
+            timestamp = timeline[step]
             # Get data for this timestamp
-            current_market = market_data[market_data['timestamp'] == timestamp]
-            current_weather = weather_data[weather_data['timestamp'] == timestamp]
+            current_market = market_slices.slice_at(step)
+            current_weather = weather_slices.slice_at(step)
 
             if current_market.empty and current_weather.empty:
                 continue
 
-            # Get current positions
-            current_positions = [p for p in all_positions if p.status == 'OPEN']
+            for prices in price_indexes:
+                prices.update(current_market)
+            for history in histories:
+                history.update(current_market, current_weather)
 
-            # Generate signals
-            signals = strategy.generate_signals(
-                current_market if not current_market.empty else pd.DataFrame(),
-                current_weather if not current_weather.empty else pd.DataFrame(),
-                current_positions
-            )
+            for run in list(runs):
+                strategy, state = run
+                try:
+                    self._simulate_tick(strategy, state, timestamp, current_market, current_weather)
+                except Exception as e:
+                    if not isolate_errors:
+                        raise
+                    self.logger.error(f"Strategy {strategy.name} backtest failed: {e}")
+                    runs.remove(run)
+
+            if checkpointer is not None:
+                checkpointer.tick(timestamp)
+
+    def _simulate_tick(self,
+                       strategy: BaseWeatherStrategy,
+                       state: SimulationState,
+                       timestamp: datetime,
+                       current_market: pd.DataFrame,
+                       current_weather: pd.DataFrame):
+        """Feed one timestamp's rows to a strategy and record the outcome"""
+        position_book = state.position_book
+
+        if state.indicators is not None:
+            state.indicators.update(current_weather)
+        if state.climatology is not None:
+            state.climatology.update(current_weather)
+
+        # Get current positions
+        if position_book:
+            current_positions = position_book.open_positions()
+        else:
+            current_positions = [p for p in state.positions if p.status == 'OPEN']
 
-            # Execute signals and update positions
-            if signals:
-                updated_positions = strategy.update_positions(signals, current_market)
-                all_signals.extend(signals)
+        # Generate signals
+        signals = strategy.generate_signals(
+            current_market if not current_market.empty else pd.DataFrame(),
+            current_weather if not current_weather.empty else pd.DataFrame(),
+            current_positions
+        )
 
-                # Update capital based on closed positions
-                capital_change = sum(p.pnl for p in updated_positions
-                                   if p.status == 'CLOSED' and p not in current_positions)
-                capital += capital_change
+        # Execute signals and update positions
+        if signals:
+            state.positions = strategy.update_positions(signals, current_market)
+            state.signals.extend(signals)
+
+            # Update capital by the P&L realized on this tick
+            if position_book:
+                new_realized_pnl = position_book.realized_pnl
+            else:
+                new_realized_pnl = sum(p.pnl for p in state.positions if p.status == 'CLOSED')
+            state.capital += new_realized_pnl - state.realized_pnl
+            state.realized_pnl = new_realized_pnl
+
+        # Record equity curve
+        state.equity_curve.append((timestamp, state.capital))
+
+    def _finish_simulation(self,
+                           strategy: BaseWeatherStrategy,
+                           state: SimulationState,
+                           checkpointer: Optional[SimulationCheckpointer] = None) -> BacktestResult:
+        """Calculate final results from the simulation state"""
+        # Quotes and incremental indicators only describe the engine's ticks;
+        # direct calls search market data and compute over frames again
+        if state.prices is not None:
+            strategy.prices = None
+        if state.indicators is not None:
+            state.indicators.detach()
+        if state.climatology is not None:
+            state.climatology.detach()
+
+        result = self._calculate_results(strategy, state.positions, state.signals, state.equity_curve)
+        self.logger.info(f"Backtest completed. Final capital: ${state.capital:.2f}")
+
+        if checkpointer is not None:
+            checkpointer.clear()
 
-                # Update position list
-                all_positions = updated_positions
+        return result
 
-            # Record equity curve
-            equity_curve.append((timestamp, capital))
+    def slice_result(self, result: BacktestResult, start_date: datetime, end_date: datetime) -> BacktestResult:
+        """
+        The part of a backtest between two timestamps, as a result of its own
 
-        # Calculate final results
-        result = self._calculate_results(strategy, all_positions, all_signals, equity_curve)
-        self.logger.info(f"Backtest completed. Final capital: ${capital:.2f}")
+        The equity curve is cut to [start_date, end_date] and rebased to the
+        initial capital, and only signals raised and positions closed in the
+        period are kept. Unlike a backtest of the period alone, the strategy
+        enters it with its history warmed up and the positions it held.
 
-        return result
+        Args:
+            result: Backtest covering the period
+            start_date: First timestamp of the period
+            end_date: Last timestamp of the period
+
+        Returns:
+            BacktestResult dated and annualized over the period
+        """
+        capital = self.config.initial_capital
+        # The curve opens with a point restating the initial capital
+        baseline = result.equity_curve[0][1]
+        equity_curve = [(start_date, capital)]
+        for timestamp, value in result.equity_curve[1:]:
+            if timestamp < start_date:
+                baseline = value
+            elif timestamp <= end_date:
+                equity_curve.append((timestamp, value - baseline + capital))
+
+        positions = [p for p in result.positions
+                     if p.status == 'CLOSED' and p.exit_time is not None and start_date <= p.exit_time <= end_date]
+        signals = [s for s in result.signals if start_date <= s.timestamp <= end_date]
+
+        engine = self.with_period(start_date, end_date)
+        return engine._summarize_results(result.strategy_name, positions, signals, equity_curve)
+
+    def combine_results(self, results: List[BacktestResult]) -> BacktestResult:
+        """
+        Stitch results for consecutive periods into one result over their span
+
+        Each period's equity curve is shifted by the P&L of the periods before
+        it, so the stitched curve continues from where the previous period
+        ended, and metrics are recalculated over the stitched curve.
+
+        Args:
+            results: Backtests of consecutive periods, in time order
+
+        Returns:
+            BacktestResult from the first period's start to the last one's end
+        """
+        if not results:
+            raise ValueError("No results to combine")
+
+        equity_curve: List[Tuple[datetime, float]] = []
+        positions: List[Position] = []
+        signals: List[TradingSignal] = []
+        offset = 0.0
+
+        for i, result in enumerate(results):
+            initial_value = result.equity_curve[0][1]
+            # Later periods drop their opening point, which restates the initial capital
+            points = result.equity_curve if i == 0 else result.equity_curve[1:]
+            equity_curve.extend((timestamp, value + offset) for timestamp, value in points)
+            offset += result.equity_curve[-1][1] - initial_value
+            positions.extend(result.positions)
+            signals.extend(result.signals)
+
+        engine = self.with_period(results[0].start_date, results[-1].end_date)
+        return engine._summarize_results(results[0].strategy_name, positions, signals, equity_curve)
 
     def run_multiple_strategies(self,
                                strategies: List[BaseWeatherStrategy],
@@ -165,6 +902,11 @@ class BacktestingEngine:
         """
         Run backtests for multiple strategies
 
+        With config.shared_pass, the data is loaded and aligned once and the
+        timeline walked once, feeding each tick to every strategy with its
+        own positions and equity curve. Otherwise each strategy runs a
+        separate backtest, on a thread pool if config.enable_parallel.
+
         Args:
             strategies: List of strategies to test
             market_ids: Market IDs to test
@@ -173,6 +915,11 @@ class BacktestingEngine:
         Returns:
             List of BacktestResult objects
         """
+        # A strategy listed twice would interleave trades on one position book
+        distinct = len({id(strategy) for strategy in strategies}) == len(strategies)
+        if self.config.shared_pass and len(strategies) > 1 and distinct:
+            return self._run_shared_backtests(strategies, market_ids, locations)
+
         results = []
 
         if self.config.enable_parallel and len(strategies) > 1:
@@ -200,19 +947,123 @@ class BacktestingEngine:
 
         return results
 
+    def run_prepared_strategies(self,
+                                strategies: List[BaseWeatherStrategy],
+                                market_data: pd.DataFrame,
+                                weather_data: pd.DataFrame) -> List[BacktestResult]:
+        """
+        Backtest several strategies in one pass over already aligned data
+
+        Strategies with batch signals are simulated from their signal frames;
+        the rest share a single walk of the timeline. A strategy that fails
+        is logged and left out of the results, as in run_multiple_strategies.
+
+        Args:
+            strategies: The trading strategies to test
+            market_data: Aligned market data, e.g. from load_aligned_data
+            weather_data: Aligned weather data, e.g. from load_aligned_data
+
+        Returns:
+            BacktestResult per successful strategy, in the order given
+        """
+        if market_data.empty or weather_data.empty:
+            raise ValueError("Insufficient data for backtesting period")
+
+        self.logger.info(f"Starting shared-pass backtest for {len(strategies)} strategies on prepared data")
+
+        runs = self._init_shared_runs(strategies)
+        batched, walking = [], []
+        for strategy, state in runs:
+            try:
+                signal_frame = self._batch_signals(strategy, state, market_data, weather_data)
+                if signal_frame is None:
+                    walking.append((strategy, state))
+                    continue
+                self._simulate_batch(strategy, state, signal_frame, market_data, weather_data)
+                batched.append((strategy, state))
+            except Exception as e:
+                self.logger.error(f"Strategy {strategy.name} backtest failed: {e}")
+
+        # Strategies that fail during the walk are dropped from walking
+        self._simulate_shared_window(walking, market_data, weather_data, isolate_errors=True)
+        return self._finish_shared(runs, batched + walking)
+
+    def start_backtests(self,
+                        strategies: List[BaseWeatherStrategy],
+                        periods: PeriodSlicer) -> 'ResumableBacktests':
+        """
+        Backtests of several strategies that can be advanced period by period
+
+        Args:
+            strategies: The trading strategies to test
+            periods: Slicer over already aligned data
+
+        Returns:
+            ResumableBacktests positioned at the start of the timeline
+        """
+        return ResumableBacktests(self.with_period(*periods.dates(0, len(periods))), strategies, periods)
+
+    def _run_shared_backtests(self,
+                              strategies: List[BaseWeatherStrategy],
+                              market_ids: Optional[List[str]],
+                              locations: Optional[List[str]]) -> List[BacktestResult]:
+        """Load (or stream) the data once and backtest every strategy over it"""
+        try:
+            if self.config.stream_chunk_size <= 0:
+                market_data, weather_data = self.load_aligned_data(market_ids, locations)
+                return self.run_prepared_strategies(strategies, market_data, weather_data)
+
+            runs = self._init_shared_runs(strategies)
+            self._stream_windows(runs, market_ids, locations, isolate_errors=True)
+        except Exception as e:
+            self.logger.error(f"Strategy backtests failed: {e}")
+            return []
+
+        return self._finish_shared(runs, runs)
+
+    def _init_shared_runs(self, strategies: List[BaseWeatherStrategy]
+                          ) -> List[Tuple[BaseWeatherStrategy, SimulationState]]:
+        """Simulation state per strategy, sharing one price index and same-lookback history"""
+        prices = PriceIndex()
+        histories: Dict[int, HistoryBuffers] = {}
+        runs = []
+
+        for strategy in strategies:
+            try:
+                runs.append((strategy, self._init_simulation_state(strategy, prices, histories)))
+            except Exception as e:
+                self.logger.error(f"Strategy {strategy.name} backtest failed: {e}")
+
+        return runs
+
+    def _finish_shared(self,
+                       runs: List[Tuple[BaseWeatherStrategy, SimulationState]],
+                       completed: List[Tuple[BaseWeatherStrategy, SimulationState]]) -> List[BacktestResult]:
+        """Results for the completed runs, in the order the strategies were given"""
+        completed_states = {id(state) for _, state in completed}
+
+        results = []
+        for strategy, state in runs:
+            if id(state) not in completed_states:
+                continue
+            try:
+                results.append(self._finish_simulation(strategy, state))
+            except Exception as e:
+                self.logger.error(f"Strategy {strategy.name} backtest failed: {e}")
+
+        return results
+
     def _create_simulation_timeline(self,
                                    market_data: pd.DataFrame,
                                    weather_data: pd.DataFrame) -> List[datetime]:
         """Create chronological timeline for simulation"""
-        all_timestamps = set()
+        timestamps = [df['timestamp'] for df in (market_data, weather_data) if not df.empty]
 
-        if not market_data.empty:
-            all_timestamps.update(market_data['timestamp'].tolist())
-
-        if not weather_data.empty:
-            all_timestamps.update(weather_data['timestamp'].tolist())
+        if not timestamps:
+            return []
 
-        return sorted(list(all_timestamps))
+        all_timestamps = pd.Index(pd.concat(timestamps, ignore_index=True).unique())
+        return all_timestamps.sort_values().tolist()
 
     def _calculate_results(self,
                           strategy: BaseWeatherStrategy,
@@ -220,6 +1071,14 @@ class BacktestingEngine:
                           signals: List[TradingSignal],
                           equity_curve: List[Tuple[datetime, float]]) -> BacktestResult:
         """Calculate comprehensive backtest results"""
+        return self._summarize_results(strategy.name, positions, signals, equity_curve)
+
+    def _summarize_results(self,
+                           strategy_name: str,
+                           positions: List[Position],
+                           signals: List[TradingSignal],
+                           equity_curve: List[Tuple[datetime, float]]) -> BacktestResult:
+        """Performance metrics for an equity curve and its positions"""
         # Extract equity values and timestamps
         timestamps, equity_values = zip(*equity_curve)
 
@@ -266,7 +1125,7 @@ class BacktestingEngine:
         }
 
         return BacktestResult(
-            strategy_name=strategy.name,
+            strategy_name=strategy_name,
             start_date=self.config.start_date,
             end_date=self.config.end_date,
             total_return=total_return,
@@ -367,4 +1226,78 @@ class BacktestingEngine:
             if gap > timedelta(hours=2):  # More than 2 hours gap
                 gaps.append((timestamps[i-1], timestamps[i]))
 
-        return gaps
\ No newline at end of file
+        return gaps
+
+
+class ResumableBacktests:
+    """
+    Shared-pass backtests that stop and resume at any point of the timeline
+
+    advance() walks the strategies still running over the next stretch of
+    a PeriodSlicer timeline, continuing from their positions, history and
+    indicators where the previous call stopped, so extending a backtest
+    never re-simulates its prefix. results() summarizes the running
+    strategies up to the current offset without ending them, and stop()
+    drops those no longer worth extending.
+
+    Usage:
+        backtests = engine.start_backtests(strategies, PeriodSlicer(market_data, weather_data))
+        backtests.advance(len(backtests.periods) // 4)
+        backtests.stop([i for i, r in enumerate(backtests.results()) if r and r.total_return < 0])
+        backtests.advance(len(backtests.periods))
+    """
+
+    def __init__(self,
+                 engine: BacktestingEngine,
+                 strategies: List[BaseWeatherStrategy],
+                 periods: PeriodSlicer):
+        self.engine = engine
+        self.periods = periods
+        self.strategies = list(strategies)
+        self.position = 0
+        self.simulated_ticks = 0
+
+        self._runs = engine._init_shared_runs(self.strategies)
+
+    @property
+    def running(self) -> List[int]:
+        """Indexes of the strategies still being advanced"""
+        live = {id(strategy) for strategy, _ in self._runs}
+        return [i for i, strategy in enumerate(self.strategies) if id(strategy) in live]
+
+    def advance(self, end: int):
+        """Walk the running strategies over the timeline period [position, end)"""
+        end = min(end, len(self.periods))
+        if end <= self.position:
+            return
+
+        market_data, weather_data = self.periods.slice(self.position, end)
+        self.simulated_ticks += len(self._runs) * (end - self.position)
+        # Strategies that raise are logged and dropped from the runs
+        self.engine._simulate_shared_window(self._runs, market_data, weather_data, isolate_errors=True)
+        self.position = end
+
+    def stop(self, indexes: List[int]):
+        """Stop advancing the strategies at these indexes"""
+        stopped = {id(self.strategies[i]) for i in indexes}
+        self._runs = [run for run in self._runs if id(run[0]) not in stopped]
+
+    def results(self) -> List[Optional[BacktestResult]]:
+        """
+        Result of every strategy up to the current offset, in the order given
+
+        Strategies that were stopped or failed, and every strategy before
+        the first advance, have None.
+        """
+        results: List[Optional[BacktestResult]] = [None] * len(self.strategies)
+        if self.position == 0:
+            return results
+
+        engine = self.engine.with_period(*self.periods.dates(0, self.position))
+        index = {id(strategy): i for i, strategy in enumerate(self.strategies)}
+        for strategy, state in self._runs:
+            results[index[id(strategy)]] = engine._calculate_results(
+                strategy, list(state.positions), list(state.signals), list(state.equity_curve)
+            )
+        return results
+
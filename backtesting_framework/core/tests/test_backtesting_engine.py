@@ -9,6 +9,8 @@ including data loading, strategy execution, position management, and results cal
 import pytest
 import pandas as pd
 import numpy as np
+import sqlite3
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
 from typing import List
@@ -18,12 +20,22 @@ from ..backtesting_engine import (
     BacktestConfig,
     BacktestResult,
     BacktestingDataLoader,
+    TimelineSlicer,
+    PeriodSlicer,
     BaseWeatherStrategy,
     TradingSignal,
     Position,
     PerformanceMetrics,
     RiskMetrics
 )
+from ...strategies.base_strategy import signal_frame
+from ...strategies.weather_strategies import (
+    TemperatureThresholdStrategy,
+    PrecipitationStrategy,
+    WindSpeedStrategy,
+    WeatherPatternStrategy,
+    SeasonalWeatherStrategy
+)
 
 
 @pytest.fixture
@@ -90,6 +102,7 @@ def sample_weather_data():
 def mock_data_loader(sample_market_data, sample_weather_data):
     """Mock data loader"""
     loader = Mock(spec=BacktestingDataLoader)
+    loader.load_rollup_data.return_value = None
     loader.load_market_data.return_value = sample_market_data
     loader.load_weather_data.return_value = sample_weather_data
     loader.align_data_timeline.return_value = (sample_market_data, sample_weather_data)
@@ -174,6 +187,7 @@ class TestBacktestingEngine:
     def test_run_backtest_insufficient_data(self, sample_config):
         """Test backtest with insufficient data"""
         mock_loader = Mock(spec=BacktestingDataLoader)
+        mock_loader.load_rollup_data.return_value = None
         mock_loader.load_market_data.return_value = pd.DataFrame()
         mock_loader.load_weather_data.return_value = pd.DataFrame()
 
@@ -188,6 +202,22 @@ class TestBacktestingEngine:
             with pytest.raises(ValueError, match="Insufficient data"):
                 engine.run_backtest(strategy)
 
+    def test_run_backtest_uses_rollups(self, sample_config, mock_data_loader, mock_strategy,
+                                       sample_market_data, sample_weather_data):
+        """Aligned data served from rollups skips the raw load and resample"""
+        mock_data_loader.load_rollup_data.return_value = (sample_market_data, sample_weather_data)
+
+        with patch('backtesting_framework.core.backtesting_engine.BacktestingDataLoader', return_value=mock_data_loader), \
+             patch('backtesting_framework.core.backtesting_engine.PerformanceMetrics'), \
+             patch('backtesting_framework.core.backtesting_engine.RiskMetrics'):
+
+            engine = BacktestingEngine(sample_config)
+            result = engine.run_backtest(mock_strategy)
+
+            assert isinstance(result, BacktestResult)
+            mock_data_loader.load_market_data.assert_not_called()
+            mock_data_loader.align_data_timeline.assert_not_called()
+
     def test_run_multiple_strategies_sequential(self, sample_config, mock_data_loader, mock_strategy):
         """Test running multiple strategies sequentially"""
         strategies = [mock_strategy, mock_strategy]
@@ -358,6 +388,839 @@ class TestBacktestingEngine:
             assert len(gaps_none) == 0
 
 
+class RecordingStrategy(BaseWeatherStrategy):
+    """Deterministic strategy that records what it sees at every tick"""
+
+    def __init__(self, name: str = "RecordingStrategy", parameters=None):
+        super().__init__(name, parameters)
+        self.seen = []
+        self.tick = 0
+
+    def generate_signals(self, market_data, weather_data, current_positions):
+        self.seen.append((market_data.copy(), weather_data.copy()))
+        self.tick += 1
+
+        if market_data.empty:
+            return []
+
+        row = market_data.iloc[0]
+        if self.tick % 3 == 0:
+            signal_type = 'BUY'
+        elif self.tick % 5 == 0:
+            signal_type = 'SELL'
+        else:
+            return []
+
+        return [TradingSignal(
+            timestamp=row['timestamp'],
+            market_id=row['market_id'],
+            outcome_name=row['outcome_name'],
+            signal_type=signal_type,
+            confidence=0.9
+        )]
+
+
+class TestTimelineSlicer:
+    """Test cases for pre-grouped timeline slicing"""
+
+    def test_grouped_matches_masked(self):
+        """Grouped slices return the same rows, in the same order, as the mask"""
+        df = pd.DataFrame({
+            'timestamp': [datetime(2024, 1, 1, h) for h in [2, 0, 1, 0, 2, 1, 0]],
+            'value': range(7)
+        })
+        timeline = [datetime(2024, 1, 1, h) for h in range(4)]
+
+        grouped = TimelineSlicer(df, timeline, mode='grouped')
+        masked = TimelineSlicer(df, timeline, mode='masked')
+
+        for step in range(len(timeline)):
+            pd.testing.assert_frame_equal(grouped.slice_at(step), masked.slice_at(step))
+
+        assert grouped.slice_at(0)['value'].tolist() == [1, 3, 6]
+        assert grouped.slice_at(3).empty
+
+    def test_empty_frame(self):
+        """Empty frames yield empty slices for every step"""
+        timeline = [datetime(2024, 1, 1, 0), datetime(2024, 1, 1, 1)]
+        slicer = TimelineSlicer(pd.DataFrame(), timeline)
+
+        assert len(slicer) == 2
+        assert slicer.slice_at(1).empty
+
+    def test_unknown_mode(self):
+        """Unknown modes are rejected"""
+        with pytest.raises(ValueError, match="Unknown simulation mode"):
+            TimelineSlicer(pd.DataFrame(), [], mode='vectorised')
+
+    def test_simulation_modes_identical(self, sample_market_data, sample_weather_data):
+        """Grouped and masked simulation produce identical backtests"""
+        shuffled_market = sample_market_data.sample(frac=1.0, random_state=7)
+        results = {}
+        strategies = {}
+
+        for mode in ('grouped', 'masked'):
+            config = BacktestConfig(
+                start_date=datetime(2024, 1, 1),
+                end_date=datetime(2024, 1, 2),
+                simulation_mode=mode
+            )
+            loader = Mock(spec=BacktestingDataLoader)
+            loader.load_rollup_data.return_value = None
+            loader.load_market_data.return_value = shuffled_market
+            loader.load_weather_data.return_value = sample_weather_data
+            loader.align_data_timeline.return_value = (shuffled_market, sample_weather_data)
+
+            with patch('backtesting_framework.core.backtesting_engine.BacktestingDataLoader', return_value=loader), \
+                 patch('backtesting_framework.core.backtesting_engine.PerformanceMetrics'), \
+                 patch('backtesting_framework.core.backtesting_engine.RiskMetrics'):
+
+                strategies[mode] = RecordingStrategy()
+                results[mode] = BacktestingEngine(config).run_backtest(strategies[mode])
+
+        grouped, masked = results['grouped'], results['masked']
+        assert grouped.equity_curve == masked.equity_curve
+        assert grouped.signals == masked.signals
+        assert grouped.positions == masked.positions
+        assert grouped.total_trades == masked.total_trades
+
+        assert len(strategies['grouped'].seen) == len(strategies['masked'].seen)
+        for (g_market, g_weather), (m_market, m_weather) in zip(strategies['grouped'].seen,
+                                                                  strategies['masked'].seen):
+            pd.testing.assert_frame_equal(g_market, m_market)
+            pd.testing.assert_frame_equal(g_weather, m_weather)
+
+    def test_capital_tracks_realized_pnl(self, sample_market_data, sample_weather_data):
+        """Each closed position's P&L is credited to capital exactly once"""
+        config = BacktestConfig(start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 2))
+        loader = Mock(spec=BacktestingDataLoader)
+        loader.load_rollup_data.return_value = None
+        loader.load_market_data.return_value = sample_market_data
+        loader.load_weather_data.return_value = sample_weather_data
+        loader.align_data_timeline.return_value = (sample_market_data, sample_weather_data)
+
+        with patch('backtesting_framework.core.backtesting_engine.BacktestingDataLoader', return_value=loader), \
+             patch('backtesting_framework.core.backtesting_engine.PerformanceMetrics'), \
+             patch('backtesting_framework.core.backtesting_engine.RiskMetrics'):
+
+            strategy = RecordingStrategy()
+            result = BacktestingEngine(config).run_backtest(strategy)
+
+        final_capital = result.equity_curve[-1][1]
+        assert strategy.get_closed_positions()
+        assert final_capital == pytest.approx(config.initial_capital + strategy.get_total_pnl())
+
+
+class TestAlignedDataCache:
+    """Test cases for the engine's aligned data cache"""
+
+    def _engine(self, loader, cache_size=4):
+        config = BacktestConfig(
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 2),
+            data_cache_size=cache_size
+        )
+        with patch('backtesting_framework.core.backtesting_engine.BacktestingDataLoader', return_value=loader), \
+             patch('backtesting_framework.core.backtesting_engine.PerformanceMetrics'), \
+             patch('backtesting_framework.core.backtesting_engine.RiskMetrics'):
+            return BacktestingEngine(config)
+
+    def test_repeated_backtests_load_once(self, mock_data_loader, mock_strategy):
+        """Backtests over the same data reuse one load and alignment"""
+        engine = self._engine(mock_data_loader)
+
+        for _ in range(3):
+            engine.run_backtest(mock_strategy)
+
+        assert mock_data_loader.load_market_data.call_count == 1
+        assert mock_data_loader.align_data_timeline.call_count == 1
+        assert engine.cache_stats == {'hits': 2, 'misses': 1, 'evictions': 0}
+
+    def test_cache_key_includes_selection(self, mock_data_loader):
+        """Different market selections are cached separately, order-insensitively"""
+        engine = self._engine(mock_data_loader)
+
+        engine.load_aligned_data(market_ids=['a', 'b'])
+        engine.load_aligned_data(market_ids=['b', 'a'])
+        engine.load_aligned_data(market_ids=['c'])
+
+        assert mock_data_loader.load_market_data.call_count == 2
+
+    def test_lru_eviction(self, mock_data_loader):
+        """The least recently used dataset is evicted when the cache is full"""
+        engine = self._engine(mock_data_loader, cache_size=2)
+
+        engine.load_aligned_data(market_ids=['a'])
+        engine.load_aligned_data(market_ids=['b'])
+        engine.load_aligned_data(market_ids=['a'])  # 'b' is now least recent
+        engine.load_aligned_data(market_ids=['c'])  # evicts 'b'
+        engine.load_aligned_data(market_ids=['a'])
+
+        assert mock_data_loader.load_market_data.call_count == 3
+        assert engine.cache_stats['evictions'] == 1
+
+        engine.load_aligned_data(market_ids=['b'])
+        assert mock_data_loader.load_market_data.call_count == 4
+
+    def test_cache_disabled(self, mock_data_loader):
+        """A cache size of zero loads on every call"""
+        engine = self._engine(mock_data_loader, cache_size=0)
+
+        engine.load_aligned_data()
+        engine.load_aligned_data()
+
+        assert mock_data_loader.load_market_data.call_count == 2
+
+
+@pytest.fixture
+def sub_hour_db(tmp_path):
+    """Database with several sub-hour ticks per hour for two markets"""
+    db_path = str(tmp_path / 'stream.db')
+    timestamps = pd.date_range('2024-01-01', periods=36, freq='20min')
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE polymarket_data (timestamp TEXT, market_id TEXT, outcome_name TEXT, "
+                     "probability REAL, volume REAL, event_title TEXT, scraped_at TEXT)")
+        conn.execute("CREATE TABLE weather_data (timestamp TEXT, location_name TEXT, latitude REAL, "
+                     "longitude REAL, temperature REAL, temperature_min REAL, temperature_max REAL, "
+                     "humidity REAL, wind_speed REAL, precipitation REAL, pressure REAL, "
+                     "weather_code INTEGER, weather_description TEXT, source_id INTEGER)")
+        conn.execute("CREATE TABLE weather_sources (id INTEGER PRIMARY KEY, source_name TEXT)")
+        conn.execute("INSERT INTO weather_sources (source_name) VALUES ('test')")
+
+        for i, ts in enumerate(timestamps):
+            for market in ('market1', 'market2'):
+                conn.execute("INSERT INTO polymarket_data VALUES (?, ?, 'Yes', ?, ?, 'Test', NULL)",
+                             (ts.isoformat(), market, 0.3 + 0.01 * i, 100.0 + i))
+            conn.execute("INSERT INTO weather_data VALUES (?, 'London', 51.5, -0.1, ?, 10.0, 20.0, "
+                         "70.0, 5.0, 0.0, 1013.0, 800, 'Clear', 1)", (ts.isoformat(), 15.0 + i % 5))
+
+    return db_path
+
+
+class TestStreamingBacktest:
+    """Test cases for chunked streaming backtests"""
+
+    def _run(self, db_path, stream_chunk_size):
+        config = BacktestConfig(
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 2),
+            stream_chunk_size=stream_chunk_size
+        )
+        with patch('backtesting_framework.core.backtesting_engine.PerformanceMetrics'), \
+             patch('backtesting_framework.core.backtesting_engine.RiskMetrics'):
+            strategy = RecordingStrategy()
+            return BacktestingEngine(config, db_path=db_path).run_backtest(strategy), strategy
+
+    def test_streaming_matches_full_load(self, sub_hour_db):
+        """Streaming in small chunks produces the same backtest as loading everything"""
+        full, full_strategy = self._run(sub_hour_db, 0)
+        streamed, streamed_strategy = self._run(sub_hour_db, 5)
+
+        assert streamed.equity_curve == full.equity_curve
+        assert streamed.signals == full.signals
+        assert streamed.positions == full.positions
+
+        assert len(streamed_strategy.seen) == len(full_strategy.seen) == 12
+        for (s_market, s_weather), (f_market, f_weather) in zip(streamed_strategy.seen, full_strategy.seen):
+            pd.testing.assert_frame_equal(s_market.reset_index(drop=True), f_market.reset_index(drop=True))
+            pd.testing.assert_frame_equal(s_weather.reset_index(drop=True), f_weather.reset_index(drop=True))
+
+    def test_streaming_insufficient_data(self, sub_hour_db):
+        """Streaming raises like a full load when the period has no data"""
+        config = BacktestConfig(
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2023, 1, 2),
+            stream_chunk_size=5
+        )
+        with patch('backtesting_framework.core.backtesting_engine.PerformanceMetrics'), \
+             patch('backtesting_framework.core.backtesting_engine.RiskMetrics'):
+            engine = BacktestingEngine(config, db_path=sub_hour_db)
+
+        with pytest.raises(ValueError, match="Insufficient data"):
+            engine.run_backtest(RecordingStrategy())
+
+
+class TestCompactDtypeBacktest:
+    """Test cases for backtests over compact dtype data"""
+
+    def test_slices_decode_categoricals(self):
+        """Strategies receive plain identifiers rather than categoricals"""
+        df = pd.DataFrame({
+            'timestamp': [datetime(2024, 1, 1, 0), datetime(2024, 1, 1, 1)],
+            'location_name': pd.Categorical(['London', 'Paris'])
+        })
+        slicer = TimelineSlicer(df, [datetime(2024, 1, 1, 0), datetime(2024, 1, 1, 1)])
+
+        rows = slicer.slice_at(0)
+        assert rows['location_name'].dtype == object
+        assert [name for name, _ in rows.groupby('location_name')] == ['London']
+
+    @pytest.mark.parametrize('strategy_class', [
+        TemperatureThresholdStrategy, PrecipitationStrategy, WindSpeedStrategy,
+        WeatherPatternStrategy, SeasonalWeatherStrategy
+    ])
+    def test_weather_strategies_unchanged(self, strategy_class, sample_market_data):
+        """Example strategies produce the same signals on compact data"""
+        rng = np.random.default_rng(11)
+        timestamps = pd.date_range('2024-01-01', '2024-01-02', freq='H')
+        n = len(timestamps) * 2
+        weather = pd.DataFrame({
+            'timestamp': np.repeat(timestamps.values, 2),
+            'location_name': ['London', 'Paris'] * len(timestamps),
+            'temperature': rng.normal(15, 15, n),
+            'humidity': rng.uniform(20, 100, n),
+            'wind_speed': rng.exponential(15, n),
+            'precipitation': rng.exponential(3, n),
+            'pressure': rng.normal(1010, 15, n),
+            'source_name': 'test'
+        })
+        compact_weather = weather.astype({
+            'location_name': 'category', 'source_name': 'category', 'temperature': np.float32,
+            'humidity': np.float32, 'wind_speed': np.float32, 'precipitation': np.float32,
+            'pressure': np.float32
+        })
+
+        signals = {}
+        for compact, weather_data in ((False, weather), (True, compact_weather)):
+            config = BacktestConfig(
+                start_date=datetime(2024, 1, 1),
+                end_date=datetime(2024, 1, 2),
+                compact_dtypes=compact
+            )
+            loader = Mock(spec=BacktestingDataLoader)
+            loader.load_rollup_data.return_value = None
+            loader.load_market_data.return_value = sample_market_data
+            loader.load_weather_data.return_value = weather_data
+            loader.align_data_timeline.return_value = (sample_market_data, weather_data)
+
+            with patch('backtesting_framework.core.backtesting_engine.BacktestingDataLoader', return_value=loader), \
+                 patch('backtesting_framework.core.backtesting_engine.PerformanceMetrics'), \
+                 patch('backtesting_framework.core.backtesting_engine.RiskMetrics'):
+                result = BacktestingEngine(config).run_backtest(strategy_class())
+
+            signals[compact] = [(s.timestamp, s.market_id, s.outcome_name, s.signal_type)
+                                for s in result.signals]
+
+        assert signals[True] == signals[False]
+
+
+class HistoryRecordingStrategy(BaseWeatherStrategy):
+    """Records the weather window it sees on every tick"""
+
+    def __init__(self, lookback: int):
+        super().__init__("HistoryRecordingStrategy")
+        self.lookback = lookback
+        self.windows = []
+
+    def required_history(self) -> int:
+        return self.lookback
+
+    def generate_signals(self, market_data, weather_data, current_positions):
+        if weather_data.empty:
+            return []
+
+        for location, location_data in weather_data.groupby('location_name'):
+            window = self.weather_window(location, location_data, self.lookback)
+            self.windows.append((location, window['temperature'].tolist()))
+        return []
+
+
+class TestStrategyHistory:
+    """Test cases for the rolling history attached to strategies"""
+
+    def test_windows_match_full_history(self, sample_config, sample_market_data):
+        """Each tick's window equals the tail of the history up to that tick"""
+        timestamps = pd.date_range('2024-01-01', periods=10, freq='H')
+        weather = pd.DataFrame({
+            'timestamp': np.repeat(timestamps.values, 2),
+            'location_name': ['London', 'Paris'] * len(timestamps),
+            'temperature': np.arange(20, dtype=float),
+            'humidity': 50.0
+        })
+
+        with patch('backtesting_framework.core.backtesting_engine.BacktestingDataLoader'), \
+             patch('backtesting_framework.core.backtesting_engine.PerformanceMetrics'), \
+             patch('backtesting_framework.core.backtesting_engine.RiskMetrics'):
+            engine = BacktestingEngine(sample_config)
+            strategy = HistoryRecordingStrategy(lookback=4)
+            engine.run_prepared_backtest(strategy, sample_market_data, weather)
+
+        expected = []
+        for ts in timestamps:
+            seen = weather[weather['timestamp'] <= ts]
+            for location, rows in seen[seen['timestamp'] == ts].groupby('location_name'):
+                history = seen[seen['location_name'] == location]
+                expected.append((location, history['temperature'].tail(4).tolist()))
+
+        assert strategy.windows == expected
+        assert strategy.history.weather('London').capacity == 4
+
+    def test_no_history_by_default(self, sample_config):
+        """Strategies that declare no lookback get no buffers"""
+        with patch('backtesting_framework.core.backtesting_engine.BacktestingDataLoader'), \
+             patch('backtesting_framework.core.backtesting_engine.PerformanceMetrics'), \
+             patch('backtesting_framework.core.backtesting_engine.RiskMetrics'):
+            engine = BacktestingEngine(sample_config)
+            state = engine._init_simulation_state(TemperatureThresholdStrategy(parameters={'lookback_period': 0}))
+
+        assert state.history is None
+
+
+class BatchTradingStrategy(BaseWeatherStrategy):
+    """Buys on warm readings and sells on cold ones, per tick or in one batch"""
+
+    def __init__(self, batch: bool = True):
+        super().__init__("BatchTradingStrategy")
+        self.batch = batch
+
+    def _signal_type(self, temperature):
+        if temperature > 20:
+            return 'BUY'
+        if temperature < 5:
+            return 'SELL'
+        return None
+
+    def generate_signals(self, market_data, weather_data, current_positions):
+        if weather_data.empty:
+            return []
+
+        signals = []
+        for location, rows in weather_data.groupby('location_name'):
+            signal_type = self._signal_type(rows['temperature'].iloc[-1])
+            if signal_type:
+                outcome = 'Yes' if location == 'London' else 'No'
+                signals.append(TradingSignal(rows['timestamp'].iloc[-1], 'market1', outcome, signal_type,
+                                             0.8, quantity=2.0 if outcome == 'Yes' else None))
+        return signals
+
+    def generate_signals_batch(self, market_data, weather_data):
+        if not self.batch:
+            return None
+
+        rows = weather_data.sort_values(['timestamp', 'location_name'], kind='mergesort')
+        signal_type = np.select([rows['temperature'] > 20, rows['temperature'] < 5], ['BUY', 'SELL'], '')
+        rows = rows[signal_type != '']
+        outcome = np.where(rows['location_name'] == 'London', 'Yes', 'No')
+        return signal_frame(rows['timestamp'], 'market1', outcome, signal_type[signal_type != ''], 0.8,
+                            quantity=np.where(outcome == 'Yes', 2.0, np.nan))
+
+
+def _signal_weather(seed=5, hours=48):
+    rng = np.random.default_rng(seed)
+    timestamps = pd.date_range('2024-01-01', periods=hours, freq='H')
+    n = len(timestamps) * 2
+    return pd.DataFrame({
+        'timestamp': np.repeat(timestamps.values, 2),
+        'location_name': ['Paris', 'London'] * len(timestamps),
+        'temperature': rng.normal(12, 12, n),
+        'humidity': rng.uniform(20, 100, n),
+        'wind_speed': rng.exponential(12, n),
+        'precipitation': rng.exponential(2, n) * (rng.random(n) < 0.5),
+        'source_name': 'test'
+    })
+
+
+def _signal_markets(weather):
+    """Prices for every market the example and test strategies trade"""
+    outcomes = [('market1', 'Yes'), ('market1', 'No'),
+                ('temperature_market', 'above_normal'), ('temperature_market', 'below_normal'),
+                ('precipitation_market', 'heavy_rain'), ('precipitation_market', 'drought'),
+                ('wind_market', 'high_winds'), ('wind_market', 'calm_winds')]
+    timestamps = weather['timestamp'].unique()
+    rng = np.random.default_rng(9)
+    return pd.DataFrame([
+        {'timestamp': ts, 'market_id': market_id, 'outcome_name': outcome,
+         'probability': rng.uniform(0.05, 0.95), 'volume': 100.0, 'event_title': market_id}
+        for ts in timestamps[::2] for market_id, outcome in outcomes
+    ])
+
+
+class TestBatchSignals:
+    """Batch-generated signals give the same backtest as the per-tick loop"""
+
+    def _run_both(self, sample_config, make_strategy, market, weather):
+        results = {}
+        for batch in (True, False):
+            sample_config.batch_signals = batch
+            with patch('backtesting_framework.core.backtesting_engine.BacktestingDataLoader'), \
+                 patch('backtesting_framework.core.backtesting_engine.PerformanceMetrics'), \
+                 patch('backtesting_framework.core.backtesting_engine.RiskMetrics'):
+                engine = BacktestingEngine(sample_config)
+                strategy = make_strategy()
+                results[batch] = (engine.run_prepared_backtest(strategy, market, weather), strategy)
+        return results
+
+    def _assert_same_backtest(self, results):
+        (batch, batch_strategy), (loop, loop_strategy) = results[True], results[False]
+
+        def signal_tuples(signals):
+            return [(s.timestamp, s.market_id, s.outcome_name, s.signal_type, pytest.approx(s.confidence),
+                     s.quantity, s.reasoning) for s in signals]
+
+        def position_tuples(positions):
+            return [(p.market_id, p.outcome_name, p.quantity, p.entry_price, p.entry_time,
+                     p.exit_price, p.exit_time, p.pnl, p.status) for p in positions]
+
+        assert signal_tuples(batch.signals) == signal_tuples(loop.signals)
+        assert position_tuples(batch.positions) == position_tuples(loop.positions)
+        assert [t for t, _ in batch.equity_curve] == [t for t, _ in loop.equity_curve]
+        assert [v for _, v in batch.equity_curve] == pytest.approx([v for _, v in loop.equity_curve])
+        assert signal_tuples(batch_strategy.signals_history) == signal_tuples(loop_strategy.signals_history)
+        assert batch_strategy.position_book.realized_pnl == pytest.approx(loop_strategy.position_book.realized_pnl)
+
+    @pytest.mark.parametrize('compact', [False, True])
+    @pytest.mark.parametrize('make_strategy', [
+        lambda: TemperatureThresholdStrategy(parameters={'hot_threshold': 20.0, 'cold_threshold': 5.0,
+                                                         'lookback_period': 6, 'signal_strength_threshold': 0.5}),
+        lambda: PrecipitationStrategy(parameters={'rain_threshold': 3.0, 'lookback_period': 3,
+                                                  'signal_strength_threshold': 0.5}),
+        lambda: WindSpeedStrategy(parameters={'high_wind_threshold': 15.0, 'low_wind_threshold': 4.0,
+                                              'signal_strength_threshold': 0.5})
+    ], ids=['temperature', 'precipitation', 'wind'])
+    def test_threshold_strategies_match_loop(self, sample_config, make_strategy, compact):
+        weather = _signal_weather()
+        if compact:
+            weather = weather.astype({'location_name': 'category', 'temperature': np.float32,
+                                      'wind_speed': np.float32, 'precipitation': np.float32})
+        market = _signal_markets(weather)
+
+        results = self._run_both(sample_config, make_strategy, market, weather)
+
+        self._assert_same_backtest(results)
+        assert results[True][0].signals
+        assert results[True][0].positions
+
+    def test_buy_and_sell_fills_match_loop(self, sample_config):
+        """Positions close on later SELLs at that tick's price, and capital follows"""
+        weather = _signal_weather(seed=2, hours=72)
+        weather.loc[weather.index[-4:], 'temperature'] = 25.0  # leaves positions open at the end
+        market = _signal_markets(weather)
+
+        results = self._run_both(sample_config, BatchTradingStrategy, market, weather)
+
+        self._assert_same_backtest(results)
+        result = results[True][0]
+        assert any(p.status == 'CLOSED' for p in result.positions)
+        assert any(p.status == 'OPEN' for p in result.positions)
+        assert result.equity_curve[-1][1] != sample_config.initial_capital
+
+    def test_strategies_without_batch_run_per_tick(self, sample_config, sample_market_data, sample_weather_data):
+        with patch('backtesting_framework.core.backtesting_engine.BacktestingDataLoader'), \
+             patch('backtesting_framework.core.backtesting_engine.PerformanceMetrics'), \
+             patch('backtesting_framework.core.backtesting_engine.RiskMetrics'):
+            engine = BacktestingEngine(sample_config)
+            strategy = BatchTradingStrategy(batch=False)
+            with patch.object(engine, '_simulate_window', wraps=engine._simulate_window) as per_tick:
+                engine.run_prepared_backtest(strategy, sample_market_data, sample_weather_data)
+
+        per_tick.assert_called_once()
+
+
+class FailingStrategy(BaseWeatherStrategy):
+    """Raises once it has seen a few ticks"""
+
+    def __init__(self):
+        super().__init__("FailingStrategy")
+        self.tick = 0
+
+    def generate_signals(self, market_data, weather_data, current_positions):
+        self.tick += 1
+        if self.tick > 3:
+            raise RuntimeError("strategy failure")
+        return []
+
+
+def _shared_pass_strategies():
+    """Strategies covering history, indicators, climatology, batch signals and plain per-tick loops"""
+    return [
+        RecordingStrategy(),
+        TemperatureThresholdStrategy(parameters={'hot_threshold': 20.0, 'cold_threshold': 5.0,
+                                                 'lookback_period': 6, 'signal_strength_threshold': 0.5}),
+        BatchTradingStrategy(),
+        BatchTradingStrategy(batch=False),
+        WeatherPatternStrategy(parameters={'pattern_lookback': 12, 'signal_strength_threshold': 0.0}),
+        SeasonalWeatherStrategy(parameters={'seasonal_lookback': 24, 'signal_strength_threshold': 0.0})
+    ]
+
+
+class TestSharedPass:
+    """Multiple strategies backtested in one pass over shared data"""
+
+    def _engine(self, config, loader=None):
+        with patch('backtesting_framework.core.backtesting_engine.BacktestingDataLoader', return_value=loader), \
+             patch('backtesting_framework.core.backtesting_engine.PerformanceMetrics'), \
+             patch('backtesting_framework.core.backtesting_engine.RiskMetrics'):
+            return BacktestingEngine(config)
+
+    def _summary(self, result):
+        return (
+            result.strategy_name,
+            [(s.timestamp, s.market_id, s.outcome_name, s.signal_type, s.confidence) for s in result.signals],
+            [(p.market_id, p.outcome_name, p.entry_price, p.entry_time, p.exit_price, p.pnl, p.status)
+             for p in result.positions],
+            result.equity_curve
+        )
+
+    def test_matches_separate_backtests(self, sample_config):
+        weather = _signal_weather(seed=2, hours=72)
+        market = _signal_markets(weather)
+        engine = self._engine(sample_config)
+
+        separate = [engine.run_prepared_backtest(strategy, market, weather)
+                    for strategy in _shared_pass_strategies()]
+        with patch.object(engine, '_simulate_shared_window',
+                          wraps=engine._simulate_shared_window) as walk:
+            shared = engine.run_prepared_strategies(_shared_pass_strategies(), market, weather)
+
+        walk.assert_called_once()
+        assert [self._summary(r) for r in shared] == [self._summary(r) for r in separate]
+        assert sum(len(r.positions) for r in shared) > 0
+
+    def test_failing_strategy_is_dropped(self, sample_config, sample_market_data, sample_weather_data):
+        engine = self._engine(sample_config)
+        strategies = [RecordingStrategy('first'), FailingStrategy(), RecordingStrategy('second')]
+
+        results = engine.run_prepared_strategies(strategies, sample_market_data, sample_weather_data)
+
+        assert [r.strategy_name for r in results] == ['first', 'second']
+        # The others keep walking the timeline after the failure
+        assert strategies[1].tick == 4
+        assert len(strategies[0].seen) == len(strategies[2].seen) > 4
+        assert all(strategy.prices is None for strategy in (strategies[0], strategies[2]))
+
+    @pytest.mark.parametrize('shared', [False, True])
+    def test_direct_calls_after_run(self, sample_config, shared):
+        """After a backtest, direct calls recompute over frames instead of reading the run's indicators"""
+        weather = _signal_weather(seed=8, hours=72)
+        seasonal = pd.DataFrame([
+            {'timestamp': ts, 'market_id': 'seasonal_market', 'outcome_name': outcome, 'probability': 0.5,
+             'volume': 100.0, 'event_title': 'seasonal_market'}
+            for ts in weather['timestamp'].unique()
+            for outcome in ('warmer_than_seasonal', 'colder_than_seasonal', 'wetter_than_seasonal')
+        ])
+        market = pd.concat([_signal_markets(weather), seasonal], ignore_index=True)
+
+        def make_strategies():
+            return [TemperatureThresholdStrategy(parameters={'hot_threshold': 20.0, 'cold_threshold': 5.0,
+                                                             'lookback_period': 6,
+                                                             'signal_strength_threshold': 0.5}),
+                    SeasonalWeatherStrategy(parameters={'seasonal_lookback': 24, 'deviation_threshold': 1.0,
+                                                        'signal_strength_threshold': 0.0})]
+
+        def signals(strategy):
+            return [(s.market_id, s.outcome_name, s.signal_type, pytest.approx(s.confidence))
+                    for s in strategy.generate_signals(market, weather, [])]
+
+        engine = self._engine(sample_config)
+        strategies = make_strategies()
+        if shared:
+            engine.run_prepared_strategies(strategies, market, weather)
+        else:
+            for strategy in strategies:
+                engine.run_prepared_backtest(strategy, market, weather)
+
+        temperature, seasonal_strategy = strategies
+        assert not temperature.indicators.active
+        assert not seasonal_strategy.indicators.active and not seasonal_strategy.climatology.active
+        for strategy, fresh in zip(strategies, make_strategies()):
+            expected = signals(fresh)
+            assert expected
+            assert signals(strategy) == expected
+
+    def test_run_multiple_strategies_loads_once(self, sample_config, mock_data_loader):
+        engine = self._engine(sample_config, mock_data_loader)
+        strategies = [RecordingStrategy('first'), RecordingStrategy('second'), RecordingStrategy('third')]
+
+        with patch.object(engine, 'run_backtest') as run_backtest:
+            results = engine.run_multiple_strategies(strategies)
+
+        run_backtest.assert_not_called()
+        mock_data_loader.load_market_data.assert_called_once()
+        mock_data_loader.align_data_timeline.assert_called_once()
+        assert [r.strategy_name for r in results] == ['first', 'second', 'third']
+
+    def test_shared_pass_disabled(self, sample_config, mock_data_loader):
+        sample_config.shared_pass = False
+        engine = self._engine(sample_config, mock_data_loader)
+
+        with patch.object(engine, '_run_shared_backtests') as shared:
+            results = engine.run_multiple_strategies([RecordingStrategy('first'), RecordingStrategy('second')])
+
+        shared.assert_not_called()
+        assert len(results) == 2
+
+    def test_streaming_shared_pass(self, sub_hour_db):
+        config = BacktestConfig(start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 2),
+                                stream_chunk_size=5)
+        engine = self._engine(config, BacktestingDataLoader(sub_hour_db))
+
+        separate = [engine.run_backtest(RecordingStrategy(name)) for name in ('first', 'second')]
+        shared = engine.run_multiple_strategies([RecordingStrategy('first'), RecordingStrategy('second')])
+
+        assert [self._summary(r) for r in shared] == [self._summary(r) for r in separate]
+
+
+class TestPeriodSlicing:
+    """Test cases for period slicing and stitching of backtests"""
+
+    def _engine(self):
+        config = BacktestConfig(start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 2))
+        with patch('backtesting_framework.core.backtesting_engine.BacktestingDataLoader'), \
+             patch('backtesting_framework.core.backtesting_engine.PerformanceMetrics'), \
+             patch('backtesting_framework.core.backtesting_engine.RiskMetrics'):
+            return BacktestingEngine(config)
+
+    def test_positional_slices(self, sample_market_data, sample_weather_data):
+        """Periods slice both frames by offsets into the shared timeline"""
+        periods = PeriodSlicer(sample_market_data.sample(frac=1.0, random_state=3), sample_weather_data)
+
+        assert len(periods) == 25
+        assert periods.locate(pd.Timestamp('2024-01-01 05:30')) == 6
+        assert periods.dates(2, 6) == (pd.Timestamp('2024-01-01 02:00'), pd.Timestamp('2024-01-01 05:00'))
+
+        market, weather = periods.slice(2, 6)
+        assert market['timestamp'].is_monotonic_increasing
+        assert len(market) == 8 and len(weather) == 4
+        assert weather['timestamp'].min() == pd.Timestamp('2024-01-01 02:00')
+
+    def test_slices_combine_to_full_run(self, sample_market_data, sample_weather_data):
+        """Slicing a backtest into consecutive periods and stitching them back keeps its P&L"""
+        engine = self._engine()
+        full = engine.run_prepared_backtest(RecordingStrategy(), sample_market_data, sample_weather_data)
+
+        split = datetime(2024, 1, 1, 12)
+        first = engine.slice_result(full, datetime(2024, 1, 1), datetime(2024, 1, 1, 11))
+        second = engine.slice_result(full, split, datetime(2024, 1, 2))
+        assert first.equity_curve[0][1] == second.equity_curve[0][1] == engine.config.initial_capital
+        assert second.start_date == split
+
+        combined = engine.combine_results([first, second])
+        assert combined.equity_curve[-1][1] == pytest.approx(full.equity_curve[-1][1])
+        assert combined.total_return == pytest.approx(full.total_return)
+        assert len(combined.signals) == len(full.signals)
+
+    def test_resumed_backtests_match_single_runs(self, sample_market_data, sample_weather_data):
+        """Advancing in steps continues each backtest exactly where it stopped"""
+        engine = self._engine()
+        periods = PeriodSlicer(sample_market_data, sample_weather_data)
+        backtests = engine.start_backtests([RecordingStrategy(), RecordingStrategy('Stopped')], periods)
+
+        backtests.advance(7)
+        prefix = engine.with_period(*periods.dates(0, 7)).run_prepared_backtest(
+            RecordingStrategy(), *periods.slice(0, 7))
+        assert [r.equity_curve for r in backtests.results()] == [prefix.equity_curve] * 2
+
+        backtests.stop([1])
+        backtests.advance(16)
+        backtests.advance(len(periods))
+        results = backtests.results()
+
+        full = engine.run_prepared_backtest(RecordingStrategy(), sample_market_data, sample_weather_data)
+        assert backtests.running == [0]
+        assert results[1] is None
+        assert results[0].equity_curve == full.equity_curve
+        assert results[0].total_trades == full.total_trades
+        assert backtests.simulated_ticks == 2 * 7 + (len(periods) - 7)
+
+
+class InterruptedStrategy(RecordingStrategy):
+    """Recording strategy whose process dies at a given tick, as on a restart"""
+
+    # Class attributes, so a restored checkpoint doesn't carry them over
+    interrupt_at = None
+    calls = 0
+
+    def generate_signals(self, market_data, weather_data, current_positions):
+        InterruptedStrategy.calls += 1
+        if self.tick + 1 == InterruptedStrategy.interrupt_at:
+            raise RuntimeError("process killed")
+        return super().generate_signals(market_data, weather_data, current_positions)
+
+
+class TestCheckpoints:
+    """Backtests resumed from periodic checkpoints"""
+
+    @pytest.fixture(autouse=True)
+    def reset_interrupts(self):
+        yield
+        InterruptedStrategy.interrupt_at = None
+        InterruptedStrategy.calls = 0
+
+    def _engine(self, config, db_path=None):
+        # Prepared-data backtests don't need a database
+        loader = (nullcontext() if db_path is not None
+                  else patch('backtesting_framework.core.backtesting_engine.BacktestingDataLoader'))
+        with loader, patch('backtesting_framework.core.backtesting_engine.PerformanceMetrics'), \
+             patch('backtesting_framework.core.backtesting_engine.RiskMetrics'):
+            return BacktestingEngine(config, db_path=db_path or "data/climatetrade.db")
+
+    def _summary(self, result):
+        return result.equity_curve, result.signals, result.positions
+
+    def _interrupt_and_resume(self, run, interrupt_at):
+        InterruptedStrategy.interrupt_at = interrupt_at
+        with pytest.raises(RuntimeError, match="process killed"):
+            run(InterruptedStrategy())
+
+        InterruptedStrategy.interrupt_at = None
+        InterruptedStrategy.calls = 0
+        strategy = InterruptedStrategy()
+        return run(strategy), strategy
+
+    def test_resume_matches_uninterrupted(self, sample_config, sample_market_data, sample_weather_data, tmp_path):
+        expected = self._engine(sample_config).run_prepared_backtest(
+            RecordingStrategy(), sample_market_data, sample_weather_data)
+
+        sample_config.checkpoint_dir = str(tmp_path / 'checkpoints')
+        sample_config.checkpoint_interval = 4
+        engine = self._engine(sample_config)
+        result, strategy = self._interrupt_and_resume(
+            lambda s: engine.run_prepared_backtest(s, sample_market_data, sample_weather_data), 11)
+
+        assert self._summary(result) == self._summary(expected)
+        # Ticks up to the checkpoint after tick 8 were restored, not simulated again
+        assert InterruptedStrategy.calls == len(strategy.seen) - 8
+        assert strategy.tick == len(strategy.seen) == len(sample_weather_data['timestamp'].unique())
+        assert strategy.prices is None
+        assert list((tmp_path / 'checkpoints').iterdir()) == []
+
+    def test_streaming_resume(self, sub_hour_db, tmp_path):
+        config = BacktestConfig(start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 2),
+                                stream_chunk_size=5)
+        expected = self._engine(config, sub_hour_db).run_backtest(RecordingStrategy())
+
+        config.checkpoint_dir = str(tmp_path / 'checkpoints')
+        config.checkpoint_interval = 3
+        engine = self._engine(config, sub_hour_db)
+        result, strategy = self._interrupt_and_resume(engine.run_backtest, 8)
+
+        assert self._summary(result) == self._summary(expected)
+        assert InterruptedStrategy.calls == 12 - 6
+        assert list((tmp_path / 'checkpoints').iterdir()) == []
+
+    def test_checkpoints_are_per_backtest(self, sample_config, sample_market_data, sample_weather_data, tmp_path):
+        sample_config.checkpoint_dir = str(tmp_path / 'checkpoints')
+        sample_config.checkpoint_interval = 4
+        engine = self._engine(sample_config)
+
+        InterruptedStrategy.interrupt_at = 11
+        with pytest.raises(RuntimeError):
+            engine.run_prepared_backtest(InterruptedStrategy(parameters={'threshold': 1}),
+                                         sample_market_data, sample_weather_data)
+        assert len(list((tmp_path / 'checkpoints').iterdir())) == 1
+
+        # Other parameters or another period start from the beginning
+        InterruptedStrategy.interrupt_at = None
+        InterruptedStrategy.calls = 0
+        engine.run_prepared_backtest(InterruptedStrategy(parameters={'threshold': 2}),
+                                     sample_market_data, sample_weather_data)
+        engine.with_period(datetime(2024, 1, 1), datetime(2024, 1, 15)).run_prepared_backtest(
+            InterruptedStrategy(parameters={'threshold': 1}), sample_market_data, sample_weather_data)
+        assert InterruptedStrategy.calls == 2 * len(sample_weather_data['timestamp'].unique())
+        assert len(list((tmp_path / 'checkpoints').iterdir())) == 1
+
+
 class TestBacktestConfig:
     """Test cases for BacktestConfig"""
 
@@ -377,6 +1240,13 @@ class TestBacktestConfig:
         assert config.data_frequency == 'H'
         assert config.enable_parallel == False
         assert config.risk_free_rate == 0.02
+        assert config.simulation_mode == 'grouped'
+        assert config.data_cache_size == 4
+        assert config.stream_chunk_size == 0
+        assert config.compact_dtypes == False
+        assert config.shared_pass == True
+        assert config.checkpoint_dir is None
+        assert config.checkpoint_interval == 1000
 
 
 class TestBacktestResult:
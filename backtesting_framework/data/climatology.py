@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Climatology Index for Seasonal Strategies
+
+Day-of-year and hour-of-day normals (mean and standard deviation) of
+temperature and precipitation per location. The index is persisted in
+SQLite as mergeable per-cell moments (count, mean and sum of squared
+deviations per location, year, day of year and hour of day), folded in
+incrementally by rowid high-water mark like the rollups, and held in memory
+as running moments that the backtesting engine updates tick by tick so
+lookups are O(1).
+
+Days of year are numbered as in a leap year, so a calendar date maps to the
+same day in every year (Feb 29 is day 60, Mar 1 always day 61).
+"""
+
+import copy
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional
+
+import numpy as np
+import pandas as pd
+import logging
+
+logger = logging.getLogger(__name__)
+
+CLIMATOLOGY_VARIABLES = ('temperature', 'precipitation')
+
+CLIMATOLOGY_TABLE = 'climatology_cells'
+CLIMATOLOGY_STATE_TABLE = 'climatology_state'
+
+CLIMATOLOGY_QUERY = """
+    SELECT rowid AS row_key, timestamp, location_name, temperature, precipitation
+    FROM weather_data
+    WHERE rowid > ? AND rowid <= ?
+    ORDER BY rowid
+"""
+
+
+@dataclass
+class ClimateNormal:
+    """Seasonal normal of a variable"""
+    count: int
+    mean: float
+    std: float  # sample standard deviation, NaN below two observations
+
+
+def day_of_year(timestamps: pd.DatetimeIndex) -> np.ndarray:
+    """Leap-year day of year (1-366) of each timestamp"""
+    days = np.asarray(timestamps.dayofyear)
+    # Shift dates after February in common years past the Feb 29 slot
+    return days + ((~np.asarray(timestamps.is_leap_year)) & (np.asarray(timestamps.month) > 2))
+
+
+def _timestamp_index(timestamps) -> pd.DatetimeIndex:
+    return pd.DatetimeIndex(pd.to_datetime(timestamps))
+
+
+def _merge(state: List[float], count: float, mean: float, m2: float):
+    """Fold (count, mean, m2) moments into state in place (Chan et al.)"""
+    if count <= 0:
+        return
+    total = state[0] + count
+    delta = mean - state[1]
+    state[1] += delta * count / total
+    state[2] += m2 + delta * delta * state[0] * count / total
+    state[0] = total
+
+
+class ClimatologyIndex:
+    """
+    In-memory climatology normals per location
+
+    Holds running moments per (location, variable, day of year) and
+    (location, variable, hour of day). update() folds in observations one
+    tick at a time; reset() returns the index to its baseline (empty, or
+    whatever was loaded from the database), which the backtesting engine
+    does before each run, and detach() drops the run's state afterwards.
+    """
+
+    GRANULARITIES = ('day', 'hour')
+
+    def __init__(self, variables=CLIMATOLOGY_VARIABLES):
+        self.variables = tuple(variables)
+        self._moments: Dict[Hashable, List[float]] = {}
+        self._day_rows: Dict[Hashable, int] = {}
+        self._observations: Dict[str, int] = {}
+        self._baseline = None
+        self.active = False
+
+    def reset(self):
+        """Restore the baseline and start accepting updates"""
+        if self._baseline is None:
+            self._moments, self._day_rows, self._observations = {}, {}, {}
+        else:
+            self._moments, self._day_rows, self._observations = copy.deepcopy(self._baseline)
+        self.active = True
+
+    def detach(self):
+        """Drop what a run folded in and stop answering lookups; the baseline is kept for reset()"""
+        self._moments, self._day_rows, self._observations = {}, {}, {}
+        self.active = False
+
+    def mark_baseline(self):
+        """Make the current contents the state reset() restores"""
+        self._baseline = copy.deepcopy((self._moments, self._day_rows, self._observations))
+
+    def update(self, weather_rows: pd.DataFrame, group_col: str = 'location_name'):
+        """Fold weather rows into the normals"""
+        if weather_rows.empty or group_col not in weather_rows.columns or 'timestamp' not in weather_rows.columns:
+            return
+
+        timestamps = _timestamp_index(weather_rows['timestamp'])
+        days = day_of_year(timestamps).tolist()
+        hours = timestamps.hour.tolist()
+        values = {var: (weather_rows[var].to_numpy(dtype=np.float64, na_value=np.nan)
+                        if var in weather_rows.columns else np.full(len(weather_rows), np.nan))
+                  for var in self.variables}
+
+        for i, location in enumerate(weather_rows[group_col].tolist()):
+            day, hour = days[i], hours[i]
+            self._observations[location] = self._observations.get(location, 0) + 1
+            self._day_rows[(location, day)] = self._day_rows.get((location, day), 0) + 1
+
+            for var in self.variables:
+                value = values[var][i]
+                if np.isnan(value):
+                    continue
+                for key in ((location, var, 'day', day), (location, var, 'hour', hour)):
+                    state = self._moments.get(key)
+                    if state is None:
+                        state = self._moments[key] = [0, 0.0, 0.0]
+                    # Welford update of a single observation
+                    state[0] += 1
+                    delta = value - state[1]
+                    state[1] += delta / state[0]
+                    state[2] += delta * (value - state[1])
+
+    def add_cells(self, cells: pd.DataFrame):
+        """
+        Fold persisted cell moments into the normals
+
+        Args:
+            cells: Rows of the climatology_cells table
+        """
+        if cells.empty:
+            return
+
+        locations = cells.groupby('location_name')['row_count'].sum()
+        for location, rows in locations.items():
+            self._observations[location] = self._observations.get(location, 0) + int(rows)
+        for (location, day), rows in cells.groupby(['location_name', 'day_of_year'])['row_count'].sum().items():
+            self._day_rows[(location, day)] = self._day_rows.get((location, day), 0) + int(rows)
+
+        for var in self.variables:
+            for granularity, column in (('day', 'day_of_year'), ('hour', 'hour_of_day')):
+                combined = combine_moments(cells, ['location_name', column], var)
+                for (location, period), count, mean, m2 in zip(combined.index, combined['count'],
+                                                               combined['mean'], combined['m2']):
+                    key = (location, var, granularity, int(period))
+                    state = self._moments.get(key)
+                    if state is None:
+                        state = self._moments[key] = [0, 0.0, 0.0]
+                    _merge(state, count, mean, m2)
+
+    def normal(self,
+               location: str,
+               variable: str,
+               timestamp,
+               by: str = 'day') -> Optional[ClimateNormal]:
+        """
+        Normal of a variable for the day of year (or hour of day) of timestamp
+
+        Returns:
+            ClimateNormal, or None if no observations fall in that period
+        """
+        if by not in self.GRANULARITIES:
+            raise ValueError(f"by must be one of {self.GRANULARITIES}")
+
+        timestamp = pd.Timestamp(timestamp)
+        period = timestamp.hour if by == 'hour' else self._day_of_year(timestamp)
+        state = self._moments.get((location, variable, by, period))
+        if state is None or state[0] == 0:
+            return None
+
+        count, mean, m2 = state
+        std = float(np.sqrt(max(m2, 0.0) / (count - 1))) if count > 1 else np.nan
+        return ClimateNormal(int(count), float(mean), std)
+
+    def day_rows(self, location: str, timestamp) -> int:
+        """Observations (including missing values) on timestamp's calendar day"""
+        return self._day_rows.get((location, self._day_of_year(pd.Timestamp(timestamp))), 0)
+
+    def observations(self, location: str) -> int:
+        """Total observations folded in for a location"""
+        return self._observations.get(location, 0)
+
+    @staticmethod
+    def _day_of_year(timestamp: pd.Timestamp) -> int:
+        day = timestamp.dayofyear
+        return day + 1 if not timestamp.is_leap_year and timestamp.month > 2 else day
+
+
+def combine_moments(cells: pd.DataFrame, keys: List[str], variable: str) -> pd.DataFrame:
+    """Merge per-cell count/mean/m2 moments of a variable over the given keys"""
+    count = cells[f'{variable}__count']
+    mean = cells[f'{variable}__mean']
+    frame = pd.DataFrame({
+        'count': count,
+        'weighted': count * mean,
+        'm2': cells[f'{variable}__m2']
+    })
+    for key in keys:
+        frame[key] = cells[key]
+
+    grouped = frame.groupby(keys)
+    combined = grouped[['count', 'weighted', 'm2']].sum()
+    combined = combined[combined['count'] > 0]
+    combined['mean'] = combined['weighted'] / combined['count']
+
+    # Between-cell part of the sum of squared deviations
+    group_mean = frame.join(combined['mean'].rename('group_mean'), on=keys)['group_mean']
+    spread = (count * (mean - group_mean) ** 2).groupby([frame[k] for k in keys]).sum()
+    combined['m2'] = combined['m2'] + spread.reindex(combined.index).fillna(0.0)
+
+    return combined[['count', 'mean', 'm2']]
+
+
+def _state_columns() -> List[str]:
+    return [f'{var}__{part}' for var in CLIMATOLOGY_VARIABLES for part in ('count', 'mean', 'm2')]
+
+
+def _merge_sql() -> List[str]:
+    """SET clauses merging incoming moments (excluded.*) into the stored ones"""
+    clauses = ['row_count = row_count + excluded.row_count']
+    for var in CLIMATOLOGY_VARIABLES:
+        n, en = f'{var}__count', f'excluded.{var}__count'
+        mean, emean = f'{var}__mean', f'excluded.{var}__mean'
+        m2, em2 = f'{var}__m2', f'excluded.{var}__m2'
+        total = f'({n} + {en})'
+        # SQLite evaluates every expression against the row before the update
+        clauses += [
+            f'{n} = {total}',
+            f'{mean} = CASE WHEN {total} = 0 THEN 0 ELSE ({n} * {mean} + {en} * {emean}) / {total} END',
+            f'{m2} = {m2} + {em2} + CASE WHEN {total} = 0 THEN 0 '
+            f'ELSE ({emean} - {mean}) * ({emean} - {mean}) * {n} * {en} / {total} END'
+        ]
+    return clauses
+
+
+def ensure_climatology_tables(conn: sqlite3.Connection):
+    """Create the climatology cell table and its high-water mark table if missing"""
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {CLIMATOLOGY_STATE_TABLE} (
+            source TEXT PRIMARY KEY,
+            last_rowid INTEGER NOT NULL
+        )
+    """)
+
+    state_sql = ',\n'.join(
+        f"{name} {'INTEGER' if name.endswith('__count') else 'REAL'} NOT NULL DEFAULT 0"
+        for name in _state_columns()
+    )
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {CLIMATOLOGY_TABLE} (
+            location_name TEXT NOT NULL,
+            year INTEGER NOT NULL,
+            day_of_year INTEGER NOT NULL,
+            hour_of_day INTEGER NOT NULL,
+            row_count INTEGER NOT NULL DEFAULT 0,
+            {state_sql},
+            PRIMARY KEY (location_name, year, day_of_year, hour_of_day)
+        )
+    """)
+
+
+def compute_cells(rows: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per (location, year, day of year, hour of day) moments of raw weather rows
+
+    Timestamps are bucketed by their UTC calendar fields; naive timestamps
+    are taken as UTC.
+    """
+    df = rows.copy()
+    df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True)
+    df = df.dropna(subset=['timestamp', 'location_name'])
+    timestamps = pd.DatetimeIndex(df['timestamp'])
+
+    df['year'] = timestamps.year
+    df['day_of_year'] = day_of_year(timestamps)
+    df['hour_of_day'] = timestamps.hour
+
+    keys = ['location_name', 'year', 'day_of_year', 'hour_of_day']
+    grouped = df.groupby(keys)
+    cells = pd.DataFrame({'row_count': grouped.size()})
+    for var in CLIMATOLOGY_VARIABLES:
+        cells[f'{var}__count'] = grouped[var].count()
+        cells[f'{var}__mean'] = grouped[var].mean().fillna(0.0)
+        cells[f'{var}__m2'] = (grouped[var].var(ddof=0) * cells[f'{var}__count']).fillna(0.0)
+
+    return cells.reset_index()
+
+
+def _upsert_cells(conn: sqlite3.Connection, cells: pd.DataFrame):
+    if cells.empty:
+        return
+
+    columns = ['location_name', 'year', 'day_of_year', 'hour_of_day', 'row_count'] + _state_columns()
+    sql = f"""
+        INSERT INTO {CLIMATOLOGY_TABLE} ({', '.join(columns)})
+        VALUES ({', '.join('?' * len(columns))})
+        ON CONFLICT (location_name, year, day_of_year, hour_of_day) DO UPDATE SET
+            {', '.join(_merge_sql())}
+    """
+    conn.executemany(sql, cells[columns].astype(object).values.tolist())
+
+
+def refresh_climatology(db_path: str, batch_size: int = 200000) -> int:
+    """
+    Fold weather rows inserted since the last refresh into the climatology
+
+    Creates the tables on first use. Raw rows are tracked by rowid, so
+    updates or deletes of rows already folded in require
+    rebuild_climatology().
+
+    Returns:
+        Number of weather rows folded in
+    """
+    with sqlite3.connect(db_path) as conn:
+        ensure_climatology_tables(conn)
+
+        row = conn.execute(f"SELECT last_rowid FROM {CLIMATOLOGY_STATE_TABLE} WHERE source = 'weather_data'").fetchone()
+        last_rowid = row[0] if row else -1
+        max_rowid = conn.execute("SELECT COALESCE(MAX(rowid), -1) FROM weather_data").fetchone()[0]
+
+        folded = 0
+        for chunk in pd.read_sql_query(CLIMATOLOGY_QUERY, conn, params=[last_rowid, max_rowid],
+                                       chunksize=batch_size):
+            if chunk.empty:
+                continue
+            folded += len(chunk)
+            _upsert_cells(conn, compute_cells(chunk))
+
+        conn.execute(f"INSERT OR REPLACE INTO {CLIMATOLOGY_STATE_TABLE} (source, last_rowid) VALUES (?, ?)",
+                     ('weather_data', max_rowid))
+
+    if folded:
+        logger.info(f"Folded {folded} weather rows into the climatology index")
+    return folded
+
+
+def rebuild_climatology(db_path: str) -> int:
+    """Drop and rebuild the climatology from weather_data"""
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(f"DROP TABLE IF EXISTS {CLIMATOLOGY_TABLE}")
+        conn.execute(f"DROP TABLE IF EXISTS {CLIMATOLOGY_STATE_TABLE}")
+
+    return refresh_climatology(db_path)
+
+
+def load_climatology(db_path: str,
+                     locations: Optional[List[str]] = None,
+                     before_year: Optional[int] = None) -> ClimatologyIndex:
+    """
+    Load the persisted climatology as the baseline of a ClimatologyIndex
+
+    Args:
+        db_path: Database refreshed with refresh_climatology()
+        locations: Locations to load (all if None)
+        before_year: Only load years before this one, e.g. the first year
+            of a backtest, so the seed holds no data from the simulated period
+
+    Returns:
+        ClimatologyIndex whose reset() restores the loaded normals
+    """
+    query = f"SELECT * FROM {CLIMATOLOGY_TABLE} WHERE 1 = 1"
+    params: List = []
+    if locations:
+        query += f" AND location_name IN ({','.join('?' * len(locations))})"
+        params.extend(locations)
+    if before_year is not None:
+        query += " AND year < ?"
+        params.append(before_year)
+
+    index = ClimatologyIndex()
+    with sqlite3.connect(db_path) as conn:
+        ensure_climatology_tables(conn)
+        index.add_cells(pd.read_sql_query(query, conn, params=params))
+
+    index.mark_baseline()
+    return index
@@ -10,12 +10,63 @@ import sqlite3
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass
 import logging
 
+from .snapshot_store import SnapshotStore
+
 logger = logging.getLogger(__name__)
 
+MARKET_COLUMNS = "timestamp, market_id, outcome_name, probability, volume, event_title, scraped_at"
+
+WEATHER_COLUMNS = """
+    w.timestamp,
+    w.location_name,
+    w.latitude,
+    w.longitude,
+    w.temperature,
+    w.temperature_min,
+    w.temperature_max,
+    w.humidity,
+    w.wind_speed,
+    w.precipitation,
+    w.pressure,
+    w.weather_code,
+    w.weather_description,
+    s.source_name
+"""
+
+WEATHER_NUMERIC_COLUMNS = ['temperature', 'temperature_min', 'temperature_max',
+                           'humidity', 'wind_speed', 'precipitation', 'pressure']
+
+# Per-column aggregations used when aligning data to a common frequency
+MARKET_AGGREGATIONS = {
+    'probability': 'mean',
+    'volume': 'sum',
+    'outcome_name': 'first',
+    'event_title': 'first'
+}
+
+WEATHER_AGGREGATIONS = {
+    'temperature': 'mean',
+    'temperature_min': 'min',
+    'temperature_max': 'max',
+    'humidity': 'mean',
+    'wind_speed': 'mean',
+    'precipitation': 'sum',
+    'pressure': 'mean',
+    'weather_code': 'first',
+    'source_name': 'first'
+}
+
+# Column dtypes used in compact mode
+MARKET_CATEGORY_COLUMNS = ['market_id', 'outcome_name', 'event_title']
+MARKET_FLOAT32_COLUMNS = ['probability']
+
+WEATHER_CATEGORY_COLUMNS = ['location_name', 'weather_description', 'source_name']
+WEATHER_FLOAT32_COLUMNS = ['latitude', 'longitude'] + WEATHER_NUMERIC_COLUMNS
+
 
 @dataclass
 class MarketData:
@@ -46,9 +97,28 @@ class WeatherData:
 class BacktestingDataLoader:
     """Loads and preprocesses data for backtesting"""
 
-    def __init__(self, db_path: str = "data/climatetrade.db"):
+    def __init__(self,
+                 db_path: str = "data/climatetrade.db",
+                 compact: bool = False,
+                 snapshot_dir: Optional[str] = None,
+                 validate_connection: bool = True):
+        """
+        Args:
+            db_path: Path to the ClimateTrade SQLite database
+            compact: Return identifiers as categoricals and measures as float32
+            snapshot_dir: Serve loads from a Parquet snapshot kept in this directory
+            validate_connection: Check the database has the required tables
+        """
         self.db_path = db_path
-        self._validate_db_connection()
+        self.compact = compact
+        self.memory_report: Dict[str, Dict[str, int]] = {}
+        if validate_connection:
+            self._validate_db_connection()
+
+        self.snapshot: Optional[SnapshotStore] = None
+        if snapshot_dir:
+            self.snapshot = SnapshotStore(db_path, snapshot_dir)
+            self.snapshot.refresh()
 
     def _validate_db_connection(self):
         """Validate database connection"""
@@ -79,19 +149,63 @@ class BacktestingDataLoader:
         Returns:
             DataFrame with market data
         """
-        query = """
-        SELECT
-            timestamp,
-            market_id,
-            outcome_name,
-            probability,
-            volume,
-            event_title,
-            scraped_at
+        if self.snapshot and self.snapshot.has_table('polymarket_data'):
+            df = self.snapshot.load('polymarket_data', market_ids, start_date, end_date)
+        else:
+            where_sql, params = self._market_filters(market_ids, start_date, end_date)
+            query = f"SELECT {MARKET_COLUMNS} FROM polymarket_data WHERE 1=1{where_sql} ORDER BY timestamp ASC"
+
+            with sqlite3.connect(self.db_path) as conn:
+                df = pd.read_sql_query(query, conn, params=params)
+
+        df = self._prepare_market_frame(df)
+        if self.compact:
+            df = self._compact('market', df, MARKET_CATEGORY_COLUMNS, MARKET_FLOAT32_COLUMNS)
+
+        logger.info(f"Loaded {len(df)} market data records")
+        return df
+
+    def iter_market_data(self,
+                         market_ids: Optional[List[str]] = None,
+                         start_date: Optional[datetime] = None,
+                         end_date: Optional[datetime] = None,
+                         chunk_size: int = 100000) -> Iterator[pd.DataFrame]:
+        """
+        Stream market data in time-ordered chunks
+
+        Pages through polymarket_data with keyset pagination on
+        (timestamp, rowid), so each query is an index range scan and memory
+        is bounded by chunk_size. Every chunk contains all rows of the
+        timestamps it covers; a timestamp is never split across chunks.
+
+        Args:
+            market_ids: List of market IDs to load (None for all)
+            start_date: Start date for data range
+            end_date: End date for data range
+            chunk_size: Rows fetched per page
+
+        Yields:
+            DataFrames with the same columns as load_market_data
+        """
+        where_sql, params = self._market_filters(market_ids, start_date, end_date)
+        query = f"""
+        SELECT rowid AS row_key, {MARKET_COLUMNS}
         FROM polymarket_data
-        WHERE 1=1
+        WHERE 1=1{where_sql}
+          AND (timestamp > ? OR (timestamp = ? AND rowid > ?))
+        ORDER BY timestamp ASC, rowid ASC
+        LIMIT ?
         """
 
+        for chunk in self._iter_keyset_chunks(query, params, chunk_size):
+            yield self._prepare_market_frame(chunk)
+
+    def _market_filters(self,
+                        market_ids: Optional[List[str]],
+                        start_date: Optional[datetime],
+                        end_date: Optional[datetime]) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause shared by market data queries"""
+        query = ""
         params = []
 
         if market_ids:
@@ -107,11 +221,10 @@ class BacktestingDataLoader:
             query += " AND timestamp <= ?"
             params.append(end_date.isoformat())
 
-        query += " ORDER BY timestamp ASC"
-
-        with sqlite3.connect(self.db_path) as conn:
-            df = pd.read_sql_query(query, conn, params=params)
+        return query, params
 
+    def _prepare_market_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert types and fill missing values in raw market rows"""
         # Convert timestamp to datetime
         df['timestamp'] = pd.to_datetime(df['timestamp'])
         df['scraped_at'] = pd.to_datetime(df['scraped_at'])
@@ -120,7 +233,6 @@ class BacktestingDataLoader:
         df['probability'] = df['probability'].fillna(0.5)  # Default to 50%
         df['volume'] = df['volume'].fillna(0.0)
 
-        logger.info(f"Loaded {len(df)} market data records")
         return df
 
     def load_weather_data(self,
@@ -140,27 +252,89 @@ class BacktestingDataLoader:
         Returns:
             DataFrame with weather data
         """
-        query = """
-        SELECT
-            w.timestamp,
-            w.location_name,
-            w.latitude,
-            w.longitude,
-            w.temperature,
-            w.temperature_min,
-            w.temperature_max,
-            w.humidity,
-            w.wind_speed,
-            w.precipitation,
-            w.pressure,
-            w.weather_code,
-            w.weather_description,
-            s.source_name
+        if self.snapshot and self.snapshot.has_table('weather_data'):
+            df = self.snapshot.load('weather_data', locations, start_date, end_date,
+                                    filters={'source_name': sources} if sources else None)
+        else:
+            where_sql, params = self._weather_filters(locations, start_date, end_date, sources)
+            query = f"""
+            SELECT {WEATHER_COLUMNS}
+            FROM weather_data w
+            JOIN weather_sources s ON w.source_id = s.id
+            WHERE 1=1{where_sql}
+            ORDER BY w.timestamp ASC
+            """
+
+            with sqlite3.connect(self.db_path) as conn:
+                df = pd.read_sql_query(query, conn, params=params)
+
+        # Convert timestamp to datetime
+        df['timestamp'] = pd.to_datetime(df['timestamp'])
+
+        # Fill missing numeric values with forward/backward fill
+        df[WEATHER_NUMERIC_COLUMNS] = df[WEATHER_NUMERIC_COLUMNS].fillna(method='ffill').fillna(method='bfill')
+
+        if self.compact:
+            df = self._compact('weather', df, WEATHER_CATEGORY_COLUMNS, WEATHER_FLOAT32_COLUMNS)
+
+        logger.info(f"Loaded {len(df)} weather data records")
+        return df
+
+    def iter_weather_data(self,
+                          locations: Optional[List[str]] = None,
+                          start_date: Optional[datetime] = None,
+                          end_date: Optional[datetime] = None,
+                          sources: Optional[List[str]] = None,
+                          chunk_size: int = 100000) -> Iterator[pd.DataFrame]:
+        """
+        Stream weather data in time-ordered chunks
+
+        Chunking follows iter_market_data. Forward fill of missing measures
+        carries the last values of the previous chunk; backward fill only
+        applies to leading gaps within the first chunk.
+
+        Args:
+            locations: List of location names to load (None for all)
+            start_date: Start date for data range
+            end_date: End date for data range
+            sources: List of weather sources to include
+            chunk_size: Rows fetched per page
+
+        Yields:
+            DataFrames with the same columns as load_weather_data
+        """
+        where_sql, params = self._weather_filters(locations, start_date, end_date, sources)
+        query = f"""
+        SELECT w.rowid AS row_key, {WEATHER_COLUMNS}
         FROM weather_data w
         JOIN weather_sources s ON w.source_id = s.id
-        WHERE 1=1
+        WHERE 1=1{where_sql}
+          AND (w.timestamp > ? OR (w.timestamp = ? AND w.rowid > ?))
+        ORDER BY w.timestamp ASC, w.rowid ASC
+        LIMIT ?
         """
 
+        carry = None
+        for chunk in self._iter_keyset_chunks(query, params, chunk_size):
+            chunk['timestamp'] = pd.to_datetime(chunk['timestamp'])
+
+            filled = chunk[WEATHER_NUMERIC_COLUMNS].ffill()
+            if carry is None:
+                filled = filled.bfill()
+            else:
+                filled = filled.fillna(carry)
+            chunk[WEATHER_NUMERIC_COLUMNS] = filled
+            carry = filled.iloc[-1]
+
+            yield chunk
+
+    def _weather_filters(self,
+                         locations: Optional[List[str]],
+                         start_date: Optional[datetime],
+                         end_date: Optional[datetime],
+                         sources: Optional[List[str]]) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause shared by weather data queries"""
+        query = ""
         params = []
 
         if locations:
@@ -181,21 +355,49 @@ class BacktestingDataLoader:
             query += " AND w.timestamp <= ?"
             params.append(end_date.isoformat())
 
-        query += " ORDER BY w.timestamp ASC"
+        return query, params
+
+    def _iter_keyset_chunks(self,
+                            query: str,
+                            params: List[Any],
+                            chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Page through a (timestamp, row_key) ordered query
+
+        The query must select a row_key column and take four trailing
+        parameters: last timestamp (twice), last row_key and page size.
+        Rows sharing the last timestamp of a full page are held back and
+        emitted with the next page, so timestamps are never split.
+        """
+        last_timestamp, last_key = '', -1
+        carry = None
 
         with sqlite3.connect(self.db_path) as conn:
-            df = pd.read_sql_query(query, conn, params=params)
+            while True:
+                page = pd.read_sql_query(
+                    query, conn, params=params + [last_timestamp, last_timestamp, last_key, chunk_size]
+                )
+                exhausted = len(page) < chunk_size
 
-        # Convert timestamp to datetime
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
+                if not page.empty:
+                    last_timestamp = page['timestamp'].iloc[-1]
+                    last_key = int(page['row_key'].iloc[-1])
 
-        # Fill missing numeric values with forward/backward fill
-        numeric_cols = ['temperature', 'temperature_min', 'temperature_max',
-                       'humidity', 'wind_speed', 'precipitation', 'pressure']
-        df[numeric_cols] = df[numeric_cols].fillna(method='ffill').fillna(method='bfill')
+                if carry is not None:
+                    # Empty pages come back with object columns; don't let them widen dtypes
+                    page = pd.concat([carry, page], ignore_index=True) if not page.empty else carry
 
-        logger.info(f"Loaded {len(df)} weather data records")
-        return df
+                if exhausted:
+                    if not page.empty:
+                        yield page.drop(columns='row_key')
+                    return
+
+                boundary = page['timestamp'] == page['timestamp'].iloc[-1]
+                carry = page[boundary]
+                complete = page[~boundary]
+
+                if not complete.empty:
+                    yield complete.drop(columns='row_key').reset_index(drop=True)
 
     def get_market_outcomes(self, market_id: str) -> List[str]:
         """Get all outcome names for a specific market"""
@@ -255,10 +457,114 @@ class BacktestingDataLoader:
 
         return df.to_dict('records')
 
+    def load_rollup_data(self,
+                         market_ids: Optional[List[str]] = None,
+                         locations: Optional[List[str]] = None,
+                         start_date: Optional[datetime] = None,
+                         end_date: Optional[datetime] = None,
+                         freq: str = 'H',
+                         refresh: bool = False) -> Optional[Tuple[pd.DataFrame, pd.DataFrame]]:
+        """
+        Aligned data served from the materialized rollups
+
+        Whole buckets inside the range come from the rollup tables; partial
+        buckets at either edge are loaded raw and aligned on the fly, so the
+        result matches load_*_data followed by align_data_timeline.
+
+        Loads only read the database: rollups behind the raw tables are
+        reported unavailable unless refresh is set, in which case the new
+        rows are folded in first. The ingestion scripts refresh them on write.
+
+        Returns:
+            Tuple of aligned (market_df, weather_df), or None when the rollups
+            can't serve the request (not built, stale, unsupported frequency,
+            no whole bucket in range, or weather gaps the loader would fill)
+        """
+        # Imported here as rollups builds on this module
+        from .rollups import ROLLUP_FREQUENCIES, bucket_bounds, fill_nulls_between, ns_to_datetime, \
+            read_rollups, refresh_rollups, rollups_current, rollups_exist
+
+        if freq not in ROLLUP_FREQUENCIES:
+            return None
+
+        with sqlite3.connect(self.db_path) as conn:
+            if not rollups_exist(conn):
+                return None
+            current = rollups_current(conn)
+
+        if not current:
+            if not refresh:
+                logger.info("Rollups are behind the raw tables; aligning from raw rows instead")
+                return None
+            refresh_rollups(self.db_path)
+
+        first, last = bucket_bounds(freq, start_date, end_date)
+        if first is not None and last is not None and first >= last:
+            return None
+
+        step = pd.tseries.frequencies.to_offset(freq).nanos
+        with sqlite3.connect(self.db_path) as conn:
+            # Edge buckets count too, since their raw rows go through the loader's fill
+            gaps = fill_nulls_between(conn, freq, locations,
+                                      first - step if first is not None else None,
+                                      last + step if last is not None else None)
+            if gaps:
+                logger.info("Weather gaps in range; aligning from raw rows instead of rollups")
+                return None
+
+            market_df = read_rollups(conn, 'market', freq, market_ids, first, last)
+            weather_df = read_rollups(conn, 'weather', freq, locations, first, last)
+
+        edges = []
+        if first is not None:
+            edges.append((start_date, ns_to_datetime(first), True))
+        if last is not None:
+            edges.append((ns_to_datetime(last), end_date, False))
+
+        for edge_start, edge_end, exclusive in edges:
+            edge_market = self.load_market_data(market_ids, edge_start, edge_end)
+            edge_weather = self.load_weather_data(locations, edge_start, edge_end)
+            if exclusive:
+                edge_market = _before(edge_market, edge_end)
+                edge_weather = _before(edge_weather, edge_end)
+
+            aligned_market, aligned_weather = self.align_data_timeline(edge_market, edge_weather, freq, compact=False)
+            # Skip empty edges so concat doesn't widen dtypes to object
+            if not aligned_market.empty:
+                market_df = pd.concat([market_df, aligned_market], ignore_index=True)
+            if not aligned_weather.empty:
+                weather_df = pd.concat([weather_df, aligned_weather], ignore_index=True)
+
+        market_df = market_df.sort_values(['market_id', 'timestamp'], kind='mergesort').reset_index(drop=True)
+        weather_df = weather_df.sort_values(['location_name', 'timestamp'], kind='mergesort').reset_index(drop=True)
+
+        if self.compact:
+            market_df = self._compact('aligned_market', market_df, MARKET_CATEGORY_COLUMNS, MARKET_FLOAT32_COLUMNS)
+            weather_df = self._compact('aligned_weather', weather_df, WEATHER_CATEGORY_COLUMNS, WEATHER_FLOAT32_COLUMNS)
+
+        logger.info(f"Loaded {freq} rollups: {len(market_df)} market, {len(weather_df)} weather records")
+        return market_df, weather_df
+
+    def _compact(self,
+                 name: str,
+                 df: pd.DataFrame,
+                 category_columns: List[str],
+                 float32_columns: List[str]) -> pd.DataFrame:
+        """Convert a frame to compact dtypes, recording the memory saved"""
+        before = frame_memory(df)
+        df = compact_frame(df, category_columns, float32_columns)
+        after = frame_memory(df)
+
+        self.memory_report[name] = {'before': before, 'after': after, 'saved': before - after}
+        logger.info(f"Compact {name} data: {before / 1e6:.1f} MB -> {after / 1e6:.1f} MB "
+                    f"({(before - after) / 1e6:.1f} MB saved)")
+        return df
+
     def align_data_timeline(self,
                            market_df: pd.DataFrame,
                            weather_df: pd.DataFrame,
-                           freq: str = 'H') -> Tuple[pd.DataFrame, pd.DataFrame]:
+                           freq: str = 'H',
+                           compact: Optional[bool] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Align market and weather data to the same time frequency
 
@@ -266,38 +572,191 @@ class BacktestingDataLoader:
             market_df: Market data DataFrame
             weather_df: Weather data DataFrame
             freq: Frequency for alignment ('H' for hourly, 'D' for daily)
+            compact: Use compact dtypes and integer time bins (defaults to the loader setting)
 
         Returns:
             Tuple of aligned (market_df, weather_df)
         """
-        # Set timestamp as index
-        market_df = market_df.set_index('timestamp')
-        weather_df = weather_df.set_index('timestamp')
-
-        # Resample to desired frequency
-        market_resampled = market_df.groupby('market_id').resample(freq).agg({
-            'probability': 'mean',
-            'volume': 'sum',
-            'outcome_name': 'first',
-            'event_title': 'first'
-        }).dropna()
-
-        weather_resampled = weather_df.groupby('location_name').resample(freq).agg({
-            'temperature': 'mean',
-            'temperature_min': 'min',
-            'temperature_max': 'max',
-            'humidity': 'mean',
-            'wind_speed': 'mean',
-            'precipitation': 'sum',
-            'pressure': 'mean',
-            'weather_code': 'first',
-            'source_name': 'first'
-        }).dropna()
-
-        # Reset index
-        market_resampled = market_resampled.reset_index()
-        weather_resampled = weather_resampled.reset_index()
+        if compact is None:
+            compact = self.compact
+
+        if compact:
+            market_df = self._compact('aligned_market', market_df,
+                                      MARKET_CATEGORY_COLUMNS, MARKET_FLOAT32_COLUMNS)
+            weather_df = self._compact('aligned_weather', weather_df,
+                                       WEATHER_CATEGORY_COLUMNS, WEATHER_FLOAT32_COLUMNS)
+            market_resampled = resample_frame_compact(market_df, 'market_id', MARKET_AGGREGATIONS, freq)
+            weather_resampled = resample_frame_compact(weather_df, 'location_name', WEATHER_AGGREGATIONS, freq)
+        else:
+            market_resampled = resample_frame(market_df, 'market_id', MARKET_AGGREGATIONS, freq)
+            weather_resampled = resample_frame(weather_df, 'location_name', WEATHER_AGGREGATIONS, freq)
 
         logger.info(f"Aligned data to {freq} frequency: {len(market_resampled)} market, {len(weather_resampled)} weather records")
 
-        return market_resampled, weather_resampled
\ No newline at end of file
+        return market_resampled, weather_resampled
+
+
+def resample_frame(df: pd.DataFrame,
+                   group_col: str,
+                   aggregations: Dict[str, str],
+                   freq: str) -> pd.DataFrame:
+    """Resample raw rows per group to freq, dropping incomplete bins"""
+    if df.empty:
+        return pd.DataFrame(columns=[group_col, 'timestamp'] + list(aggregations))
+
+    resampled = df.set_index('timestamp').groupby(group_col).resample(freq).agg(aggregations).dropna()
+    return resampled.reset_index()
+
+
+def resample_frame_compact(df: pd.DataFrame,
+                           group_col: str,
+                           aggregations: Dict[str, str],
+                           freq: str) -> pd.DataFrame:
+    """
+    Resample like resample_frame, grouping on int64 epoch bins
+
+    For fixed frequencies that divide a day, bins are computed with integer
+    arithmetic on the epoch nanoseconds and aggregated with a single
+    observed-only groupby, which avoids materialising the empty bins that
+    resample creates (and dropna would discard). Calendar frequencies and
+    non-UTC timezones fall back to resample_frame.
+    """
+    step = _fixed_bin_nanos(freq)
+    timestamps = df['timestamp'] if not df.empty else None
+    tz = getattr(timestamps.dtype, 'tz', None) if timestamps is not None else None
+
+    if timestamps is None or step is None or (tz is not None and str(tz) != 'UTC'):
+        return resample_frame(df, group_col, aggregations, freq)
+
+    epoch = timestamps.dt.tz_localize(None) if tz is not None else timestamps
+    epoch = epoch.to_numpy('datetime64[ns]').view('i8')
+    bins = pd.Series((epoch // step) * step, index=df.index, name='timestamp')
+
+    columns = [col for col in aggregations if col in df.columns]
+    resampled = df.groupby([df[group_col], bins], observed=True, sort=True)[columns].agg(
+        {col: aggregations[col] for col in columns}
+    ).dropna().reset_index()
+
+    resampled['timestamp'] = resampled['timestamp'].to_numpy().view('datetime64[ns]')
+    if tz is not None:
+        resampled['timestamp'] = resampled['timestamp'].dt.tz_localize(tz)
+
+    for col in columns:
+        # Means of float32 columns come back as float64
+        if df[col].dtype == np.float32 and resampled[col].dtype != np.float32:
+            resampled[col] = resampled[col].astype(np.float32)
+
+    return resampled
+
+
+def _fixed_bin_nanos(freq: str) -> Optional[int]:
+    """Bin width in nanoseconds if freq is fixed and divides a day, else None"""
+    try:
+        offset = pd.tseries.frequencies.to_offset(freq)
+    except ValueError:
+        return None
+
+    if not isinstance(offset, pd.offsets.Tick) or (86_400 * 10**9) % offset.nanos:
+        return None
+    return offset.nanos
+
+
+def compact_frame(df: pd.DataFrame,
+                  category_columns: List[str],
+                  float32_columns: List[str]) -> pd.DataFrame:
+    """Copy of df with identifier columns as categoricals and measures as float32"""
+    converted = {}
+
+    for col in category_columns:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            converted[col] = df[col].astype('category')
+
+    for col in float32_columns:
+        if col in df.columns and df[col].dtype != np.float32:
+            converted[col] = df[col].astype(np.float32)
+
+    return df.assign(**converted) if converted else df
+
+
+def frame_memory(df: pd.DataFrame) -> int:
+    """Memory used by a frame in bytes, including Python string objects"""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def _before(df: pd.DataFrame, bound: pd.Timestamp) -> pd.DataFrame:
+    """Rows strictly before a naive UTC bound"""
+    if df.empty:
+        return df
+
+    timestamps = df['timestamp']
+    bound = pd.Timestamp(bound)
+    if isinstance(timestamps.dtype, pd.DatetimeTZDtype):
+        bound = bound.tz_localize('UTC')
+    return df[timestamps < bound]
+
+
+def bin_start(timestamps: pd.Series, freq: str) -> pd.Series:
+    """Start of the resample bin each timestamp falls into"""
+    try:
+        return timestamps.dt.floor(freq)
+    except ValueError:
+        # Non-fixed frequencies such as weekly or monthly
+        return timestamps.dt.to_period(freq).dt.start_time
+
+
+def iter_time_windows(market_chunks: Iterator[pd.DataFrame],
+                      weather_chunks: Iterator[pd.DataFrame],
+                      freq: str = 'H') -> Iterator[Tuple[pd.DataFrame, pd.DataFrame]]:
+    """
+    Merge two time-ordered chunk streams into windows of complete bins
+
+    A window is emitted once both streams have moved past its last resample
+    bin, so aligning each window independently gives the same rows as
+    aligning the whole range at once. Only the chunks not yet covered by
+    both streams are held in memory.
+
+    Yields:
+        Tuples of raw (market_df, weather_df) rows for consecutive windows
+    """
+    streams = [iter(market_chunks), iter(weather_chunks)]
+    buffers = [pd.DataFrame(), pd.DataFrame()]
+    exhausted = [False, False]
+
+    while True:
+        if all(exhausted):
+            if not (buffers[0].empty and buffers[1].empty):
+                yield buffers[0], buffers[1]
+            return
+
+        # Bins before the last buffered bin of a live stream can no longer grow
+        bounds = [None if exhausted[i] or buffers[i].empty
+                  else bin_start(buffers[i]['timestamp'].iloc[-1:], freq).iloc[0]
+                  for i in range(2)]
+        waiting = [i for i in range(2) if not exhausted[i] and buffers[i].empty]
+
+        if not waiting:
+            window_end = min(bound for bound in bounds if bound is not None)
+            window = []
+            for i in range(2):
+                if buffers[i].empty:
+                    window.append(buffers[i])
+                    continue
+                ready = bin_start(buffers[i]['timestamp'], freq) < window_end
+                window.append(buffers[i][ready])
+                buffers[i] = buffers[i][~ready]
+
+            if not (window[0].empty and window[1].empty):
+                yield window[0], window[1]
+
+        # Advance the stream that is furthest behind
+        if waiting:
+            i = waiting[0]
+        else:
+            live = [j for j in range(2) if not exhausted[j]]
+            i = min(live, key=lambda j: bounds[j])
+
+        try:
+            chunk = next(streams[i])
+            buffers[i] = chunk if buffers[i].empty else pd.concat([buffers[i], chunk], ignore_index=True)
+        except StopIteration:
+            exhausted[i] = True
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Materialized Rollups for Data Alignment
+
+Maintains hourly and daily aggregates of polymarket_data and weather_data
+in SQLite so backtests at those frequencies can skip resampling raw rows.
+Each rollup row stores mergeable partial state for the aggregations that
+align_data_timeline applies (sum and count for means, sums, minima, maxima
+and the earliest non-null value for 'first'), so new rows are folded in
+incrementally by rowid high-water mark as the ingesters insert them.
+"""
+
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import logging
+
+from .data_loader import (
+    MARKET_AGGREGATIONS,
+    WEATHER_AGGREGATIONS,
+    WEATHER_NUMERIC_COLUMNS,
+    bin_start
+)
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_FREQUENCIES = ('H', 'D')
+
+ROLLUP_STATE_TABLE = 'rollup_state'
+
+# Rollup tables and the raw rows they aggregate
+ROLLUP_SPECS = {
+    'market': {
+        'table': 'market_rollups',
+        'source': 'polymarket_data',
+        'query': """
+            SELECT rowid AS row_key, timestamp, market_id, outcome_name, probability, volume, event_title
+            FROM polymarket_data
+            WHERE rowid > ? AND rowid <= ?
+            ORDER BY rowid
+        """,
+        'group_col': 'market_id',
+        'aggregations': MARKET_AGGREGATIONS,
+        # Defaults the loader applies to raw market rows before aligning
+        'defaults': {'probability': 0.5, 'volume': 0.0},
+        'fill_columns': []
+    },
+    'weather': {
+        'table': 'weather_rollups',
+        'source': 'weather_data',
+        'query': """
+            SELECT w.rowid AS row_key, w.timestamp, w.location_name, w.temperature, w.temperature_min,
+                   w.temperature_max, w.humidity, w.wind_speed, w.precipitation, w.pressure,
+                   w.weather_code, s.source_name
+            FROM weather_data w
+            JOIN weather_sources s ON w.source_id = s.id
+            WHERE w.rowid > ? AND w.rowid <= ?
+            ORDER BY w.rowid
+        """,
+        'group_col': 'location_name',
+        'aggregations': WEATHER_AGGREGATIONS,
+        'defaults': {},
+        # Columns the loader forward/backward fills across rows; buckets with
+        # nulls here can't be served from rollups
+        'fill_columns': WEATHER_NUMERIC_COLUMNS
+    }
+}
+
+
+def _state_columns(aggregations: Dict[str, str]) -> List[Tuple[str, str]]:
+    """Partial-state columns (name, SQL type) stored per aggregated column"""
+    columns = []
+    for col, agg in aggregations.items():
+        if agg == 'mean':
+            columns += [(f'{col}__sum', 'REAL NOT NULL DEFAULT 0'), (f'{col}__count', 'INTEGER NOT NULL DEFAULT 0')]
+        elif agg == 'sum':
+            columns.append((f'{col}__sum', 'REAL NOT NULL DEFAULT 0'))
+        elif agg in ('min', 'max'):
+            columns.append((f'{col}__{agg}', 'REAL'))
+        elif agg == 'first':
+            # Untyped so values keep their storage class
+            columns += [(f'{col}__first', ''), (f'{col}__first_ns', 'INTEGER'), (f'{col}__first_row', 'INTEGER')]
+        else:
+            raise ValueError(f"Unsupported rollup aggregation: {agg}")
+    return columns
+
+
+def _merge_sql(aggregations: Dict[str, str]) -> List[str]:
+    """SET clauses folding an incoming partial (excluded.*) into a stored one"""
+    clauses = ['row_count = row_count + excluded.row_count', 'fill_nulls = fill_nulls + excluded.fill_nulls']
+
+    for col, agg in aggregations.items():
+        if agg == 'mean':
+            clauses += [f'{col}__sum = {col}__sum + excluded.{col}__sum',
+                        f'{col}__count = {col}__count + excluded.{col}__count']
+        elif agg == 'sum':
+            clauses.append(f'{col}__sum = {col}__sum + excluded.{col}__sum')
+        elif agg in ('min', 'max'):
+            name = f'{col}__{agg}'
+            clauses.append(f'{name} = CASE WHEN {name} IS NULL THEN excluded.{name} '
+                           f'WHEN excluded.{name} IS NULL THEN {name} '
+                           f'ELSE {agg.upper()}({name}, excluded.{name}) END')
+        elif agg == 'first':
+            ns, row = f'{col}__first_ns', f'{col}__first_row'
+            earlier = (f'excluded.{ns} IS NOT NULL AND ({ns} IS NULL OR excluded.{ns} < {ns} '
+                       f'OR (excluded.{ns} = {ns} AND excluded.{row} < {row}))')
+            for name in (f'{col}__first', ns, row):
+                clauses.append(f'{name} = CASE WHEN {earlier} THEN excluded.{name} ELSE {name} END')
+
+    return clauses
+
+
+def ensure_rollup_tables(conn: sqlite3.Connection):
+    """Create the rollup tables and their high-water mark table if missing"""
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {ROLLUP_STATE_TABLE} (
+            source TEXT PRIMARY KEY,
+            last_rowid INTEGER NOT NULL
+        )
+    """)
+
+    for spec in ROLLUP_SPECS.values():
+        state_sql = ',\n'.join(f'{name} {sql_type}'.strip() for name, sql_type in _state_columns(spec['aggregations']))
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {spec['table']} (
+                freq TEXT NOT NULL,
+                group_key TEXT NOT NULL,
+                bucket TEXT NOT NULL,
+                bucket_ns INTEGER NOT NULL,
+                row_count INTEGER NOT NULL DEFAULT 0,
+                fill_nulls INTEGER NOT NULL DEFAULT 0,
+                {state_sql},
+                PRIMARY KEY (freq, group_key, bucket_ns)
+            )
+        """)
+
+
+def rollups_exist(conn: sqlite3.Connection) -> bool:
+    """Whether rollups have been built in this database"""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (ROLLUP_STATE_TABLE,)
+    ).fetchone()
+    return row is not None
+
+
+def refresh_rollups(db_path: str, batch_size: int = 200000) -> Dict[str, int]:
+    """
+    Fold rows inserted since the last refresh into the rollup tables
+
+    Creates the tables on first use. Raw rows are tracked by rowid, so
+    updates or deletes of rows already folded in require rebuild_rollups().
+
+    Returns:
+        Number of raw rows folded in per dataset
+    """
+    folded = {}
+    with sqlite3.connect(db_path) as conn:
+        ensure_rollup_tables(conn)
+        for name, spec in ROLLUP_SPECS.items():
+            folded[name] = _refresh_dataset(conn, spec, batch_size)
+
+    if any(folded.values()):
+        logger.info(f"Refreshed rollups: {folded}")
+    return folded
+
+
+def rebuild_rollups(db_path: str) -> Dict[str, int]:
+    """Drop and rebuild all rollups from the raw tables"""
+    with sqlite3.connect(db_path) as conn:
+        for spec in ROLLUP_SPECS.values():
+            conn.execute(f"DROP TABLE IF EXISTS {spec['table']}")
+        conn.execute(f"DROP TABLE IF EXISTS {ROLLUP_STATE_TABLE}")
+
+    return refresh_rollups(db_path)
+
+
+def rollups_current(conn: sqlite3.Connection) -> bool:
+    """Whether every raw row has been folded into the rollups"""
+    marks = dict(conn.execute(f"SELECT source, last_rowid FROM {ROLLUP_STATE_TABLE}").fetchall())
+    for spec in ROLLUP_SPECS.values():
+        max_rowid = conn.execute(f"SELECT COALESCE(MAX(rowid), -1) FROM {spec['source']}").fetchone()[0]
+        if marks.get(spec['source'], -1) != max_rowid:
+            return False
+    return True
+
+
+def _refresh_dataset(conn: sqlite3.Connection, spec: Dict[str, Any], batch_size: int) -> int:
+    row = conn.execute(f"SELECT last_rowid FROM {ROLLUP_STATE_TABLE} WHERE source = ?",
+                       (spec['source'],)).fetchone()
+    last_rowid = row[0] if row else -1
+    max_rowid = conn.execute(f"SELECT COALESCE(MAX(rowid), -1) FROM {spec['source']}").fetchone()[0]
+
+    folded = 0
+    for chunk in pd.read_sql_query(spec['query'], conn, params=[last_rowid, max_rowid], chunksize=batch_size):
+        if chunk.empty:
+            continue
+
+        folded += len(chunk)
+        for freq in ROLLUP_FREQUENCIES:
+            partials = compute_partials(chunk, spec, freq)
+            _upsert_partials(conn, spec, freq, partials)
+
+    conn.execute(f"INSERT OR REPLACE INTO {ROLLUP_STATE_TABLE} (source, last_rowid) VALUES (?, ?)",
+                 (spec['source'], max_rowid))
+    return folded
+
+
+def compute_partials(rows: pd.DataFrame, spec: Dict[str, Any], freq: str) -> pd.DataFrame:
+    """
+    Per (group, bucket) partial aggregate state of raw rows
+
+    Args:
+        rows: Raw rows with a row_key column, as selected by spec['query']
+        spec: Entry of ROLLUP_SPECS
+        freq: Bucket frequency
+
+    Returns:
+        DataFrame with group_key, bucket, bucket_ns and the state columns
+    """
+    group_col = spec['group_col']
+    df = rows.copy()
+    df['timestamp'] = pd.to_datetime(df['timestamp'])
+    for col, default in spec['defaults'].items():
+        df[col] = df[col].fillna(default)
+
+    # resample drops rows without a timestamp or group
+    df = df.dropna(subset=['timestamp', group_col])
+    df['_bucket'] = bin_start(df['timestamp'], freq)
+    df['_ns'] = _epoch_ns(df['timestamp'])
+    df = df.sort_values(['_ns', 'row_key'], kind='mergesort')
+
+    keys = [group_col, '_bucket']
+    grouped = df.groupby(keys, sort=False)
+    partials = pd.DataFrame({'row_count': grouped.size()})
+
+    fill_columns = [col for col in spec['fill_columns'] if col in df.columns]
+    if fill_columns:
+        partials['fill_nulls'] = df[fill_columns].isna().sum(axis=1).groupby([df[k] for k in keys]).sum()
+    else:
+        partials['fill_nulls'] = 0
+
+    for col, agg in spec['aggregations'].items():
+        if agg == 'mean':
+            partials[f'{col}__sum'] = grouped[col].sum()
+            partials[f'{col}__count'] = grouped[col].count()
+        elif agg == 'sum':
+            partials[f'{col}__sum'] = grouped[col].sum()
+        elif agg in ('min', 'max'):
+            partials[f'{col}__{agg}'] = grouped[col].agg(agg)
+        elif agg == 'first':
+            valid = df[df[col].notna()].drop_duplicates(subset=keys).set_index(keys)
+            partials[f'{col}__first'] = valid[col]
+            partials[f'{col}__first_ns'] = valid['_ns']
+            partials[f'{col}__first_row'] = valid['row_key']
+
+    partials = partials.reset_index().rename(columns={group_col: 'group_key', '_bucket': 'bucket'})
+    partials['bucket_ns'] = _epoch_ns(partials['bucket'])
+    partials['bucket'] = partials['bucket'].map(lambda ts: ts.isoformat())
+    return partials
+
+
+def _epoch_ns(timestamps: pd.Series) -> pd.Series:
+    """UTC epoch nanoseconds; naive timestamps are taken as UTC"""
+    if isinstance(timestamps.dtype, pd.DatetimeTZDtype):
+        timestamps = timestamps.dt.tz_convert('UTC').dt.tz_localize(None)
+    return pd.Series(timestamps.to_numpy('datetime64[ns]').view('i8'), index=timestamps.index)
+
+
+def _upsert_partials(conn: sqlite3.Connection, spec: Dict[str, Any], freq: str, partials: pd.DataFrame):
+    if partials.empty:
+        return
+
+    state_columns = [name for name, _ in _state_columns(spec['aggregations'])]
+    columns = ['group_key', 'bucket', 'bucket_ns', 'row_count', 'fill_nulls'] + state_columns
+    placeholders = ', '.join('?' * (len(columns) + 1))
+
+    sql = f"""
+        INSERT INTO {spec['table']} (freq, {', '.join(columns)})
+        VALUES ({placeholders})
+        ON CONFLICT (freq, group_key, bucket_ns) DO UPDATE SET
+            {', '.join(_merge_sql(spec['aggregations']))}
+    """
+
+    # Native Python values with None for missing, as sqlite3 expects
+    values = partials[columns].astype(object).where(partials[columns].notna(), None)
+    conn.executemany(sql, ([freq] + row for row in values.values.tolist()))
+
+
+def _bucket_filters(freq: str,
+                    keys: Optional[List[str]],
+                    start_ns: Optional[int],
+                    end_ns: Optional[int]) -> Tuple[str, List[Any]]:
+    """WHERE clause selecting buckets with start_ns <= bucket_ns < end_ns"""
+    query = " WHERE freq = ?"
+    params: List[Any] = [freq]
+
+    if keys:
+        query += f" AND group_key IN ({','.join('?' * len(keys))})"
+        params.extend(keys)
+    if start_ns is not None:
+        query += " AND bucket_ns >= ?"
+        params.append(start_ns)
+    if end_ns is not None:
+        query += " AND bucket_ns < ?"
+        params.append(end_ns)
+
+    return query, params
+
+
+def fill_nulls_between(conn: sqlite3.Connection,
+                       freq: str,
+                       locations: Optional[List[str]],
+                       start_ns: Optional[int],
+                       end_ns: Optional[int]) -> int:
+    """Null weather measures in the selected buckets"""
+    where_sql, params = _bucket_filters(freq, locations, start_ns, end_ns)
+    query = f"SELECT COALESCE(SUM(fill_nulls), 0) FROM {ROLLUP_SPECS['weather']['table']}{where_sql}"
+    return int(conn.execute(query, params).fetchone()[0])
+
+
+def read_rollups(conn: sqlite3.Connection,
+                 dataset: str,
+                 freq: str,
+                 keys: Optional[List[str]],
+                 start_ns: Optional[int],
+                 end_ns: Optional[int]) -> pd.DataFrame:
+    """Aligned rows, as align_data_timeline produces them, for whole buckets in range"""
+    spec = ROLLUP_SPECS[dataset]
+    state_columns = [name for name, _ in _state_columns(spec['aggregations'])]
+
+    where_sql, params = _bucket_filters(freq, keys, start_ns, end_ns)
+    query = (f"SELECT group_key, bucket, {', '.join(state_columns)} FROM {spec['table']}{where_sql}"
+             f" ORDER BY group_key, bucket_ns")
+    state = pd.read_sql_query(query, conn, params=params)
+
+    aligned = pd.DataFrame({
+        spec['group_col']: state['group_key'],
+        'timestamp': pd.to_datetime(state['bucket'])
+    })
+
+    for col, agg in spec['aggregations'].items():
+        if agg == 'mean':
+            counts = state[f'{col}__count']
+            aligned[col] = (state[f'{col}__sum'] / counts.where(counts > 0)).astype(float)
+        elif agg == 'sum':
+            aligned[col] = state[f'{col}__sum'].astype(float)
+        elif agg in ('min', 'max'):
+            aligned[col] = state[f'{col}__{agg}'].astype(float)
+        elif agg == 'first':
+            aligned[col] = state[f'{col}__first']
+
+    return aligned.dropna().reset_index(drop=True)
+
+
+def bucket_bounds(freq: str,
+                  start_date: Optional[pd.Timestamp],
+                  end_date: Optional[pd.Timestamp]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Epoch-ns range [first, last) of buckets lying wholly inside [start, end]
+
+    Naive bounds are taken as UTC, matching how ISO timestamps compare in
+    the SQL loader.
+    """
+    step = pd.tseries.frequencies.to_offset(freq).nanos
+
+    first = last = None
+    if start_date is not None:
+        start_ns = _bound_ns(start_date)
+        first = -(-start_ns // step) * step
+    if end_date is not None:
+        last = ((_bound_ns(end_date) + 1) // step) * step
+
+    return first, last
+
+
+def _bound_ns(bound) -> int:
+    bound = pd.Timestamp(bound)
+    bound = bound.tz_localize('UTC') if bound.tzinfo is None else bound.tz_convert('UTC')
+    return int(bound.value)
+
+
+def ns_to_datetime(ns: int) -> datetime:
+    """Naive UTC datetime for an epoch-ns bucket bound"""
+    return pd.Timestamp(np.int64(ns), unit='ns').to_pydatetime()
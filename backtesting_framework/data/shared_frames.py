@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Memory-Mapped DataFrame Sharing
+
+Exports aligned market and weather frames to per-column NumPy files so
+worker processes can memory-map them once instead of receiving pickled
+copies with every task. Numeric and datetime columns are mapped directly;
+string columns are stored as integer codes plus their distinct values, and
+categorical columns as their codes plus categories, so they load as categoricals.
+"""
+
+import os
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def export_frame(df: pd.DataFrame, directory: str, name: str) -> Dict[str, Any]:
+    """
+    Write a DataFrame to per-column .npy files
+
+    Args:
+        df: Frame to export (the index is not preserved)
+        directory: Directory to write column files into
+        name: Prefix for the column files
+
+    Returns:
+        Manifest describing the exported columns, passed to load_frame
+    """
+    manifest = {'name': name, 'length': len(df), 'columns': []}
+
+    for position, column in enumerate(df.columns):
+        series = df[column]
+        path = os.path.join(directory, f"{name}__{position}.npy")
+        entry = {'name': column, 'path': path}
+
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            entry.update(kind='categorical', categories=series.cat.categories,
+                         ordered=bool(series.cat.ordered))
+            values = series.cat.codes.to_numpy().astype(np.int32)
+        elif isinstance(series.dtype, pd.DatetimeTZDtype):
+            entry.update(kind='datetime', dtype='datetime64[ns]', tz=str(series.dt.tz))
+            values = series.dt.tz_convert('UTC').dt.tz_localize(None).to_numpy('datetime64[ns]').view('i8')
+        elif pd.api.types.is_datetime64_any_dtype(series.dtype):
+            entry.update(kind='datetime', dtype=str(series.dtype), tz=None)
+            values = series.to_numpy().view('i8')
+        elif pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+            entry.update(kind='numeric')
+            values = series.to_numpy()
+        else:
+            codes, uniques = pd.factorize(series)
+            entry.update(kind='coded', values=list(uniques))
+            values = codes.astype(np.int32)
+
+        np.save(path, values)
+        manifest['columns'].append(entry)
+
+    logger.debug(f"Exported {len(df)} rows of '{name}' to {directory}")
+    return manifest
+
+
+def load_frame(manifest: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Rebuild a DataFrame from files written by export_frame
+
+    Numeric columns stay backed by read-only memory maps, so processes
+    loading the same manifest share the operating system page cache.
+    """
+    data = {}
+
+    for entry in manifest['columns']:
+        values = np.load(entry['path'], mmap_mode='r')
+
+        if entry['kind'] == 'datetime':
+            column = pd.Series(np.asarray(values).view(entry['dtype']))
+            if entry['tz']:
+                column = column.dt.tz_localize('UTC').dt.tz_convert(entry['tz'])
+        elif entry['kind'] == 'categorical':
+            column = pd.Series(pd.Categorical.from_codes(np.asarray(values), categories=entry['categories'],
+                                                         ordered=entry['ordered']))
+        elif entry['kind'] == 'coded':
+            lookup = np.empty(len(entry['values']) + 1, dtype=object)
+            lookup[:-1] = entry['values']
+            lookup[-1] = None
+            column = pd.Series(lookup[np.asarray(values)])
+        else:
+            column = pd.Series(values, copy=False)
+
+        data[entry['name']] = column
+
+    return pd.DataFrame(data, copy=False)
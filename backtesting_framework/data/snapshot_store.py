@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Columnar Snapshot Store for Historical Data
+
+Keeps a Parquet copy of polymarket_data and weather_data next to the
+SQLite database, partitioned by period and by market or location, so
+backtests read only the partitions and columns they need instead of
+scanning and parsing the row store. Snapshots are refreshed incrementally
+from a (created_at, rowid) high-water mark per table.
+
+Requires pyarrow; check PYARROW_AVAILABLE before constructing a store.
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import logging
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = '_snapshot.json'
+ROW_GROUP_SIZE = 65536
+
+# Per-table export settings: source query, partition key and column types
+SNAPSHOT_TABLES = {
+    'polymarket_data': {
+        'select': """
+            SELECT rowid AS row_key, timestamp, market_id, outcome_name, probability,
+                   volume, event_title, scraped_at{created_at}
+            FROM polymarket_data
+        """,
+        'alias': '',
+        'partition_col': 'market_id',
+        'columns': {
+            'row_key': 'int64',
+            'timestamp': 'timestamp',
+            'market_id': 'string',
+            'outcome_name': 'string',
+            'probability': 'float64',
+            'volume': 'float64',
+            'event_title': 'string',
+            'scraped_at': 'timestamp'
+        }
+    },
+    'weather_data': {
+        'select': """
+            SELECT w.rowid AS row_key, w.timestamp, w.location_name, w.latitude, w.longitude,
+                   w.temperature, w.temperature_min, w.temperature_max, w.humidity,
+                   w.wind_speed, w.precipitation, w.pressure, w.weather_code,
+                   w.weather_description, s.source_name{created_at}
+            FROM weather_data w
+            JOIN weather_sources s ON w.source_id = s.id
+        """,
+        'alias': 'w.',
+        'partition_col': 'location_name',
+        'columns': {
+            'row_key': 'int64',
+            'timestamp': 'timestamp',
+            'location_name': 'string',
+            'latitude': 'float64',
+            'longitude': 'float64',
+            'temperature': 'float64',
+            'temperature_min': 'float64',
+            'temperature_max': 'float64',
+            'humidity': 'float64',
+            'wind_speed': 'float64',
+            'precipitation': 'float64',
+            'pressure': 'float64',
+            'weather_code': 'int64',
+            'weather_description': 'string',
+            'source_name': 'string'
+        }
+    }
+}
+
+
+class SnapshotStore:
+    """Parquet snapshot of the market and weather tables of one database"""
+
+    def __init__(self,
+                 db_path: str,
+                 root_dir: str,
+                 period_format: str = '%Y',
+                 batch_size: int = 200000):
+        """
+        Args:
+            db_path: SQLite database the snapshot mirrors
+            root_dir: Directory holding one dataset per table
+            period_format: strftime format of the time partition ('%Y-%m' for monthly)
+            batch_size: Rows exported per part file during refresh
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for columnar snapshots (pip install pyarrow)")
+
+        self.db_path = db_path
+        self.root_dir = root_dir
+        self.period_format = period_format
+        self.batch_size = batch_size
+        os.makedirs(root_dir, exist_ok=True)
+        self.manifest = self._read_manifest()
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        path = os.path.join(self.root_dir, MANIFEST_FILE)
+        if os.path.exists(path):
+            with open(path) as f:
+                manifest = json.load(f)
+            if manifest.get('period_format') == self.period_format:
+                return manifest
+            logger.warning("Snapshot partitioning changed, rebuilding")
+            self._remove_datasets()
+
+        return {'period_format': self.period_format, 'tables': {}}
+
+    def _write_manifest(self):
+        path = os.path.join(self.root_dir, MANIFEST_FILE)
+        with open(path + '.tmp', 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(path + '.tmp', path)
+
+    def _remove_datasets(self):
+        for table in SNAPSHOT_TABLES:
+            shutil.rmtree(os.path.join(self.root_dir, table), ignore_errors=True)
+
+    def rebuild(self) -> Dict[str, int]:
+        """Discard the snapshot and export both tables from scratch"""
+        self._remove_datasets()
+        self.manifest = {'period_format': self.period_format, 'tables': {}}
+        return self.refresh()
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Append rows inserted since the last refresh
+
+        Rows are picked up by (created_at, rowid) where the table has a
+        created_at column and by rowid otherwise. Updates to rows that were
+        already exported are not tracked; call rebuild() after rewriting data.
+
+        Returns:
+            Number of rows appended per table
+        """
+        appended = {}
+        # The Arrow writer pulls batches from its own thread
+        with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
+            for table in SNAPSHOT_TABLES:
+                appended[table] = self._refresh_table(conn, table)
+
+        self._write_manifest()
+        return appended
+
+    def _refresh_table(self, conn: sqlite3.Connection, table: str) -> int:
+        spec = SNAPSHOT_TABLES[table]
+        state = self.manifest['tables'].setdefault(
+            table, {'created_at': None, 'rowid': -1, 'rows': 0, 'parts': 0, 'timezones': {}}
+        )
+
+        columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+        alias = spec['alias']
+
+        if 'created_at' in columns:
+            query = spec['select'].format(created_at=f", {alias}created_at AS created_at")
+            query += (f" WHERE (COALESCE({alias}created_at, '') > ?"
+                      f" OR (COALESCE({alias}created_at, '') = ? AND {alias}rowid > ?))"
+                      f" ORDER BY COALESCE({alias}created_at, ''), {alias}rowid")
+            mark = state['created_at'] or ''
+            params = [mark, mark, state['rowid']]
+        else:
+            query = spec['select'].format(created_at='')
+            query += f" WHERE {alias}rowid > ? ORDER BY {alias}rowid"
+            params = [state['rowid']]
+
+        appended = 0
+
+        def batches():
+            nonlocal appended
+            for chunk in pd.read_sql_query(query, conn, params=params, chunksize=self.batch_size):
+                if chunk.empty:
+                    continue
+                if 'created_at' in chunk.columns:
+                    state['created_at'] = chunk['created_at'].fillna('').iloc[-1]
+                    chunk = chunk.drop(columns='created_at')
+                state['rowid'] = int(chunk['row_key'].iloc[-1])
+                appended += len(chunk)
+                yield from self._to_arrow(table, chunk, state).to_batches()
+
+        # One write per refresh, so each partition gains at most one file
+        ds.write_dataset(
+            batches(),
+            os.path.join(self.root_dir, table),
+            schema=self._schema(table),
+            format='parquet',
+            partitioning=self._partitioning(table),
+            basename_template=f"part-{state['parts']:06d}-{{i}}.parquet",
+            existing_data_behavior='overwrite_or_ignore',
+            # Batches split thinly across partitions; buffer them into real row groups
+            min_rows_per_group=ROW_GROUP_SIZE,
+            max_rows_per_group=ROW_GROUP_SIZE * 16
+        )
+
+        if appended:
+            state['parts'] += 1
+            state['rows'] += appended
+            logger.info(f"Snapshot of {table}: appended {appended} rows ({state['rows']} total)")
+        return appended
+
+    def _to_arrow(self, table: str, chunk: pd.DataFrame, state: Dict[str, Any]):
+        """Convert one batch of SQL rows to an Arrow table with the snapshot schema"""
+        spec = SNAPSHOT_TABLES[table]
+
+        for col, kind in spec['columns'].items():
+            if kind == 'timestamp':
+                chunk[col], tz = _to_utc(chunk[col])
+                # Remember whether the source is naive so loads can match the SQL path
+                state['timezones'].setdefault(col, tz)
+
+        chunk['period'] = chunk['timestamp'].dt.strftime(self.period_format)
+
+        # Fixed schema so batches with all-null columns stay compatible
+        return pa.Table.from_pandas(chunk, schema=self._schema(table), preserve_index=False)
+
+    def _schema(self, table: str):
+        fields = []
+        for col, kind in SNAPSHOT_TABLES[table]['columns'].items():
+            if kind == 'timestamp':
+                fields.append((col, pa.timestamp('ns', tz='UTC')))
+            else:
+                fields.append((col, pa.type_for_alias(kind)))
+        return pa.schema(fields + [('period', pa.string())])
+
+    def _partitioning(self, table: str):
+        partition_col = SNAPSHOT_TABLES[table]['partition_col']
+        return ds.partitioning(
+            pa.schema([('period', pa.string()), (partition_col, pa.string())]),
+            flavor='hive'
+        )
+
+    def has_table(self, table: str) -> bool:
+        """Whether the table has been exported"""
+        return self.manifest['tables'].get(table, {}).get('parts', 0) > 0
+
+    def load(self,
+             table: str,
+             keys: Optional[List[str]] = None,
+             start_date: Optional[datetime] = None,
+             end_date: Optional[datetime] = None,
+             columns: Optional[List[str]] = None,
+             filters: Optional[Dict[str, List[Any]]] = None) -> pd.DataFrame:
+        """
+        Read rows from a table's snapshot in timestamp order
+
+        Args:
+            table: 'polymarket_data' or 'weather_data'
+            keys: Market IDs or location names to read (None for all)
+            start_date: Inclusive start of the time range
+            end_date: Inclusive end of the time range
+            columns: Columns to read (None for all exported columns)
+            filters: Extra equality filters, column -> allowed values
+
+        Range bounds are compared as instants, naive bounds being taken as
+        UTC; rows exactly at a bound are always included.
+
+        Returns:
+            DataFrame sorted by timestamp, as the SQL loader would return it
+        """
+        spec = SNAPSHOT_TABLES[table]
+        state = self.manifest['tables'].get(table)
+        if not self.has_table(table):
+            raise ValueError(f"No snapshot for {table}; call refresh() first")
+
+        dataset = ds.dataset(os.path.join(self.root_dir, table), format='parquet',
+                             partitioning=self._partitioning(table))
+        expression = None
+
+        def combine(condition):
+            return condition if expression is None else expression & condition
+
+        if keys:
+            expression = combine(ds.field(spec['partition_col']).isin(list(keys)))
+        for column, values in (filters or {}).items():
+            expression = combine(ds.field(column).isin(list(values)))
+
+        timestamp_type = dataset.schema.field('timestamp').type
+        if start_date:
+            bound = pd.Timestamp(start_date)
+            expression = combine(ds.field('period') >= bound.strftime(self.period_format))
+            expression = combine(ds.field('timestamp') >= self._time_scalar(bound, timestamp_type))
+        if end_date:
+            bound = pd.Timestamp(end_date)
+            expression = combine(ds.field('period') <= bound.strftime(self.period_format))
+            expression = combine(ds.field('timestamp') <= self._time_scalar(bound, timestamp_type))
+
+        read_columns = None
+        if columns is not None:
+            read_columns = list(dict.fromkeys(['row_key', 'timestamp'] + list(columns)))
+
+        table_data = dataset.to_table(columns=read_columns, filter=expression)
+        table_data = table_data.take(_timeline_order(table_data))
+        df = table_data.to_pandas().drop(columns=['row_key', 'period'], errors='ignore')
+
+        if spec['partition_col'] in df.columns:
+            df[spec['partition_col']] = df[spec['partition_col']].astype(object)
+
+        for col, tz in state['timezones'].items():
+            if tz is None and col in df.columns:
+                df[col] = df[col].dt.tz_convert(None)
+
+        # Partition columns come back last; restore the source column order
+        order = [col for col in spec['columns'] if col in df.columns]
+        return df[list(columns) if columns is not None else order]
+
+    @staticmethod
+    def _time_scalar(bound: pd.Timestamp, timestamp_type):
+        """Range bound comparable to the stored UTC timestamps"""
+        # Naive bounds are compared as UTC wall-clock times, matching the
+        # string comparison of ISO timestamps in the SQL loader
+        bound = bound.tz_localize('UTC') if bound.tzinfo is None else bound.tz_convert('UTC')
+        return pa.scalar(bound, type=timestamp_type)
+
+
+def _to_utc(values: pd.Series):
+    """Parse timestamps to UTC, returning them with the source timezone (None if naive)"""
+    parsed = pd.to_datetime(values)
+
+    if isinstance(parsed.dtype, pd.DatetimeTZDtype):
+        return parsed.dt.tz_convert('UTC'), str(parsed.dt.tz)
+    if pd.api.types.is_datetime64_dtype(parsed.dtype):
+        return parsed.dt.tz_localize('UTC'), None
+
+    # Mixed offsets parse to objects; normalise them explicitly
+    return pd.to_datetime(values, utc=True), 'UTC'
+
+
+def _timeline_order(table_data) -> np.ndarray:
+    """Row order by (timestamp, row_key) from two stable integer sorts"""
+    timestamps = table_data['timestamp'].to_numpy().view('i8')
+    row_keys = table_data['row_key'].to_numpy()
+
+    order = np.argsort(row_keys, kind='stable')
+    return order[np.argsort(timestamps[order], kind='stable')]
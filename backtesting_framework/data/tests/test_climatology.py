@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Climatology Index
+
+Checks the day-of-year and hour-of-day normals against pandas group
+statistics, that incremental database refreshes agree with the in-memory
+index, and that SeasonalWeatherStrategy signals are unchanged when served
+from the index.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sqlite3
+from datetime import datetime
+
+from ..climatology import (
+    ClimatologyIndex,
+    day_of_year,
+    load_climatology,
+    rebuild_climatology,
+    refresh_climatology
+)
+from ...strategies.weather_strategies import SeasonalWeatherStrategy
+
+
+def _weather(start, periods, freq='6H', seed=0):
+    rng = np.random.default_rng(seed)
+    timestamps = pd.date_range(start, periods=periods, freq=freq)
+    frames = []
+    for location, offset in (('London', 10.0), ('Paris', 14.0)):
+        season = np.sin(2 * np.pi * timestamps.dayofyear.to_numpy() / 366)
+        temperature = offset + 8 * season + rng.normal(0, 2, periods)
+        precipitation = rng.exponential(1.0, periods)
+        temperature[rng.random(periods) < 0.05] = np.nan
+        frames.append(pd.DataFrame({
+            'timestamp': timestamps,
+            'location_name': location,
+            'temperature': temperature,
+            'precipitation': precipitation
+        }))
+    return pd.concat(frames).sort_values(['timestamp', 'location_name']).reset_index(drop=True)
+
+
+def _insert(db_path, weather):
+    rows = [(ts.strftime('%Y-%m-%dT%H:%M:%SZ'), loc, None if np.isnan(t) else t, p)
+            for ts, loc, t, p in weather[['timestamp', 'location_name', 'temperature', 'precipitation']]
+            .itertuples(index=False)]
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO weather_data (timestamp, location_name, temperature, precipitation) VALUES (?, ?, ?, ?)",
+            rows
+        )
+
+
+@pytest.fixture
+def weather_db(tmp_path):
+    db_path = str(tmp_path / 'climatology.db')
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE weather_data (
+                timestamp TEXT, location_name TEXT, temperature REAL, precipitation REAL
+            )
+        """)
+    return db_path
+
+
+def _assert_matches_groups(index, weather):
+    """Index normals equal pandas statistics grouped by calendar day and hour"""
+    weather = weather.assign(month=weather['timestamp'].dt.month, day=weather['timestamp'].dt.day,
+                             hour=weather['timestamp'].dt.hour)
+    for (location, month, day), group in weather.groupby(['location_name', 'month', 'day']):
+        ts = group['timestamp'].iloc[0]
+        assert index.day_rows(location, ts) == len(group)
+        for var in ('temperature', 'precipitation'):
+            normal = index.normal(location, var, ts)
+            assert normal.count == group[var].count()
+            assert normal.mean == pytest.approx(group[var].mean(), rel=1e-9)
+            assert normal.std == pytest.approx(group[var].std(), rel=1e-7, nan_ok=True)
+
+    for (location, hour), group in weather.groupby(['location_name', 'hour']):
+        normal = index.normal(location, 'temperature', group['timestamp'].iloc[0], by='hour')
+        assert normal.mean == pytest.approx(group['temperature'].mean(), rel=1e-9)
+        assert normal.std == pytest.approx(group['temperature'].std(), rel=1e-7)
+
+
+class TestDayOfYear:
+    """Test cases for day_of_year"""
+
+    def test_dates_map_to_the_same_day_every_year(self):
+        timestamps = pd.DatetimeIndex(['2023-02-28', '2024-02-28', '2024-02-29',
+                                       '2023-03-01', '2024-03-01', '2023-12-31', '2024-12-31'])
+
+        assert day_of_year(timestamps).tolist() == [59, 59, 60, 61, 61, 366, 366]
+        assert ClimatologyIndex._day_of_year(pd.Timestamp('2023-03-01')) == 61
+
+
+class TestClimatologyIndex:
+    """Test cases for ClimatologyIndex"""
+
+    def test_normals_match_pandas(self):
+        weather = _weather('2021-01-01', 4 * 365 * 3)
+        index = ClimatologyIndex()
+        for _, tick in weather.groupby('timestamp'):
+            index.update(tick)
+
+        _assert_matches_groups(index, weather)
+        assert index.observations('London') == 4 * 365 * 3
+        assert index.normal('Berlin', 'temperature', weather['timestamp'].iloc[0]) is None
+
+    def test_invalid_granularity(self):
+        with pytest.raises(ValueError):
+            ClimatologyIndex().normal('London', 'temperature', datetime(2024, 1, 1), by='week')
+
+    def test_reset_restores_baseline(self):
+        weather = _weather('2022-01-01', 40)
+        index = ClimatologyIndex()
+        index.update(weather.iloc[:20])
+        index.mark_baseline()
+        baseline = index.normal('London', 'temperature', weather['timestamp'].iloc[0])
+
+        index.update(weather.iloc[20:])
+        index.reset()
+
+        assert index.active
+        assert index.normal('London', 'temperature', weather['timestamp'].iloc[0]) == baseline
+
+
+class TestPersistedClimatology:
+    """Test cases for the persisted climatology tables"""
+
+    def test_incremental_refresh_matches_full_data(self, weather_db):
+        weather = _weather('2021-01-01', 4 * 365 * 3)
+        split = len(weather) // 3
+
+        _insert(weather_db, weather.iloc[:split])
+        assert refresh_climatology(weather_db) == split
+        _insert(weather_db, weather.iloc[split:])
+        assert refresh_climatology(weather_db) == len(weather) - split
+        assert refresh_climatology(weather_db) == 0
+
+        index = load_climatology(weather_db)
+        _assert_matches_groups(index, weather)
+
+        # A rebuild folds everything in again and agrees
+        assert rebuild_climatology(weather_db) == len(weather)
+        rebuilt = load_climatology(weather_db)
+        ts = weather['timestamp'].iloc[-1]
+        assert rebuilt.normal('Paris', 'temperature', ts) == index.normal('Paris', 'temperature', ts)
+
+    def test_load_filters(self, weather_db):
+        weather = _weather('2021-01-01', 4 * 365 * 3)
+        _insert(weather_db, weather)
+        refresh_climatology(weather_db)
+
+        seed = load_climatology(weather_db, locations=['London'], before_year=2023)
+        _assert_matches_groups(seed, weather[(weather['location_name'] == 'London') &
+                                             (weather['timestamp'].dt.year < 2023)])
+        assert seed.observations('Paris') == 0
+
+
+class TestSeasonalStrategyClimatology:
+    """SeasonalWeatherStrategy signals from the index match the frame computation"""
+
+    def test_signals_match_frame_analysis(self):
+        weather = _weather('2021-01-01', 4 * 365 * 3 + 4 * 10, seed=4)
+        # Anomalies on the final days
+        weather.loc[weather.index[-16:], 'temperature'] += 25
+        weather.loc[weather.index[-6:], 'precipitation'] += 6
+
+        parameters = {'seasonal_lookback': 4 * 365, 'signal_strength_threshold': 0.0}
+        indexed = SeasonalWeatherStrategy(parameters=parameters)
+        indexed.climatology.reset()
+        indexed.indicators.reset()
+        direct = SeasonalWeatherStrategy(parameters=parameters)
+
+        ticks = list(weather.groupby('timestamp'))
+        checked = 0
+        for i, (timestamp, tick) in enumerate(ticks):
+            indexed.climatology.update(tick)
+            indexed.indicators.update(tick)
+            if i < len(ticks) - 12:
+                continue
+
+            from_index = indexed.generate_signals(pd.DataFrame(), tick, [])
+            history = weather[weather['timestamp'] <= timestamp]
+            from_frame = []
+            for _, location_history in history.groupby('location_name'):
+                from_frame.extend(direct._analyze_seasonal_patterns(location_history))
+
+            assert [(s.outcome_name, pytest.approx(s.confidence)) for s in from_index] == \
+                [(s.outcome_name, s.confidence) for s in from_frame]
+            checked += len(from_index)
+
+        assert checked > 0
@@ -8,6 +8,7 @@ including market data loading, weather data loading, and data alignment.
 
 import pytest
 import pandas as pd
+import numpy as np
 import sqlite3
 import tempfile
 import os
@@ -17,7 +18,10 @@ from unittest.mock import patch, MagicMock
 from ..data_loader import (
     BacktestingDataLoader,
     MarketData,
-    WeatherData
+    WeatherData,
+    compact_frame,
+    frame_memory,
+    iter_time_windows
 )
 
 
@@ -298,6 +302,172 @@ class TestBacktestingDataLoader:
         assert len(aligned_weather) == 2
 
 
+class TestStreamingLoad:
+    """Test cases for chunked, time-ordered data streaming"""
+
+    def test_market_chunks_match_full_load(self, temp_db):
+        """Concatenated chunks equal a full load, in time order"""
+        loader = BacktestingDataLoader(temp_db)
+
+        chunks = list(loader.iter_market_data(chunk_size=1))
+        streamed = pd.concat(chunks, ignore_index=True)
+
+        assert len(chunks) == 3
+        pd.testing.assert_frame_equal(streamed, loader.load_market_data())
+
+    def test_chunks_never_split_timestamps(self, temp_db):
+        """Rows sharing a timestamp always land in the same chunk"""
+        with sqlite3.connect(temp_db) as conn:
+            conn.executemany(
+                "INSERT INTO polymarket_data VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [('2024-01-01T11:00:00Z', f'market{i}', 'Yes', 0.5, 10.0, 'Extra', None) for i in range(3, 7)]
+            )
+
+        loader = BacktestingDataLoader(temp_db)
+        chunks = list(loader.iter_market_data(chunk_size=2))
+
+        timestamps = [set(chunk['timestamp']) for chunk in chunks]
+        for i, first in enumerate(timestamps):
+            for second in timestamps[i + 1:]:
+                assert not first & second
+        assert sum(len(chunk) for chunk in chunks) == 7
+
+    def test_weather_chunks_match_full_load(self, temp_db):
+        """Streamed weather rows, including filled gaps, equal a full load"""
+        with sqlite3.connect(temp_db) as conn:
+            conn.execute("UPDATE weather_data SET humidity = NULL WHERE timestamp = '2024-01-02T10:00:00Z'")
+
+        loader = BacktestingDataLoader(temp_db)
+        streamed = pd.concat(list(loader.iter_weather_data(chunk_size=1)), ignore_index=True)
+
+        pd.testing.assert_frame_equal(streamed, loader.load_weather_data())
+        assert streamed['humidity'].iloc[-1] == 70.0
+
+    def test_time_windows_align_like_full_range(self, temp_db):
+        """Aligning each window separately matches aligning everything at once"""
+        loader = BacktestingDataLoader(temp_db)
+        timestamps = pd.date_range('2024-01-01', periods=48, freq='20min')
+        market_df = pd.DataFrame({
+            'timestamp': timestamps,
+            'market_id': ['m1', 'm2'] * 24,
+            'probability': np.linspace(0.1, 0.9, 48),
+            'volume': np.arange(48, dtype=float),
+            'outcome_name': 'Yes',
+            'event_title': 'Test'
+        })
+        weather_df = pd.DataFrame({
+            'timestamp': timestamps[::3],
+            'location_name': 'London',
+            'temperature': np.arange(16, dtype=float),
+            'temperature_min': 0.0,
+            'temperature_max': 20.0,
+            'humidity': 70.0,
+            'wind_speed': 10.0,
+            'precipitation': 0.0,
+            'pressure': 1013.0,
+            'weather_code': 800,
+            'source_name': 'test'
+        })
+
+        def chunks(df, size):
+            return (df.iloc[i:i + size] for i in range(0, len(df), size))
+
+        aligned = [loader.align_data_timeline(m, w, 'H')
+                   for m, w in iter_time_windows(chunks(market_df, 5), chunks(weather_df, 4), 'H')]
+        windowed_market = pd.concat([m for m, _ in aligned]).sort_values(['timestamp', 'market_id'])
+        windowed_weather = pd.concat([w for _, w in aligned]).sort_values('timestamp')
+        full_market, full_weather = loader.align_data_timeline(market_df, weather_df, 'H')
+
+        assert len(aligned) > 1
+        pd.testing.assert_frame_equal(
+            windowed_market.reset_index(drop=True),
+            full_market.sort_values(['timestamp', 'market_id']).reset_index(drop=True)
+        )
+        pd.testing.assert_frame_equal(windowed_weather.reset_index(drop=True),
+                                      full_weather.reset_index(drop=True))
+
+
+class TestCompactDtypes:
+    """Test cases for compact dtype loading and alignment"""
+
+    def test_compact_market_load(self, temp_db):
+        """Identifiers load as categoricals and probabilities as float32"""
+        loader = BacktestingDataLoader(temp_db, compact=True)
+        df = loader.load_market_data()
+        full = BacktestingDataLoader(temp_db).load_market_data()
+
+        assert isinstance(df['market_id'].dtype, pd.CategoricalDtype)
+        assert isinstance(df['event_title'].dtype, pd.CategoricalDtype)
+        assert df['probability'].dtype == np.float32
+        assert df['volume'].dtype == np.float64
+        assert df['market_id'].tolist() == full['market_id'].tolist()
+        report = loader.memory_report['market']
+        assert report['saved'] == report['before'] - report['after']
+
+    def test_compact_weather_load(self, temp_db):
+        """Weather identifiers and measures use compact dtypes"""
+        loader = BacktestingDataLoader(temp_db, compact=True)
+        df = loader.load_weather_data()
+
+        assert isinstance(df['location_name'].dtype, pd.CategoricalDtype)
+        assert isinstance(df['source_name'].dtype, pd.CategoricalDtype)
+        assert df['temperature'].dtype == np.float32
+        assert df['pressure'].dtype == np.float32
+        assert set(loader.memory_report['weather']) == {'before', 'after', 'saved'}
+
+    def test_compact_frame_saves_memory(self):
+        """Repeated identifiers and float measures shrink substantially"""
+        df = pd.DataFrame({
+            'market_id': [f'market{i % 20}' for i in range(10000)],
+            'probability': np.linspace(0, 1, 10000)
+        })
+
+        compact = compact_frame(df, ['market_id'], ['probability'])
+
+        assert frame_memory(compact) < frame_memory(df) / 4
+        assert compact['market_id'].tolist() == df['market_id'].tolist()
+
+    @pytest.mark.parametrize('freq', ['H', '15min', 'D'])
+    def test_compact_alignment_matches_resample(self, temp_db, freq):
+        """Integer-binned compact alignment gives the same rows as resample"""
+        rng = np.random.default_rng(3)
+        n = 400
+        timestamps = pd.Timestamp('2024-01-01') + pd.to_timedelta(np.sort(rng.integers(0, 3 * 86400, n)), unit='s')
+        market_df = pd.DataFrame({
+            'timestamp': timestamps,
+            'market_id': rng.choice(['m1', 'm2', 'm3'], n),
+            'probability': rng.uniform(0, 1, n),
+            'volume': rng.uniform(0, 100, n),
+            'outcome_name': rng.choice(['Yes', 'No'], n),
+            'event_title': 'Test'
+        })
+        market_df.loc[::7, 'probability'] = np.nan
+        weather_df = pd.DataFrame({
+            'timestamp': timestamps,
+            'location_name': rng.choice(['London', 'Paris'], n),
+            'temperature': rng.normal(15, 5, n),
+            'temperature_min': rng.normal(10, 5, n),
+            'temperature_max': rng.normal(20, 5, n),
+            'humidity': rng.uniform(40, 90, n),
+            'wind_speed': rng.uniform(0, 20, n),
+            'precipitation': rng.exponential(1, n),
+            'pressure': rng.normal(1013, 10, n),
+            'weather_code': rng.choice([800, 500], n),
+            'source_name': 'test'
+        })
+
+        loader = BacktestingDataLoader(temp_db)
+        expected_market, expected_weather = loader.align_data_timeline(market_df, weather_df, freq)
+        compact_market, compact_weather = loader.align_data_timeline(market_df, weather_df, freq, compact=True)
+
+        assert compact_market['probability'].dtype == np.float32
+        assert isinstance(compact_weather['location_name'].dtype, pd.CategoricalDtype)
+        pd.testing.assert_frame_equal(compact_market, expected_market,
+                                      check_dtype=False, check_categorical=False, rtol=1e-5)
+        pd.testing.assert_frame_equal(compact_weather, expected_weather,
+                                      check_dtype=False, check_categorical=False, rtol=1e-5)
+
+
 class TestDataClasses:
     """Test cases for data classes"""
 
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Materialized Rollups
+
+Checks that aligned data served from the hourly and daily rollups matches
+align_data_timeline over raw rows, and that incremental refreshes agree
+with a full rebuild.
+"""
+
+import pytest
+import pandas as pd
+import sqlite3
+from datetime import datetime
+
+from ..data_loader import BacktestingDataLoader
+from ..rollups import rebuild_rollups, refresh_rollups
+
+
+def _market_rows(start, periods):
+    rows = []
+    for i, ts in enumerate(pd.date_range(start, periods=periods, freq='20min')):
+        stamp = ts.strftime('%Y-%m-%dT%H:%M:%SZ')
+        for market_id in ('market1', 'market2'):
+            # Sparse nulls exercise the loader's probability/volume defaults
+            probability = None if i % 11 == 0 else 0.3 + 0.01 * (i % 40)
+            volume = None if i % 13 == 0 else float(10 * i)
+            rows.append((stamp, market_id, f'Outcome {i % 3}', probability, volume, f'Event {market_id}'))
+    return rows
+
+
+def _weather_rows(start, periods, null_at=None):
+    rows = []
+    for i, ts in enumerate(pd.date_range(start, periods=periods, freq='30min')):
+        stamp = ts.strftime('%Y-%m-%dT%H:%M:%SZ')
+        for location, source_id in (('London', 1), ('Paris', 2)):
+            temperature = None if i == null_at else 10.0 + (i % 24) * 0.5
+            rows.append((stamp, location, 51.5, -0.1, temperature, 5.0, 20.0 + i % 5, 70.0, 3.0 + i % 7,
+                         0.1 * (i % 4), 1010.0 + i % 9, 800 + i % 3, 'Clear', source_id))
+    return rows
+
+
+def _insert(db_path, market_rows, weather_rows):
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany("""
+            INSERT INTO polymarket_data (timestamp, market_id, outcome_name, probability, volume, event_title)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, market_rows)
+        conn.executemany("""
+            INSERT INTO weather_data (timestamp, location_name, latitude, longitude, temperature,
+                                      temperature_min, temperature_max, humidity, wind_speed,
+                                      precipitation, pressure, weather_code, weather_description, source_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, weather_rows)
+
+
+@pytest.fixture
+def rollup_db(tmp_path):
+    """Database with sub-hourly market and weather rows over several days"""
+    db_path = str(tmp_path / 'rollups.db')
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE polymarket_data (
+                timestamp TEXT, market_id TEXT, outcome_name TEXT, probability REAL,
+                volume REAL, event_title TEXT, scraped_at TEXT
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE weather_data (
+                timestamp TEXT, location_name TEXT, latitude REAL, longitude REAL,
+                temperature REAL, temperature_min REAL, temperature_max REAL, humidity REAL,
+                wind_speed REAL, precipitation REAL, pressure REAL, weather_code INTEGER,
+                weather_description TEXT, source_id INTEGER
+            )
+        """)
+        conn.execute("CREATE TABLE weather_sources (id INTEGER PRIMARY KEY, source_name TEXT)")
+        conn.executemany("INSERT INTO weather_sources (source_name) VALUES (?)", [('openweather',), ('noaa',)])
+
+    _insert(db_path, _market_rows('2024-01-01 00:10', 300), _weather_rows('2024-01-01 00:00', 200))
+    return db_path
+
+
+def _on_the_fly(loader, start, end, freq, market_ids=None, locations=None):
+    market_df = loader.load_market_data(market_ids, start, end)
+    weather_df = loader.load_weather_data(locations, start, end)
+    return loader.align_data_timeline(market_df, weather_df, freq)
+
+
+def _assert_matches(served, expected):
+    for actual_df, expected_df in zip(served, expected):
+        pd.testing.assert_frame_equal(actual_df.reset_index(drop=True), expected_df.reset_index(drop=True),
+                                      check_dtype=False)
+
+
+class TestRollups:
+    """Test cases for the materialized rollups"""
+
+    @pytest.mark.parametrize('freq', ['H', 'D'])
+    @pytest.mark.parametrize('start,end', [
+        (None, None),
+        (datetime(2024, 1, 1, 3, 25), datetime(2024, 1, 3, 17, 40)),
+        (datetime(2024, 1, 2), datetime(2024, 1, 4))
+    ])
+    def test_matches_on_the_fly_alignment(self, rollup_db, freq, start, end):
+        """Rollup-served alignment equals align_data_timeline over raw rows"""
+        refresh_rollups(rollup_db)
+        loader = BacktestingDataLoader(rollup_db)
+
+        served = loader.load_rollup_data(start_date=start, end_date=end, freq=freq)
+
+        assert served is not None
+        _assert_matches(served, _on_the_fly(loader, start, end, freq))
+
+    def test_filters_markets_and_locations(self, rollup_db):
+        """Market and location filters select the same aligned rows"""
+        refresh_rollups(rollup_db)
+        loader = BacktestingDataLoader(rollup_db)
+        start, end = datetime(2024, 1, 1, 5, 5), datetime(2024, 1, 2, 22, 0)
+
+        served = loader.load_rollup_data(['market2'], ['Paris'], start, end, 'H')
+
+        _assert_matches(served, _on_the_fly(loader, start, end, 'H', ['market2'], ['Paris']))
+        assert set(served[0]['market_id']) == {'market2'}
+
+    def test_incremental_refresh_matches_rebuild(self, rollup_db):
+        """Folding in newly inserted rows gives the same rollups as a rebuild"""
+        assert refresh_rollups(rollup_db) == {'market': 600, 'weather': 400}
+        assert refresh_rollups(rollup_db) == {'market': 0, 'weather': 0}
+
+        # Overlaps existing buckets as well as extending past them
+        _insert(rollup_db, _market_rows('2024-01-04 02:05', 120), _weather_rows('2024-01-05 03:00', 60))
+        assert refresh_rollups(rollup_db) == {'market': 240, 'weather': 120}
+
+        loader = BacktestingDataLoader(rollup_db)
+        incremental = {freq: loader.load_rollup_data(freq=freq) for freq in ('H', 'D')}
+
+        rebuild_rollups(rollup_db)
+        for freq in ('H', 'D'):
+            _assert_matches(incremental[freq], loader.load_rollup_data(freq=freq))
+            _assert_matches(incremental[freq], _on_the_fly(loader, None, None, freq))
+
+    def test_stale_rollups_fall_back(self, rollup_db):
+        """Rows inserted after the last refresh disable the rollup path without writing to the database"""
+        refresh_rollups(rollup_db)
+        _insert(rollup_db, _market_rows('2024-01-06 00:00', 30), [])
+        loader = BacktestingDataLoader(rollup_db)
+
+        with sqlite3.connect(rollup_db) as conn:
+            marks = conn.execute("SELECT source, last_rowid FROM rollup_state ORDER BY source").fetchall()
+        assert loader.load_rollup_data(freq='H') is None
+        with sqlite3.connect(rollup_db) as conn:
+            assert conn.execute("SELECT source, last_rowid FROM rollup_state ORDER BY source").fetchall() == marks
+
+    def test_stale_rollups_refresh_on_request(self, rollup_db):
+        """With refresh set, rows inserted after the last refresh are folded in and served"""
+        refresh_rollups(rollup_db)
+        _insert(rollup_db, _market_rows('2024-01-06 00:00', 30), [])
+        loader = BacktestingDataLoader(rollup_db)
+
+        served = loader.load_rollup_data(freq='H', refresh=True)
+
+        _assert_matches(served, _on_the_fly(loader, None, None, 'H'))
+        assert refresh_rollups(rollup_db) == {'market': 0, 'weather': 0}
+
+    def test_weather_gaps_fall_back(self, rollup_db):
+        """Null weather measures the loader would fill disable the rollup path"""
+        _insert(rollup_db, [], _weather_rows('2024-01-06 00:00', 10, null_at=4))
+        refresh_rollups(rollup_db)
+        loader = BacktestingDataLoader(rollup_db)
+
+        assert loader.load_rollup_data(freq='H') is None
+        # Ranges that don't touch the gap are still served
+        assert loader.load_rollup_data(end_date=datetime(2024, 1, 3), freq='H') is not None
+
+    def test_unavailable_without_rollups(self, rollup_db):
+        """Loads fall back when rollups are not built or the frequency isn't kept"""
+        loader = BacktestingDataLoader(rollup_db)
+        assert loader.load_rollup_data(freq='H') is None
+
+        refresh_rollups(rollup_db)
+        assert loader.load_rollup_data(freq='15min') is None
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Memory-Mapped DataFrame Sharing
+
+Round-trip tests for exporting frames to column files and mapping them back.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from datetime import datetime
+
+from ..shared_frames import export_frame, load_frame
+
+
+@pytest.fixture
+def aligned_frame():
+    """Frame with the column kinds produced by align_data_timeline"""
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=4, freq='H'),
+        'market_id': ['market1', 'market2', 'market1', None],
+        'probability': [0.6, 0.4, 0.55, 0.45],
+        'volume': np.array([1000, 800, 950, 700], dtype=np.int64),
+        'active': [True, False, True, True]
+    })
+
+
+class TestSharedFrames:
+    """Test cases for export_frame/load_frame"""
+
+    def test_round_trip(self, aligned_frame, tmp_path):
+        """Loaded frames match the exported frame column for column"""
+        manifest = export_frame(aligned_frame, str(tmp_path), 'market')
+        loaded = load_frame(manifest)
+
+        pd.testing.assert_frame_equal(loaded, aligned_frame)
+        assert manifest['length'] == 4
+        assert len(list(tmp_path.iterdir())) == len(aligned_frame.columns)
+
+    def test_numeric_columns_are_memory_mapped(self, aligned_frame, tmp_path):
+        """Numeric columns are backed by the mapped files, not copies"""
+        loaded = load_frame(export_frame(aligned_frame, str(tmp_path), 'market'))
+
+        assert not loaded['probability'].to_numpy().flags.writeable
+
+    def test_timezone_aware_timestamps(self, tmp_path):
+        """Timezone-aware timestamps keep their zone"""
+        frame = pd.DataFrame({
+            'timestamp': pd.date_range(datetime(2024, 1, 1), periods=3, freq='H', tz='Europe/London')
+        })
+
+        loaded = load_frame(export_frame(frame, str(tmp_path), 'weather'))
+
+        pd.testing.assert_frame_equal(loaded, frame)
+
+    def test_categorical_columns(self, tmp_path):
+        """Categorical columns (compact_dtypes) load as the same categoricals, missing values included"""
+        frame = pd.DataFrame({
+            'market_id': pd.Categorical(['market1', None, 'market2', 'market1']),
+            'location': pd.Categorical(['London', 'Paris', 'London', 'Paris'],
+                                       categories=['Paris', 'London', 'Berlin'], ordered=True)
+        })
+
+        manifest = export_frame(frame, str(tmp_path), 'market')
+        loaded = load_frame(manifest)
+
+        assert [entry['kind'] for entry in manifest['columns']] == ['categorical', 'categorical']
+        pd.testing.assert_frame_equal(loaded, frame)
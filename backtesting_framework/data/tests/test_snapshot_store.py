@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Columnar Snapshot Store
+
+Checks that snapshot-backed loads match the SQLite loader and that
+refreshes append only newly inserted rows.
+"""
+
+import pytest
+import pandas as pd
+import sqlite3
+from datetime import datetime
+
+pytest.importorskip('pyarrow')
+
+from ..data_loader import BacktestingDataLoader
+from ..snapshot_store import SnapshotStore
+
+
+def _market_row(ts, market_id, outcome, probability, created_at):
+    return (ts, market_id, outcome, probability, 100.0, f'Event {market_id}', None, created_at)
+
+
+@pytest.fixture
+def snapshot_db(tmp_path):
+    """Database with created_at columns, several markets and two months of data"""
+    db_path = str(tmp_path / 'snapshot.db')
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE polymarket_data (
+                timestamp TEXT, market_id TEXT, outcome_name TEXT, probability REAL,
+                volume REAL, event_title TEXT, scraped_at TEXT, created_at TEXT
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE weather_data (
+                timestamp TEXT, location_name TEXT, latitude REAL, longitude REAL,
+                temperature REAL, temperature_min REAL, temperature_max REAL, humidity REAL,
+                wind_speed REAL, precipitation REAL, pressure REAL, weather_code INTEGER,
+                weather_description TEXT, source_id INTEGER, created_at TEXT
+            )
+        """)
+        conn.execute("CREATE TABLE weather_sources (id INTEGER PRIMARY KEY, source_name TEXT)")
+        conn.executemany("INSERT INTO weather_sources (source_name) VALUES (?)", [('openweather',), ('noaa',)])
+
+        market_rows = []
+        weather_rows = []
+        for day in range(1, 60, 3):
+            ts = (datetime(2024, 1, 1) + pd.Timedelta(days=day)).strftime('%Y-%m-%dT%H:%M:%SZ')
+            for market_id in ('market1', 'market2', '12345'):
+                market_rows.append(_market_row(ts, market_id, 'Yes', 0.01 * day, '2024-03-01 00:00:00'))
+            for location, source_id in (('London', 1), ('Paris', 2)):
+                temperature = None if day == 10 else float(day)
+                weather_rows.append((ts, location, 51.5, -0.1, temperature, 1.0, 20.0, 70.0, 5.0, 0.0,
+                                     1013.0, 800, 'Clear', source_id, '2024-03-01 00:00:00'))
+
+        conn.executemany("INSERT INTO polymarket_data VALUES (?, ?, ?, ?, ?, ?, ?, ?)", market_rows)
+        conn.executemany("INSERT INTO weather_data VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                         weather_rows)
+
+    return db_path
+
+
+class TestSnapshotStore:
+    """Test cases for SnapshotStore"""
+
+    def test_loads_match_sqlite(self, snapshot_db, tmp_path):
+        """Snapshot-backed loads return the same frames as SQLite queries"""
+        sql_loader = BacktestingDataLoader(snapshot_db)
+        snap_loader = BacktestingDataLoader(snapshot_db, snapshot_dir=str(tmp_path / 'snap'))
+
+        pd.testing.assert_frame_equal(snap_loader.load_market_data(), sql_loader.load_market_data())
+        pd.testing.assert_frame_equal(snap_loader.load_weather_data(), sql_loader.load_weather_data())
+
+    def test_filtered_loads_match_sqlite(self, snapshot_db, tmp_path):
+        """Market, location, source and date filters select the same rows"""
+        sql_loader = BacktestingDataLoader(snapshot_db)
+        snap_loader = BacktestingDataLoader(snapshot_db, snapshot_dir=str(tmp_path / 'snap'))
+        start, end = datetime(2024, 1, 20, 12), datetime(2024, 2, 10, 12)
+
+        pd.testing.assert_frame_equal(
+            snap_loader.load_market_data(['12345', 'market2'], start, end),
+            sql_loader.load_market_data(['12345', 'market2'], start, end)
+        )
+        pd.testing.assert_frame_equal(
+            snap_loader.load_weather_data(['Paris'], start, end, sources=['noaa']),
+            sql_loader.load_weather_data(['Paris'], start, end, sources=['noaa'])
+        )
+
+    def test_refresh_appends_new_rows(self, snapshot_db, tmp_path):
+        """Refreshes export only rows inserted after the high-water mark"""
+        store = SnapshotStore(snapshot_db, str(tmp_path / 'snap'))
+        assert store.refresh() == {'polymarket_data': 60, 'weather_data': 40}
+        assert store.refresh() == {'polymarket_data': 0, 'weather_data': 0}
+
+        with sqlite3.connect(snapshot_db) as conn:
+            conn.execute("INSERT INTO polymarket_data VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                         _market_row('2024-03-05T00:00:00Z', 'market3', 'No', 0.2, '2024-03-05 00:00:00'))
+
+        # A fresh store resumes from the persisted manifest
+        store = SnapshotStore(snapshot_db, str(tmp_path / 'snap'))
+        assert store.refresh() == {'polymarket_data': 1, 'weather_data': 0}
+        assert store.load('polymarket_data', ['market3'])['probability'].tolist() == [0.2]
+
+    def test_column_projection(self, snapshot_db, tmp_path):
+        """Only the requested columns are returned"""
+        store = SnapshotStore(snapshot_db, str(tmp_path / 'snap'))
+        store.refresh()
+
+        df = store.load('weather_data', ['London'], columns=['timestamp', 'temperature'])
+
+        assert list(df.columns) == ['timestamp', 'temperature']
+        assert len(df) == 20
+        assert df['timestamp'].is_monotonic_increasing
@@ -153,14 +153,19 @@ def run_multiple_strategies_backtest(strategy_names: List[str],
 
 def optimize_strategy(strategy_name: str,
                      optimization_method: str = 'random_search',
-                     max_evaluations: int = 50) -> Dict[str, Any]:
+                     max_evaluations: int = 50,
+                     n_jobs: int = 1,
+                     backend: str = 'thread') -> Dict[str, Any]:
     """
     Optimize strategy parameters
 
     Args:
         strategy_name: Name of strategy to optimize
-        optimization_method: Optimization method ('grid_search', 'random_search', 'bayesian', 'evolutionary')
+        optimization_method: Optimization method ('grid_search', 'random_search', 'bayesian', 'evolutionary',
+            'successive_halving', 'hyperband')
         max_evaluations: Maximum number of parameter evaluations
+        n_jobs: Number of parallel evaluations
+        backend: Parallel backend ('thread' or 'process')
 
     Returns:
         Dictionary with optimization results
@@ -192,7 +197,9 @@ def optimize_strategy(strategy_name: str,
         strategy_class=strategy_class,
         parameter_spaces=parameter_spaces,
         optimization_method=optimization_method,
-        max_evaluations=max_evaluations
+        max_evaluations=max_evaluations,
+        n_jobs=n_jobs,
+        backend=backend
     )
 
     logger.info(f"Optimization completed. Best score: {optimization_result.best_score:.4f}")
@@ -331,7 +338,7 @@ def main():
     )
     parser.add_argument(
         '--optimization-method', '-o',
-        choices=['grid_search', 'random_search', 'bayesian', 'evolutionary'],
+        choices=['grid_search', 'random_search', 'bayesian', 'evolutionary', 'successive_halving', 'hyperband'],
         default='random_search',
         help='Optimization method'
     )
@@ -341,6 +348,18 @@ def main():
         default=50,
         help='Maximum optimization evaluations'
     )
+    parser.add_argument(
+        '--n-jobs', '-j',
+        type=int,
+        default=1,
+        help='Number of parallel optimization evaluations'
+    )
+    parser.add_argument(
+        '--parallel-backend',
+        choices=['thread', 'process'],
+        default='thread',
+        help='Parallel backend for optimization (process scales CPU-bound sweeps across cores)'
+    )
     parser.add_argument(
         '--output', '-f',
         default='backtest_report.html',
@@ -407,7 +426,9 @@ def main():
             optimization_result = optimize_strategy(
                 args.strategy[0],
                 args.optimization_method,
-                args.max_evaluations
+                args.max_evaluations,
+                args.n_jobs,
+                args.parallel_backend
             )
 
             # Print optimization results
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Bayesian Optimization Surrogate
+
+Gaussian-process surrogate and expected-improvement proposals for
+StrategyOptimizer's Bayesian search, in plain NumPy/SciPy. Parameter dicts
+are encoded into the unit hypercube (categorical parameters one-hot), and
+batches of proposals are drawn with the kriging believer heuristic so
+several backtests can run concurrently.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import scipy.optimize as opt
+from scipy.linalg import cho_factor, cho_solve
+from scipy.stats import norm
+
+ParameterKey = Tuple[Tuple[str, Any], ...]
+
+
+def canonical_parameters(parameters: Dict[str, Any]) -> ParameterKey:
+    """
+    Hashable key for a parameter dict
+
+    NumPy scalars become Python values and floats are rounded to 12
+    significant digits, so the same point proposed by different search
+    paths maps to the same key.
+    """
+    items = []
+    for name in sorted(parameters):
+        value = parameters[name]
+        if isinstance(value, np.generic):
+            value = value.item()
+        if isinstance(value, float):
+            value = float(f'{value:.12g}')
+        elif not isinstance(value, (int, str, bool, type(None))):
+            value = repr(value)
+        items.append((name, value))
+    return tuple(items)
+
+
+class ParameterEncoder:
+    """
+    Maps parameter dicts to points in the unit hypercube and back
+
+    Continuous and discrete parameters take one dimension each (log-scaled
+    for log distributions); categorical parameters take one dimension per
+    value, one-hot encoded.
+    """
+
+    def __init__(self, parameter_spaces: Dict[str, Any]):
+        self.parameter_spaces = parameter_spaces
+        self.slices: Dict[str, slice] = {}
+
+        offset = 0
+        for name, space in parameter_spaces.items():
+            width = len(space.values) if space.param_type == 'categorical' else 1
+            self.slices[name] = slice(offset, offset + width)
+            offset += width
+        self.n_dims = offset
+
+    def _bounds(self, space) -> Tuple[float, float]:
+        low, high = float(space.min_value), float(space.max_value)
+        if space.param_type == 'continuous' and space.distribution == 'log':
+            return np.log10(low), np.log10(high)
+        return low, high
+
+    def encode(self, parameters: Dict[str, Any]) -> np.ndarray:
+        """Unit-hypercube point for a parameter dict"""
+        x = np.zeros(self.n_dims)
+        for name, space in self.parameter_spaces.items():
+            position = self.slices[name]
+            value = parameters[name]
+            if space.param_type == 'categorical':
+                x[position.start + list(space.values).index(value)] = 1.0
+                continue
+
+            low, high = self._bounds(space)
+            if space.param_type == 'continuous' and space.distribution == 'log':
+                value = np.log10(value)
+            x[position.start] = (value - low) / (high - low) if high > low else 0.0
+        return x
+
+    def decode(self, x: np.ndarray) -> Dict[str, Any]:
+        """Nearest parameter dict to a point (discrete values rounded, categories by argmax)"""
+        parameters = {}
+        for name, space in self.parameter_spaces.items():
+            position = self.slices[name]
+            if space.param_type == 'categorical':
+                parameters[name] = space.values[int(np.argmax(x[position]))]
+                continue
+
+            low, high = self._bounds(space)
+            value = low + float(np.clip(x[position.start], 0.0, 1.0)) * (high - low)
+            if space.param_type == 'discrete':
+                parameters[name] = int(round(value))
+            elif space.distribution == 'log':
+                parameters[name] = float(10 ** value)
+            else:
+                parameters[name] = float(value)
+        return parameters
+
+    def snap(self, X: np.ndarray) -> np.ndarray:
+        """Points moved to the encodings of their nearest parameter dicts (vectorized decode/encode)"""
+        X = np.clip(X, 0.0, 1.0)
+        rows = np.arange(len(X))
+        for name, space in self.parameter_spaces.items():
+            position = self.slices[name]
+            if space.param_type == 'categorical':
+                one_hot = np.zeros((len(X), position.stop - position.start))
+                one_hot[rows, np.argmax(X[:, position], axis=1)] = 1.0
+                X[:, position] = one_hot
+            elif space.param_type == 'discrete':
+                low, high = self._bounds(space)
+                if high > low:
+                    X[:, position.start] = (np.round(low + X[:, position.start] * (high - low)) - low) / (high - low)
+        return X
+
+    def sample(self, n: int) -> np.ndarray:
+        """n uniformly random points snapped to valid parameter values"""
+        return self.snap(np.random.uniform(size=(n, self.n_dims)))
+
+
+class GaussianProcess:
+    """
+    Gaussian-process regression with a Matern 5/2 kernel
+
+    Length scales are per dimension (ARD). Targets are standardized before
+    fitting, and the kernel hyperparameters are fitted by maximizing the
+    log marginal likelihood with L-BFGS-B, warm-started from the last fit.
+    """
+
+    LENGTH_SCALE_BOUNDS = (1e-2, 1e1)
+    SIGNAL_BOUNDS = (5e-2, 2e1)
+    NOISE_BOUNDS = (1e-6, 1.0)
+
+    def __init__(self, n_dims: int):
+        self.length_scales = np.full(n_dims, 0.3)
+        self.signal_variance = 1.0
+        self.noise_variance = 1e-3
+        self._X: Optional[np.ndarray] = None
+
+    def _kernel(self, A: np.ndarray, B: np.ndarray, length_scales: np.ndarray, signal: float) -> np.ndarray:
+        diff = (A[:, None, :] - B[None, :, :]) / length_scales
+        r = np.sqrt(np.sum(diff ** 2, axis=-1))
+        scaled = np.sqrt(5.0) * r
+        return signal * (1.0 + scaled + scaled ** 2 / 3.0) * np.exp(-scaled)
+
+    def _negative_log_likelihood(self, theta: np.ndarray, X: np.ndarray, y: np.ndarray) -> float:
+        length_scales, signal, noise = np.exp(theta[:-2]), np.exp(theta[-2]), np.exp(theta[-1])
+        K = self._kernel(X, X, length_scales, signal) + (noise + 1e-9) * np.eye(len(X))
+        try:
+            factor = cho_factor(K, lower=True)
+        except np.linalg.LinAlgError:
+            return 1e10
+        alpha = cho_solve(factor, y)
+        return 0.5 * y @ alpha + np.sum(np.log(np.diag(factor[0]))) + 0.5 * len(X) * np.log(2 * np.pi)
+
+    def fit(self, X: np.ndarray, y: np.ndarray, optimize: bool = True) -> 'GaussianProcess':
+        """Condition on observations, refitting the hyperparameters when optimize is set"""
+        self._y_mean = float(np.mean(y))
+        self._y_std = float(np.std(y)) or 1.0
+        targets = (y - self._y_mean) / self._y_std
+
+        if optimize and len(X) > 1:
+            theta = np.log(np.concatenate([self.length_scales, [self.signal_variance, self.noise_variance]]))
+            bounds = ([tuple(np.log(self.LENGTH_SCALE_BOUNDS))] * len(self.length_scales)
+                      + [tuple(np.log(self.SIGNAL_BOUNDS)), tuple(np.log(self.NOISE_BOUNDS))])
+            fitted = opt.minimize(self._negative_log_likelihood, theta, args=(X, targets),
+                                  method='L-BFGS-B', bounds=bounds)
+            if np.isfinite(fitted.fun):
+                self.length_scales = np.exp(fitted.x[:-2])
+                self.signal_variance, self.noise_variance = np.exp(fitted.x[-2:])
+
+        K = self._kernel(X, X, self.length_scales, self.signal_variance)
+        K += (self.noise_variance + 1e-9) * np.eye(len(X))
+        self._factor = cho_factor(K, lower=True)
+        self._alpha = cho_solve(self._factor, targets)
+        self._X = X
+        return self
+
+    def predict(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Posterior mean and standard deviation at X, in target units"""
+        K_star = self._kernel(X, self._X, self.length_scales, self.signal_variance)
+        mean = K_star @ self._alpha
+        v = cho_solve(self._factor, K_star.T)
+        variance = np.maximum(self.signal_variance - np.sum(K_star * v.T, axis=1), 1e-12)
+        return mean * self._y_std + self._y_mean, np.sqrt(variance) * self._y_std
+
+
+def expected_improvement(mean: np.ndarray, std: np.ndarray, best: float, xi: float = 0.01) -> np.ndarray:
+    """Expected improvement over best for a maximization problem"""
+    improvement = mean - best - xi
+    z = improvement / std
+    return improvement * norm.cdf(z) + std * norm.pdf(z)
+
+
+class GaussianProcessProposer:
+    """
+    Proposes parameter sets to evaluate next from the scores seen so far
+
+    Candidates are random points plus perturbations of the best ones,
+    ranked by expected improvement under a GP fitted to the scores.
+    Batches use the kriging believer heuristic: each chosen point is added
+    as if it had scored the GP mean, and the rest of the batch is ranked
+    against the updated posterior. Points whose keys are in `exclude`
+    (already evaluated) are never proposed.
+    """
+
+    def __init__(self,
+                 parameter_spaces: Dict[str, Any],
+                 n_candidates: int = 2048,
+                 xi: float = 0.01):
+        """
+        Args:
+            parameter_spaces: Dictionary of parameter spaces to search
+            n_candidates: Random candidates ranked per proposal
+            xi: Exploration margin, as a fraction of the score spread
+        """
+        self.encoder = ParameterEncoder(parameter_spaces)
+        self.gp = GaussianProcess(self.encoder.n_dims)
+        self.n_candidates = n_candidates
+        self.xi = xi
+
+    def sample(self, n: int, exclude: Set[ParameterKey]) -> List[Dict[str, Any]]:
+        """Up to n distinct random parameter sets not in exclude"""
+        return self._distinct(self.encoder.sample(max(4 * n, 16)), n, exclude)
+
+    def propose(self,
+                parameters: List[Dict[str, Any]],
+                scores: List[float],
+                n: int,
+                exclude: Set[ParameterKey]) -> List[Dict[str, Any]]:
+        """
+        Next batch of up to n parameter sets
+
+        Args:
+            parameters: Parameter sets evaluated so far
+            scores: Their scores (higher is better; non-finite are failures)
+            n: Batch size
+            exclude: Keys that must not be proposed
+
+        Returns:
+            Distinct parameter sets, fewer than n if the space is exhausted
+        """
+        scores = np.asarray(scores, dtype=float)
+        finite = np.isfinite(scores)
+        if finite.sum() < 2:
+            return self.sample(n, exclude)
+
+        # Failed evaluations count as the worst score seen
+        y = np.where(finite, scores, scores[finite].min())
+        X = np.array([self.encoder.encode(p) for p in parameters])
+        self.gp.fit(X, y)
+
+        candidates = self._candidates(X, y)
+        keys: Dict[int, ParameterKey] = {}
+        # Exploration margin in score units
+        xi = self.xi * (np.std(y) or 1.0)
+        chosen: List[Dict[str, Any]] = []
+        taken = set(exclude)
+        X_batch, y_batch = X, y
+
+        for _ in range(n):
+            mean, std = self.gp.predict(candidates)
+            ranking = np.argsort(-expected_improvement(mean, std, y_batch.max(), xi))
+            index = None
+            for i in ranking:
+                if i not in keys:
+                    keys[i] = canonical_parameters(self.encoder.decode(candidates[i]))
+                if keys[i] not in taken:
+                    index = i
+                    break
+            if index is None:
+                break
+
+            taken.add(keys[index])
+            chosen.append(self.encoder.decode(candidates[index]))
+
+            # Believe the GP mean at the chosen point for the rest of the batch
+            X_batch = np.vstack([X_batch, candidates[index]])
+            y_batch = np.append(y_batch, mean[index])
+            self.gp.fit(X_batch, y_batch, optimize=False)
+
+        return chosen
+
+    def _candidates(self, X: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Random points and local perturbations of the best observations"""
+        random_points = self.encoder.sample(self.n_candidates)
+        best = X[np.argsort(-y)[:5]]
+        noise = np.random.normal(0.0, 0.05, size=(len(best), 64, self.encoder.n_dims))
+        local = self.encoder.snap((best[:, None, :] + noise).reshape(-1, self.encoder.n_dims))
+        return np.vstack([random_points, local])
+
+    def _distinct(self, points: Iterable[np.ndarray], n: int, exclude: Set[ParameterKey]) -> List[Dict[str, Any]]:
+        chosen, taken = [], set(exclude)
+        for x in points:
+            parameters = self.encoder.decode(x)
+            key = canonical_parameters(parameters)
+            if key not in taken:
+                taken.add(key)
+                chosen.append(parameters)
+                if len(chosen) == n:
+                    break
+        return chosen
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Process-Pool Parameter Evaluation
+
+Runs optimizer backtests in worker processes so CPU-bound sweeps scale past
+the GIL. Aligned data is loaded once in the parent, exported to
+memory-mapped column files, and mapped by each worker at start-up; tasks
+then carry only parameter dicts and return compact score records.
+"""
+
+import dataclasses
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+
+import pandas as pd
+
+from ..core.backtesting_engine import BacktestingEngine, BacktestConfig, BacktestResult, PeriodSlicer
+from ..data.shared_frames import export_frame, load_frame
+
+logger = logging.getLogger(__name__)
+
+# Per-process state populated by _init_worker
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def summarize_result(parameters: Dict[str, Any],
+                     score: float,
+                     result: BacktestResult) -> Dict[str, Any]:
+    """Compact, picklable record of one evaluation"""
+    return {
+        'parameters': parameters,
+        'score': score,
+        'total_return': result.total_return,
+        'annualized_return': result.annualized_return,
+        'volatility': result.volatility,
+        'sharpe_ratio': result.sharpe_ratio,
+        'max_drawdown': result.max_drawdown,
+        'win_rate': result.win_rate,
+        'total_trades': result.total_trades,
+        'timestamp': datetime.now()
+    }
+
+
+def failure_record(parameters: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+    """Record for an evaluation that raised"""
+    return {
+        'parameters': parameters,
+        'score': float('-inf'),
+        'error': str(error),
+        'timestamp': datetime.now()
+    }
+
+
+def _init_worker(config: BacktestConfig,
+                 db_path: str,
+                 optimization_target: str,
+                 market_manifest: Dict[str, Any],
+                 weather_manifest: Dict[str, Any]):
+    """Map the shared frames and build one engine per worker process"""
+    # Imported here to avoid a circular import with strategy_optimizer
+    from .strategy_optimizer import StrategyOptimizer
+
+    # Workers only run prepared data: skip the database check and leave the
+    # snapshot alone, which concurrent refreshes from every worker would race on
+    worker_config = dataclasses.replace(config, snapshot_dir=None, use_rollups=False)
+    engine = BacktestingEngine(worker_config, db_path, validate_connection=False)
+    _WORKER_STATE['engine'] = engine
+    _WORKER_STATE['optimizer'] = StrategyOptimizer(engine, optimization_target)
+    _WORKER_STATE['market_data'] = load_frame(market_manifest)
+    _WORKER_STATE['weather_data'] = load_frame(weather_manifest)
+
+
+def _evaluate_chunk(strategy_class: type,
+                    param_chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Evaluate a chunk of parameter sets inside a worker"""
+    engine = _WORKER_STATE['engine']
+    optimizer = _WORKER_STATE['optimizer']
+    records = []
+
+    for parameters in param_chunk:
+        try:
+            strategy = strategy_class(parameters=parameters)
+            result = engine.run_prepared_backtest(
+                strategy, _WORKER_STATE['market_data'], _WORKER_STATE['weather_data']
+            )
+            score = optimizer._extract_optimization_score(result)
+            records.append(summarize_result(parameters, score, result))
+        except Exception as e:
+            records.append(failure_record(parameters, e))
+
+    return records
+
+
+def _backtest_periods(strategy_class: type,
+                      tasks: List[Tuple[int, int, Dict[str, Any]]]) -> List[Any]:
+    """
+    Backtest (start, end, parameters) tasks on timeline periods of the shared data
+
+    Returns a BacktestResult per task, or the error message if it raised.
+    """
+    periods = _WORKER_STATE.get('periods')
+    if periods is None:
+        periods = _WORKER_STATE['periods'] = PeriodSlicer(
+            _WORKER_STATE['market_data'], _WORKER_STATE['weather_data']
+        )
+
+    results = []
+    for start, end, parameters in tasks:
+        try:
+            market_data, weather_data = periods.slice(start, end)
+            engine = _WORKER_STATE['engine'].with_period(*periods.dates(start, end))
+            results.append(engine.run_prepared_backtest(strategy_class(parameters=parameters),
+                                                        market_data, weather_data))
+        except Exception as e:
+            results.append(str(e))
+
+    return results
+
+
+class ProcessPoolEvaluator:
+    """
+    Evaluates parameter sets for one strategy class across worker processes
+
+    Usage:
+        with ProcessPoolEvaluator(engine, 'sharpe_ratio', n_jobs=8) as evaluator:
+            records = evaluator.evaluate(MyStrategy, param_combinations)
+    """
+
+    def __init__(self,
+                 engine: BacktestingEngine,
+                 optimization_target: str,
+                 n_jobs: int,
+                 chunk_size: Optional[int] = None,
+                 market_data: Optional[pd.DataFrame] = None,
+                 weather_data: Optional[pd.DataFrame] = None):
+        """
+        Args:
+            engine: Engine whose config and database the workers use
+            optimization_target: Metric extracted as the score
+            n_jobs: Number of worker processes
+            chunk_size: Parameter sets per task (None to size automatically)
+            market_data: Aligned market data (loaded from the engine if None)
+            weather_data: Aligned weather data (loaded from the engine if None)
+        """
+        self.engine = engine
+        self.optimization_target = optimization_target
+        self.n_jobs = max(1, n_jobs)
+        self.chunk_size = chunk_size
+        self.market_data = market_data
+        self.weather_data = weather_data
+        self._shared_dir: Optional[str] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def start(self):
+        """Export the shared frames and start the worker pool"""
+        if self.market_data is None or self.weather_data is None:
+            self.market_data, self.weather_data = self.engine.load_aligned_data()
+
+        self._shared_dir = tempfile.mkdtemp(prefix='climatetrade_shared_')
+        market_manifest = export_frame(self.market_data, self._shared_dir, 'market')
+        weather_manifest = export_frame(self.weather_data, self._shared_dir, 'weather')
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.n_jobs,
+            initializer=_init_worker,
+            initargs=(self.engine.config, self.engine.data_loader.db_path,
+                      self.optimization_target, market_manifest, weather_manifest)
+        )
+        logger.info(f"Started process pool with {self.n_jobs} workers")
+
+    def shutdown(self):
+        """Stop the workers and remove the shared column files"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        if self._shared_dir is not None:
+            shutil.rmtree(self._shared_dir, ignore_errors=True)
+            self._shared_dir = None
+
+    def evaluate(self,
+                 strategy_class: type,
+                 param_combinations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Evaluate parameter sets, submitting them to the pool in chunks
+
+        Failed evaluations are returned as records with score -inf and an
+        'error' entry; if the pool itself breaks, the remaining parameter
+        sets are reported as failed rather than aborting the sweep.
+        """
+        return self._map_chunks(_evaluate_chunk, strategy_class, param_combinations,
+                                lambda params, e: [failure_record(params, e)])
+
+    def backtest_periods(self,
+                         strategy_class: type,
+                         tasks: List[Tuple[int, int, Dict[str, Any]]]) -> List[Any]:
+        """
+        Backtest parameter sets on periods of the shared data
+
+        Tasks are (start, end, parameters) with start/end offsets into the
+        timeline of a PeriodSlicer over the shared frames. Results come back
+        in task order, each a BacktestResult or an error message.
+        """
+        return self._map_chunks(_backtest_periods, strategy_class, tasks,
+                                lambda task, e: [str(e)], ordered=True)
+
+    def _map_chunks(self,
+                    worker: Callable,
+                    strategy_class: type,
+                    items: List[Any],
+                    on_failure: Callable[[Any, Exception], List[Any]],
+                    ordered: bool = False) -> List[Any]:
+        """Submit items to the pool in chunks, keeping a bounded number in flight"""
+        if self._executor is None:
+            raise RuntimeError("ProcessPoolEvaluator has not been started")
+
+        chunk_size = self.chunk_size or max(1, len(items) // (self.n_jobs * 4))
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+        chunk_results: Dict[int, List[Any]] = {}
+        pending = {}
+        max_in_flight = self.n_jobs * 2
+        next_chunk = 0
+
+        while next_chunk < len(chunks) or pending:
+            # Keep a bounded number of chunks in flight
+            while next_chunk < len(chunks) and len(pending) < max_in_flight:
+                try:
+                    future = self._executor.submit(worker, strategy_class, chunks[next_chunk])
+                except BrokenProcessPool as e:
+                    for index in range(next_chunk, len(chunks)):
+                        chunk_results[index] = [r for item in chunks[index] for r in on_failure(item, e)]
+                    next_chunk = len(chunks)
+                    break
+                pending[future] = next_chunk
+                next_chunk += 1
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    chunk_results[index] = future.result()
+                except Exception as e:
+                    logger.error(f"Parameter chunk evaluation failed: {e}")
+                    chunk_results[index] = [r for item in chunks[index] for r in on_failure(item, e)]
+
+        # Completion order unless the caller needs results aligned with items
+        order = sorted(chunk_results) if ordered else chunk_results
+        return [result for index in order for result in chunk_results[index]]
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Optimizer Results Store
+
+Records finished optimizer evaluations in the backtest_results table so a
+sweep that is interrupted (out of memory, a preempted machine) and run
+again skips the parameter sets it already backtested. Each evaluation is
+identified by the strategy class, optimization target, canonicalized
+parameters and the engine settings that affect its score; the score and
+summary metrics are kept as JSON in the metrics column, and the
+evaluations of one strategy and period share a backtest_configs row.
+"""
+
+import hashlib
+import json
+import math
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import logging
+
+from .bayesian import canonical_parameters
+
+logger = logging.getLogger(__name__)
+
+# Same definitions as database/schema.sql, for databases set up without it
+BACKTEST_TABLES_SQL = """
+CREATE TABLE IF NOT EXISTS backtest_configs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    config_name TEXT NOT NULL UNIQUE,
+    strategy_id INTEGER,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    initial_capital REAL DEFAULT 10000.0,
+    commission_per_trade REAL DEFAULT 0.001,
+    max_position_size REAL DEFAULT 0.1,
+    max_positions INTEGER DEFAULT 10,
+    data_frequency TEXT DEFAULT 'H',
+    risk_free_rate REAL DEFAULT 0.02,
+    enable_parallel BOOLEAN DEFAULT 0,
+    parameters TEXT,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS backtest_results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    backtest_id TEXT NOT NULL UNIQUE,
+    config_id INTEGER NOT NULL,
+    strategy_name TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    total_return REAL NOT NULL,
+    annualized_return REAL NOT NULL,
+    volatility REAL NOT NULL,
+    sharpe_ratio REAL NOT NULL,
+    max_drawdown REAL NOT NULL,
+    win_rate REAL NOT NULL,
+    total_trades INTEGER NOT NULL,
+    equity_curve TEXT,
+    metrics TEXT,
+    execution_time_seconds REAL,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+# Record fields kept with the score; summarize_result records carry the same names
+SUMMARY_FIELDS = ('total_return', 'annualized_return', 'volatility', 'sharpe_ratio',
+                  'max_drawdown', 'win_rate', 'total_trades')
+
+# Engine settings that change a backtest's score
+CONFIG_FIELDS = ('start_date', 'end_date', 'initial_capital', 'commission_per_trade', 'max_position_size',
+                 'max_positions', 'data_frequency', 'risk_free_rate')
+
+
+# Hashable form of the engine settings that change a backtest's score
+ConfigKey = Tuple[Tuple[str, Any], ...]
+
+
+def config_fingerprint(config: Optional[Any]) -> ConfigKey:
+    """The CONFIG_FIELDS of an engine config as (name, value) pairs (engine stand-ins may have none)"""
+    if config is None:
+        return ()
+    return tuple((name, getattr(config, name)) for name in CONFIG_FIELDS if hasattr(config, name))
+
+
+def _column_value(value: Any) -> float:
+    """NOT NULL column value (SQLite stores NaN as NULL, so non-finite values become 0)"""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return value if math.isfinite(value) else 0.0
+
+
+class BacktestResultsStore:
+    """
+    Finished optimizer evaluations in the backtest_results table
+
+    Usage:
+        store = BacktestResultsStore("data/climatetrade.db")
+        optimizer = StrategyOptimizer(engine, 'sharpe_ratio', results_store=store)
+        optimizer.optimize_strategy(MyStrategy, spaces, 'grid_search')  # re-runs resume
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: SQLite database holding (or to hold) the backtest tables
+        """
+        self.db_path = db_path
+        self._config_ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executescript(BACKTEST_TABLES_SQL)
+
+    def evaluation_id(self,
+                      strategy_class: type,
+                      optimization_target: str,
+                      parameters: Dict[str, Any],
+                      config: Optional[Any]) -> str:
+        """Stable backtest_id for one evaluation"""
+        identity = json.dumps([
+            f"{strategy_class.__module__}.{strategy_class.__qualname__}",
+            optimization_target,
+            [list(item) for item in canonical_parameters(parameters)],
+            self._config_fields(config)
+        ], default=str)
+        return 'opt-' + hashlib.sha1(identity.encode()).hexdigest()
+
+    def load(self, backtest_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Stored records by backtest_id, for the ids that have one"""
+        backtest_ids = list(dict.fromkeys(backtest_ids))
+        found: Dict[str, Dict[str, Any]] = {}
+        if not backtest_ids:
+            return found
+
+        with sqlite3.connect(self.db_path) as conn:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(backtest_ids), 500):
+                batch = backtest_ids[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT backtest_id, metrics FROM backtest_results "
+                    f"WHERE backtest_id IN ({','.join('?' * len(batch))})", batch
+                ).fetchall()
+                for backtest_id, metrics in rows:
+                    try:
+                        found[backtest_id] = json.loads(metrics)
+                    except (TypeError, ValueError):
+                        logger.warning(f"Ignoring unreadable stored evaluation {backtest_id}")
+
+        return found
+
+    def save(self,
+             backtest_id: str,
+             strategy_class: type,
+             config: Optional[Any],
+             record: Dict[str, Any]):
+        """Store a successful evaluation record (its score, parameters and summary metrics)"""
+        summary = self._summary(record)
+        stored = {
+            'parameters': dict(canonical_parameters(record['parameters'])),
+            'score': float(record['score']),
+            **summary
+        }
+        fields = self._config_fields(config)
+
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            config_id = self._config_id(conn, strategy_class, fields)
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO backtest_results
+                    (backtest_id, config_id, strategy_name, start_date, end_date, total_return,
+                     annualized_return, volatility, sharpe_ratio, max_drawdown, win_rate, total_trades,
+                     metrics)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (backtest_id, config_id, strategy_class.__name__,
+                 str(fields.get('start_date', '')), str(fields.get('end_date', '')),
+                 *(_column_value(summary.get(name)) for name in SUMMARY_FIELDS[:-1]),
+                 int(_column_value(summary.get('total_trades'))),
+                 json.dumps(stored, default=str))
+            )
+
+    def _summary(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Summary metrics of a record holding a BacktestResult or a compact summary"""
+        result = record.get('result')
+        summary = {}
+        for name in SUMMARY_FIELDS:
+            value = getattr(result, name, None) if result is not None else record.get(name)
+            if value is not None:
+                summary[name] = value.item() if hasattr(value, 'item') else value
+        return summary
+
+    def _config_fields(self, config: Optional[Any]) -> Dict[str, Any]:
+        return dict(config_fingerprint(config))
+
+    def _config_id(self, conn: sqlite3.Connection, strategy_class: type, fields: Dict[str, Any]) -> int:
+        """backtest_configs row shared by the evaluations of a strategy over one engine setup"""
+        parameters = json.dumps(fields, default=str, sort_keys=True)
+        config_name = (f"optimizer:{strategy_class.__name__}:"
+                       f"{hashlib.sha1(parameters.encode()).hexdigest()[:12]}")
+        if config_name in self._config_ids:
+            return self._config_ids[config_name]
+
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO backtest_configs
+                (config_name, start_date, end_date, initial_capital, commission_per_trade, data_frequency,
+                 parameters)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (config_name, str(fields.get('start_date', '')), str(fields.get('end_date', '')),
+             fields.get('initial_capital', 10000.0), fields.get('commission_per_trade', 0.001),
+             fields.get('data_frequency', 'H'), parameters)
+        )
+        config_id = conn.execute("SELECT id FROM backtest_configs WHERE config_name = ?",
+                                 (config_name,)).fetchone()[0]
+        self._config_ids[config_name] = config_id
+        return config_id
+
+    def count(self) -> int:
+        """Number of stored evaluations"""
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM backtest_results WHERE backtest_id LIKE 'opt-%'"
+                                ).fetchone()[0]
@@ -12,15 +12,23 @@ from typing import Dict, List, Tuple, Optional, Any, Callable
 from dataclasses import dataclass
 from datetime import datetime
 import logging
+from contextlib import nullcontext
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from sklearn.model_selection import ParameterGrid
 import scipy.optimize as opt
 
-from ..core.backtesting_engine import BacktestingEngine, BacktestConfig, BacktestResult
+from ..core.backtesting_engine import BacktestingEngine, BacktestConfig, BacktestResult, PeriodSlicer
 from ..strategies.base_strategy import BaseWeatherStrategy
+from .bayesian import GaussianProcessProposer, ParameterKey, canonical_parameters
+from .parallel_evaluation import ProcessPoolEvaluator
+from .results_store import BacktestResultsStore, ConfigKey, config_fingerprint
+from .walk_forward import Period, WalkForwardResult, build_walk_forward_windows
 
 logger = logging.getLogger(__name__)
 
+# Memo key: strategy class, optimization target, engine settings and canonical parameters
+EvaluationKey = Tuple[type, str, ConfigKey, ParameterKey]
+
 
 @dataclass
 class OptimizationResult:
@@ -52,28 +60,54 @@ class StrategyOptimizer:
     - Random Search: Random sampling from parameter space
     - Bayesian Optimization: Gaussian process-based optimization
     - Evolutionary Algorithms: Genetic algorithm-based optimization
+    - Successive Halving / Hyperband: Candidates backtested on a prefix of
+      the period, with the best extended to longer prefixes
+
+    Grid, random and Bayesian search can evaluate in parallel on threads
+    or, for CPU-bound sweeps, on a process pool sharing memory-mapped data.
+    Evaluations are memoized by canonicalized parameter dict, so a
+    parameter set proposed twice is only backtested once per optimizer.
+    With a results store, finished evaluations are also written to the
+    backtest_results table as they complete, and a re-run of an
+    interrupted sweep answers them from there instead of backtesting again.
     """
 
+    PARALLEL_BACKENDS = ('thread', 'process')
+
+    # Successive halving keeps 1 / HALVING_ETA of the candidates per rung,
+    # starting from a prefix of at least HALVING_MIN_PERIOD days
+    HALVING_ETA = 3
+    HALVING_MIN_PERIOD = 7
+
     def __init__(self,
                  backtest_engine: BacktestingEngine,
-                 optimization_target: str = 'sharpe_ratio'):
+                 optimization_target: str = 'sharpe_ratio',
+                 results_store: Optional[BacktestResultsStore] = None):
         """
         Initialize optimizer
 
         Args:
             backtest_engine: BacktestingEngine instance
             optimization_target: Metric to optimize ('sharpe_ratio', 'total_return', 'win_rate', etc.)
+            results_store: Store of finished evaluations shared across runs (None keeps them in memory only)
         """
         self.engine = backtest_engine
         self.optimization_target = optimization_target
+        self.results_store = results_store
         self.logger = logging.getLogger(__name__)
+        self._evaluation_cache: Dict[EvaluationKey, Dict[str, Any]] = {}
+
+    def clear_evaluation_cache(self):
+        """Forget memoized evaluations, e.g. after changing the engine's data or config"""
+        self._evaluation_cache.clear()
 
     def optimize_strategy(self,
                          strategy_class: type,
                          parameter_spaces: Dict[str, ParameterSpace],
                          optimization_method: str = 'grid_search',
                          max_evaluations: int = 50,
-                         n_jobs: int = 1) -> OptimizationResult:
+                         n_jobs: int = 1,
+                         backend: str = 'thread') -> OptimizationResult:
         """
         Optimize strategy parameters
 
@@ -83,20 +117,30 @@ class StrategyOptimizer:
             optimization_method: Optimization method to use
             max_evaluations: Maximum number of parameter evaluations
             n_jobs: Number of parallel jobs
+            backend: Parallel backend when n_jobs > 1 ('thread' or 'process')
 
         Returns:
             OptimizationResult with best parameters and optimization history
         """
         self.logger.info(f"Starting optimization of {strategy_class.__name__} using {optimization_method}")
 
+        if backend not in self.PARALLEL_BACKENDS:
+            raise ValueError(f"Unknown parallel backend: {backend}")
+
         if optimization_method == 'grid_search':
-            return self._grid_search_optimization(strategy_class, parameter_spaces, max_evaluations, n_jobs)
+            return self._grid_search_optimization(strategy_class, parameter_spaces, max_evaluations,
+                                                  n_jobs, backend)
         elif optimization_method == 'random_search':
-            return self._random_search_optimization(strategy_class, parameter_spaces, max_evaluations, n_jobs)
+            return self._random_search_optimization(strategy_class, parameter_spaces, max_evaluations,
+                                                    n_jobs, backend)
         elif optimization_method == 'bayesian':
-            return self._bayesian_optimization(strategy_class, parameter_spaces, max_evaluations)
+            return self._bayesian_optimization(strategy_class, parameter_spaces, max_evaluations,
+                                               n_jobs, backend)
         elif optimization_method == 'evolutionary':
             return self._evolutionary_optimization(strategy_class, parameter_spaces, max_evaluations)
+        elif optimization_method in ('successive_halving', 'hyperband'):
+            return self._halving_optimization(strategy_class, parameter_spaces, max_evaluations,
+                                              hyperband=optimization_method == 'hyperband')
         else:
             raise ValueError(f"Unknown optimization method: {optimization_method}")
 
@@ -104,39 +148,17 @@ class StrategyOptimizer:
                                  strategy_class: type,
                                  parameter_spaces: Dict[str, ParameterSpace],
                                  max_evaluations: int,
-                                 n_jobs: int) -> OptimizationResult:
+                                 n_jobs: int,
+                                 backend: str = 'thread') -> OptimizationResult:
         """Perform grid search optimization"""
-        # Create parameter grid
-        param_grid = {}
-        for param_name, param_space in parameter_spaces.items():
-            if param_space.param_type == 'discrete':
-                param_grid[param_name] = range(int(param_space.min_value), int(param_space.max_value) + 1)
-            elif param_space.param_type == 'categorical':
-                param_grid[param_name] = param_space.values
-            else:
-                # For continuous parameters, create a discrete grid
-                n_points = min(10, max_evaluations // 10)  # Limit grid size
-                if param_space.distribution == 'log':
-                    param_grid[param_name] = np.logspace(
-                        np.log10(param_space.min_value),
-                        np.log10(param_space.max_value),
-                        n_points
-                    )
-                else:
-                    param_grid[param_name] = np.linspace(
-                        param_space.min_value,
-                        param_space.max_value,
-                        n_points
-                    )
-
-        grid = ParameterGrid(param_grid)
+        grid = self._grid_candidates(parameter_spaces, max_evaluations)
         total_combinations = len(grid)
 
         self.logger.info(f"Grid search with {total_combinations} parameter combinations")
 
         # Evaluate parameter combinations
         results = self._evaluate_parameter_combinations(
-            strategy_class, list(grid)[:max_evaluations], n_jobs
+            strategy_class, list(grid)[:max_evaluations], n_jobs, backend
         )
 
         # Find best result
@@ -155,11 +177,66 @@ class StrategyOptimizer:
                                    strategy_class: type,
                                    parameter_spaces: Dict[str, ParameterSpace],
                                    max_evaluations: int,
-                                   n_jobs: int) -> OptimizationResult:
+                                   n_jobs: int,
+                                   backend: str = 'thread') -> OptimizationResult:
         """Perform random search optimization"""
         self.logger.info(f"Random search with {max_evaluations} evaluations")
 
-        # Generate random parameter combinations
+        param_combinations = self._random_candidates(parameter_spaces, max_evaluations)
+
+        # Evaluate parameter combinations
+        results = self._evaluate_parameter_combinations(
+            strategy_class, param_combinations, n_jobs, backend
+        )
+
+        # Find best result
+        best_result = max(results, key=lambda x: x['score'])
+        best_params = best_result['parameters']
+
+        return OptimizationResult(
+            best_parameters=best_params,
+            best_score=best_result['score'],
+            optimization_history=results,
+            convergence_info={
+                'total_evaluations': len(results),
+                'cache_hits': self._cache_hits(results),
+                'method': 'random_search'
+            },
+            optimization_method='random_search'
+        )
+
+    def _grid_candidates(self,
+                         parameter_spaces: Dict[str, ParameterSpace],
+                         max_evaluations: int) -> ParameterGrid:
+        """Parameter grid over the spaces (continuous ones discretized)"""
+        param_grid = {}
+        for param_name, param_space in parameter_spaces.items():
+            if param_space.param_type == 'discrete':
+                param_grid[param_name] = range(int(param_space.min_value), int(param_space.max_value) + 1)
+            elif param_space.param_type == 'categorical':
+                param_grid[param_name] = param_space.values
+            else:
+                # For continuous parameters, create a discrete grid
+                n_points = min(10, max_evaluations // 10)  # Limit grid size
+                if param_space.distribution == 'log':
+                    param_grid[param_name] = np.logspace(
+                        np.log10(param_space.min_value),
+                        np.log10(param_space.max_value),
+                        n_points
+                    )
+                else:
+                    param_grid[param_name] = np.linspace(
+                        param_space.min_value,
+                        param_space.max_value,
+                        n_points
+                    )
+
+        return ParameterGrid(param_grid)
+
+    def _random_candidates(self,
+                           parameter_spaces: Dict[str, ParameterSpace],
+                           max_evaluations: int) -> List[Dict[str, Any]]:
+        """Random parameter combinations sampled from the spaces"""
         param_combinations = []
         for _ in range(max_evaluations):
             params = {}
@@ -191,40 +268,231 @@ class StrategyOptimizer:
 
             param_combinations.append(params)
 
-        # Evaluate parameter combinations
-        results = self._evaluate_parameter_combinations(
-            strategy_class, param_combinations, n_jobs
-        )
+        return param_combinations
 
-        # Find best result
-        best_result = max(results, key=lambda x: x['score'])
-        best_params = best_result['parameters']
+    def _bayesian_optimization(self,
+                              strategy_class: type,
+                              parameter_spaces: Dict[str, ParameterSpace],
+                              max_evaluations: int,
+                              n_jobs: int = 1,
+                              backend: str = 'thread') -> OptimizationResult:
+        """
+        Perform Bayesian optimization
+
+        Starts from a random design of 2 * dimensions + 1 points, then fits
+        a Gaussian process to the scores and evaluates the expected
+        improvement maximizers in batches of n_jobs. Stops early when the
+        space has no unevaluated points left.
+        """
+        self.logger.info(f"Bayesian optimization with {max_evaluations} evaluations")
+
+        proposer = GaussianProcessProposer(parameter_spaces)
+        batch_size = max(1, n_jobs)
+        n_initial = min(max_evaluations, max(batch_size, 2 * proposer.encoder.n_dims + 1))
+
+        optimization_history = []
+        evaluated: Dict[ParameterKey, Dict[str, Any]] = {}
+        best_score_trace = []
+
+        use_processes = n_jobs > 1 and backend == 'process'
+        # One pool for every batch, so the data is exported once
+        pool = (ProcessPoolEvaluator(self.engine, self.optimization_target, n_jobs)
+                if use_processes else nullcontext())
+
+        with pool as evaluator:
+            iteration = 0
+            while len(evaluated) < max_evaluations:
+                n = min(batch_size, max_evaluations - len(evaluated))
+                if len(evaluated) < n_initial:
+                    batch = proposer.sample(min(n, n_initial - len(evaluated)), set(evaluated))
+                else:
+                    records = list(evaluated.values())
+                    batch = proposer.propose([r['parameters'] for r in records],
+                                             [r['score'] for r in records], n, set(evaluated))
+                if not batch:
+                    break
+
+                results = self._evaluate_parameter_combinations(strategy_class, batch, n_jobs, backend,
+                                                                evaluator=evaluator)
+                if not results:
+                    break
+                for result in results:
+                    result['iteration'] = iteration
+                    evaluated[canonical_parameters(result['parameters'])] = result
+                    optimization_history.append(result)
+                    best_score_trace.append(max(best_score_trace[-1:] + [result['score']]))
+                iteration += 1
+
+        best_result = max(optimization_history, key=lambda x: x['score'])
 
         return OptimizationResult(
-            best_parameters=best_params,
+            best_parameters=best_result['parameters'],
             best_score=best_result['score'],
-            optimization_history=results,
-            convergence_info={'total_evaluations': len(results), 'method': 'random_search'},
-            optimization_method='random_search'
+            optimization_history=optimization_history,
+            convergence_info={
+                'total_evaluations': len(optimization_history),
+                'initial_points': n_initial,
+                'batch_size': batch_size,
+                'iterations': iteration,
+                'best_score_trace': best_score_trace,
+                'cache_hits': self._cache_hits(optimization_history),
+                'method': 'bayesian'
+            },
+            optimization_method='bayesian'
         )
 
-    def _bayesian_optimization(self,
+    def _halving_optimization(self,
                               strategy_class: type,
                               parameter_spaces: Dict[str, ParameterSpace],
-                              max_evaluations: int) -> OptimizationResult:
-        """Perform Bayesian optimization"""
-        # This is a simplified implementation
-        # In practice, you would use libraries like scikit-optimize or GPyOpt
+                              max_evaluations: int,
+                              hyperband: bool = False) -> OptimizationResult:
+        """
+        Perform successive halving or Hyperband optimization
+
+        Every candidate is backtested on a short prefix of the period; the
+        best 1 / HALVING_ETA are resumed to a prefix HALVING_ETA times longer,
+        and so on until the survivors reach the full period. Candidates of a
+        bracket advance together in one shared pass, and extending a
+        backtest continues it rather than restarting it.
+
+        Hyperband runs several brackets that trade the number of candidates
+        against the length of the first prefix, from many candidates on the
+        shortest prefix down to a few on the full period, splitting the
+        max_evaluations candidates between them.
+        """
+        method = 'hyperband' if hyperband else 'successive_halving'
+        self.logger.info(f"{method} with {max_evaluations} candidates")
+
+        market_data, weather_data = self.engine.load_aligned_data()
+        periods = PeriodSlicer(market_data, weather_data)
+        eta = self.HALVING_ETA
+        rungs = self._halving_rungs(periods, max_evaluations)
+
+        if hyperband:
+            # Bracket i starts at rung i, sized as in Hyperband and scaled to max_evaluations
+            s_max = len(rungs) - 1
+            weights = [np.ceil((s_max + 1) / (s + 1) * eta ** s) for s in range(s_max, -1, -1)]
+            sizes = [max(1, int(round(max_evaluations * w / sum(weights)))) for w in weights]
+            brackets = [(size, rungs[i:]) for i, size in enumerate(sizes)]
+        else:
+            brackets = [(max_evaluations, rungs)]
 
-        self.logger.info(f"Bayesian optimization with {max_evaluations} evaluations")
+        candidates = self._sweep_candidates(parameter_spaces, sum(size for size, _ in brackets))
 
-        # For now, fall back to random search with some intelligence
-        # A full Bayesian optimization would require additional dependencies
+        optimization_history = []
+        bracket_info = []
+        simulated_ticks = 0
+        start = 0
+        for bracket, (size, bracket_rungs) in enumerate(brackets):
+            bracket_candidates = candidates[start:start + size]
+            start += size
+            if not bracket_candidates:
+                continue
+            simulated_ticks += self._run_halving_bracket(strategy_class, bracket_candidates, periods,
+                                                         bracket_rungs, bracket, optimization_history)
+            bracket_info.append({'candidates': len(bracket_candidates), 'rungs': bracket_rungs})
+
+        # Only candidates that reached the full period compete for best
+        finalists = [r for r in optimization_history if r['period_end'] == len(periods)]
+        if not finalists:
+            raise ValueError(f"No {strategy_class.__name__} candidate could be backtested")
+        best_result = max(finalists, key=lambda x: x['score'])
+        full_ticks = len(candidates) * len(periods)
 
-        return self._random_search_optimization(
-            strategy_class, parameter_spaces, max_evaluations, 1
+        return OptimizationResult(
+            best_parameters=best_result['parameters'],
+            best_score=best_result['score'],
+            optimization_history=optimization_history,
+            convergence_info={
+                'total_evaluations': len(candidates),
+                'brackets': bracket_info,
+                'eta': eta,
+                'simulated_ticks': simulated_ticks,
+                'full_ticks': full_ticks,
+                'tick_reduction': full_ticks / simulated_ticks if simulated_ticks else float('nan'),
+                'method': method
+            },
+            optimization_method=method
         )
 
+    def _halving_rungs(self, periods: PeriodSlicer, n_candidates: int) -> List[int]:
+        """
+        Timeline offsets successive rungs extend to, growing by HALVING_ETA
+
+        The last rung is the full period. Rungs are added while there are
+        candidates left to halve and the first prefix stays at least
+        HALVING_MIN_PERIOD days long.
+        """
+        eta, total = self.HALVING_ETA, len(periods)
+        if total == 0:
+            raise ValueError("Insufficient data for backtesting period")
+        min_end = max(1, periods.locate(periods.timeline[0] + pd.Timedelta(days=self.HALVING_MIN_PERIOD)))
+
+        n_rungs = 1
+        while eta ** n_rungs <= n_candidates and total / eta ** n_rungs >= min_end:
+            n_rungs += 1
+        return [max(1, int(round(total / eta ** (n_rungs - 1 - i)))) for i in range(n_rungs)]
+
+    def _sweep_candidates(self,
+                          parameter_spaces: Dict[str, ParameterSpace],
+                          n_candidates: int) -> List[Dict[str, Any]]:
+        """Up to n distinct candidates: the whole grid if it fits, else random draws"""
+        if all(space.param_type != 'continuous' for space in parameter_spaces.values()):
+            grid = self._grid_candidates(parameter_spaces, n_candidates)
+            if len(grid) <= n_candidates:
+                return list(grid)
+
+        candidates = {}
+        for params in self._random_candidates(parameter_spaces, n_candidates):
+            candidates.setdefault(canonical_parameters(params), params)
+        return list(candidates.values())
+
+    def _run_halving_bracket(self,
+                             strategy_class: type,
+                             candidates: List[Dict[str, Any]],
+                             periods: PeriodSlicer,
+                             rungs: List[int],
+                             bracket: int,
+                             optimization_history: List[Dict[str, Any]]) -> int:
+        """Successively halve one bracket of candidates, returning the ticks simulated"""
+        strategies, parameters = [], []
+        for params in candidates:
+            try:
+                strategies.append(strategy_class(parameters=params))
+                parameters.append(params)
+            except Exception as e:
+                self.logger.error(f"Failed to evaluate parameters {params}: {e}")
+
+        backtests = self.engine.start_backtests(strategies, periods)
+        survivors = list(range(len(strategies)))
+
+        for rung, end in enumerate(rungs):
+            backtests.advance(end)
+            results = backtests.results()
+            scores = {i: self._window_score(results[i]) for i in survivors}
+            final = rung == len(rungs) - 1
+
+            for i in survivors:
+                record = {
+                    'parameters': parameters[i],
+                    'score': scores[i],
+                    'bracket': bracket,
+                    'rung': rung,
+                    'period_end': end,
+                    'timestamp': datetime.now()
+                }
+                if final and results[i] is not None:
+                    record['result'] = results[i]
+                optimization_history.append(record)
+
+            if not final:
+                keep = max(1, len(survivors) // self.HALVING_ETA)
+                ranked = sorted(survivors, key=lambda i: scores[i], reverse=True)
+                backtests.stop(ranked[keep:])
+                survivors = sorted(ranked[:keep])
+
+        return backtests.simulated_ticks
+
     def _evolutionary_optimization(self,
                                   strategy_class: type,
                                   parameter_spaces: Dict[str, ParameterSpace],
@@ -274,6 +542,7 @@ class StrategyOptimizer:
             convergence_info={
                 'generations': n_generations,
                 'population_size': population_size,
+                'cache_hits': self._cache_hits(optimization_history),
                 'method': 'evolutionary'
             },
             optimization_method='evolutionary'
@@ -387,11 +656,65 @@ class StrategyOptimizer:
     def _evaluate_parameter_combinations(self,
                                         strategy_class: type,
                                         param_combinations: List[Dict[str, Any]],
-                                        n_jobs: int) -> List[Dict[str, Any]]:
-        """Evaluate multiple parameter combinations"""
+                                        n_jobs: int,
+                                        backend: str = 'thread',
+                                        evaluator: Optional[ProcessPoolEvaluator] = None) -> List[Dict[str, Any]]:
+        """
+        Evaluate multiple parameter combinations
+
+        Parameter sets already evaluated, or repeated within the batch, are
+        answered from the memo (marked 'cached') instead of re-run, as are
+        those found in the results store (also marked 'stored'). An open
+        ProcessPoolEvaluator can be passed to reuse its workers.
+        """
+        self._load_stored(strategy_class, param_combinations)
+
+        pending: Dict[EvaluationKey, Dict[str, Any]] = {}
+        for params in param_combinations:
+            key = self._cache_key(strategy_class, params)
+            if key not in self._evaluation_cache:
+                pending.setdefault(key, params)
+
+        fresh = self._run_evaluations(strategy_class, list(pending.values()), n_jobs, backend, evaluator)
+
+        results = []
+        fresh_by_key = {self._cache_key(strategy_class, record['parameters']): record for record in fresh}
+        returned = set()
+        for params in param_combinations:
+            key = self._cache_key(strategy_class, params)
+            if key in fresh_by_key and key not in returned:
+                returned.add(key)
+                results.append(fresh_by_key[key])
+            elif key in self._evaluation_cache:
+                results.append(self._cached_record(key))
+            elif key in fresh_by_key:
+                # Repeat of a failed evaluation in the same batch
+                results.append(dict(fresh_by_key[key], timestamp=datetime.now()))
+
+        return results
+
+    def _run_evaluations(self,
+                         strategy_class: type,
+                         param_combinations: List[Dict[str, Any]],
+                         n_jobs: int,
+                         backend: str,
+                         evaluator: Optional[ProcessPoolEvaluator]) -> List[Dict[str, Any]]:
+        """Backtest parameter sets sequentially, on threads or on worker processes"""
         results = []
 
-        if n_jobs == 1:
+        if not param_combinations:
+            return results
+
+        if evaluator is not None or (n_jobs > 1 and backend == 'process'):
+            # Workers map the aligned data once and return compact score records
+            if evaluator is not None:
+                results = evaluator.evaluate(strategy_class, param_combinations)
+            else:
+                with ProcessPoolEvaluator(self.engine, self.optimization_target, n_jobs) as evaluator:
+                    results = evaluator.evaluate(strategy_class, param_combinations)
+            for record in results:
+                self._memoize(strategy_class, record)
+        elif n_jobs == 1:
             # Sequential evaluation
             for params in param_combinations:
                 result = self._evaluate_single_parameter_set(strategy_class, params)
@@ -417,6 +740,12 @@ class StrategyOptimizer:
                                       strategy_class: type,
                                       parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate a single parameter set"""
+        key = self._cache_key(strategy_class, parameters)
+        if key not in self._evaluation_cache:
+            self._load_stored(strategy_class, [parameters])
+        if key in self._evaluation_cache:
+            return self._cached_record(key)
+
         try:
             # Create strategy instance with parameters
             strategy = strategy_class(parameters=parameters)
@@ -427,12 +756,14 @@ class StrategyOptimizer:
             # Extract optimization target
             score = self._extract_optimization_score(result)
 
-            return {
+            record = {
                 'parameters': parameters,
                 'score': score,
                 'result': result,
                 'timestamp': datetime.now()
             }
+            self._memoize(strategy_class, record)
+            return record
 
         except Exception as e:
             self.logger.error(f"Failed to evaluate parameters {parameters}: {e}")
@@ -443,6 +774,65 @@ class StrategyOptimizer:
                 'timestamp': datetime.now()
             }
 
+    def _cache_key(self, strategy_class: type, parameters: Dict[str, Any]) -> EvaluationKey:
+        """Memo key for one evaluation under the engine's current config, as in the results store"""
+        return (strategy_class, self.optimization_target, config_fingerprint(self._engine_config()),
+                canonical_parameters(parameters))
+
+    def _memoize(self, strategy_class: type, record: Dict[str, Any]):
+        """Remember a successful evaluation (failures may be transient and are retried)"""
+        if 'error' in record:
+            return
+
+        self._evaluation_cache[self._cache_key(strategy_class, record['parameters'])] = dict(record)
+        if self.results_store is not None:
+            try:
+                self.results_store.save(self._store_id(strategy_class, record['parameters']),
+                                        strategy_class, self._engine_config(), record)
+            except Exception as e:
+                self.logger.warning(f"Could not store evaluation of {record['parameters']}: {e}")
+
+    def _load_stored(self, strategy_class: type, param_combinations: List[Dict[str, Any]]):
+        """Memoize the evaluations of these parameter sets finished by earlier runs"""
+        if self.results_store is None:
+            return
+
+        missing = {}
+        for params in param_combinations:
+            key = self._cache_key(strategy_class, params)
+            if key not in self._evaluation_cache:
+                missing[self._store_id(strategy_class, params)] = key
+        if not missing:
+            return
+
+        try:
+            stored = self.results_store.load(missing)
+        except Exception as e:
+            self.logger.warning(f"Could not read stored evaluations: {e}")
+            return
+
+        for store_id, record in stored.items():
+            self._evaluation_cache[missing[store_id]] = dict(record, stored=True, timestamp=datetime.now())
+        if stored:
+            self.logger.info(f"Resumed {len(stored)} evaluations from the results store")
+
+    def _store_id(self, strategy_class: type, parameters: Dict[str, Any]) -> str:
+        """Results store id for one evaluation under the engine's current config"""
+        return self.results_store.evaluation_id(strategy_class, self.optimization_target, parameters,
+                                                self._engine_config())
+
+    def _engine_config(self) -> Optional[BacktestConfig]:
+        """The engine's config (engine stand-ins may have none)"""
+        return getattr(self.engine, 'config', None)
+
+    def _cached_record(self, key: EvaluationKey) -> Dict[str, Any]:
+        """Copy of a memoized evaluation, marked as answered from the memo"""
+        return dict(self._evaluation_cache[key], cached=True, timestamp=datetime.now())
+
+    def _cache_hits(self, records: List[Dict[str, Any]]) -> int:
+        """Number of records answered from the memo"""
+        return sum(1 for record in records if record.get('cached'))
+
     def _extract_optimization_score(self, result: BacktestResult) -> float:
         """Extract the optimization target score from backtest result"""
         if self.optimization_target == 'sharpe_ratio':
@@ -463,21 +853,167 @@ class StrategyOptimizer:
                                  strategy_class: type,
                                  parameter_spaces: Dict[str, ParameterSpace],
                                  window_size: int = 30,
-                                 step_size: int = 7) -> List[OptimizationResult]:
+                                 step_size: int = 7,
+                                 test_size: Optional[int] = None,
+                                 optimization_method: str = 'grid_search',
+                                 max_evaluations: int = 50,
+                                 n_jobs: int = 1,
+                                 backend: str = 'thread',
+                                 reuse_overlaps: bool = True) -> WalkForwardResult:
         """
         Perform walk-forward optimization
 
+        The configured period is loaded and aligned once, and backtests run
+        on positional slices of it. Every window evaluates the same
+        candidates (the grid, or one random sample), so all backtests are
+        independent and run together on the chosen backend.
+
+        With reuse_overlaps, each candidate is backtested once over the
+        whole period and every window is scored on its slice of that run
+        (see BacktestingEngine.slice_result), so overlapping windows share
+        one backtest; the out-of-sample result is likewise the best
+        candidate's run over the test period. The strategy then enters each
+        window warmed up and holding its positions, as it would trading
+        live. Without it, each in-sample window and each test period is
+        backtested on its own from a flat start.
+
         Args:
             strategy_class: Strategy class to optimize
             parameter_spaces: Parameter spaces to search
             window_size: Size of optimization window in days
             step_size: Step size for moving window in days
+            test_size: Out-of-sample period in days (defaults to step_size)
+            optimization_method: 'grid_search' or 'random_search'
+            max_evaluations: Maximum number of candidates
+            n_jobs: Number of parallel jobs
+            backend: Parallel backend when n_jobs > 1 ('thread' or 'process')
+            reuse_overlaps: Score windows from one full-period backtest per candidate
 
         Returns:
-            List of optimization results for each window
+            WalkForwardResult with each window's optimization and the
+            out-of-sample results stitched into one
         """
-        # This would require modifying the backtest engine to support date ranges
-        # For now, return a placeholder implementation
+        if backend not in self.PARALLEL_BACKENDS:
+            raise ValueError(f"Unknown parallel backend: {backend}")
+
+        if optimization_method == 'grid_search':
+            candidates = list(self._grid_candidates(parameter_spaces, max_evaluations))[:max_evaluations]
+        elif optimization_method == 'random_search':
+            candidates = self._random_candidates(parameter_spaces, max_evaluations)
+        else:
+            raise ValueError(f"Walk-forward optimization supports grid_search and random_search, "
+                             f"not {optimization_method}")
+
+        market_data, weather_data = self.engine.load_aligned_data()
+        periods = PeriodSlicer(market_data, weather_data)
+        windows = build_walk_forward_windows(periods, window_size, step_size, test_size)
+        self.logger.info(f"Walk-forward optimization of {strategy_class.__name__} over {len(windows)} windows "
+                         f"with {len(candidates)} candidates")
+
+        def backtest(tasks):
+            return self._backtest_periods(strategy_class, candidates, tasks,
+                                          periods, market_data, weather_data, n_jobs, backend)
+
+        if reuse_overlaps:
+            full_period = (0, len(periods))
+            runs = backtest([(full_period, c) for c in range(len(candidates))])
+            run_engine = self.engine.with_period(*periods.dates(*full_period))
+
+            def window_result(period, c):
+                run = runs.get((full_period, c))
+                return run_engine.slice_result(run, *periods.dates(*period)) if run is not None else None
+        else:
+            runs = backtest([(window.train_period, c) for window in windows for c in range(len(candidates))])
+
+            def window_result(period, c):
+                return runs.get((period, c))
+
+        best_candidates = []
+        for window in windows:
+            history = []
+            for c, parameters in enumerate(candidates):
+                result = window_result(window.train_period, c)
+                history.append({
+                    'parameters': parameters,
+                    'score': self._window_score(result),
+                    'timestamp': datetime.now()
+                })
+            best = int(np.argmax([record['score'] for record in history]))
+            window.best_parameters = candidates[best]
+            window.in_sample_score = history[best]['score']
+            window.optimization_history = history
+            best_candidates.append(best)
+
+        # Out-of-sample: each window's best candidate over its test period
+        test_tasks = [(window.test_period, best) for window, best in zip(windows, best_candidates)]
+        if not reuse_overlaps:
+            runs.update(backtest(list(dict.fromkeys(test_tasks))))
+        for window, (period, best) in zip(windows, test_tasks):
+            window.out_of_sample = window_result(period, best)
+
+        tested = [window.out_of_sample for window in windows if window.out_of_sample is not None]
+        return WalkForwardResult(
+            windows=windows,
+            out_of_sample=self.engine.combine_results(tested) if tested else None,
+            optimization_method=optimization_method,
+            convergence_info={
+                'windows': len(windows),
+                'candidates': len(candidates),
+                'backtests': len(runs),
+                'reuse_overlaps': reuse_overlaps,
+                'method': 'walk_forward'
+            }
+        )
 
-        self.logger.info("Walk-forward optimization not yet implemented")
-        return []
\ No newline at end of file
+    def _backtest_periods(self,
+                          strategy_class: type,
+                          candidates: List[Dict[str, Any]],
+                          tasks: List[Tuple[Period, int]],
+                          periods: PeriodSlicer,
+                          market_data: pd.DataFrame,
+                          weather_data: pd.DataFrame,
+                          n_jobs: int,
+                          backend: str) -> Dict[Tuple[Period, int], BacktestResult]:
+        """Backtest (period, candidate index) tasks on slices of the loaded data"""
+        if not tasks:
+            return {}
+
+        if n_jobs > 1 and backend == 'process':
+            with ProcessPoolEvaluator(self.engine, self.optimization_target, n_jobs,
+                                      market_data=market_data, weather_data=weather_data) as evaluator:
+                outcomes = evaluator.backtest_periods(
+                    strategy_class, [(start, end, candidates[c]) for (start, end), c in tasks]
+                )
+        else:
+            def backtest(task):
+                (start, end), c = task
+                try:
+                    period_market, period_weather = periods.slice(start, end)
+                    engine = self.engine.with_period(*periods.dates(start, end))
+                    return engine.run_prepared_backtest(strategy_class(parameters=candidates[c]),
+                                                        period_market, period_weather)
+                except Exception as e:
+                    return str(e)
+
+            if n_jobs > 1:
+                with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                    outcomes = list(executor.map(backtest, tasks))
+            else:
+                outcomes = [backtest(task) for task in tasks]
+
+        backtests = {}
+        for task, outcome in zip(tasks, outcomes):
+            if isinstance(outcome, BacktestResult):
+                backtests[task] = outcome
+            else:
+                start, end = periods.dates(*task[0])
+                self.logger.error(f"Failed to backtest parameters {candidates[task[1]]} "
+                                  f"from {start} to {end}: {outcome}")
+        return backtests
+
+    def _window_score(self, result: Optional[BacktestResult]) -> float:
+        """Optimization score of a window's result (-inf if its backtest failed)"""
+        if result is None:
+            return float('-inf')
+        score = self._extract_optimization_score(result)
+        return float('-inf') if pd.isna(score) else score
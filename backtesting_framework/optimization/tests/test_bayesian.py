@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Bayesian Optimization and Evaluation Memoization
+
+Covers the parameter encoding and Gaussian-process surrogate, batch
+proposals, and that StrategyOptimizer never backtests the same
+canonicalized parameter set twice.
+"""
+
+import pytest
+import numpy as np
+from dataclasses import replace
+from datetime import datetime
+from unittest.mock import Mock
+
+from ..bayesian import GaussianProcess, GaussianProcessProposer, ParameterEncoder, canonical_parameters
+from ..strategy_optimizer import StrategyOptimizer, ParameterSpace
+from ...core.backtesting_engine import BacktestingEngine, BacktestConfig
+
+MIXED_SPACES = {
+    'threshold': ParameterSpace(name='threshold', param_type='continuous', min_value=0.0, max_value=10.0),
+    'rate': ParameterSpace(name='rate', param_type='continuous', min_value=0.001, max_value=1.0,
+                           distribution='log'),
+    'lookback': ParameterSpace(name='lookback', param_type='discrete', min_value=6, max_value=48),
+    'mode': ParameterSpace(name='mode', param_type='categorical', values=['mean', 'median', 'last'])
+}
+
+CONTINUOUS_SPACES = {
+    'x': ParameterSpace(name='x', param_type='continuous', min_value=-2.0, max_value=2.0),
+    'y': ParameterSpace(name='y', param_type='continuous', min_value=-2.0, max_value=2.0)
+}
+
+
+def _objective(parameters):
+    """Smooth peak of 1.0 at x=0.7, y=-0.4"""
+    return float(np.exp(-((parameters['x'] - 0.7) ** 2 + (parameters['y'] + 0.4) ** 2)))
+
+
+class ScoredStrategy:
+    """Minimal strategy stand-in; the mock engine scores its parameters"""
+
+    def __init__(self, parameters=None):
+        self.parameters = parameters or {}
+
+
+@pytest.fixture
+def engine():
+    engine = Mock(spec=BacktestingEngine)
+    engine.run_backtest.side_effect = lambda strategy: Mock(total_return=_objective(strategy.parameters))
+    return engine
+
+
+class TestCanonicalParameters:
+    """Test cases for canonical_parameters"""
+
+    def test_equivalent_dicts_share_a_key(self):
+        a = {'x': np.float64(0.1) + np.float64(0.2), 'n': np.int64(12), 'mode': 'mean'}
+        b = {'mode': 'mean', 'n': 12, 'x': 0.3}
+        assert canonical_parameters(a) == canonical_parameters(b)
+        assert hash(canonical_parameters(a)) == hash(canonical_parameters(b))
+
+    def test_distinct_values_differ(self):
+        assert canonical_parameters({'x': 0.3}) != canonical_parameters({'x': 0.30001})
+
+
+class TestParameterEncoder:
+    """Test cases for ParameterEncoder"""
+
+    def test_round_trip(self):
+        encoder = ParameterEncoder(MIXED_SPACES)
+        parameters = {'threshold': 2.5, 'rate': 0.01, 'lookback': 24, 'mode': 'median'}
+
+        x = encoder.encode(parameters)
+        assert encoder.n_dims == 6
+        assert x[encoder.slices['mode']].tolist() == [0.0, 1.0, 0.0]
+        assert x[encoder.slices['rate'].start] == pytest.approx(1 / 3)
+
+        decoded = encoder.decode(x)
+        assert decoded['lookback'] == 24 and decoded['mode'] == 'median'
+        assert decoded['threshold'] == pytest.approx(2.5)
+        assert decoded['rate'] == pytest.approx(0.01)
+
+    def test_samples_are_valid_points(self):
+        np.random.seed(0)
+        encoder = ParameterEncoder(MIXED_SPACES)
+
+        for x in encoder.sample(50):
+            parameters = encoder.decode(x)
+            assert 6 <= parameters['lookback'] <= 48
+            assert 0.001 <= parameters['rate'] <= 1.0
+            np.testing.assert_allclose(encoder.encode(parameters), x)
+
+
+class TestGaussianProcess:
+    """Test cases for GaussianProcess"""
+
+    def test_interpolates_observations(self):
+        rng = np.random.default_rng(1)
+        X = rng.uniform(size=(15, 2))
+        y = np.sin(4 * X[:, 0]) + X[:, 1]
+
+        gp = GaussianProcess(2).fit(X, y)
+        mean, std = gp.predict(X)
+
+        np.testing.assert_allclose(mean, y, atol=0.05)
+        _, far_std = gp.predict(np.array([[5.0, 5.0]]))
+        assert far_std[0] > std.max()
+
+
+class TestGaussianProcessProposer:
+    """Test cases for GaussianProcessProposer"""
+
+    def test_batches_are_distinct_and_new(self):
+        np.random.seed(2)
+        proposer = GaussianProcessProposer(CONTINUOUS_SPACES)
+        seen = proposer.sample(8, set())
+        scores = [_objective(p) for p in seen]
+        exclude = {canonical_parameters(p) for p in seen}
+
+        batch = proposer.propose(seen, scores, 4, exclude)
+
+        keys = [canonical_parameters(p) for p in batch]
+        assert len(batch) == 4
+        assert len(set(keys)) == 4
+        assert not exclude & set(keys)
+
+    def test_exhausted_space(self):
+        spaces = {'mode': ParameterSpace(name='mode', param_type='categorical', values=['a', 'b'])}
+        proposer = GaussianProcessProposer(spaces)
+        seen = [{'mode': 'a'}, {'mode': 'b'}]
+
+        assert proposer.propose(seen, [1.0, 2.0], 3, {canonical_parameters(p) for p in seen}) == []
+
+
+class TestBayesianOptimization:
+    """Test cases for StrategyOptimizer Bayesian search"""
+
+    def test_converges_faster_than_random_search(self, engine):
+        bayesian_scores, random_scores = [], []
+        for seed in range(3):
+            np.random.seed(seed)
+            optimizer = StrategyOptimizer(engine, optimization_target='total_return')
+            bayesian_scores.append(optimizer.optimize_strategy(ScoredStrategy, CONTINUOUS_SPACES, 'bayesian',
+                                                               max_evaluations=20).best_score)
+            np.random.seed(seed)
+            random_scores.append(optimizer.optimize_strategy(ScoredStrategy, CONTINUOUS_SPACES, 'random_search',
+                                                             max_evaluations=20).best_score)
+
+        assert min(bayesian_scores) > 0.98
+        assert np.mean(bayesian_scores) > np.mean(random_scores)
+
+    def test_batch_proposals(self, engine):
+        np.random.seed(4)
+        optimizer = StrategyOptimizer(engine, optimization_target='total_return')
+        result = optimizer.optimize_strategy(ScoredStrategy, CONTINUOUS_SPACES, 'bayesian',
+                                             max_evaluations=17, n_jobs=4)
+
+        info = result.convergence_info
+        assert info['total_evaluations'] == 17
+        assert engine.run_backtest.call_count == 17
+        assert info['batch_size'] == 4
+        assert info['iterations'] == 5  # 5 initial points in 2 batches, then 3 batches of at most 4
+        assert info['best_score_trace'][-1] == result.best_score
+        assert info['best_score_trace'] == sorted(info['best_score_trace'])
+
+    def test_stops_when_space_is_exhausted(self, engine):
+        spaces = {
+            'x': ParameterSpace(name='x', param_type='categorical', values=[0.0, 0.7]),
+            'y': ParameterSpace(name='y', param_type='discrete', min_value=-1, max_value=0)
+        }
+        optimizer = StrategyOptimizer(engine, optimization_target='total_return')
+        result = optimizer.optimize_strategy(ScoredStrategy, spaces, 'bayesian', max_evaluations=20)
+
+        assert result.convergence_info['total_evaluations'] == 4
+        assert result.best_parameters == {'x': 0.7, 'y': 0}
+
+
+class TestEvaluationMemo:
+    """Test cases for memoized evaluations"""
+
+    def test_random_search_duplicates_not_rerun(self, engine):
+        spaces = {'x': ParameterSpace(name='x', param_type='categorical', values=[0.0, 0.7]),
+                  'y': ParameterSpace(name='y', param_type='categorical', values=[-0.4])}
+        optimizer = StrategyOptimizer(engine, optimization_target='total_return')
+
+        np.random.seed(5)
+        result = optimizer.optimize_strategy(ScoredStrategy, spaces, 'random_search', max_evaluations=10, n_jobs=3)
+
+        assert len(result.optimization_history) == 10
+        assert engine.run_backtest.call_count == 2
+        assert result.convergence_info['cache_hits'] == 8
+        assert result.best_score == pytest.approx(1.0)
+
+    def test_memo_spans_methods(self, engine):
+        optimizer = StrategyOptimizer(engine, optimization_target='total_return')
+        np.random.seed(6)
+        optimizer.optimize_strategy(ScoredStrategy, CONTINUOUS_SPACES, 'evolutionary', max_evaluations=20)
+        evolutionary_calls = engine.run_backtest.call_count
+
+        # Elitism carries the best individual into every generation without re-running it
+        assert evolutionary_calls < 20
+
+        grid = [{'x': 0.7, 'y': -0.4}, {'x': np.float64(0.7), 'y': np.float64(-0.4)}]
+        records = optimizer._evaluate_parameter_combinations(ScoredStrategy, grid, n_jobs=1)
+        assert [r.get('cached', False) for r in records] == [False, True]
+        assert engine.run_backtest.call_count == evolutionary_calls + 1
+
+        optimizer.clear_evaluation_cache()
+        optimizer._evaluate_parameter_combinations(ScoredStrategy, grid[:1], n_jobs=1)
+        assert engine.run_backtest.call_count == evolutionary_calls + 2
+
+    def test_memo_follows_engine_config(self, engine):
+        """Changing the engine's config or period re-runs the backtest instead of reusing the old score"""
+        engine.config = BacktestConfig(start_date=datetime(2024, 1, 1), end_date=datetime(2024, 2, 1))
+        optimizer = StrategyOptimizer(engine, optimization_target='total_return')
+        params = [{'x': 0.5, 'y': 0.5}]
+
+        optimizer._evaluate_parameter_combinations(ScoredStrategy, params, n_jobs=1)
+        original = engine.config
+
+        engine.config = replace(original, commission_per_trade=0.01)
+        assert not optimizer._evaluate_parameter_combinations(ScoredStrategy, params, n_jobs=1)[0].get('cached')
+        engine.config = replace(original, end_date=datetime(2024, 1, 15))
+        assert not optimizer._evaluate_parameter_combinations(ScoredStrategy, params, n_jobs=1)[0].get('cached')
+        assert engine.run_backtest.call_count == 3
+
+        engine.config = original
+        assert optimizer._evaluate_parameter_combinations(ScoredStrategy, params, n_jobs=1)[0]['cached']
+        assert engine.run_backtest.call_count == 3
+
+    def test_failures_are_retried(self, engine):
+        engine.run_backtest.side_effect = RuntimeError("database locked")
+        optimizer = StrategyOptimizer(engine, optimization_target='total_return')
+        params = {'x': 0.0, 'y': 0.0}
+
+        records = optimizer._evaluate_parameter_combinations(ScoredStrategy, [params, params], n_jobs=1)
+        assert [r['score'] for r in records] == [float('-inf')] * 2
+        assert engine.run_backtest.call_count == 1
+
+        engine.run_backtest.side_effect = lambda strategy: Mock(total_return=_objective(strategy.parameters))
+        record = optimizer._evaluate_single_parameter_set(ScoredStrategy, params)
+        assert record['score'] == pytest.approx(_objective(params))
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Process-Pool Parameter Evaluation
+
+Checks that sweeps on worker processes score parameter sets exactly as the
+thread backend does, that workers build their engine without touching the
+database or snapshot, that chunks are submitted with a bounded number in
+flight, and that a broken pool reports the remaining sets as failed.
+"""
+
+import os
+
+import pytest
+from datetime import datetime
+from unittest.mock import Mock
+
+from ..parallel_evaluation import ProcessPoolEvaluator, _WORKER_STATE, _init_worker
+from ..strategy_optimizer import StrategyOptimizer, ParameterSpace
+from ...core.backtesting_engine import BacktestingEngine, BacktestConfig, PeriodSlicer
+from ...data.data_loader import BacktestingDataLoader
+from ...data.shared_frames import export_frame
+from .test_walk_forward import ThresholdTrader, _aligned_data
+
+PARAMETER_SPACES = {
+    'threshold': ParameterSpace(name='threshold', param_type='categorical',
+                                values=[10.0, 12.0, 14.0, 16.0, 18.0, 20.0])
+}
+
+
+class CrashingTrader(ThresholdTrader):
+    """Kills the worker process it is built in"""
+
+    def __init__(self, name: str = "CrashingTrader", parameters=None):
+        os._exit(1)
+
+
+def _engine(**config_overrides):
+    """Engine with real metrics over the test data, without a database"""
+    loader = Mock(spec=BacktestingDataLoader)
+    loader.db_path = 'missing.db'
+    loader.load_rollup_data.return_value = _aligned_data()
+
+    config = BacktestConfig(start_date=datetime(2024, 1, 1), end_date=datetime(2024, 2, 14), **config_overrides)
+    engine = BacktestingEngine(config, 'missing.db', validate_connection=False)
+    engine.data_loader = loader
+    return engine
+
+
+def _summary(records):
+    return sorted((r['parameters']['threshold'], r['score']) for r in records)
+
+
+class TestProcessPoolEvaluator:
+    """Test cases for ProcessPoolEvaluator"""
+
+    def test_process_backend_matches_threads(self):
+        """A grid search on worker processes gives the same scores as on threads"""
+        by_thread = StrategyOptimizer(_engine(), 'total_return').optimize_strategy(
+            ThresholdTrader, PARAMETER_SPACES, 'grid_search', n_jobs=2, backend='thread')
+        by_process = StrategyOptimizer(_engine(), 'total_return').optimize_strategy(
+            ThresholdTrader, PARAMETER_SPACES, 'grid_search', n_jobs=2, backend='process')
+
+        assert len(by_process.optimization_history) == 6
+        assert not any('error' in r for r in by_process.optimization_history)
+        assert _summary(by_process.optimization_history) == _summary(by_thread.optimization_history)
+        assert by_process.best_parameters == by_thread.best_parameters
+        assert by_process.best_score == by_thread.best_score
+
+    def test_worker_engine_skips_database_and_snapshot(self, tmp_path):
+        """Workers neither check the database nor refresh the snapshot"""
+        market, weather = _aligned_data()
+        config = BacktestConfig(start_date=datetime(2024, 1, 1), end_date=datetime(2024, 2, 14),
+                                snapshot_dir=str(tmp_path / 'snapshot'))
+        try:
+            _init_worker(config, str(tmp_path / 'missing.db'), 'total_return',
+                         export_frame(market, str(tmp_path), 'market'),
+                         export_frame(weather, str(tmp_path), 'weather'))
+            engine = _WORKER_STATE['engine']
+            assert engine.config.snapshot_dir is None and not engine.config.use_rollups
+            assert engine.data_loader.snapshot is None
+            assert len(_WORKER_STATE['market_data']) == len(market)
+        finally:
+            _WORKER_STATE.clear()
+
+        assert not (tmp_path / 'snapshot').exists()
+        assert not (tmp_path / 'missing.db').exists()
+
+    def test_chunks_in_flight_are_bounded(self):
+        """Items go out in chunk_size pieces with at most two chunks per worker in flight"""
+        params = [{'threshold': float(t)} for t in range(10, 17)]
+        submitted, in_flight = [], []
+
+        with ProcessPoolEvaluator(_engine(), 'total_return', n_jobs=1, chunk_size=2) as evaluator:
+            submit = evaluator._executor.submit
+            futures = []
+
+            def counting_submit(worker, strategy_class, chunk):
+                in_flight.append(sum(not future.done() for future in futures))
+                submitted.append(len(chunk))
+                futures.append(submit(worker, strategy_class, chunk))
+                return futures[-1]
+
+            evaluator._executor.submit = counting_submit
+            records = evaluator.evaluate(ThresholdTrader, params)
+
+        assert submitted == [2, 2, 2, 1]
+        assert max(in_flight) <= 1  # Two in flight means one outstanding at the second submit
+        assert sorted(r['parameters']['threshold'] for r in records) == [p['threshold'] for p in params]
+        assert not any('error' in r for r in records)
+
+    def test_backtest_periods_keep_task_order(self):
+        """Period backtests come back aligned with their tasks"""
+        periods = PeriodSlicer(*_aligned_data())
+        tasks = [(0, 60, {'threshold': 12.0}), (60, 180, {'threshold': 16.0}), (0, 180, {'threshold': 20.0})]
+        engine = _engine()
+
+        with ProcessPoolEvaluator(engine, 'total_return', n_jobs=2, chunk_size=1) as evaluator:
+            results = evaluator.backtest_periods(ThresholdTrader, tasks)
+
+        for (start, end, parameters), result in zip(tasks, results):
+            expected = engine.with_period(*periods.dates(start, end)).run_prepared_backtest(
+                ThresholdTrader(parameters=parameters), *periods.slice(start, end))
+            assert result.total_return == expected.total_return
+            assert result.total_trades == expected.total_trades
+
+    def test_broken_pool_reports_failures(self):
+        """When workers die, every parameter set is still reported, as failed"""
+        params = [{'threshold': float(t)} for t in range(10, 16)]
+
+        with ProcessPoolEvaluator(_engine(), 'total_return', n_jobs=2, chunk_size=1) as evaluator:
+            records = evaluator.evaluate(CrashingTrader, params)
+
+        assert sorted(r['parameters']['threshold'] for r in records) == [p['threshold'] for p in params]
+        assert all(r['score'] == float('-inf') and r['error'] for r in records)
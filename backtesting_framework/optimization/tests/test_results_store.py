@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Optimizer Results Store
+
+Checks that finished evaluations are written to backtest_results as they
+complete, and that re-running an interrupted sweep backtests only the
+parameter sets that were not finished, with the same scores.
+"""
+
+import os
+import sqlite3
+import pytest
+import numpy as np
+from datetime import datetime
+from unittest.mock import patch
+
+from ..results_store import BacktestResultsStore
+from ..strategy_optimizer import StrategyOptimizer, ParameterSpace
+from .test_walk_forward import ThresholdTrader, optimizer  # noqa: F401 (fixture)
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'database', 'schema.sql')
+
+PARAMETER_SPACES = {
+    'threshold': ParameterSpace(name='threshold', param_type='discrete', min_value=8, max_value=19)
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BacktestResultsStore(str(tmp_path / 'results.db'))
+
+
+def _optimizer_with_store(optimizer, store):
+    return StrategyOptimizer(optimizer.engine, optimizer.optimization_target, results_store=store)
+
+
+def _scores(result):
+    return {r['parameters']['threshold']: r['score'] for r in result.optimization_history}
+
+
+class TestResultsStore:
+    """Test cases for BacktestResultsStore"""
+
+    def test_evaluation_ids(self, store, optimizer):
+        config = optimizer.engine.config
+        same = store.evaluation_id(ThresholdTrader, 'total_return', {'threshold': 12}, config)
+
+        assert same == store.evaluation_id(ThresholdTrader, 'total_return', {'threshold': np.int64(12)}, config)
+        assert same != store.evaluation_id(ThresholdTrader, 'sharpe_ratio', {'threshold': 12}, config)
+        assert same != store.evaluation_id(ThresholdTrader, 'total_return', {'threshold': 13}, config)
+        other_period = optimizer.engine.with_period(datetime(2024, 1, 1), datetime(2024, 1, 20)).config
+        assert same != store.evaluation_id(ThresholdTrader, 'total_return', {'threshold': 12}, other_period)
+
+    def test_schema_database(self, tmp_path, optimizer):
+        db_path = str(tmp_path / 'climatetrade.db')
+        with sqlite3.connect(db_path) as conn:
+            conn.executescript(open(SCHEMA_PATH).read())
+
+        store = BacktestResultsStore(db_path)
+        _optimizer_with_store(optimizer, store).optimize_strategy(
+            ThresholdTrader, PARAMETER_SPACES, 'grid_search')
+
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute("SELECT r.strategy_name, r.total_trades, c.config_name FROM backtest_results r "
+                                "JOIN backtest_configs c ON r.config_id = c.id").fetchall()
+        assert len(rows) == 12
+        assert {row[0] for row in rows} == {'ThresholdTrader'}
+        assert len({row[2] for row in rows}) == 1
+
+
+class TestResumedSweeps:
+    """Test cases for sweeps resumed from the results store"""
+
+    def test_rerun_backtests_nothing(self, store, optimizer):
+        first = _optimizer_with_store(optimizer, store).optimize_strategy(
+            ThresholdTrader, PARAMETER_SPACES, 'grid_search')
+        assert store.count() == 12
+
+        rerun = _optimizer_with_store(optimizer, store)
+        with patch.object(optimizer.engine, 'run_backtest', wraps=optimizer.engine.run_backtest) as run_backtest:
+            second = rerun.optimize_strategy(ThresholdTrader, PARAMETER_SPACES, 'grid_search')
+
+        run_backtest.assert_not_called()
+        assert _scores(second) == pytest.approx(_scores(first))
+        assert second.best_parameters == first.best_parameters
+        assert all(r['stored'] and r['cached'] for r in second.optimization_history)
+
+    def test_interrupted_sweep_resumes(self, store, optimizer):
+        expected = _scores(StrategyOptimizer(optimizer.engine, 'total_return').optimize_strategy(
+            ThresholdTrader, PARAMETER_SPACES, 'grid_search'))
+
+        run_backtest = optimizer.engine.run_backtest
+        calls = []
+
+        def killed_after_five(strategy):
+            if len(calls) == 5:
+                raise KeyboardInterrupt
+            calls.append(strategy.parameters)
+            return run_backtest(strategy)
+
+        with patch.object(optimizer.engine, 'run_backtest', side_effect=killed_after_five):
+            with pytest.raises(KeyboardInterrupt):
+                _optimizer_with_store(optimizer, store).optimize_strategy(
+                    ThresholdTrader, PARAMETER_SPACES, 'grid_search')
+        assert store.count() == 5
+
+        with patch.object(optimizer.engine, 'run_backtest', wraps=run_backtest) as resumed:
+            result = _optimizer_with_store(optimizer, store).optimize_strategy(
+                ThresholdTrader, PARAMETER_SPACES, 'grid_search')
+
+        assert resumed.call_count == 7
+        assert result.convergence_info['total_evaluations'] == 12
+        assert sum(1 for r in result.optimization_history if r.get('stored')) == 5
+        assert _scores(result) == pytest.approx(expected)
+
+    def test_other_period_is_not_reused(self, store, optimizer):
+        _optimizer_with_store(optimizer, store).optimize_strategy(ThresholdTrader, PARAMETER_SPACES, 'grid_search')
+
+        shorter = optimizer.engine.with_period(datetime(2024, 1, 1), datetime(2024, 1, 20))
+        with patch.object(shorter, 'run_backtest', wraps=shorter.run_backtest) as run_backtest:
+            StrategyOptimizer(shorter, 'total_return', results_store=store).optimize_strategy(
+                ThresholdTrader, PARAMETER_SPACES, 'grid_search')
+
+        assert run_backtest.call_count == 12
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Successive Halving and Hyperband
+
+Checks that every rung scores its candidates exactly as a backtest of the
+rung's prefix would, that only the best candidates are extended, and that
+resuming survivors simulates far fewer ticks than full backtests.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from ..strategy_optimizer import StrategyOptimizer, ParameterSpace
+from ...core.backtesting_engine import BacktestingEngine, BacktestConfig, PeriodSlicer
+from ...data.data_loader import BacktestingDataLoader
+from .test_walk_forward import ThresholdTrader, _aligned_data
+
+PARAMETER_SPACES = {
+    'threshold': ParameterSpace(name='threshold', param_type='discrete', min_value=4, max_value=30)
+}
+
+
+@pytest.fixture
+def optimizer():
+    loader = Mock(spec=BacktestingDataLoader)
+    loader.load_rollup_data.return_value = _aligned_data()
+
+    config = BacktestConfig(start_date=datetime(2024, 1, 1), end_date=datetime(2024, 2, 14))
+    with patch('backtesting_framework.core.backtesting_engine.BacktestingDataLoader', return_value=loader), \
+         patch('backtesting_framework.core.backtesting_engine.PerformanceMetrics'), \
+         patch('backtesting_framework.core.backtesting_engine.RiskMetrics'):
+        engine = BacktestingEngine(config)
+    optimizer = StrategyOptimizer(engine, optimization_target='total_return')
+    optimizer.HALVING_MIN_PERIOD = 2
+    return optimizer
+
+
+def _prefix_score(optimizer, parameters, end):
+    """Score of a fresh backtest over the first `end` timeline entries"""
+    periods = PeriodSlicer(*_aligned_data())
+    engine = optimizer.engine.with_period(*periods.dates(0, end))
+    result = engine.run_prepared_backtest(ThresholdTrader(parameters=parameters), *periods.slice(0, end))
+    return result.total_return
+
+
+class TestSuccessiveHalving:
+    """Test cases for successive halving"""
+
+    def test_rungs_match_prefix_backtests(self, optimizer):
+        result = optimizer.optimize_strategy(ThresholdTrader, PARAMETER_SPACES, 'successive_halving',
+                                             max_evaluations=27)
+
+        info = result.convergence_info
+        assert info['brackets'] == [{'candidates': 27, 'rungs': [20, 60, 180]}]
+        assert optimizer.engine.data_loader.load_rollup_data.call_count == 1
+
+        rungs = [[r for r in result.optimization_history if r['rung'] == rung] for rung in range(3)]
+        assert [len(records) for records in rungs] == [27, 9, 3]
+
+        for records in rungs:
+            for record in records[::4]:
+                assert record['score'] == pytest.approx(
+                    _prefix_score(optimizer, record['parameters'], record['period_end']))
+
+        for earlier, later in zip(rungs, rungs[1:]):
+            ranked = sorted(earlier, key=lambda r: r['score'], reverse=True)
+            cutoff = ranked[len(later) - 1]['score']
+            assert all(r['score'] >= cutoff for r in earlier if r['parameters'] in
+                       [s['parameters'] for s in later])
+
+        assert result.best_score == max(r['score'] for r in rungs[2])
+        assert result.best_score == pytest.approx(_prefix_score(optimizer, result.best_parameters, 180))
+
+    def test_resuming_saves_ticks(self, optimizer):
+        result = optimizer.optimize_strategy(ThresholdTrader, PARAMETER_SPACES, 'successive_halving',
+                                             max_evaluations=27)
+
+        info = result.convergence_info
+        assert info['simulated_ticks'] == 27 * 20 + 9 * 40 + 3 * 120
+        assert info['full_ticks'] == 27 * 180
+        assert info['tick_reduction'] > 3
+
+    def test_short_data_runs_one_rung(self, optimizer):
+        optimizer.HALVING_MIN_PERIOD = 60
+        result = optimizer.optimize_strategy(ThresholdTrader, PARAMETER_SPACES, 'successive_halving',
+                                             max_evaluations=5)
+
+        assert result.convergence_info['brackets'] == [{'candidates': 5, 'rungs': [180]}]
+        assert len(result.optimization_history) == 5
+        assert all('result' in record for record in result.optimization_history)
+
+
+class TestHyperband:
+    """Test cases for Hyperband"""
+
+    def test_brackets(self, optimizer):
+        result = optimizer.optimize_strategy(ThresholdTrader, PARAMETER_SPACES, 'hyperband',
+                                             max_evaluations=27)
+
+        brackets = result.convergence_info['brackets']
+        assert [b['rungs'] for b in brackets] == [[20, 60, 180], [60, 180], [180]]
+        assert brackets[0]['candidates'] > brackets[1]['candidates'] > brackets[2]['candidates']
+        assert result.convergence_info['total_evaluations'] == sum(b['candidates'] for b in brackets)
+
+        finalists = [r for r in result.optimization_history if r['period_end'] == 180]
+        assert {r['bracket'] for r in finalists} == {0, 1, 2}
+        assert result.best_score == max(r['score'] for r in finalists)
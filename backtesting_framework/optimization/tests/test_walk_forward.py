@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Walk-Forward Optimization
+
+Checks the rolling window layout over a PeriodSlicer timeline, and that
+window scores and out-of-sample results match backtesting the windows
+directly, whether taken from one shared run per candidate or from
+separate window backtests.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from ..strategy_optimizer import StrategyOptimizer, ParameterSpace
+from ..walk_forward import build_walk_forward_windows
+from ...core.backtesting_engine import BacktestingEngine, BacktestConfig, PeriodSlicer
+from ...data.data_loader import BacktestingDataLoader
+from ...strategies.base_strategy import BaseWeatherStrategy, TradingSignal
+
+
+class ThresholdTrader(BaseWeatherStrategy):
+    """Buys when it is warmer than the threshold and sells when it is colder"""
+
+    def __init__(self, name: str = "ThresholdTrader", parameters=None):
+        super().__init__(name, parameters)
+        self.threshold = self.parameters.get('threshold', 15.0)
+
+    def generate_signals(self, market_data, weather_data, current_positions):
+        if weather_data.empty or market_data.empty:
+            return []
+
+        temperature = weather_data['temperature'].iloc[-1]
+        if temperature > self.threshold:
+            signal_type = 'BUY'
+        elif temperature < self.threshold - 5 and current_positions:
+            signal_type = 'SELL'
+        else:
+            return []
+
+        return [TradingSignal(weather_data['timestamp'].iloc[-1], 'market1', 'Yes', signal_type, 0.8)]
+
+
+def _aligned_data(days=45, freq='6H'):
+    rng = np.random.default_rng(3)
+    timestamps = pd.date_range('2024-01-01', periods=days * 4, freq=freq)
+    weather = pd.DataFrame({
+        'timestamp': timestamps,
+        'location_name': 'London',
+        'temperature': 15 + 8 * np.sin(np.arange(len(timestamps)) / 5) + rng.normal(0, 2, len(timestamps))
+    })
+    market = pd.DataFrame({
+        'timestamp': timestamps,
+        'market_id': 'market1',
+        'outcome_name': 'Yes',
+        'probability': np.clip(0.5 + 0.3 * np.sin(np.arange(len(timestamps)) / 7), 0.05, 0.95),
+        'volume': 100.0
+    })
+    return market, weather
+
+
+@pytest.fixture
+def optimizer():
+    market, weather = _aligned_data()
+    loader = Mock(spec=BacktestingDataLoader)
+    loader.load_rollup_data.return_value = (market, weather)
+
+    config = BacktestConfig(start_date=datetime(2024, 1, 1), end_date=datetime(2024, 2, 14))
+    with patch('backtesting_framework.core.backtesting_engine.BacktestingDataLoader', return_value=loader), \
+         patch('backtesting_framework.core.backtesting_engine.PerformanceMetrics'), \
+         patch('backtesting_framework.core.backtesting_engine.RiskMetrics'):
+        engine = BacktestingEngine(config)
+    return StrategyOptimizer(engine, optimization_target='total_return')
+
+
+PARAMETER_SPACES = {
+    'threshold': ParameterSpace(name='threshold', param_type='categorical', values=[12.0, 16.0, 20.0])
+}
+
+
+class TestWalkForwardWindows:
+    """Test cases for build_walk_forward_windows"""
+
+    def test_rolling_windows(self):
+        periods = PeriodSlicer(*_aligned_data())
+        windows = build_walk_forward_windows(periods, window_size=14, step_size=7)
+
+        assert len(windows) == 5  # the last test period is cut short by the data
+        for window, following in zip(windows, windows[1:]):
+            assert window.train_period[1] == window.test_period[0]
+            assert (following.train_start - window.train_start).days == 7
+            assert (window.test_start - window.train_start).days == 14
+            assert window.test_period[1] == following.test_period[0]
+
+        assert windows[0].train_start == pd.Timestamp('2024-01-01')
+        assert windows[0].test_start == pd.Timestamp('2024-01-15')
+        assert windows[-1].test_period[1] == len(periods)
+
+    def test_test_size(self):
+        periods = PeriodSlicer(*_aligned_data())
+        windows = build_walk_forward_windows(periods, window_size=10, step_size=7, test_size=3)
+
+        for window in windows:
+            (start, split), (test_start, test_end) = window.train_period, window.test_period
+            assert split == test_start
+            assert (periods.timeline[split] - periods.timeline[start]).days == 10
+            assert (periods.timeline[test_end - 1] - periods.timeline[test_start]).days < 3
+
+    def test_invalid_sizes(self):
+        with pytest.raises(ValueError):
+            build_walk_forward_windows(PeriodSlicer(*_aligned_data()), window_size=0, step_size=7)
+
+
+class TestWalkForwardOptimization:
+    """Test cases for StrategyOptimizer.walk_forward_optimization"""
+
+    def _backtest(self, optimizer, period, parameters):
+        periods = PeriodSlicer(*_aligned_data())
+        engine = optimizer.engine.with_period(*periods.dates(*period))
+        return engine.run_prepared_backtest(ThresholdTrader(parameters=parameters), *periods.slice(*period))
+
+    def _assert_stitched(self, optimizer, result):
+        """Stitched equity continues across windows and ends at the summed P&L"""
+        capital = optimizer.engine.config.initial_capital
+        pnl = sum(w.out_of_sample.equity_curve[-1][1] - capital for w in result.windows)
+        timestamps = [t for t, _ in result.equity_curve]
+        assert timestamps == sorted(timestamps)
+        assert result.equity_curve[-1][1] == pytest.approx(capital + pnl)
+        assert result.out_of_sample.total_return == pytest.approx(pnl / capital)
+
+    def test_windows_scored_from_shared_runs(self, optimizer):
+        result = optimizer.walk_forward_optimization(ThresholdTrader, PARAMETER_SPACES,
+                                                     window_size=14, step_size=7)
+
+        assert len(result.windows) == 5
+        assert optimizer.engine.data_loader.load_rollup_data.call_count == 1
+        assert result.convergence_info['backtests'] == 3  # one per candidate
+
+        full_period = (0, len(PeriodSlicer(*_aligned_data())))
+        runs = [self._backtest(optimizer, full_period, {'threshold': t}) for t in (12.0, 16.0, 20.0)]
+        run_engine = optimizer.engine.with_period(runs[0].start_date, runs[0].end_date)
+
+        for window in result.windows:
+            scores = [record['score'] for record in window.optimization_history]
+            assert scores == [run_engine.slice_result(run, window.train_start, window.train_end).total_return
+                              for run in runs]
+            assert window.in_sample_score == max(scores)
+
+            best = runs[scores.index(max(scores))]
+            expected = run_engine.slice_result(best, window.test_start, window.test_end)
+            assert window.out_of_sample.equity_curve == expected.equity_curve
+
+        assert len({str(w.best_parameters) for w in result.windows}) > 1
+        self._assert_stitched(optimizer, result)
+
+    def test_separate_window_backtests(self, optimizer):
+        result = optimizer.walk_forward_optimization(ThresholdTrader, PARAMETER_SPACES,
+                                                     window_size=14, step_size=7, reuse_overlaps=False)
+
+        for window in result.windows:
+            direct = self._backtest(optimizer, window.train_period, window.best_parameters)
+            assert window.in_sample_score == pytest.approx(direct.total_return)
+
+            direct = self._backtest(optimizer, window.test_period, window.best_parameters)
+            assert window.out_of_sample.equity_curve == direct.equity_curve
+
+        self._assert_stitched(optimizer, result)
+
+    def test_threads_match_sequential(self, optimizer):
+        sequential = optimizer.walk_forward_optimization(ThresholdTrader, PARAMETER_SPACES,
+                                                         window_size=14, step_size=7, reuse_overlaps=False)
+        threaded = optimizer.walk_forward_optimization(ThresholdTrader, PARAMETER_SPACES,
+                                                       window_size=14, step_size=7, reuse_overlaps=False,
+                                                       n_jobs=3)
+
+        assert [w.best_parameters for w in threaded.windows] == [w.best_parameters for w in sequential.windows]
+        assert threaded.equity_curve == sequential.equity_curve
+
+    def test_adaptive_methods_rejected(self, optimizer):
+        with pytest.raises(ValueError):
+            optimizer.walk_forward_optimization(ThresholdTrader, PARAMETER_SPACES,
+                                                optimization_method='evolutionary')
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Walk-Forward Optimization Windows
+
+Rolling in-sample / out-of-sample windows over the timeline of aligned
+data, expressed as offsets into a PeriodSlicer so every window is a
+positional slice of data loaded once.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from ..core.backtesting_engine import BacktestResult, PeriodSlicer
+
+# (start, end) offsets into a PeriodSlicer timeline
+Period = Tuple[int, int]
+
+
+@dataclass
+class WalkForwardWindow:
+    """One in-sample optimization and its out-of-sample test"""
+    index: int
+    train_start: datetime
+    train_end: datetime
+    test_start: datetime
+    test_end: datetime
+    train_period: Period
+    test_period: Period
+    best_parameters: Optional[Dict[str, Any]] = None
+    in_sample_score: float = float('-inf')
+    out_of_sample: Optional[BacktestResult] = None
+    optimization_history: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class WalkForwardResult:
+    """Walk-forward windows and the stitched out-of-sample performance"""
+    windows: List[WalkForwardWindow]
+    out_of_sample: Optional[BacktestResult]
+    optimization_method: str
+    convergence_info: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def equity_curve(self) -> List[Tuple[datetime, float]]:
+        """Out-of-sample equity stitched across windows"""
+        return self.out_of_sample.equity_curve if self.out_of_sample is not None else []
+
+
+def build_walk_forward_windows(periods: PeriodSlicer,
+                               window_size: int,
+                               step_size: int,
+                               test_size: Optional[int] = None) -> List[WalkForwardWindow]:
+    """
+    Rolling windows over the timeline of a PeriodSlicer
+
+    Args:
+        periods: Slicer over the aligned data
+        window_size: In-sample window length in days
+        step_size: Days the window advances each step
+        test_size: Out-of-sample length in days (defaults to step_size)
+
+    Returns:
+        Windows in time order, each with in-sample data and at least one
+        out-of-sample timestamp
+    """
+    if window_size <= 0 or step_size <= 0:
+        raise ValueError("window_size and step_size must be positive")
+    test_size = test_size or step_size
+    if test_size <= 0:
+        raise ValueError("test_size must be positive")
+    if len(periods) == 0:
+        return []
+
+    origin = periods.timeline[0]
+    step, window, test = (pd.Timedelta(days=days) for days in (step_size, window_size, test_size))
+
+    windows = []
+    k = 0
+    while True:
+        train_start = origin + k * step
+        start = periods.locate(train_start)
+        split = periods.locate(train_start + window)
+        end = periods.locate(train_start + window + test)
+        if split >= len(periods):
+            break
+
+        if split > start:
+            windows.append(WalkForwardWindow(
+                index=len(windows),
+                train_start=periods.timeline[start],
+                train_end=periods.timeline[split - 1],
+                test_start=periods.timeline[split],
+                test_end=periods.timeline[end - 1],
+                train_period=(start, split),
+                test_period=(split, end)
+            ))
+        k += 1
+
+    return windows
@@ -7,6 +7,7 @@ that use weather data to generate trading signals on Polymarket.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
@@ -14,6 +15,9 @@ import pandas as pd
 import numpy as np
 import logging
 
+from .history import HistoryBuffers
+from .indicators import IndicatorSet
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +34,36 @@ class TradingSignal:
     reasoning: Optional[str] = None
 
 
+# Columns of the signal frames returned by generate_signals_batch, one row
+# per TradingSignal in the order the signals are acted on
+SIGNAL_COLUMNS = ['timestamp', 'market_id', 'outcome_name', 'signal_type',
+                  'confidence', 'quantity', 'price', 'reasoning']
+
+
+def signal_frame(timestamps,
+                 market_id,
+                 outcome_name,
+                 signal_type,
+                 confidence,
+                 reasoning=None,
+                 quantity=None,
+                 price=None) -> pd.DataFrame:
+    """Build a signal frame; scalar arguments are broadcast over the rows"""
+    frame = pd.DataFrame({'timestamp': pd.Series(timestamps).reset_index(drop=True)})
+    for col, values in (('market_id', market_id), ('outcome_name', outcome_name),
+                        ('signal_type', signal_type), ('confidence', confidence),
+                        ('quantity', quantity), ('price', price), ('reasoning', reasoning)):
+        frame[col] = values.to_numpy() if isinstance(values, (pd.Series, pd.Index)) else values
+    return frame[SIGNAL_COLUMNS]
+
+
+def signals_from_frame(frame: pd.DataFrame) -> List[TradingSignal]:
+    """TradingSignal objects for the rows of a signal frame"""
+    frame = frame.reindex(columns=SIGNAL_COLUMNS).astype(object)
+    frame = frame.where(frame.notna(), None)
+    return [TradingSignal(*row) for row in frame.itertuples(index=False, name=None)]
+
+
 @dataclass
 class Position:
     """Represents a trading position"""
@@ -45,6 +79,257 @@ class Position:
     status: str = 'OPEN'  # 'OPEN', 'CLOSED', 'STOPPED'
 
 
+class PriceIndex:
+    """
+    Latest price and volume per (market_id, outcome_name)
+
+    The backtesting engine updates the index with each tick's market rows,
+    so opening and closing positions is a dictionary lookup rather than a
+    boolean mask over the tick's market data. Lookups only return quotes
+    from the current tick, matching a search of that tick's rows; the last
+    row for an outcome wins, as with iloc[-1].
+    """
+
+    def __init__(self, capacity: int = 64):
+        self._slots: Dict[Tuple[str, str], int] = {}
+        self.price = np.full(capacity, np.nan, dtype=np.float64)
+        self.volume = np.full(capacity, np.nan, dtype=np.float64)
+        self.updated_at = np.full(capacity, -1, dtype=np.int64)
+        self.step = -1
+
+    def update(self, market_rows: pd.DataFrame):
+        """Advance to the next tick and record its quotes"""
+        self.step += 1
+        if market_rows.empty or 'market_id' not in market_rows.columns:
+            return
+
+        n = len(market_rows)
+        prices = market_rows['probability'].to_numpy(dtype=np.float64, na_value=np.nan)
+        volumes = (market_rows['volume'].to_numpy(dtype=np.float64, na_value=np.nan)
+                   if 'volume' in market_rows.columns else np.full(n, np.nan))
+
+        slots = np.empty(n, dtype=np.int64)
+        for i, key in enumerate(zip(market_rows['market_id'].tolist(), market_rows['outcome_name'].tolist())):
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._slots[key] = len(self._slots)
+                if slot == len(self.price):
+                    self._grow()
+            slots[i] = slot
+
+        # Fancy assignment keeps the last value for repeated slots
+        self.price[slots] = prices
+        self.volume[slots] = volumes
+        self.updated_at[slots] = self.step
+
+    def _grow(self):
+        size = len(self.price)
+        self.price = np.concatenate([self.price, np.full(size, np.nan)])
+        self.volume = np.concatenate([self.volume, np.full(size, np.nan)])
+        self.updated_at = np.concatenate([self.updated_at, np.full(size, -1, dtype=np.int64)])
+
+    def _current_slot(self, market_id: str, outcome_name: str) -> Optional[int]:
+        slot = self._slots.get((market_id, outcome_name))
+        if slot is None or self.updated_at[slot] != self.step:
+            return None
+        return slot
+
+    def quote(self, market_id: str, outcome_name: str) -> Optional[Tuple[float, float]]:
+        """(price, volume) of an outcome on the current tick, or None if it has no row"""
+        slot = self._current_slot(market_id, outcome_name)
+        if slot is None:
+            return None
+        return float(self.price[slot]), float(self.volume[slot])
+
+    def latest_price(self, market_id: str, outcome_name: str) -> Optional[float]:
+        """Most recent price seen for an outcome on any tick"""
+        slot = self._slots.get((market_id, outcome_name))
+        return float(self.price[slot]) if slot is not None else None
+
+
+class PositionBook:
+    """
+    Columnar position store indexed by (market_id, outcome_name)
+
+    Numeric position state lives in NumPy arrays so mark-to-market and P&L
+    aggregation are vectorized, while the Position records are kept in
+    opening order for callers that iterate positions. Open positions are
+    indexed per market outcome, so opening and closing do not scan the
+    full trade history.
+    """
+
+    STATUS_CODES = {'OPEN': 0, 'CLOSED': 1, 'STOPPED': 2}
+
+    def __init__(self, capacity: int = 256):
+        self.records: List[Position] = []
+        self._open_index: Dict[Tuple[str, str], List[int]] = {}
+        self._open_rows: Dict[int, None] = {}
+        self.realized_pnl = 0.0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        self.quantity = np.zeros(capacity, dtype=np.float64)
+        self.entry_price = np.zeros(capacity, dtype=np.float64)
+        self.current_price = np.full(capacity, np.nan, dtype=np.float64)
+        self.pnl = np.zeros(capacity, dtype=np.float64)
+        self.status = np.full(capacity, -1, dtype=np.int8)
+
+    def _grow(self):
+        size = len(self.records)
+        columns = (self.quantity, self.entry_price, self.current_price, self.pnl, self.status)
+        self._allocate(max(16, size * 2))
+        for new, old in zip((self.quantity, self.entry_price, self.current_price, self.pnl, self.status),
+                            columns):
+            new[:size] = old[:size]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def add(self, position: Position) -> Position:
+        """Append a position in any state, indexing it if it is open"""
+        row = len(self.records)
+        if row == len(self.quantity):
+            self._grow()
+
+        self.records.append(position)
+        self.quantity[row] = position.quantity
+        self.entry_price[row] = position.entry_price
+        self.current_price[row] = np.nan if position.current_price is None else position.current_price
+        self.pnl[row] = position.pnl
+        self.status[row] = self.STATUS_CODES.get(position.status, -1)
+
+        if position.status == 'OPEN':
+            key = (position.market_id, position.outcome_name)
+            self._open_index.setdefault(key, []).append(row)
+            self._open_rows[row] = None
+        elif position.status == 'CLOSED':
+            self.realized_pnl += position.pnl
+
+        return position
+
+    def open(self, position: Position) -> Position:
+        """Record a newly opened position"""
+        position.status = 'OPEN'
+        return self.add(position)
+
+    def close(self,
+              market_id: str,
+              outcome_name: str,
+              exit_price: float,
+              exit_time: datetime) -> List[Position]:
+        """Close every open position on a market outcome at exit_price"""
+        rows = self._open_index.pop((market_id, outcome_name), [])
+        closed = []
+
+        for row in rows:
+            position = self.records[row]
+            position.exit_price = exit_price
+            position.exit_time = exit_time
+            position.pnl = (exit_price - position.entry_price) * position.quantity
+            position.status = 'CLOSED'
+
+            self.pnl[row] = position.pnl
+            self.status[row] = self.STATUS_CODES['CLOSED']
+            self.realized_pnl += position.pnl
+            del self._open_rows[row]
+            closed.append(position)
+
+        return closed
+
+    def has_open(self, market_id: str, outcome_name: str) -> bool:
+        """Whether any position is open on a market outcome"""
+        return (market_id, outcome_name) in self._open_index
+
+    def open_positions(self) -> List[Position]:
+        """Open positions in opening order"""
+        return [self.records[row] for row in self._open_rows]
+
+    def closed_positions(self) -> List[Position]:
+        """Closed positions in opening order"""
+        size = len(self.records)
+        rows = np.flatnonzero(self.status[:size] == self.STATUS_CODES['CLOSED'])
+        return [self.records[row] for row in rows]
+
+    def mark_to_market(self, prices: Dict[Tuple[str, str], float]) -> float:
+        """
+        Update current prices of open positions and return unrealized P&L
+
+        Args:
+            prices: Latest price per (market_id, outcome_name)
+
+        Returns:
+            Unrealized P&L across all open positions
+        """
+        for key, price in prices.items():
+            rows = self._open_index.get(key)
+            if rows:
+                self.current_price[rows] = price
+                for row in rows:
+                    self.records[row].current_price = price
+
+        return self.unrealized_pnl()
+
+    def unrealized_pnl(self) -> float:
+        """Unrealized P&L of open positions at their last marked price"""
+        if not self._open_rows:
+            return 0.0
+
+        rows = np.fromiter(self._open_rows, dtype=np.int64, count=len(self._open_rows))
+        marked = self.current_price[rows]
+        entry = self.entry_price[rows]
+        marked = np.where(np.isnan(marked), entry, marked)
+        return float(np.sum((marked - entry) * self.quantity[rows]))
+
+    def closed_pnl(self) -> np.ndarray:
+        """P&L of closed positions as an array, in opening order"""
+        size = len(self.records)
+        return self.pnl[:size][self.status[:size] == self.STATUS_CODES['CLOSED']]
+
+
+class PositionList(Sequence):
+    """
+    Live list view of a PositionBook's positions
+
+    append and extend add positions through the book, so they are indexed
+    and counted like positions the strategy opens itself; mutations the
+    book cannot follow (insert, remove, item assignment) are not offered.
+    """
+
+    def __init__(self, book: PositionBook):
+        self._book = book
+
+    def __len__(self) -> int:
+        return len(self._book.records)
+
+    def __getitem__(self, index):
+        return self._book.records[index]
+
+    def __iter__(self):
+        return iter(self._book.records)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, PositionList)):
+            return self._book.records == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self._book.records)
+
+    def append(self, position: Position):
+        """Add a position to the book"""
+        self._book.add(position)
+
+    def extend(self, positions):
+        """Add positions to the book in order"""
+        for position in positions:
+            self._book.add(position)
+
+
 class BaseWeatherStrategy(ABC):
     """
     Abstract base class for weather-based trading strategies
@@ -56,10 +341,74 @@ class BaseWeatherStrategy(ABC):
     def __init__(self, name: str, parameters: Optional[Dict[str, Any]] = None):
         self.name = name
         self.parameters = parameters or {}
-        self.positions: List[Position] = []
+        self.position_book = PositionBook()
         self.signals_history: List[TradingSignal] = []
+        self.history: Optional[HistoryBuffers] = None
+        self.indicators = IndicatorSet()
+        self.prices: Optional[PriceIndex] = None
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
+    @property
+    def positions(self) -> PositionList:
+        """All positions in opening order, a live view of the position book"""
+        return PositionList(self.position_book)
+
+    @positions.setter
+    def positions(self, positions: List[Position]):
+        self.position_book = PositionBook(capacity=max(256, len(positions)))
+        for position in positions:
+            self.position_book.add(position)
+
+    def required_history(self) -> int:
+        """
+        Rows of history per location and per market outcome the strategy needs
+
+        The backtesting engine keeps this many of the most recent aligned rows
+        in ring buffers attached as self.history while it walks the timeline.
+        The default of 0 disables history tracking.
+        """
+        return 0
+
+    def weather_window(self,
+                       location: str,
+                       location_data: pd.DataFrame,
+                       periods: Optional[int] = None) -> pd.DataFrame:
+        """
+        Last `periods` weather rows for a location (all available if None)
+
+        Served from the engine's history buffers when attached; otherwise
+        location_data is taken to already hold the location's history.
+        """
+        if self.history is not None:
+            window = self.history.weather_frame(location, periods)
+            if window is not None:
+                return window
+        return location_data if periods is None else location_data.tail(periods)
+
+    def generate_signals_batch(self,
+                               market_data: pd.DataFrame,
+                               weather_data: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Generate the signals for a whole aligned dataset at once (optional)
+
+        Strategies whose signals at each timestamp depend only on the data,
+        not on positions or other state built up while trading, can override
+        this to evaluate every timestamp in a few vectorized operations. The
+        backtesting engine then simulates fills and P&L from the returned
+        frame instead of calling generate_signals tick by tick.
+
+        Args:
+            market_data: Aligned market data for the full backtest period
+            weather_data: Aligned weather data for the full backtest period
+
+        Returns:
+            Signal frame with SIGNAL_COLUMNS, one row per signal, where
+            'timestamp' is the timeline step the signal is acted on and rows
+            are in the order generate_signals would emit them; or None if the
+            strategy has no batch implementation
+        """
+        return None
+
     @abstractmethod
     def generate_signals(self,
                         market_data: pd.DataFrame,
@@ -91,36 +440,45 @@ class BaseWeatherStrategy(ABC):
         Returns:
             Updated list of positions
         """
-        updated_positions = self.positions.copy()
-
         for signal in signals:
             if signal.signal_type == 'BUY':
                 position = self._open_position(signal, market_data)
                 if position:
-                    updated_positions.append(position)
+                    self.position_book.open(position)
                     self.signals_history.append(signal)
 
             elif signal.signal_type == 'SELL':
-                closed_positions = self._close_positions(signal, market_data, updated_positions)
-                updated_positions.extend(closed_positions)
+                self._close_positions(signal, market_data)
                 self.signals_history.append(signal)
 
-        self.positions = updated_positions
         return self.positions
 
+    def _current_price(self, market_id: str, outcome_name: str, market_data: pd.DataFrame) -> Optional[float]:
+        """
+        Price of an outcome in the current market data, or None if it has no row
+
+        Served from the engine's price index when attached; otherwise
+        market_data is searched.
+        """
+        if self.prices is not None:
+            quote = self.prices.quote(market_id, outcome_name)
+            return quote[0] if quote is not None else None
+
+        current_data = market_data[
+            (market_data['market_id'] == market_id) &
+            (market_data['outcome_name'] == outcome_name)
+        ]
+        return current_data['probability'].iloc[-1] if not current_data.empty else None
+
     def _open_position(self, signal: TradingSignal, market_data: pd.DataFrame) -> Optional[Position]:
         """Open a new position based on signal"""
         # Get current market price
-        current_data = market_data[
-            (market_data['market_id'] == signal.market_id) &
-            (market_data['outcome_name'] == signal.outcome_name)
-        ]
+        current_price = self._current_price(signal.market_id, signal.outcome_name, market_data)
 
-        if current_data.empty:
+        if current_price is None:
             self.logger.warning(f"No market data found for {signal.market_id}:{signal.outcome_name}")
             return None
 
-        current_price = current_data['probability'].iloc[-1]
         quantity = signal.quantity or 1.0  # Default quantity
 
         position = Position(
@@ -138,46 +496,38 @@ class BaseWeatherStrategy(ABC):
 
     def _close_positions(self,
                         signal: TradingSignal,
-                        market_data: pd.DataFrame,
-                        positions: List[Position]) -> List[Position]:
+                        market_data: pd.DataFrame) -> List[Position]:
         """Close positions matching the signal"""
-        closed_positions = []
+        if not self.position_book.has_open(signal.market_id, signal.outcome_name):
+            return []
 
-        for position in positions:
-            if (position.market_id == signal.market_id and
-                position.outcome_name == signal.outcome_name and
-                position.status == 'OPEN'):
-
-                # Get current market price
-                current_data = market_data[
-                    (market_data['market_id'] == signal.market_id) &
-                    (market_data['outcome_name'] == signal.outcome_name)
-                ]
-
-                if not current_data.empty:
-                    exit_price = current_data['probability'].iloc[-1]
-                    position.exit_price = exit_price
-                    position.exit_time = signal.timestamp
-                    position.pnl = (exit_price - position.entry_price) * position.quantity
-                    position.status = 'CLOSED'
-
-                    self.logger.info(f"Closed position: {signal.market_id}:{signal.outcome_name} "
-                                    f"PNL: {position.pnl:.4f}")
-                    closed_positions.append(position)
+        # Get current market price
+        exit_price = self._current_price(signal.market_id, signal.outcome_name, market_data)
+
+        if exit_price is None:
+            return []
+
+        closed_positions = self.position_book.close(
+            signal.market_id, signal.outcome_name, exit_price, signal.timestamp
+        )
+
+        for position in closed_positions:
+            self.logger.info(f"Closed position: {signal.market_id}:{signal.outcome_name} "
+                            f"PNL: {position.pnl:.4f}")
 
         return closed_positions
 
     def get_open_positions(self) -> List[Position]:
         """Get all currently open positions"""
-        return [p for p in self.positions if p.status == 'OPEN']
+        return self.position_book.open_positions()
 
     def get_closed_positions(self) -> List[Position]:
         """Get all closed positions"""
-        return [p for p in self.positions if p.status == 'CLOSED']
+        return self.position_book.closed_positions()
 
     def get_total_pnl(self) -> float:
         """Calculate total realized P&L"""
-        return sum(p.pnl for p in self.get_closed_positions())
+        return float(self.position_book.closed_pnl().sum())
 
     def get_strategy_metrics(self) -> Dict[str, Any]:
         """Get strategy performance metrics"""
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Rolling History Buffers for Strategies
+
+Fixed-capacity NumPy ring buffers holding the most recent rows per weather
+location and per market outcome. The backtesting engine appends each tick's
+rows as it walks the timeline, so strategies can look back over a window
+without the engine re-slicing the full history every tick.
+"""
+
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class RingBuffer:
+    """
+    Fixed-capacity buffer of timestamped numeric rows
+
+    Every row is written twice, at its slot and at slot + capacity, so the
+    last n rows always occupy one contiguous range of the backing array and
+    windows are returned as O(1) NumPy views rather than copies.
+    """
+
+    def __init__(self, capacity: int, columns: List[str], keys: Optional[Dict[str, Any]] = None):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self.columns = list(columns)
+        self.keys = keys or {}
+        self._column_index = {col: i for i, col in enumerate(self.columns)}
+        self._values = np.full((2 * capacity, len(self.columns)), np.nan, dtype=np.float64)
+        self._times = np.zeros(2 * capacity, dtype=np.int64)
+        self._head = 0  # slot the next row is written to
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp_ns: int, values: np.ndarray):
+        """Add a row, evicting the oldest once the buffer is full"""
+        head = self._head
+        self._values[head] = values
+        self._values[head + self.capacity] = values
+        self._times[head] = timestamp_ns
+        self._times[head + self.capacity] = timestamp_ns
+
+        self._head = (head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def _bounds(self, periods: Optional[int]) -> Tuple[int, int]:
+        n = self._size if periods is None else max(0, min(periods, self._size))
+        end = self._head + self.capacity
+        return end - n, end
+
+    def values(self, column: Optional[str] = None, periods: Optional[int] = None) -> np.ndarray:
+        """
+        View of the last `periods` rows, oldest first
+
+        Args:
+            column: Single column to return as a 1-D view (all columns if None)
+            periods: Window length (everything buffered if None)
+        """
+        start, end = self._bounds(periods)
+        if column is None:
+            return self._values[start:end]
+        return self._values[start:end, self._column_index[column]]
+
+    def timestamps(self, periods: Optional[int] = None) -> np.ndarray:
+        """Epoch-nanosecond timestamps of the last `periods` rows"""
+        start, end = self._bounds(periods)
+        return self._times[start:end]
+
+    def latest(self, column: str) -> float:
+        """Most recent value of a column"""
+        if not self._size:
+            raise IndexError("RingBuffer is empty")
+        return float(self._values[self._head + self.capacity - 1, self._column_index[column]])
+
+    def frame(self, periods: Optional[int] = None, tz: Optional[str] = None) -> pd.DataFrame:
+        """Last `periods` rows as a DataFrame shaped like the aligned input data"""
+        timestamps = pd.to_datetime(self.timestamps(periods), unit='ns')
+        if tz is not None:
+            timestamps = timestamps.tz_localize('UTC').tz_convert(tz)
+
+        df = pd.DataFrame(self.values(periods=periods), columns=self.columns)
+        df.insert(0, 'timestamp', timestamps)
+        for position, (key, value) in enumerate(self.keys.items()):
+            df.insert(position, key, value)
+        return df
+
+
+class HistoryBuffers:
+    """
+    Ring buffers per weather location and per market outcome
+
+    Numeric columns are fixed from the first non-empty rows seen for each
+    dataset; later rows missing one of them record NaN.
+    """
+
+    WEATHER_KEYS = ('location_name',)
+    MARKET_KEYS = ('market_id', 'outcome_name')
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self._weather: Dict[Hashable, RingBuffer] = {}
+        self._market: Dict[Hashable, RingBuffer] = {}
+        self._columns: Dict[str, List[str]] = {}
+        self.tz: Optional[str] = None
+
+    def update(self, market_rows: pd.DataFrame, weather_rows: pd.DataFrame):
+        """Append one tick of aligned market and weather rows"""
+        self._append('market', self._market, market_rows, self.MARKET_KEYS)
+        self._append('weather', self._weather, weather_rows, self.WEATHER_KEYS)
+
+    def weather(self, location: str) -> Optional[RingBuffer]:
+        """History for a location, or None if none has been seen"""
+        return self._weather.get(location)
+
+    def market(self, market_id: str, outcome_name: str) -> Optional[RingBuffer]:
+        """History for a market outcome, or None if none has been seen"""
+        return self._market.get((market_id, outcome_name))
+
+    def weather_frame(self, location: str, periods: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """Last `periods` weather rows for a location as a DataFrame"""
+        buffer = self.weather(location)
+        return buffer.frame(periods, tz=self.tz) if buffer is not None else None
+
+    def _append(self,
+                dataset: str,
+                buffers: Dict[Hashable, RingBuffer],
+                rows: pd.DataFrame,
+                key_columns: Tuple[str, ...]):
+        if rows.empty or 'timestamp' not in rows.columns or not all(k in rows.columns for k in key_columns):
+            return
+
+        columns = self._columns.get(dataset)
+        if columns is None:
+            columns = [col for col in rows.columns
+                       if col not in key_columns and col != 'timestamp'
+                       and pd.api.types.is_numeric_dtype(rows[col]) and not pd.api.types.is_bool_dtype(rows[col])]
+            self._columns[dataset] = columns
+
+        timestamps = rows['timestamp']
+        if isinstance(timestamps.dtype, pd.DatetimeTZDtype):
+            self.tz = str(timestamps.dt.tz)
+            timestamps = timestamps.dt.tz_convert('UTC').dt.tz_localize(None)
+        times = timestamps.to_numpy('datetime64[ns]').view(np.int64)
+        values = rows.reindex(columns=columns).to_numpy(dtype=np.float64, na_value=np.nan)
+
+        if len(key_columns) == 1:
+            keys = rows[key_columns[0]].tolist()
+        else:
+            keys = list(zip(*(rows[k].tolist() for k in key_columns)))
+
+        for i, key in enumerate(keys):
+            buffer = buffers.get(key)
+            if buffer is None:
+                key_values = (key,) if len(key_columns) == 1 else key
+                buffer = RingBuffer(self.capacity, columns, dict(zip(key_columns, key_values)))
+                buffers[key] = buffer
+            buffer.append(times[i], values[i])
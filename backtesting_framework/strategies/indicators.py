@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Incremental Rolling Indicators for Strategies
+
+Sliding-window statistics updated in O(1) per observation with Welford-style
+add/remove updates, so strategies evaluating the same window every tick do
+not recompute it from scratch. Results follow pandas' conventions for the
+equivalent window computations: NaNs are skipped, variances use ddof=1 and
+correlations use pairwise-complete observations.
+"""
+
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class RollingMoments:
+    """
+    Count, sum, mean and variance over the last `window` observations
+
+    Welford updates accumulate rounding error when values are also removed,
+    so the moments are recomputed exactly from the retained values once
+    every `window` updates, keeping the amortized cost per update O(1).
+    """
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window must be positive")
+
+        self.window = window
+        self._values = np.full(window, np.nan)
+        self._pos = 0
+        self.size = 0  # observations in the window, including NaNs
+        self.count = 0  # non-NaN observations in the window
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._same_run = 0  # trailing run of identical values, as pandas tracks
+        self._last = np.nan
+        self._updates = 0
+
+    def update(self, value: float):
+        """Push an observation, evicting the oldest once the window is full"""
+        value = float(value)
+        if self.size == self.window:
+            old = self._values[self._pos]
+            if not np.isnan(old):
+                self._remove(old)
+        else:
+            self.size += 1
+
+        self._values[self._pos] = value
+        self._pos = (self._pos + 1) % self.window
+
+        if np.isnan(value):
+            self._same_run = 0
+        else:
+            self._add(value)
+            self._same_run = self._same_run + 1 if value == self._last else 1
+        self._last = value
+
+        self._updates += 1
+        if self._updates >= self.window:
+            self._resync()
+
+    def _add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def _remove(self, value: float):
+        if self.count <= 1:
+            self.count, self.mean, self._m2 = 0, 0.0, 0.0
+            return
+
+        self.count -= 1
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self._m2 -= delta * (value - self.mean)
+
+    def _resync(self):
+        values = self._values[:self.size]
+        finite = values[~np.isnan(values)]
+        self.count = len(finite)
+        self.mean = float(finite.mean()) if self.count else 0.0
+        self._m2 = float(((finite - self.mean) ** 2).sum()) if self.count else 0.0
+        self._updates = 0
+
+    @property
+    def sum(self) -> float:
+        return self.mean * self.count if self.count else 0.0
+
+    @property
+    def average(self) -> float:
+        """Mean of the window (NaN when empty)"""
+        return self.mean if self.count else np.nan
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1) of the window"""
+        if self.count < 2:
+            return np.nan
+        # A window of one repeated value has exactly zero variance
+        if self._same_run >= self.count:
+            return 0.0
+        return max(self._m2, 0.0) / (self.count - 1)
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.variance))
+
+    def zscore(self, value: float) -> float:
+        """Standard score of a value against the window"""
+        std = self.std
+        return (value - self.average) / std if std else np.nan
+
+
+class RollingCovariance:
+    """
+    Covariance and correlation of paired observations over a sliding window
+
+    Only pairs where both values are present contribute, matching
+    Series.cov / Series.corr on the same window.
+    """
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window must be positive")
+
+        self.window = window
+        self._x = np.full(window, np.nan)
+        self._y = np.full(window, np.nan)
+        self._pos = 0
+        self.size = 0
+        self.count = 0
+        self.mean_x = self.mean_y = 0.0
+        self._c = self._m2x = self._m2y = 0.0
+        self._updates = 0
+
+    def update(self, x: float, y: float):
+        """Push an observation pair, evicting the oldest once the window is full"""
+        x, y = float(x), float(y)
+        if self.size == self.window:
+            old_x, old_y = self._x[self._pos], self._y[self._pos]
+            if not (np.isnan(old_x) or np.isnan(old_y)):
+                self._remove(old_x, old_y)
+        else:
+            self.size += 1
+
+        self._x[self._pos], self._y[self._pos] = x, y
+        self._pos = (self._pos + 1) % self.window
+
+        if not (np.isnan(x) or np.isnan(y)):
+            self._add(x, y)
+
+        self._updates += 1
+        if self._updates >= self.window:
+            self._resync()
+
+    def _add(self, x: float, y: float):
+        self.count += 1
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += dx / self.count
+        self.mean_y += dy / self.count
+        self._c += dx * (y - self.mean_y)
+        self._m2x += dx * (x - self.mean_x)
+        self._m2y += dy * (y - self.mean_y)
+
+    def _remove(self, x: float, y: float):
+        if self.count <= 1:
+            self.count = 0
+            self.mean_x = self.mean_y = self._c = self._m2x = self._m2y = 0.0
+            return
+
+        self.count -= 1
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x -= dx / self.count
+        self.mean_y -= dy / self.count
+        self._c -= dx * (y - self.mean_y)
+        self._m2x -= dx * (x - self.mean_x)
+        self._m2y -= dy * (y - self.mean_y)
+
+    def _resync(self):
+        x, y = self._x[:self.size], self._y[:self.size]
+        valid = ~(np.isnan(x) | np.isnan(y))
+        x, y = x[valid], y[valid]
+
+        self.count = len(x)
+        if self.count:
+            self.mean_x, self.mean_y = float(x.mean()), float(y.mean())
+            dx, dy = x - self.mean_x, y - self.mean_y
+            self._c = float((dx * dy).sum())
+            self._m2x = float((dx * dx).sum())
+            self._m2y = float((dy * dy).sum())
+        else:
+            self.mean_x = self.mean_y = self._c = self._m2x = self._m2y = 0.0
+        self._updates = 0
+
+    def _is_constant(self, values: np.ndarray) -> bool:
+        """Whether the paired values of one side are all identical"""
+        x, y = self._x[:self.size], self._y[:self.size]
+        paired = values[:self.size][~(np.isnan(x) | np.isnan(y))]
+        return len(paired) > 0 and bool(np.all(paired == paired[0]))
+
+    @property
+    def covariance(self) -> float:
+        """Sample covariance (ddof=1) of the window"""
+        if self.count < 2:
+            return np.nan
+        return self._c / (self.count - 1)
+
+    @property
+    def correlation(self) -> float:
+        """Pearson correlation of the window (NaN if either side is constant)"""
+        if self.count < 2:
+            return np.nan
+
+        denominator = self._m2x * self._m2y
+        # Rounding can leave a tiny positive variance for a constant series;
+        # confirm against the window before dividing by it
+        scale = max(abs(self.mean_x), abs(self.mean_y), 1.0) ** 2 * self.count
+        if denominator <= (1e-12 * scale) ** 2 and (self._is_constant(self._x) or self._is_constant(self._y)):
+            return np.nan
+        if denominator <= 0:
+            return np.nan
+
+        return float(np.clip(self._c / np.sqrt(denominator), -1.0, 1.0))
+
+
+class IndicatorSet:
+    """
+    Rolling indicators per location, fed one aligned weather tick at a time
+
+    Strategies register the indicators they use (typically in __init__);
+    the backtesting engine calls reset() before a run and update() with each
+    tick's weather rows. Lookups return None until the set has been fed, so
+    strategies called directly can fall back to computing over a frame.
+    """
+
+    def __init__(self):
+        self._moment_specs: List[Tuple[str, int, Optional[float]]] = []
+        self._covariance_specs: List[Tuple[str, str, int]] = []
+        self._moments: Dict[Hashable, RollingMoments] = {}
+        self._covariances: Dict[Hashable, RollingCovariance] = {}
+        self.active = False
+
+    def __bool__(self) -> bool:
+        return bool(self._moment_specs or self._covariance_specs)
+
+    def track(self, column: str, window: int):
+        """Track count/sum/mean/variance of a column"""
+        if window > 0 and (column, window, None) not in self._moment_specs:
+            self._moment_specs.append((column, window, None))
+
+    def track_below(self, column: str, threshold: float, window: int):
+        """Track how many observations of a column fall below a threshold"""
+        if window > 0 and (column, window, threshold) not in self._moment_specs:
+            self._moment_specs.append((column, window, threshold))
+
+    def track_correlation(self, x: str, y: str, window: int):
+        """Track covariance/correlation of two columns"""
+        if window > 0 and (x, y, window) not in self._covariance_specs:
+            self._covariance_specs.append((x, y, window))
+
+    def reset(self):
+        """Drop accumulated state and start accepting updates"""
+        self._moments.clear()
+        self._covariances.clear()
+        self.active = True
+
+    def detach(self):
+        """Drop accumulated state and stop answering lookups, as after a run"""
+        self._moments.clear()
+        self._covariances.clear()
+        self.active = False
+
+    def update(self, weather_rows: pd.DataFrame, group_col: str = 'location_name'):
+        """Push one tick of aligned weather rows (at most one per location)"""
+        if weather_rows.empty or group_col not in weather_rows.columns:
+            return
+
+        columns = {col for col, _, _ in self._moment_specs}
+        columns.update(col for x, y, _ in self._covariance_specs for col in (x, y))
+        values = {col: (weather_rows[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                        if col in weather_rows.columns else np.full(len(weather_rows), np.nan))
+                  for col in columns}
+
+        for i, location in enumerate(weather_rows[group_col].tolist()):
+            for column, window, threshold in self._moment_specs:
+                key = (location, column, window, threshold)
+                moments = self._moments.get(key)
+                if moments is None:
+                    moments = self._moments[key] = RollingMoments(window)
+
+                value = values[column][i]
+                if threshold is not None:
+                    # NaN compares False, as in a DataFrame filter
+                    value = 1.0 if value < threshold else 0.0
+                moments.update(value)
+
+            for x, y, window in self._covariance_specs:
+                key = (location, x, y, window)
+                covariance = self._covariances.get(key)
+                if covariance is None:
+                    covariance = self._covariances[key] = RollingCovariance(window)
+                covariance.update(values[x][i], values[y][i])
+
+    def moments(self, location: str, column: str, window: int) -> Optional[RollingMoments]:
+        """Rolling moments of a column for a location"""
+        if not self.active:
+            return None
+        return self._moments.get((location, column, window, None))
+
+    def count_below(self, location: str, column: str, threshold: float, window: int) -> Optional[int]:
+        """Observations below threshold in the window, if tracked"""
+        if not self.active:
+            return None
+        moments = self._moments.get((location, column, window, threshold))
+        return int(round(moments.sum)) if moments is not None else None
+
+    def covariance(self, location: str, x: str, y: str, window: int) -> Optional[RollingCovariance]:
+        """Rolling covariance of two columns for a location"""
+        if not self.active:
+            return None
+        return self._covariances.get((location, x, y, window))
@@ -16,7 +16,9 @@ from ..base_strategy import (
     BaseWeatherStrategy,
     WeatherThresholdStrategy,
     TradingSignal,
-    Position
+    Position,
+    PositionBook,
+    PriceIndex
 )
 
 
@@ -297,6 +299,167 @@ class TestBaseWeatherStrategy:
         assert metrics['open_positions'] == 1
 
 
+class TestPositionBook:
+    """Test cases for the columnar PositionBook"""
+
+    def _position(self, outcome='Yes', entry_price=0.5, quantity=1.0):
+        return Position(
+            market_id='market1',
+            outcome_name=outcome,
+            quantity=quantity,
+            entry_price=entry_price,
+            entry_time=datetime(2024, 1, 1, 9)
+        )
+
+    def test_open_and_close(self):
+        """Closing a market outcome closes every open position on it"""
+        book = PositionBook()
+        book.open(self._position(entry_price=0.5))
+        book.open(self._position(entry_price=0.4, quantity=2.0))
+        book.open(self._position(outcome='No', entry_price=0.3))
+
+        closed = book.close('market1', 'Yes', 0.6, datetime(2024, 1, 1, 10))
+
+        assert len(closed) == 2
+        assert all(p.status == 'CLOSED' for p in closed)
+        assert closed[1].pnl == pytest.approx(0.4)
+        assert book.realized_pnl == pytest.approx(0.5)
+        assert not book.has_open('market1', 'Yes')
+        assert book.has_open('market1', 'No')
+        assert [p.outcome_name for p in book.open_positions()] == ['No']
+        assert len(book.closed_positions()) == 2
+        assert len(book) == 3
+
+    def test_close_without_open_positions(self):
+        """Closing an outcome with nothing open is a no-op"""
+        book = PositionBook()
+        assert book.close('market1', 'Yes', 0.6, datetime(2024, 1, 1)) == []
+        assert book.realized_pnl == 0.0
+
+    def test_mark_to_market(self):
+        """Mark-to-market updates open positions and returns unrealized P&L"""
+        book = PositionBook()
+        book.open(self._position(entry_price=0.5, quantity=2.0))
+        book.open(self._position(outcome='No', entry_price=0.5))
+
+        unrealized = book.mark_to_market({('market1', 'Yes'): 0.7})
+
+        assert unrealized == pytest.approx(0.4)  # 'No' is still marked at entry
+        assert book.open_positions()[0].current_price == 0.7
+
+    def test_grows_beyond_capacity(self):
+        """The book reallocates its arrays as positions accumulate"""
+        book = PositionBook(capacity=2)
+        for i in range(50):
+            book.open(self._position(outcome=f'outcome{i}', entry_price=0.5))
+            book.close('market1', f'outcome{i}', 0.6, datetime(2024, 1, 2))
+
+        assert len(book.closed_positions()) == 50
+        assert book.closed_pnl().sum() == pytest.approx(5.0)
+
+    def test_strategy_positions_backed_by_book(self, sample_positions, sample_market_data):
+        """Assigning positions rebuilds the book and SELLs close in place"""
+        strategy = WeatherThresholdStrategy()
+        strategy.positions = sample_positions
+
+        assert strategy.get_total_pnl() == pytest.approx(-0.1)
+        assert len(strategy.get_open_positions()) == 1
+
+        sell_signal = TradingSignal(
+            timestamp=datetime(2024, 1, 1, 11),
+            market_id='market1',
+            outcome_name='Yes',
+            signal_type='SELL',
+            confidence=0.8
+        )
+        positions = strategy.update_positions([sell_signal], sample_market_data)
+
+        assert len(positions) == 2
+        assert strategy.get_open_positions() == []
+        assert strategy.get_total_pnl() == pytest.approx(0.0)  # -0.1 + (0.6 - 0.5)
+
+    def test_appending_to_positions_goes_through_book(self, sample_market_data):
+        """positions.append indexes the position, so SELLs and exposure see it"""
+        strategy = WeatherThresholdStrategy()
+        position = self._position(entry_price=0.5)
+        strategy.positions.append(position)
+
+        assert strategy.positions == [position]
+        assert len(strategy.position_book) == 1
+        assert strategy.get_open_positions() == [position]
+
+        sell_signal = TradingSignal(
+            timestamp=datetime(2024, 1, 1, 11),
+            market_id='market1',
+            outcome_name='Yes',
+            signal_type='SELL',
+            confidence=0.8
+        )
+        strategy.update_positions([sell_signal], sample_market_data)
+
+        assert position.status == 'CLOSED'
+        assert strategy.get_total_pnl() == pytest.approx(0.1)  # (0.6 - 0.5) * 1
+        with pytest.raises(AttributeError):
+            strategy.positions.insert(0, position)
+
+
+class TestPriceIndex:
+    """Test cases for PriceIndex"""
+
+    def _tick(self, rows):
+        return pd.DataFrame(rows, columns=['market_id', 'outcome_name', 'probability', 'volume'])
+
+    def test_quotes_are_current_tick_only(self):
+        """An outcome without a row on the current tick has no quote"""
+        prices = PriceIndex()
+        prices.update(self._tick([('market1', 'Yes', 0.5, 100.0), ('market1', 'No', 0.5, 80.0)]))
+        prices.update(self._tick([('market1', 'Yes', 0.6, 120.0)]))
+
+        assert prices.quote('market1', 'Yes') == (0.6, 120.0)
+        assert prices.quote('market1', 'No') is None
+        assert prices.quote('market2', 'Yes') is None
+        assert prices.latest_price('market1', 'No') == 0.5
+
+        prices.update(self._tick([]))
+        assert prices.quote('market1', 'Yes') is None
+
+    def test_last_row_wins(self):
+        prices = PriceIndex()
+        prices.update(self._tick([('market1', 'Yes', 0.5, 1.0), ('market1', 'Yes', 0.7, 2.0)]))
+
+        assert prices.quote('market1', 'Yes') == (0.7, 2.0)
+
+    def test_grows_beyond_capacity(self):
+        prices = PriceIndex(capacity=2)
+        rows = [(f'market{i}', 'Yes', i / 100, float(i)) for i in range(50)]
+        prices.update(self._tick(rows))
+
+        assert prices.quote('market0', 'Yes') == (0.0, 0.0)
+        assert prices.quote('market49', 'Yes') == (0.49, 49.0)
+
+    def test_strategy_uses_attached_index(self, sample_market_data):
+        """Positions open at the indexed quote, matching a search of the same rows"""
+        tick = sample_market_data[sample_market_data['timestamp'] == datetime(2024, 1, 1, 11)]
+        signal = TradingSignal(
+            timestamp=datetime(2024, 1, 1, 11),
+            market_id='market1',
+            outcome_name='No',
+            signal_type='BUY',
+            confidence=0.8
+        )
+
+        searched = WeatherThresholdStrategy()
+        searched.update_positions([signal], tick)
+
+        indexed = WeatherThresholdStrategy()
+        indexed.prices = PriceIndex()
+        indexed.prices.update(tick)
+        # The index answers even when the frame passed in has no matching row
+        indexed.update_positions([signal], tick.iloc[0:0])
+
+        assert indexed.positions[0].entry_price == searched.positions[0].entry_price
+
+
 class TestWeatherThresholdStrategy:
     """Test cases for WeatherThresholdStrategy"""
 
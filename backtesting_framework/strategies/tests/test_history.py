@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Rolling History Buffers
+
+Tests the ring buffer windows and the per-location / per-market buffers
+the engine maintains for strategies.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from datetime import datetime
+
+from ..history import RingBuffer, HistoryBuffers
+from ..weather_strategies import TemperatureThresholdStrategy
+
+
+def _ns(hour):
+    return pd.Timestamp(datetime(2024, 1, 1, hour)).value
+
+
+class TestRingBuffer:
+    """Test cases for RingBuffer"""
+
+    def test_windows_after_wraparound(self):
+        """Windows hold the most recent rows oldest first, across wraparound"""
+        buffer = RingBuffer(4, ['a', 'b'])
+        for i in range(10):
+            buffer.append(_ns(i), np.array([i, 10 * i], dtype=float))
+
+        assert len(buffer) == 4
+        np.testing.assert_array_equal(buffer.values('a'), [6, 7, 8, 9])
+        np.testing.assert_array_equal(buffer.values('b', periods=2), [80, 90])
+        np.testing.assert_array_equal(buffer.timestamps(3), [_ns(7), _ns(8), _ns(9)])
+        assert buffer.latest('a') == 9.0
+
+    def test_partial_fill(self):
+        buffer = RingBuffer(5, ['a'])
+        buffer.append(_ns(0), np.array([1.0]))
+        buffer.append(_ns(1), np.array([2.0]))
+
+        np.testing.assert_array_equal(buffer.values('a', periods=10), [1.0, 2.0])
+        assert len(buffer.values(periods=0)) == 0
+
+    def test_windows_are_views(self):
+        """Windows share memory with the buffer instead of copying"""
+        buffer = RingBuffer(3, ['a'])
+        for i in range(5):
+            buffer.append(_ns(i), np.array([float(i)]))
+
+        assert np.shares_memory(buffer.values('a'), buffer.values())
+
+    def test_frame(self):
+        """Frames carry timestamps, key columns and values"""
+        buffer = RingBuffer(3, ['temperature'], keys={'location_name': 'London'})
+        for i in range(4):
+            buffer.append(_ns(i), np.array([float(i)]))
+
+        df = buffer.frame(2, tz='UTC')
+
+        assert list(df.columns) == ['location_name', 'timestamp', 'temperature']
+        assert df['temperature'].tolist() == [2.0, 3.0]
+        assert df['timestamp'].iloc[-1] == pd.Timestamp(datetime(2024, 1, 1, 3), tz='UTC')
+        assert (df['location_name'] == 'London').all()
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            RingBuffer(0, ['a'])
+
+
+class TestHistoryBuffers:
+    """Test cases for HistoryBuffers"""
+
+    def test_buffers_per_location_and_market(self):
+        """Rows are routed to a buffer per location and per market outcome"""
+        history = HistoryBuffers(capacity=3)
+
+        for hour in range(5):
+            ts = pd.Timestamp(datetime(2024, 1, 1, hour), tz='UTC')
+            market = pd.DataFrame({
+                'timestamp': [ts, ts],
+                'market_id': ['m1', 'm1'],
+                'outcome_name': ['Yes', 'No'],
+                'probability': [0.1 * hour, 1 - 0.1 * hour],
+                'volume': [100.0, 100.0],
+                'event_title': ['Event', 'Event']
+            })
+            weather = pd.DataFrame({
+                'timestamp': [ts, ts],
+                'location_name': ['London', 'Paris'],
+                'temperature': [float(hour), float(-hour)],
+                'source_name': ['test', 'test']
+            })
+            history.update(market, weather)
+
+        np.testing.assert_allclose(history.market('m1', 'Yes').values('probability'), [0.2, 0.3, 0.4])
+        np.testing.assert_allclose(history.weather('Paris').values('temperature'), [-2.0, -3.0, -4.0])
+        assert history.weather('Berlin') is None
+        # Non-numeric columns are not buffered
+        assert history.weather('London').columns == ['temperature']
+
+        frame = history.weather_frame('London', 2)
+        assert frame['timestamp'].dt.tz is not None
+        assert frame['temperature'].tolist() == [3.0, 4.0]
+
+    def test_strategy_reads_window_from_history(self):
+        """Strategies with history attached look back beyond the current slice"""
+        strategy = TemperatureThresholdStrategy(parameters={'lookback_period': 3})
+        strategy.history = HistoryBuffers(strategy.required_history())
+        assert strategy.required_history() == 3
+
+        for hour in range(5):
+            weather = pd.DataFrame({
+                'timestamp': [datetime(2024, 1, 1, hour)],
+                'location_name': ['London'],
+                'temperature': [float(hour)]
+            })
+            strategy.history.update(pd.DataFrame(), weather)
+
+        window = strategy.weather_window('London', weather, 3)
+        assert window['temperature'].tolist() == [2.0, 3.0, 4.0]
+
+        # Without history the passed frame is the history
+        strategy.history = None
+        assert strategy.weather_window('London', weather, 3)['temperature'].tolist() == [4.0]
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Incremental Rolling Indicators
+
+Checks the online window statistics against the equivalent pandas rolling
+computations, and that strategies produce the same signals from the
+indicators as from recomputing over a frame.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from datetime import datetime, timedelta
+
+from ..indicators import RollingMoments, RollingCovariance, IndicatorSet
+from ..history import HistoryBuffers
+from ..weather_strategies import TemperatureThresholdStrategy, WeatherPatternStrategy
+
+
+def _series_with_gaps(n=500, seed=7):
+    rng = np.random.default_rng(seed)
+    values = rng.normal(20.0, 5.0, n) + 1e4  # large offset stresses cancellation
+    values[rng.random(n) < 0.1] = np.nan
+    values[200:230] = 10042.5  # constant stretch
+    return pd.Series(values)
+
+
+class TestRollingMoments:
+    """Test cases for RollingMoments"""
+
+    @pytest.mark.parametrize('window', [1, 2, 7, 24, 100])
+    def test_matches_pandas_rolling(self, window):
+        series = _series_with_gaps()
+        rolling = series.rolling(window, min_periods=1)
+        expected = pd.DataFrame({
+            'count': rolling.count(),
+            'mean': rolling.mean(),
+            'var': rolling.var(),
+            'std': rolling.std(),
+            'sum': rolling.sum()
+        })
+
+        moments = RollingMoments(window)
+        actual = []
+        for value in series:
+            moments.update(value)
+            actual.append((moments.count, moments.average, moments.variance, moments.std, moments.sum))
+        actual = pd.DataFrame(actual, columns=expected.columns)
+
+        # pandas reports an all-NaN window's sum as NaN
+        expected['sum'] = expected['sum'].fillna(0.0)
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False, rtol=1e-9, atol=1e-9)
+
+    def test_constant_window_has_zero_variance(self):
+        moments = RollingMoments(5)
+        for value in [1.0, 2.0, 0.1, 0.1, 0.1, 0.1, 0.1]:
+            moments.update(value)
+
+        assert moments.variance == 0.0
+        assert np.isnan(moments.zscore(0.1))
+
+    def test_zscore(self):
+        moments = RollingMoments(4)
+        for value in [1.0, 2.0, 3.0, 4.0]:
+            moments.update(value)
+
+        window = pd.Series([1.0, 2.0, 3.0, 4.0])
+        assert moments.zscore(4.0) == pytest.approx((4.0 - window.mean()) / window.std())
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            RollingMoments(0)
+
+
+class TestRollingCovariance:
+    """Test cases for RollingCovariance"""
+
+    @pytest.mark.parametrize('window', [2, 10, 48])
+    def test_matches_pandas_rolling(self, window):
+        rng = np.random.default_rng(3)
+        x = pd.Series(rng.normal(15.0, 4.0, 400))
+        y = 0.6 * x + pd.Series(rng.normal(0.0, 2.0, 400))
+        x[rng.random(400) < 0.08] = np.nan
+        y[rng.random(400) < 0.08] = np.nan
+        y[100:160] = 3.0  # constant stretch has undefined correlation
+
+        expected_cov = x.rolling(window, min_periods=1).cov(y)
+        expected_corr = x.rolling(window, min_periods=1).corr(y)
+
+        rolling = RollingCovariance(window)
+        actual_cov, actual_corr = [], []
+        for xi, yi in zip(x, y):
+            rolling.update(xi, yi)
+            actual_cov.append(rolling.covariance)
+            actual_corr.append(rolling.correlation)
+
+        np.testing.assert_allclose(actual_cov, expected_cov, rtol=1e-9, atol=1e-9)
+        # pandas reports infinities as NaN for a constant side of the window
+        np.testing.assert_allclose(actual_corr, expected_corr.replace([np.inf, -np.inf], np.nan),
+                                   rtol=1e-7, atol=1e-9)
+
+    def test_window_tail_matches_series_corr(self):
+        """The correlation of the current window equals Series.corr on the tail"""
+        rng = np.random.default_rng(11)
+        x = pd.Series(rng.normal(size=300))
+        y = pd.Series(-x + rng.normal(scale=0.5, size=300))
+
+        rolling = RollingCovariance(72)
+        for xi, yi in zip(x, y):
+            rolling.update(xi, yi)
+
+        assert rolling.correlation == pytest.approx(x.tail(72).corr(y.tail(72)), rel=1e-9)
+
+
+class TestIndicatorSet:
+    """Test cases for IndicatorSet"""
+
+    def _ticks(self, hours=60):
+        rng = np.random.default_rng(5)
+        start = datetime(2024, 1, 1)
+        for hour in range(hours):
+            yield pd.DataFrame({
+                'timestamp': [start + timedelta(hours=hour)] * 2,
+                'location_name': ['London', 'Paris'],
+                'temperature': rng.normal(10.0, 3.0, 2),
+                'precipitation': rng.exponential(0.3, 2),
+                'source_name': ['test', 'test']
+            })
+
+    def test_per_location_indicators(self):
+        indicators = IndicatorSet()
+        indicators.track('temperature', 24)
+        indicators.track_below('precipitation', 0.1, 24)
+        indicators.track_correlation('temperature', 'precipitation', 24)
+
+        assert indicators.moments('London', 'temperature', 24) is None
+
+        ticks = list(self._ticks())
+        indicators.reset()
+        for tick in ticks:
+            indicators.update(tick)
+
+        frame = pd.concat(ticks)
+        paris = frame[frame['location_name'] == 'Paris'].tail(24)
+
+        moments = indicators.moments('Paris', 'temperature', 24)
+        assert moments.average == pytest.approx(paris['temperature'].mean(), rel=1e-12)
+        assert moments.std == pytest.approx(paris['temperature'].std(), rel=1e-9)
+        assert indicators.count_below('Paris', 'precipitation', 0.1, 24) == (paris['precipitation'] < 0.1).sum()
+        assert indicators.covariance('Paris', 'temperature', 'precipitation', 24).correlation == \
+            pytest.approx(paris['temperature'].corr(paris['precipitation']), rel=1e-9)
+
+        # Untracked columns and windows have no indicator
+        assert indicators.moments('Paris', 'temperature', 12) is None
+
+    def test_missing_column_records_nan(self):
+        indicators = IndicatorSet()
+        indicators.track('humidity', 5)
+        indicators.reset()
+        for tick in self._ticks(3):
+            indicators.update(tick)
+
+        moments = indicators.moments('London', 'humidity', 5)
+        assert moments.size == 3
+        assert moments.count == 0
+        assert np.isnan(moments.average)
+
+
+class TestStrategyIndicators:
+    """Strategies give the same answers from indicators as from frames"""
+
+    def _weather(self, hours, seed=1):
+        rng = np.random.default_rng(seed)
+        start = datetime(2024, 7, 1)
+        timestamps = [start + timedelta(hours=h) for h in range(hours)]
+        temperature = 28.0 + 9.0 * np.sin(np.arange(hours) / 6.0) + rng.normal(0, 0.5, hours)
+        temperature[-1] = 45.0  # heat spike
+        return pd.DataFrame({
+            'timestamp': timestamps,
+            'location_name': 'London',
+            'temperature': temperature,
+            'humidity': 60.0 - (temperature - 28.0) * 4.0,
+            'wind_speed': 16.0 + (temperature - 28.0) * 0.8,
+            'precipitation': np.where(np.arange(hours) >= hours - 6, 3.0, 0.0)
+        })
+
+    def _signals_by_tick(self, strategy, weather, use_indicators):
+        strategy.history = HistoryBuffers(strategy.required_history())
+        if use_indicators:
+            strategy.indicators.reset()
+
+        signals = []
+        for i in range(len(weather)):
+            tick = weather.iloc[[i]]
+            strategy.history.update(pd.DataFrame(), tick)
+            if use_indicators:
+                strategy.indicators.update(tick)
+            signals.extend((s.outcome_name, round(s.confidence, 9)) for s in
+                           strategy.generate_signals(pd.DataFrame(), tick, []))
+        return signals
+
+    def test_temperature_strategy_parity(self):
+        weather = self._weather(96)
+
+        with_indicators = self._signals_by_tick(
+            TemperatureThresholdStrategy(parameters={'lookback_period': 24}), weather, True)
+        without = self._signals_by_tick(
+            TemperatureThresholdStrategy(parameters={'lookback_period': 24}), weather, False)
+
+        assert with_indicators == without
+        assert 'above_normal' in {name for name, _ in with_indicators}
+
+    def test_pattern_strategy_parity(self):
+        weather = self._weather(120)
+        parameters = {'pattern_lookback': 48, 'correlation_threshold': 0.5, 'signal_strength_threshold': 0.5}
+
+        with_indicators = self._signals_by_tick(WeatherPatternStrategy(parameters=parameters), weather, True)
+        without = self._signals_by_tick(WeatherPatternStrategy(parameters=parameters), weather, False)
+
+        assert with_indicators == without
+        assert {name for name, _ in with_indicators} >= {'storm_front', 'drought_relief'}
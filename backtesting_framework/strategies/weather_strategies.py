@@ -9,8 +9,40 @@ to generate trading signals for Polymarket weather-related markets.
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from .base_strategy import BaseWeatherStrategy, TradingSignal
+from typing import Dict, List, Optional, Any, Tuple
+from .base_strategy import BaseWeatherStrategy, TradingSignal, SIGNAL_COLUMNS, signal_frame
+from ..data.climatology import ClimatologyIndex
+
+
+def _timeline_rows(weather_data: pd.DataFrame) -> pd.DataFrame:
+    """Weather rows in the order the engine walks them, with plain location names"""
+    rows = weather_data.sort_values('timestamp', kind='mergesort').reset_index(drop=True)
+    if isinstance(rows['location_name'].dtype, pd.CategoricalDtype):
+        rows['location_name'] = rows['location_name'].astype(rows['location_name'].cat.categories.dtype)
+    return rows
+
+
+def _tick_groups(rows: pd.DataFrame, periods: int) -> pd.core.groupby.DataFrameGroupBy:
+    """
+    Last `periods` rows of each (timestamp, location) group
+
+    Mirrors location_data.tail(periods) for each location in a timestamp's
+    slice, grouped in the order generate_signals visits them.
+    """
+    keys = ['timestamp', 'location_name']
+    tail = rows[rows.groupby(keys, sort=False).cumcount(ascending=False) < periods]
+    return tail.groupby(keys, sort=True)
+
+
+def _ordered_signals(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Combine signal frames tagged with a _location column into tick order"""
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=SIGNAL_COLUMNS)
+
+    combined = pd.concat(frames, ignore_index=True)
+    combined = combined.sort_values(['timestamp', '_location'], kind='mergesort')
+    return combined.drop(columns='_location').reset_index(drop=True)
 
 
 class TemperatureThresholdStrategy(BaseWeatherStrategy):
@@ -32,6 +64,11 @@ class TemperatureThresholdStrategy(BaseWeatherStrategy):
         self.signal_strength_threshold = self.parameters.get('signal_strength_threshold', 0.6)
         self.lookback_period = self.parameters.get('lookback_period', 24)  # hours
 
+        self.indicators.track('temperature', self.lookback_period)
+
+    def required_history(self) -> int:
+        return self.lookback_period
+
     def generate_signals(self,
                         market_data: pd.DataFrame,
                         weather_data: pd.DataFrame,
@@ -46,13 +83,19 @@ class TemperatureThresholdStrategy(BaseWeatherStrategy):
             if location_data.empty:
                 continue
 
-            # Get recent weather data
-            recent_weather = location_data.tail(self.lookback_period)
+            # Rolling temperature stats, maintained incrementally by the engine
+            moments = self.indicators.moments(location, 'temperature', self.lookback_period)
+            if moments is not None:
+                recent_weather = location_data
+                avg_temp = moments.average
+                temp_std = moments.std
+            else:
+                recent_weather = self.weather_window(location, location_data, self.lookback_period)
+                avg_temp = recent_weather['temperature'].mean()
+                temp_std = recent_weather['temperature'].std()
 
             # Check for temperature anomalies
             current_temp = recent_weather['temperature'].iloc[-1] if not recent_weather.empty else None
-            avg_temp = recent_weather['temperature'].mean()
-            temp_std = recent_weather['temperature'].std()
 
             if current_temp is None or temp_std == 0:
                 continue
@@ -73,6 +116,44 @@ class TemperatureThresholdStrategy(BaseWeatherStrategy):
 
         return signals
 
+    def generate_signals_batch(self, market_data: pd.DataFrame, weather_data: pd.DataFrame) -> pd.DataFrame:
+        """Vectorized generate_signals over the full aligned history"""
+        if weather_data.empty or self.lookback_period <= 0:
+            return _ordered_signals([])
+
+        rows = _timeline_rows(weather_data)
+        temperature = rows['temperature'].astype(np.float64)
+
+        # Rolling window per location over every row, as the indicators see them
+        rolling = temperature.groupby(rows['location_name'], sort=False).rolling(self.lookback_period, min_periods=1)
+        rows['avg_temp'] = rolling.mean().droplevel(0)
+        rows['temp_std'] = rolling.std().droplevel(0)
+        rows['temperature'] = temperature
+
+        current = _tick_groups(rows, 1).last()
+        current = current[current['temp_std'] != 0]
+        zscore = (current['temperature'] - current['avg_temp']) / current['temp_std']
+        confidence = np.minimum(1.0, zscore.abs() / 3.0)
+
+        hot = (current['temperature'] >= self.hot_threshold) & (zscore > 1.5)
+        cold = ~hot & (current['temperature'] <= self.cold_threshold) & (zscore < -1.5)
+
+        frames = []
+        for mask, outcome, label in ((hot, 'above_normal', 'heat'), (cold, 'below_normal', 'cold')):
+            mask = mask & (confidence >= self.signal_strength_threshold)
+            selected = current[mask]
+            frames.append(signal_frame(
+                selected.index.get_level_values('timestamp'),
+                'temperature_market',
+                outcome,
+                'BUY',
+                confidence[mask],
+                reasoning=[f"Extreme {label} detected: {temp:.1f}°C (z-score: {z:.2f})"
+                           for temp, z in zip(selected['temperature'], zscore[mask])]
+            ).assign(_location=selected.index.get_level_values('location_name')))
+
+        return _ordered_signals(frames)
+
     def _create_heat_signal(self, weather_data: pd.DataFrame, market_data: pd.DataFrame, zscore: float) -> Optional[TradingSignal]:
         """Create signal for heat conditions"""
         confidence = min(1.0, abs(zscore) / 3.0)  # Scale confidence
@@ -156,6 +237,37 @@ class PrecipitationStrategy(BaseWeatherStrategy):
 
         return signals
 
+    def generate_signals_batch(self, market_data: pd.DataFrame, weather_data: pd.DataFrame) -> pd.DataFrame:
+        """Vectorized generate_signals over the full aligned history"""
+        if weather_data.empty or self.lookback_period <= 0:
+            return _ordered_signals([])
+
+        groups = _tick_groups(_timeline_rows(weather_data), self.lookback_period)
+        totals = groups['precipitation'].sum()
+        hours = groups.size()
+
+        rain = totals >= self.rain_threshold
+        drought = ~rain & (totals <= self.drought_threshold)
+        rain_confidence = np.minimum(1.0, totals / (self.rain_threshold * 2))
+        drought_confidence = np.minimum(1.0, (self.drought_threshold - totals) / self.drought_threshold)
+
+        frames = []
+        for mask, confidence, outcome, reasoning in (
+                (rain, rain_confidence, 'heavy_rain', "Heavy precipitation detected: {:.1f}mm in {} hours"),
+                (drought, drought_confidence, 'drought', "Drought conditions detected: only {:.1f}mm in {} hours")):
+            mask = mask & (confidence >= self.signal_strength_threshold)
+            selected = totals[mask]
+            frames.append(signal_frame(
+                selected.index.get_level_values('timestamp'),
+                'precipitation_market',
+                outcome,
+                'BUY',
+                confidence[mask],
+                reasoning=[reasoning.format(total, n) for total, n in zip(selected, hours[mask])]
+            ).assign(_location=selected.index.get_level_values('location_name')))
+
+        return _ordered_signals(frames)
+
     def _create_rain_signal(self, weather_data: pd.DataFrame, market_data: pd.DataFrame, total_rain: float) -> Optional[TradingSignal]:
         """Create signal for heavy rain conditions"""
         confidence = min(1.0, total_rain / (self.rain_threshold * 2))
@@ -234,6 +346,35 @@ class WindSpeedStrategy(BaseWeatherStrategy):
 
         return signals
 
+    def generate_signals_batch(self, market_data: pd.DataFrame, weather_data: pd.DataFrame) -> pd.DataFrame:
+        """Vectorized generate_signals over the full aligned history"""
+        if weather_data.empty or self.lookback_period <= 0:
+            return _ordered_signals([])
+
+        wind = _tick_groups(_timeline_rows(weather_data), 1)['wind_speed'].last()
+
+        high = wind >= self.high_wind_threshold
+        low = ~high & (wind <= self.low_wind_threshold)
+        high_confidence = np.minimum(1.0, wind / (self.high_wind_threshold * 1.5))
+        low_confidence = np.minimum(1.0, (self.low_wind_threshold - wind) / self.low_wind_threshold)
+
+        frames = []
+        for mask, confidence, outcome, reasoning in (
+                (high, high_confidence, 'high_winds', "High wind speeds detected: {:.1f} m/s"),
+                (low, low_confidence, 'calm_winds', "Calm wind conditions: {:.1f} m/s")):
+            mask = mask & (confidence >= self.signal_strength_threshold)
+            selected = wind[mask]
+            frames.append(signal_frame(
+                selected.index.get_level_values('timestamp'),
+                'wind_market',
+                outcome,
+                'BUY',
+                confidence[mask],
+                reasoning=[reasoning.format(speed) for speed in selected]
+            ).assign(_location=selected.index.get_level_values('location_name')))
+
+        return _ordered_signals(frames)
+
     def _create_high_wind_signal(self, weather_data: pd.DataFrame, market_data: pd.DataFrame, wind_speed: float) -> Optional[TradingSignal]:
         """Create signal for high wind conditions"""
         confidence = min(1.0, wind_speed / (self.high_wind_threshold * 1.5))
@@ -275,6 +416,11 @@ class WeatherPatternStrategy(BaseWeatherStrategy):
     more sophisticated trading signals.
     """
 
+    # Variable pairs whose rolling correlation feeds the patterns
+    PATTERN_CORRELATIONS = (('temperature', 'humidity'),
+                            ('temperature', 'precipitation'),
+                            ('wind_speed', 'temperature'))
+
     def __init__(self,
                  name: str = "WeatherPatternStrategy",
                  parameters: Optional[Dict[str, Any]] = None):
@@ -284,6 +430,20 @@ class WeatherPatternStrategy(BaseWeatherStrategy):
         self.correlation_threshold = self.parameters.get('correlation_threshold', 0.7)
         self.signal_strength_threshold = self.parameters.get('signal_strength_threshold', 0.8)
 
+        for column in ('temperature', 'humidity', 'wind_speed', 'precipitation'):
+            self.indicators.track(column, self.pattern_lookback)
+        self.indicators.track('precipitation', self._recent_rain_window)
+        self.indicators.track_below('precipitation', 0.1, self.pattern_lookback)
+        for x, y in self.PATTERN_CORRELATIONS:
+            self.indicators.track_correlation(x, y, self.pattern_lookback)
+
+    @property
+    def _recent_rain_window(self) -> int:
+        return min(24, self.pattern_lookback)
+
+    def required_history(self) -> int:
+        return self.pattern_lookback
+
     def generate_signals(self,
                         market_data: pd.DataFrame,
                         weather_data: pd.DataFrame,
@@ -294,11 +454,16 @@ class WeatherPatternStrategy(BaseWeatherStrategy):
             return signals
 
         for location, location_data in weather_data.groupby('location_name'):
-            if len(location_data) < self.pattern_lookback:
-                continue
-
-            # Analyze weather patterns
-            pattern_signals = self._analyze_weather_patterns(location_data)
+            stats = self._indicator_pattern_stats(location)
+            if stats is not None:
+                if stats['rows'] < self.pattern_lookback:
+                    continue
+                pattern_signals = self._match_patterns(stats, location_data['timestamp'].iloc[-1])
+            else:
+                history = self.weather_window(location, location_data, self.pattern_lookback)
+                if len(history) < self.pattern_lookback:
+                    continue
+                pattern_signals = self._analyze_weather_patterns(history)
 
             for signal in pattern_signals:
                 if signal.confidence >= self.signal_strength_threshold:
@@ -306,28 +471,67 @@ class WeatherPatternStrategy(BaseWeatherStrategy):
 
         return signals
 
+    def _indicator_pattern_stats(self, location: str) -> Optional[Dict[str, float]]:
+        """Window statistics from the incremental indicators, if they are being fed"""
+        window = self.pattern_lookback
+        means = {column: self.indicators.moments(location, column, window)
+                 for column in ('temperature', 'humidity', 'wind_speed', 'precipitation')}
+        correlations = [self.indicators.covariance(location, x, y, window) for x, y in self.PATTERN_CORRELATIONS]
+        recent_rain = self.indicators.moments(location, 'precipitation', self._recent_rain_window)
+        dry_count = self.indicators.count_below(location, 'precipitation', 0.1, window)
+
+        if (any(m is None for m in means.values()) or any(c is None for c in correlations)
+                or recent_rain is None or dry_count is None):
+            return None
+
+        return {
+            'rows': means['temperature'].size,
+            'temperature_mean': means['temperature'].average,
+            'temperature_std': means['temperature'].std,
+            'humidity_mean': means['humidity'].average,
+            'wind_speed_mean': means['wind_speed'].average,
+            'temp_humidity_corr': correlations[0].correlation,
+            'temp_precip_corr': correlations[1].correlation,
+            'wind_temp_corr': correlations[2].correlation,
+            'dry_count': dry_count,
+            'recent_rain': recent_rain.sum
+        }
+
     def _analyze_weather_patterns(self, weather_data: pd.DataFrame) -> List[TradingSignal]:
         """Analyze complex weather patterns for trading signals"""
-        signals = []
-
         # Get recent data
         recent_data = weather_data.tail(self.pattern_lookback)
 
-        # Calculate correlations between weather variables
-        temp_humidity_corr = recent_data['temperature'].corr(recent_data['humidity'])
-        temp_precip_corr = recent_data['temperature'].corr(recent_data['precipitation'])
-        wind_temp_corr = recent_data['wind_speed'].corr(recent_data['temperature'])
+        stats = {
+            'rows': len(recent_data),
+            'temperature_mean': recent_data['temperature'].mean(),
+            'temperature_std': recent_data['temperature'].std(),
+            'humidity_mean': recent_data['humidity'].mean(),
+            'wind_speed_mean': recent_data['wind_speed'].mean(),
+            # Correlations between weather variables
+            'temp_humidity_corr': recent_data['temperature'].corr(recent_data['humidity']),
+            'temp_precip_corr': recent_data['temperature'].corr(recent_data['precipitation']),
+            'wind_temp_corr': recent_data['wind_speed'].corr(recent_data['temperature']),
+            'dry_count': len(recent_data[recent_data['precipitation'] < 0.1]),
+            'recent_rain': recent_data['precipitation'].tail(24).sum()
+        }
+
+        return self._match_patterns(stats, recent_data['timestamp'].iloc[-1])
+
+    def _match_patterns(self, stats: Dict[str, float], timestamp: datetime) -> List[TradingSignal]:
+        """Match window statistics against the known weather patterns"""
+        signals = []
 
         # Pattern 1: Heat wave with low humidity (fire risk)
-        if (recent_data['temperature'].mean() > 25 and
-            recent_data['humidity'].mean() < 40 and
-            abs(temp_humidity_corr) > self.correlation_threshold):
+        if (stats['temperature_mean'] > 25 and
+            stats['humidity_mean'] < 40 and
+            abs(stats['temp_humidity_corr']) > self.correlation_threshold):
 
-            confidence = min(1.0, (recent_data['temperature'].mean() - 25) / 10 +
-                           (40 - recent_data['humidity'].mean()) / 20)
+            confidence = min(1.0, (stats['temperature_mean'] - 25) / 10 +
+                           (40 - stats['humidity_mean']) / 20)
 
             signals.append(TradingSignal(
-                timestamp=recent_data['timestamp'].iloc[-1],
+                timestamp=timestamp,
                 market_id='weather_pattern_market',
                 outcome_name='heat_wave_dry',
                 signal_type='BUY',
@@ -336,15 +540,15 @@ class WeatherPatternStrategy(BaseWeatherStrategy):
             ))
 
         # Pattern 2: Cold front with high winds (storm potential)
-        if (recent_data['temperature'].std() > 5 and
-            recent_data['wind_speed'].mean() > 15 and
-            abs(wind_temp_corr) > self.correlation_threshold):
+        if (stats['temperature_std'] > 5 and
+            stats['wind_speed_mean'] > 15 and
+            abs(stats['wind_temp_corr']) > self.correlation_threshold):
 
-            confidence = min(1.0, recent_data['temperature'].std() / 10 +
-                           recent_data['wind_speed'].mean() / 25)
+            confidence = min(1.0, stats['temperature_std'] / 10 +
+                           stats['wind_speed_mean'] / 25)
 
             signals.append(TradingSignal(
-                timestamp=recent_data['timestamp'].iloc[-1],
+                timestamp=timestamp,
                 market_id='weather_pattern_market',
                 outcome_name='storm_front',
                 signal_type='BUY',
@@ -353,15 +557,14 @@ class WeatherPatternStrategy(BaseWeatherStrategy):
             ))
 
         # Pattern 3: Prolonged dry spell followed by rain (relief signal)
-        dry_period = recent_data[recent_data['precipitation'] < 0.1]
-        if (len(dry_period) > self.pattern_lookback * 0.7 and
-            recent_data['precipitation'].tail(24).sum() > 5):
+        if (stats['dry_count'] > self.pattern_lookback * 0.7 and
+            stats['recent_rain'] > 5):
 
-            confidence = min(1.0, len(dry_period) / self.pattern_lookback +
-                           recent_data['precipitation'].tail(24).sum() / 20)
+            confidence = min(1.0, stats['dry_count'] / self.pattern_lookback +
+                           stats['recent_rain'] / 20)
 
             signals.append(TradingSignal(
-                timestamp=recent_data['timestamp'].iloc[-1],
+                timestamp=timestamp,
                 market_id='weather_pattern_market',
                 outcome_name='drought_relief',
                 signal_type='BUY',
@@ -388,6 +591,17 @@ class SeasonalWeatherStrategy(BaseWeatherStrategy):
         self.deviation_threshold = self.parameters.get('deviation_threshold', 2.0)  # standard deviations
         self.signal_strength_threshold = self.parameters.get('signal_strength_threshold', 0.75)
 
+        # Seasonal normals and the daily precipitation total, both maintained
+        # by the engine as it walks the timeline; assign an index from
+        # load_climatology() to seed the normals with stored history
+        self.climatology = ClimatologyIndex()
+        self.indicators.track('precipitation', 24)
+
+    def required_history(self) -> int:
+        # The climatology index replaces the raw history when the engine runs
+        # the strategy, so no rows need to be buffered
+        return 0
+
     def generate_signals(self,
                         market_data: pd.DataFrame,
                         weather_data: pd.DataFrame,
@@ -398,11 +612,18 @@ class SeasonalWeatherStrategy(BaseWeatherStrategy):
             return signals
 
         for location, location_data in weather_data.groupby('location_name'):
-            if len(location_data) < self.seasonal_lookback:
-                continue
+            if self.climatology.active:
+                if self.climatology.observations(location) < self.seasonal_lookback:
+                    continue
+                seasonal_signals = self._climatology_signals(location, location_data)
+            else:
+                # Seasonal normals use every row available, not just the last year
+                history = self.weather_window(location, location_data)
+                if len(history) < self.seasonal_lookback:
+                    continue
 
-            # Analyze seasonal patterns
-            seasonal_signals = self._analyze_seasonal_patterns(location_data)
+                # Analyze seasonal patterns
+                seasonal_signals = self._analyze_seasonal_patterns(history)
 
             for signal in seasonal_signals:
                 if signal.confidence >= self.signal_strength_threshold:
@@ -410,6 +631,31 @@ class SeasonalWeatherStrategy(BaseWeatherStrategy):
 
         return signals
 
+    def _climatology_signals(self, location: str, location_data: pd.DataFrame) -> List[TradingSignal]:
+        """Seasonal deviation signals from the climatology index"""
+        current_timestamp = location_data['timestamp'].iloc[-1]
+
+        if self.climatology.day_rows(location, current_timestamp) < 3:
+            return []
+
+        temp = self.climatology.normal(location, 'temperature', current_timestamp)
+        precip = self.climatology.normal(location, 'precipitation', current_timestamp)
+        nan_normal = (np.nan, np.nan)
+
+        daily_rain = self.indicators.moments(location, 'precipitation', 24)
+        if daily_rain is not None:
+            current_precip = daily_rain.sum
+        else:
+            current_precip = location_data['precipitation'].tail(24).sum()
+
+        return self._seasonal_deviation_signals(
+            current_timestamp,
+            location_data['temperature'].iloc[-1],
+            current_precip,
+            (temp.mean, temp.std) if temp else nan_normal,
+            (precip.mean, precip.std) if precip else nan_normal
+        )
+
     def _analyze_seasonal_patterns(self, weather_data: pd.DataFrame) -> List[TradingSignal]:
         """Analyze seasonal weather patterns"""
         signals = []
@@ -438,6 +684,20 @@ class SeasonalWeatherStrategy(BaseWeatherStrategy):
         current_temp = weather_data['temperature'].iloc[-1]
         current_precip = weather_data['precipitation'].tail(24).sum()  # Daily total
 
+        return self._seasonal_deviation_signals(current_timestamp, current_temp, current_precip,
+                                                (temp_normal, temp_std), (precip_normal, precip_std))
+
+    def _seasonal_deviation_signals(self,
+                                    current_timestamp: datetime,
+                                    current_temp: float,
+                                    current_precip: float,
+                                    temp_stats: Tuple[float, float],
+                                    precip_stats: Tuple[float, float]) -> List[TradingSignal]:
+        """Signals for current conditions deviating from (mean, std) seasonal normals"""
+        signals = []
+        temp_normal, temp_std = temp_stats
+        precip_normal, precip_std = precip_stats
+
         # Check for seasonal deviations
         if abs(current_temp - temp_normal) > self.deviation_threshold * temp_std:
             if current_temp > temp_normal:
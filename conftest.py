@@ -173,6 +173,7 @@ def sample_positions():
 def mock_data_loader(sample_market_data, sample_weather_data):
     """Mock data loader with sample data"""
     loader = Mock(spec=BacktestingDataLoader)
+    loader.load_rollup_data.return_value = None
     loader.load_market_data.return_value = sample_market_data
     loader.load_weather_data.return_value = sample_weather_data
     loader.align_data_timeline.return_value = (sample_market_data, sample_weather_data)
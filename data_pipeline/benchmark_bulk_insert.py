@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Bulk Insert Benchmark
+
+Times inserting a synthetic Polymarket CSV into a fresh database with the
+original row-by-row loop (default journaling) against batched executemany
+on a WAL connection, at a few batch sizes.
+
+Usage:
+    python data_pipeline/benchmark_bulk_insert.py
+    python data_pipeline/benchmark_bulk_insert.py --rows 200000 --batch-sizes 1000 10000
+"""
+
+import argparse
+import csv
+import os
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from bulk_insert import configure_connection, insert_batched
+
+INSERT_SQL = """
+INSERT OR IGNORE INTO polymarket_data
+(event_title, event_url, market_id, outcome_name, probability, volume, timestamp, scraped_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+FIELDS = ['event_title', 'event_url', 'market_id', 'outcome_name', 'probability', 'volume',
+          'timestamp', 'scraped_at']
+
+
+def write_csv(path: str, n_rows: int, n_markets: int = 100):
+    """Write n_rows of hourly Polymarket-style records, two outcomes per market"""
+    start = datetime(2020, 1, 1)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        for i in range(n_rows):
+            market = (i // 2) % n_markets
+            ts = (start + timedelta(hours=i // (2 * n_markets))).strftime('%Y-%m-%dT%H:%M:%SZ')
+            writer.writerow([f'Event {market}', f'https://polymarket.com/event/{market}', f'market{market}',
+                             'Yes' if i % 2 == 0 else 'No', f'{(i % 97) / 100:.2f}', f'{i % 5000}.0',
+                             ts, ts])
+
+
+def read_rows(path: str) -> list:
+    """Parse the CSV into insert parameter tuples, as the ingester does"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [(r['event_title'], r['event_url'], r['market_id'], r['outcome_name'],
+                 float(r['probability']), float(r['volume']), r['timestamp'], r['scraped_at'])
+                for r in csv.DictReader(f)]
+
+
+def fresh_db() -> str:
+    fd, db_path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript((Path(__file__).parent / 'schema.sql').read_text())
+    return db_path
+
+
+def remove_db(db_path: str):
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+
+
+def insert_row_by_row(db_path: str, rows: list) -> int:
+    """The original ingestion loop: one execute and rowcount check per record"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    inserted = 0
+    for row in rows:
+        cursor.execute(INSERT_SQL, row)
+        if cursor.rowcount > 0:
+            inserted += 1
+    conn.commit()
+    conn.close()
+    return inserted
+
+
+def insert_bulk(db_path: str, rows: list, batch_size: int) -> int:
+    conn = sqlite3.connect(db_path)
+    configure_connection(conn)
+    result = insert_batched(conn, INSERT_SQL, rows, batch_size)
+    conn.commit()
+    conn.close()
+    return result.inserted
+
+
+def timed(fn, *args) -> tuple:
+    db_path = fresh_db()
+    try:
+        start = time.perf_counter()
+        inserted = fn(db_path, *args)
+        return time.perf_counter() - start, inserted
+    finally:
+        remove_db(db_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched Polymarket ingestion")
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Rows in the synthetic CSV file')
+    parser.add_argument('--batch-sizes', nargs='+', type=int, default=[1000, 5000, 50000],
+                        help='executemany batch sizes to time')
+    args = parser.parse_args()
+
+    fd, csv_path = tempfile.mkstemp(suffix='.csv')
+    os.close(fd)
+    try:
+        write_csv(csv_path, args.rows)
+        rows = read_rows(csv_path)
+    finally:
+        os.remove(csv_path)
+
+    baseline, inserted = timed(insert_row_by_row, rows)
+    print(f"rows: {len(rows)} ({inserted} unique)")
+    print(f"{'method':<28}{'time (s)':>10}{'rows/s':>12}{'speedup':>9}")
+    print(f"{'row-by-row':<28}{baseline:>10.2f}{len(rows) / baseline:>12.0f}{'1.0x':>9}")
+
+    for batch_size in args.batch_sizes:
+        elapsed, _ = timed(insert_bulk, rows, batch_size)
+        label = f'executemany batch={batch_size}'
+        print(f"{label:<28}{elapsed:>10.2f}{len(rows) / elapsed:>12.0f}{baseline / elapsed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Outlier Detection Benchmark
+
+Times OutlierDetector.detect_outliers on synthetic weather records against
+the previous sort-and-rescan implementation (sort each field's values, then
+scan every record once per field), times folding the same records into a
+StreamingOutlierDetector in ingestion-sized batches, and times the isolation
+forest over several fields.
+
+Usage (from the repository root):
+    python -m data_pipeline.benchmark_outliers
+    python -m data_pipeline.benchmark_outliers --rows 1000000 --batch-size 50000
+"""
+
+import argparse
+import logging
+import time
+from statistics import mean, stdev
+from typing import Dict, List
+
+from data_pipeline.benchmark_quality_pipeline import weather_records
+from data_pipeline.data_cleaning import OutlierDetector
+from data_pipeline.outlier_detection import StreamingOutlierDetector
+
+FIELDS = ['temperature', 'humidity', 'pressure', 'wind_speed']
+
+
+def detect_sorted(data: List[Dict], method: str, fields: List[str]) -> List[int]:
+    """Outlier indices the way the detector found them before: sort, then rescan per field"""
+    outliers = []
+    for field in fields:
+        values = [r[field] for r in data if r.get(field) is not None and isinstance(r[field], (int, float))]
+        if method == 'zscore':
+            mean_val, std_val = mean(values), stdev(values)
+            outside = lambda value: abs((value - mean_val) / std_val) > 3.0
+        else:
+            values.sort()
+            if method == 'iqr':
+                q1, q3 = values[len(values) // 4], values[3 * len(values) // 4]
+                lower_bound, upper_bound = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+            else:
+                lower_bound, upper_bound = values[int(len(values) * 0.05)], values[int(len(values) * 0.95)]
+            outside = lambda value: value < lower_bound or value > upper_bound
+        for i, record in enumerate(data):
+            value = record.get(field)
+            if value is not None and isinstance(value, (int, float)) and outside(value):
+                outliers.append(i)
+    return outliers
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch, streaming and isolation forest outlier detection")
+    parser.add_argument('--rows', type=int, default=500_000, help='Synthetic weather records')
+    parser.add_argument('--batch-size', type=int, default=50_000, help='Records per streaming update')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    records = weather_records(args.rows)
+    detector = OutlierDetector()
+
+    print(f"weather: {args.rows} records, fields {', '.join(FIELDS)}")
+    print(f"{'method':<18}{'sorted (s)':>12}{'detector (s)':>14}{'speedup':>9}{'outliers':>10}")
+    for method in ('iqr', 'percentile', 'zscore'):
+        sorted_seconds, expected = timed(detect_sorted, records, method, FIELDS)
+        seconds, result = timed(detector.detect_outliers, records, method, FIELDS)
+        found = [outlier['index'] for outlier in result['outliers']]
+        note = '' if method == 'zscore' or found == expected else ' (differs)'
+        print(f"{method:<18}{sorted_seconds:>12.2f}{seconds:>14.2f}{sorted_seconds / seconds:>8.1f}x"
+              f"{len(found):>10}{note}")
+
+    streaming = StreamingOutlierDetector('iqr', FIELDS, group_field='location_name')
+    start = time.perf_counter()
+    for offset in range(0, len(records), args.batch_size):
+        streaming.update(records[offset:offset + args.batch_size])
+    stream_seconds = time.perf_counter() - start
+    state_kb = len(str(streaming.to_dict())) / 1024
+    print(f"streaming iqr: {stream_seconds:.2f}s in batches of {args.batch_size} "
+          f"({args.rows / stream_seconds:.0f} records/s), {len(streaming.summaries)} locations, "
+          f"state {state_kb:.0f} KB")
+
+    seconds, result = timed(detector.detect_outliers, records, 'isolation_forest', FIELDS)
+    print(f"isolation forest: {seconds:.2f}s ({args.rows / seconds:.0f} records/s), "
+          f"{result['total_outliers']} anomalous records")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Timestamp Parsing Benchmark
+
+Times parsing the timestamp and scraped_at strings of synthetic Polymarket
+records the way validation, normalization and real-time validation did before
+(each stage trying strptime formats in turn, or fromisoformat, on its own)
+against the shared TimestampParser, uncached and with its cache.
+
+Usage (from the repository root):
+    python -m data_pipeline.benchmark_timestamps
+    python -m data_pipeline.benchmark_timestamps --rows 1000000
+"""
+
+import argparse
+import time
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from data_pipeline.benchmark_quality_pipeline import polymarket_records
+from data_pipeline.timestamp_parsing import NORMALIZER_FORMATS, TIMESTAMP_FORMATS, TimestampParser
+
+
+def strptime_in_turn(value: str, formats: List[str]) -> Optional[datetime]:
+    for fmt in formats:
+        try:
+            dt = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
+    return None
+
+
+def parse_by_stage(values: List[str]) -> int:
+    """Validation format check, scraped_at future check, normalization and the real-time parse"""
+    parsed = 0
+    for value in values:
+        parsed += strptime_in_turn(value, TIMESTAMP_FORMATS) is not None
+        datetime.fromisoformat(value.replace('Z', '+00:00'))
+        parsed += strptime_in_turn(value, NORMALIZER_FORMATS).isoformat() is not None
+        datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return parsed
+
+
+def parse_shared(values: List[str], cache_size: int) -> int:
+    validation, normalization = TimestampParser(TIMESTAMP_FORMATS, cache_size), \
+        TimestampParser(NORMALIZER_FORMATS, cache_size)
+    parsed = 0
+    for value in values:
+        parsed += validation.parse(value) is not None
+        validation.epoch(value)
+        parsed += normalization.isoformat(value) is not None
+        validation.epoch(value)
+    return parsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark shared timestamp parsing")
+    parser.add_argument('--rows', type=int, default=200_000, help='Synthetic records')
+    args = parser.parse_args()
+
+    records = polymarket_records(args.rows)
+    values = [record[field] for record in records for field in ('timestamp', 'scraped_at')]
+    distinct = len(set(values))
+
+    print(f"polymarket: {args.rows} records, {len(values)} timestamps ({distinct} distinct), 4 parses each")
+    print(f"{'parsing':<24}{'time (s)':>10}{'timestamps/s':>14}{'speedup':>9}")
+    baseline = None
+    for name, func in [('each stage (strptime)', lambda: parse_by_stage(values)),
+                       ('shared, uncached', lambda: parse_shared(values, 0)),
+                       ('shared, cached', lambda: parse_shared(values, 65536))]:
+        start = time.perf_counter()
+        func()
+        seconds = time.perf_counter() - start
+        baseline = baseline or seconds
+        print(f"{name:<24}{seconds:>10.2f}{len(values) / seconds:>14.0f}{baseline / seconds:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
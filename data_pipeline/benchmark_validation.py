@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Record Validation Benchmark
+
+Times validate_batch on synthetic Polymarket or weather records against the
+CompiledValidator, which runs the same rules as column checks and reports
+only the records with errors or warnings, checks both flag the same records,
+and prints the time spent in each compiled rule.
+
+Usage (from the repository root):
+    python -m data_pipeline.benchmark_validation
+    python -m data_pipeline.benchmark_validation --source weather --rows 1000000 --skip-records
+"""
+
+import argparse
+import logging
+import time
+
+from data_pipeline.benchmark_quality_pipeline import polymarket_records, weather_records
+from data_pipeline.columnar_quality import CompiledValidator
+from data_pipeline.data_validation import PolymarketDataValidator, WeatherDataValidator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compiled record validation")
+    parser.add_argument('--source', choices=['polymarket', 'weather'], default='weather')
+    parser.add_argument('--rows', type=int, default=200_000, help='Synthetic records')
+    parser.add_argument('--skip-records', action='store_true', help='Skip the record-at-a-time validate_batch')
+    parser.add_argument('--rules', type=int, default=10, help='Slowest compiled rules to list')
+    args = parser.parse_args()
+
+    # validate_batch logs every error and warning
+    logging.disable(logging.WARNING)
+
+    if args.source == 'polymarket':
+        records, validator_class = polymarket_records(args.rows), PolymarketDataValidator
+    else:
+        records, validator_class = weather_records(args.rows), WeatherDataValidator
+
+    print(f"{args.source}: {args.rows} records")
+    print(f"{'validation':<24}{'time (s)':>10}{'records/s':>12}{'flagged':>9}")
+
+    expected = None
+    if not args.skip_records:
+        start = time.perf_counter()
+        result = validator_class().validate_batch(records)
+        seconds = time.perf_counter() - start
+        expected = [r for r in result['results'] if r['errors'] or r['warnings']]
+        print(f"{'validate_batch':<24}{seconds:>10.2f}{len(records) / seconds:>12.0f}{len(expected):>9}")
+
+    compiled = CompiledValidator(validator_class())
+    start = time.perf_counter()
+    result = compiled.validate(records)
+    seconds = time.perf_counter() - start
+    print(f"{'compiled':<24}{seconds:>10.2f}{len(records) / seconds:>12.0f}{len(result['results']):>9}")
+    if expected is not None:
+        print(f"same flagged records: {result['results'] == expected}")
+
+    print(f"\n{'rule':<32}{'time (s)':>10}")
+    for name, rule_seconds in sorted(compiled.rule_timings.items(), key=lambda item: -item[1])[:args.rules]:
+        print(f"{name:<32}{rule_seconds:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Bulk Insert Module
+
+Batched SQLite insertion shared by the ingesters. Rows are written with
+executemany in fixed-size batches inside one transaction, each batch under
+its own savepoint so a failing batch can be rolled back and retried row by
+row without losing the batches around it.
+"""
+
+import logging
+import sqlite3
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 5000
+
+# Connection settings for bulk loads: WAL lets readers (backtests) continue
+# during ingestion, and NORMAL sync is durable in WAL mode except on power loss
+BULK_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -65536,  # negative = KiB, i.e. 64 MiB
+    'temp_store': 'MEMORY'
+}
+
+
+@dataclass
+class BatchInsertResult:
+    """Outcome of a batched insert."""
+    inserted: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    batches: int = 0
+    fallback_batches: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.duplicates + self.failed
+
+
+def configure_connection(conn: sqlite3.Connection, pragmas: Optional[Dict[str, Any]] = None):
+    """Apply bulk-load pragmas to a connection."""
+    for name, value in (pragmas or BULK_PRAGMAS).items():
+        conn.execute(f"PRAGMA {name} = {value}")
+
+
+def iter_batches(rows: Iterable[Tuple], batch_size: int) -> Iterable[List[Tuple]]:
+    """Yield lists of at most batch_size rows."""
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def insert_batched(conn: sqlite3.Connection,
+                   insert_sql: str,
+                   rows: Iterable[Tuple],
+                   batch_size: int = DEFAULT_BATCH_SIZE,
+                   on_error: Optional[Callable[[Tuple, sqlite3.Error], None]] = None) -> BatchInsertResult:
+    """
+    Insert rows with executemany in batches, counting new versus ignored rows.
+
+    insert_sql is expected to be an INSERT OR IGNORE statement; rows it skips
+    (normally uniqueness conflicts) are counted as duplicates. Inserted rows are
+    counted per batch from the connection's change counter. A batch that
+    raises is rolled back to its savepoint and replayed row by row; rows that
+    still fail are passed to on_error and counted as failed.
+
+    The caller owns the transaction and commits once all batches are written.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+
+    result = BatchInsertResult()
+    if not conn.in_transaction:
+        conn.execute("BEGIN")
+
+    for batch in iter_batches(rows, batch_size):
+        result.batches += 1
+        before = conn.total_changes
+
+        conn.execute("SAVEPOINT bulk_batch")
+        try:
+            conn.executemany(insert_sql, batch)
+            inserted = conn.total_changes - before
+        except sqlite3.Error as e:
+            conn.execute("ROLLBACK TO bulk_batch")
+            logger.warning(f"Batch {result.batches} failed ({e}); retrying {len(batch)} rows individually")
+            result.fallback_batches += 1
+            inserted, failed = _insert_rows(conn, insert_sql, batch, on_error)
+            result.failed += failed
+            result.duplicates += len(batch) - inserted - failed
+        else:
+            result.duplicates += len(batch) - inserted
+        finally:
+            conn.execute("RELEASE bulk_batch")
+
+        result.inserted += inserted
+        logger.debug(f"Batch {result.batches}: {inserted} inserted of {len(batch)}")
+
+    return result
+
+
+def _insert_rows(conn: sqlite3.Connection,
+                 insert_sql: str,
+                 batch: List[Tuple],
+                 on_error: Optional[Callable[[Tuple, sqlite3.Error], None]]) -> Tuple[int, int]:
+    """Row-by-row fallback for a failed batch; returns (inserted, failed)."""
+    inserted = failed = 0
+    for row in batch:
+        try:
+            inserted += conn.execute(insert_sql, row).rowcount
+        except sqlite3.Error as e:
+            failed += 1
+            if on_error:
+                on_error(row, e)
+            else:
+                logger.error(f"Error inserting row: {e}")
+    return inserted, failed
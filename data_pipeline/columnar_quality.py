@@ -0,0 +1,942 @@
+#!/usr/bin/env python3
+"""
+Columnar Data Quality Module
+
+This module runs the data quality pipeline stages (validation, cleaning and the
+quality metrics) as NumPy/pandas column operations over a batch of records, for
+backfills where looping over dicts dominates the run time. Each stage gives the
+same results as the record-at-a-time implementations in data_validation.py,
+data_cleaning.py and data_quality_pipeline.py: per-value work (timestamp parsing,
+text normalization) runs once per distinct value. Validation compiles the
+validator's rules into column checks that format messages only for the records
+they flag, and hands the few values a rule cannot describe exactly to the
+record validator so messages match.
+"""
+
+import gc
+import json
+import logging
+import statistics
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from fractions import Fraction
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .data_validation import MARKET_ID_PATTERN, DataValidator, PolymarketDataValidator, WeatherDataValidator
+from .data_cleaning import NON_NUMERIC_CHARS, DataNormalizer, PolymarketDataCleaner, WeatherDataCleaner
+from .outlier_detection import ISOLATION_FOREST_THRESHOLD, isolation_forest_scores, outlier_mask
+
+logger = logging.getLogger(__name__)
+
+# infer_dtype kinds whose non-null values are all ints or floats
+NUMERIC_KINDS = ('floating', 'integer', 'mixed-integer-float', 'boolean', 'empty')
+
+
+@contextmanager
+def gc_paused():
+    """Suspend cyclic garbage collection while building many acyclic containers.
+
+    Allocating a dict per record triggers repeated collections that walk every
+    live object, which costs several times the allocations on large batches.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class ColumnBatch:
+    """A batch of records held as one object array per field.
+
+    Values keep their Python types so every stage sees what the dict path sees;
+    a per-field presence mask tells a missing key apart from a None value.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], present: Dict[str, Optional[np.ndarray]], length: int):
+        self.columns = columns
+        self.present = present  # None when every record has the field
+        self.length = length
+        self._filled: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def from_records(cls, records: List[Dict]) -> 'ColumnBatch':
+        """Build a batch from a list of record dicts."""
+        n = len(records)
+        shapes = list(dict.fromkeys(map(tuple, records)))
+        keys = list(dict.fromkeys(key for shape in shapes for key in shape))
+        shared = set(shapes[0]).intersection(*shapes[1:]) if shapes else set()
+
+        columns, present = {}, {}
+        for key in keys:
+            if key in shared:
+                columns[key] = np.fromiter((record[key] for record in records), dtype=object, count=n)
+                present[key] = None
+            else:
+                columns[key] = np.fromiter((record.get(key) for record in records), dtype=object, count=n)
+                present[key] = np.fromiter((key in record for record in records), dtype=bool, count=n)
+        return cls(columns, present, n)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> 'ColumnBatch':
+        """Build a batch from a DataFrame.
+
+        Missing cells (NaN, None, NaT) become None and datetime columns become
+        ISO 8601 strings, as in records read from JSON or SQLite.
+        """
+        columns, present = {}, {}
+        for key in frame.columns:
+            series = frame[key]
+            if pd.api.types.is_datetime64_any_dtype(series):
+                if series.dt.tz is not None:
+                    series = series.dt.tz_convert('UTC').dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+                else:
+                    series = series.dt.strftime('%Y-%m-%dT%H:%M:%S')
+            values = np.fromiter(series.tolist(), dtype=object, count=len(series))
+            values[series.isna().to_numpy()] = None
+            columns[str(key)] = values
+            present[str(key)] = None
+        return cls(columns, present, len(frame))
+
+    def __len__(self) -> int:
+        return self.length
+
+    def keys(self) -> List[str]:
+        """Field names in first-seen order."""
+        return list(self.columns)
+
+    def column(self, field: str) -> np.ndarray:
+        """Values of a field (None where the field is missing)."""
+        if field not in self.columns:
+            return np.full(self.length, None, dtype=object)
+        return self.columns[field]
+
+    def present_mask(self, field: str) -> np.ndarray:
+        """Whether each record has the field."""
+        if field not in self.columns:
+            return np.zeros(self.length, dtype=bool)
+        mask = self.present[field]
+        return np.ones(self.length, dtype=bool) if mask is None else mask
+
+    def set_column(self, field: str, values: np.ndarray, present: Optional[np.ndarray] = None):
+        """Replace a field's values (and presence, None meaning unchanged)."""
+        if present is None:
+            present = self.present.get(field) if field in self.columns else np.zeros(self.length, dtype=bool)
+        self.columns[field] = values
+        self.present[field] = None if present is None or present.all() else present
+        self._filled.pop(field, None)
+
+    def filled(self, field: str) -> np.ndarray:
+        """Whether each record has the field with a value other than None."""
+        if field not in self.columns:
+            return np.zeros(self.length, dtype=bool)
+        if field not in self._filled:
+            self._filled[field] = self.present_mask(field) & ~_is_none(self.columns[field])
+        return self._filled[field]
+
+    def take(self, indices: np.ndarray) -> 'ColumnBatch':
+        """New batch holding the records at the given positions."""
+        indices = np.asarray(indices, dtype=np.intp)
+        batch = ColumnBatch(
+            {key: values[indices] for key, values in self.columns.items()},
+            {key: None if mask is None else mask[indices] for key, mask in self.present.items()},
+            len(indices)
+        )
+        batch._filled = {key: mask[indices] for key, mask in self._filled.items()}
+        return batch
+
+    def record(self, index: int) -> Dict:
+        """One record as a dict."""
+        return {key: values[index] for key, values in self.columns.items()
+                if self.present[key] is None or self.present[key][index]}
+
+    def to_records(self) -> List[Dict]:
+        """The batch as a list of record dicts."""
+        keys = self.keys()
+        if not keys:
+            return [{} for _ in range(self.length)]
+        with gc_paused():
+            records = [dict(zip(keys, row)) for row in zip(*(self.columns[key].tolist() for key in keys))]
+        for key in keys:
+            if self.present[key] is not None:
+                for index in np.flatnonzero(~self.present[key]):
+                    del records[index][key]
+        return records
+
+    def to_frame(self) -> pd.DataFrame:
+        """The batch as a DataFrame, with None for missing fields."""
+        return pd.DataFrame({key: self.column(key) for key in self.keys()},
+                            index=pd.RangeIndex(self.length)).infer_objects()
+
+
+def _is_none(values: np.ndarray) -> np.ndarray:
+    # Elementwise == None; only None compares equal to None
+    return np.equal(values, None).astype(bool, copy=False)
+
+
+def _is_instance(values: np.ndarray, given: np.ndarray, types: Tuple[type, ...]) -> np.ndarray:
+    """isinstance(value, types) for each value; given masks the values other than None."""
+    if types == (int, float) and (not given.any()
+                                  or pd.api.types.infer_dtype(values[given], skipna=False) == 'floating'):
+        return given  # Only floats (NaN included) and None
+    return np.fromiter((isinstance(value, types) for value in values), dtype=bool, count=len(values))
+
+
+def _is_number(values: np.ndarray, given: np.ndarray) -> np.ndarray:
+    return _is_instance(values, given, (int, float))
+
+
+def _as_float(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """float(value) where mask is set, NaN elsewhere."""
+    floats = np.full(len(values), np.nan)
+    if mask.any():
+        floats[mask] = values[mask].astype(float)
+    return floats
+
+
+def _is_blank(values: np.ndarray, given: np.ndarray) -> np.ndarray:
+    """Strings that are empty after stripping whitespace; given masks the values other than None."""
+    blank = np.zeros(len(values), dtype=bool)
+    if pd.api.types.infer_dtype(values, skipna=True) in NUMERIC_KINDS:
+        return blank
+    blank[given] = _map_values(values[given], lambda value: isinstance(value, str)
+                               and not value.strip()).astype(bool)
+    return blank
+
+
+def _map_values(values: np.ndarray, func: Callable[[Any], Any]) -> np.ndarray:
+    """func(value) for each value, computed once per distinct string."""
+    if len(values) and pd.api.types.infer_dtype(values, skipna=False) == 'string':
+        codes, uniques = pd.factorize(values)
+        mapped = np.fromiter(map(func, uniques), dtype=object, count=len(uniques))
+        return mapped[codes]
+    return np.fromiter(map(func, values), dtype=object, count=len(values))
+
+
+def _map_floats(values: np.ndarray, func: Callable[[float], Any]) -> np.ndarray:
+    """func(value) for each float, computed once per distinct value."""
+    uniques, inverse = np.unique(values, return_inverse=True)
+    mapped = np.fromiter(map(func, uniques.tolist()), dtype=object, count=len(uniques))
+    return mapped[inverse]
+
+
+def _float_values(values: np.ndarray) -> Optional[np.ndarray]:
+    """The values as a float array if they are all Python floats, else None."""
+    if len(values) and pd.api.types.infer_dtype(values, skipna=False) == 'floating':
+        return values.astype(float)
+    return None
+
+
+def exact_mean(values: np.ndarray) -> float:
+    """statistics.mean of a float array, correctly rounded like the original.
+
+    Each float is an integer times a power of two, so the sum is kept exact by
+    adding the integer parts of each exponent group in int64 halves.
+    """
+    if not np.isfinite(values).all():
+        return float(np.mean(values))
+
+    mantissas, exponents = np.frexp(values)
+    integers = (mantissas * 2.0 ** 53).astype(np.int64)
+    exponents = exponents.astype(np.int64) - 53
+
+    order = np.argsort(exponents, kind='stable')
+    integers, exponents = integers[order], exponents[order]
+    starts = np.flatnonzero(np.r_[True, exponents[1:] != exponents[:-1]])
+
+    # |integer| < 2**53: the high halves sum without overflow for up to 2**36 values
+    high = integers >> 26
+    low = integers - (high << 26)
+    high_sums = np.add.reduceat(high, starts)
+    low_sums = np.add.reduceat(low, starts)
+
+    total = Fraction(0)
+    for exponent, high_sum, low_sum in zip(exponents[starts].tolist(), high_sums.tolist(), low_sums.tolist()):
+        group = (high_sum << 26) + low_sum
+        total += group * 2 ** exponent if exponent >= 0 else Fraction(group, 2 ** -exponent)
+    return float(total / len(values))
+
+
+def _mean(values: np.ndarray) -> Any:
+    floats = _float_values(values)
+    return exact_mean(floats) if floats is not None else statistics.mean(values.tolist())
+
+
+def _median(values: np.ndarray) -> Any:
+    floats = _float_values(values)
+    if floats is None or np.isnan(floats).any():
+        return statistics.median(values.tolist())
+    n = len(floats)
+    if n % 2 == 1:
+        return float(np.partition(floats, n // 2)[n // 2])
+    ordered = np.partition(floats, [n // 2 - 1, n // 2])
+    return (float(ordered[n // 2 - 1]) + float(ordered[n // 2])) / 2
+
+
+def _mode(values: np.ndarray) -> Any:
+    kind = pd.api.types.infer_dtype(values, skipna=False) if len(values) else 'empty'
+    if kind == 'string' or (kind == 'floating' and not np.isnan(values.astype(float)).any()):
+        codes, uniques = pd.factorize(values)
+        # Counter.most_common breaks ties by first appearance, as does argmax over factorize codes
+        return uniques[int(np.argmax(np.bincount(codes)))]
+    return Counter(values.tolist()).most_common(1)[0][0]
+
+
+# Validation
+
+def _present_values(batch: ColumnBatch, field: str) -> Tuple[np.ndarray, np.ndarray]:
+    """A field's values and a mask of records where it is present and not None."""
+    return batch.column(field), batch.filled(field)
+
+
+def _check(values: np.ndarray, mask: np.ndarray, func: Callable[[Any], bool], default: bool) -> np.ndarray:
+    """func(value) where mask is set, default elsewhere."""
+    checked = np.full(len(values), default)
+    if mask.any():
+        checked[mask] = _map_values(values[mask], func).astype(bool)
+    return checked
+
+
+def _numbers(batch: ColumnBatch, field: str, cache: Dict) -> Tuple[np.ndarray, np.ndarray]:
+    """A field's ints and floats as a float array (NaN elsewhere) and a mask of its other values.
+
+    The record validator reads those other values with float() or compares them
+    as they are, so records holding them are left to it.
+    """
+    if field not in cache:
+        values, filled = _present_values(batch, field)
+        numeric = _is_number(values, filled)
+        cache[field] = (_as_float(values, filled & numeric), filled & ~numeric)
+    return cache[field]
+
+
+class ValidationRule:
+    """One check of a record validator, run over every record of a batch at once.
+
+    check(batch, numbers) returns a mask of the records the check flags, the
+    message for a flagged record given its index, and a mask (or None) of the
+    records the check cannot describe exactly because validate_record would
+    raise or fail them without a message; those are validated record by record.
+    numbers caches _numbers across the rules of one batch.
+    """
+
+    def __init__(self, name: str, level: str, check: Callable):
+        self.name = name
+        self.level = level  # 'error' or 'warning'
+        self.check = check
+
+
+def _no_hits(batch: ColumnBatch) -> np.ndarray:
+    return np.zeros(len(batch), dtype=bool)
+
+
+def _required_rule(field: str) -> ValidationRule:
+    def check(batch, numbers):
+        values, filled = _present_values(batch, field)
+        present = batch.present_mask(field)
+        return ~filled | _is_blank(values, filled), lambda i: DataValidator.format_message(
+            field, "Required field is empty or null" if present[i] else "Required field is missing"), None
+    return ValidationRule(f'required:{field}', 'error', check)
+
+
+def _type_rule(field: str, expected_type) -> ValidationRule:
+    # validate_data_types converts some strings and cannot name a tuple of types,
+    # so every mismatch is left to it
+    def check(batch, numbers):
+        values, filled = _present_values(batch, field)
+        return _no_hits(batch), None, filled & ~_is_instance(values, filled, expected_type)
+    return ValidationRule(f'type:{field}', 'error', check)
+
+
+def _range_rule(field: str, bound: Optional[float], message: str, exceeds: Callable) -> ValidationRule:
+    def check(batch, numbers):
+        floats, other = _numbers(batch, field, numbers)
+        hits = exceeds(floats, bound) if bound is not None else _no_hits(batch)
+        return hits, lambda i: DataValidator.format_message(field, message, float(floats[i])), other
+    return ValidationRule(f'range:{field}', 'warning', check)
+
+
+def _timestamp_rule(validator: DataValidator, field: str) -> ValidationRule:
+    # validate_timestamp_format fails empty values without a message and raises for non-strings
+    def check(batch, numbers):
+        values, filled = _present_values(batch, field)
+        strings = _check(values, filled, lambda value: isinstance(value, str) and value != '', False)
+        parsed = _check(values, strings, lambda value: validator.timestamp_parser.parse(value) is not None, False)
+        return strings & ~parsed, lambda i: DataValidator.format_message(
+            field, f"Invalid timestamp format: {values[i]}"), ~strings
+    return ValidationRule(f'timestamp:{field}', 'error', check)
+
+
+def _market_id_rule() -> ValidationRule:
+    def check(batch, numbers):
+        values, present = batch.column('market_id'), batch.present_mask('market_id')
+        strings = _check(values, present, lambda value: isinstance(value, str), False)
+        matches = _check(values, strings, lambda value: MARKET_ID_PATTERN.match(value) is not None, False)
+        return ~present | (strings & ~matches), lambda i: DataValidator.format_message(
+            'market_id', f"Invalid market ID format: {values[i] if present[i] else ''}"), present & ~strings
+    return ValidationRule('market_id', 'error', check)
+
+
+def _scraped_at_future_rule(validator: DataValidator) -> ValidationRule:
+    def check(batch, numbers):
+        now = time.time()
+        values, filled = _present_values(batch, 'scraped_at')
+
+        def future(value: Any) -> bool:
+            epoch = validator.timestamp_parser.epoch(value) if isinstance(value, str) else None
+            return epoch is not None and epoch > now
+
+        return _check(values, filled, future, False), lambda i: DataValidator.format_message(
+            'scraped_at', "Scraped timestamp is in the future", values[i]), None
+    return ValidationRule('scraped_at_future', 'warning', check)
+
+
+def _comparison_rule(name: str, level: str, field: str, left: str, right: str, hit: Callable,
+                     message: str) -> ValidationRule:
+    """Rule flagging hit(left, right) over two numeric fields; message is formatted with their values."""
+    def check(batch, numbers):
+        left_floats, left_other = _numbers(batch, left, numbers)
+        right_floats, right_other = _numbers(batch, right, numbers)
+        left_values, right_values = batch.column(left), batch.column(right)
+        return hit(left_floats, right_floats), lambda i: DataValidator.format_message(
+            field, message.format(left_values[i], right_values[i])), left_other | right_other
+    return ValidationRule(name, level, check)
+
+
+def _wind_direction_rule() -> ValidationRule:
+    def check(batch, numbers):
+        wind_speed, other = _numbers(batch, 'wind_speed', numbers)
+        return (wind_speed > 0) & ~batch.filled('wind_direction'), lambda i: DataValidator.format_message(
+            'wind_direction', "Wind direction missing when wind speed is present"), other
+    return ValidationRule('wind_direction', 'warning', check)
+
+
+def _value_rule(name: str, field: str, flagged: Callable[[Any], bool], message: str) -> ValidationRule:
+    """Warning for the values of a field flagged by a per-value check; message is formatted with the value."""
+    def check(batch, numbers):
+        values, filled = _present_values(batch, field)
+        return _check(values, filled, flagged, False), lambda i: DataValidator.format_message(
+            field, message.format(values[i])), None
+    return ValidationRule(name, 'warning', check)
+
+
+def _non_numeric_code(value: Any) -> bool:
+    if not isinstance(value, str):
+        return False
+    try:
+        int(value)
+        return False
+    except ValueError:
+        return True
+
+
+def _invalid_json(value: Any) -> bool:
+    if not value or not isinstance(value, str):
+        return False
+    try:
+        json.loads(value)
+        return False
+    except json.JSONDecodeError:
+        return True
+
+
+def compile_rules(validator: DataValidator) -> List[Tuple[bool, List[ValidationRule]]]:
+    """The checks of a validator's validate_record as stages of rules, in the order it runs them.
+
+    Each stage is (ends_early, rules): records with an error from a stage that
+    ends early skip the later stages, as validate_record returns there.
+    """
+    if not isinstance(validator, (PolymarketDataValidator, WeatherDataValidator)):
+        raise ValueError(f"Unsupported validator: {type(validator).__name__}")
+
+    ranges = []
+    for field, (min_val, max_val) in validator.range_requirements.items():
+        ranges.append(_range_rule(field, min_val, f"Value below minimum threshold {min_val}", np.less))
+        ranges.append(_range_rule(field, max_val, f"Value above maximum threshold {max_val}", np.greater))
+
+    stages = [
+        (True, [_required_rule(field) for field in validator.required_fields]),
+        (True, [_type_rule(field, expected) for field, expected in validator.type_requirements.items()]),
+        (False, ranges),
+        (True, [_timestamp_rule(validator, 'timestamp')])
+    ]
+
+    if isinstance(validator, PolymarketDataValidator):
+        stages += [
+            (True, [_timestamp_rule(validator, 'scraped_at')]),
+            (False, [_market_id_rule(), _scraped_at_future_rule(validator)])
+        ]
+    else:
+        stages.append((False, [
+            _comparison_rule('coordinates', 'warning', 'coordinates', 'latitude', 'longitude',
+                             lambda lat, lon: (lat == 0.0) & (lon == 0.0),
+                             "Coordinates are (0,0) which may indicate missing location data"),
+            _comparison_rule('temperature_range', 'error', 'temperature_range', 'temperature_min',
+                             'temperature_max', np.greater, "Min temperature ({}) > max temperature ({})"),
+            _comparison_rule('temperature_below_min', 'warning', 'temperature', 'temperature', 'temperature_min',
+                             np.less, "Temperature ({}) < min temperature ({})"),
+            _comparison_rule('temperature_above_max', 'warning', 'temperature', 'temperature', 'temperature_max',
+                             np.greater, "Temperature ({}) > max temperature ({})"),
+            _wind_direction_rule(),
+            _value_rule('weather_code', 'weather_code', _non_numeric_code, "Non-numeric weather code: {}"),
+            _value_rule('raw_data', 'raw_data', _invalid_json, "Invalid JSON in raw_data field")
+        ]))
+    return stages
+
+
+class CompiledValidator:
+    """A record validator's rules compiled into column checks over whole batches.
+
+    validate gives the records the validator's validate_batch would report an
+    error or a warning for, with the same 'index', 'is_valid', 'errors' and
+    'warnings'; records left out of 'results' are valid without messages. Each
+    rule runs once over the batch with NumPy masks and formats messages only
+    for the records it flags. Messages are not logged one by one, only a count
+    per rule. Seconds spent in each rule on the last batch are kept in
+    rule_timings, alongside 'columns' (building the batch), 'messages' and
+    'record_fallback' (records left to validate_record).
+    """
+
+    def __init__(self, validator: DataValidator):
+        self.validator = validator
+        self.stages = compile_rules(validator)
+        self.rule_timings: Dict[str, float] = {}
+
+    def validate(self, data: Union[List[Dict], pd.DataFrame, ColumnBatch]) -> Dict:
+        """Validate a batch; 'results' holds only the records with errors or warnings."""
+        timings: Dict[str, float] = {}
+        start = time.perf_counter()
+        if isinstance(data, ColumnBatch):
+            batch = data
+        elif isinstance(data, pd.DataFrame):
+            batch = ColumnBatch.from_frame(data)
+        else:
+            batch = ColumnBatch.from_records(data)
+        timings['columns'] = time.perf_counter() - start
+
+        n = len(batch)
+        active = np.ones(n, dtype=bool)
+        fallback = np.zeros(n, dtype=bool)
+        numbers: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        flagged = []
+        for ends_early, rules in self.stages:
+            stage_errors = np.zeros(n, dtype=bool)
+            for rule in rules:
+                start = time.perf_counter()
+                hits, message, undescribed = rule.check(batch, numbers)
+                hits = hits & active
+                if undescribed is not None:
+                    fallback |= undescribed & active
+                timings[rule.name] = timings.get(rule.name, 0.0) + time.perf_counter() - start
+                if hits.any():
+                    flagged.append((rule, hits, message))
+                    if rule.level == 'error':
+                        stage_errors |= hits
+            if ends_early:
+                active &= ~stage_errors
+
+        start = time.perf_counter()
+        messages: Dict[int, Tuple[List[str], List[str]]] = {}
+        for rule, hits, message in flagged:
+            rows = np.flatnonzero(hits & ~fallback).tolist()
+            if rows:
+                logger.info(f"Validation rule {rule.name} flagged {len(rows)} records")
+            is_warning = rule.level == 'warning'
+            for i in rows:
+                if i not in messages:
+                    messages[i] = ([], [])
+                messages[i][is_warning].append(message(i))
+        results = {i: {'index': i, 'is_valid': not errors, 'errors': errors, 'warnings': warnings}
+                   for i, (errors, warnings) in messages.items()}
+        timings['messages'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        validator = self.validator
+        for i in np.flatnonzero(fallback).tolist():
+            is_valid = validator.validate_record(batch.record(i))
+            if not is_valid or validator.validation_warnings:
+                results[i] = {
+                    'index': i,
+                    'is_valid': is_valid,
+                    'errors': validator.validation_errors.copy(),
+                    'warnings': validator.validation_warnings.copy()
+                }
+        timings['record_fallback'] = time.perf_counter() - start
+
+        self.rule_timings = timings
+        invalid = sum(not result['is_valid'] for result in results.values())
+        return {
+            'total_records': n,
+            'valid_records': n - invalid,
+            'invalid_records': invalid,
+            'results': [results[i] for i in sorted(results)],
+            'rule_timings': timings
+        }
+
+
+def validate_columns(batch: ColumnBatch, source: str) -> Dict:
+    """Validate a batch; same result as the source's validate_batch over its records."""
+    if source == 'polymarket':
+        validator = PolymarketDataValidator()
+    elif source == 'weather':
+        validator = WeatherDataValidator()
+    else:
+        raise ValueError(f"Unsupported data source: {source}")
+
+    compiled = CompiledValidator(validator).validate(batch)
+    with gc_paused():
+        results = [{'index': i, 'is_valid': True, 'errors': [], 'warnings': []} for i in range(len(batch))]
+    for result in compiled['results']:
+        results[result['index']] = result
+
+    return {
+        'total_records': compiled['total_records'],
+        'valid_records': compiled['valid_records'],
+        'invalid_records': compiled['invalid_records'],
+        'results': results
+    }
+
+
+# Cleaning
+
+def _normalize_timestamps(batch: ColumnBatch, normalizer: DataNormalizer,
+                          fields: Iterable[str] = ('timestamp', 'scraped_at', 'created_at')):
+    def normalize(value: Any) -> Any:
+        if not value:
+            return value
+        return normalizer.timestamp_parser.isoformat(str(value)) or value
+
+    for field in fields:
+        values, filled = _present_values(batch, field)
+        if filled.any():
+            values = values.copy()
+            values[filled] = _map_values(values[filled], normalize)
+            batch.set_column(field, values)
+
+
+def _clean_numeric_string(value: Any) -> Optional[float]:
+    if not isinstance(value, str):
+        return None
+    clean_value = NON_NUMERIC_CHARS.sub('', value.strip())
+    if not clean_value:
+        return None
+    try:
+        return float(clean_value)
+    except ValueError:
+        return None
+
+
+def _normalize_numeric_fields(batch: ColumnBatch,
+                              fields: Iterable[str] = ('probability', 'volume', 'temperature', 'humidity',
+                                                       'wind_speed', 'pressure', 'latitude', 'longitude')):
+    for field in fields:
+        values, filled = _present_values(batch, field)
+        if not filled.any():
+            continue
+        numbers = filled & _is_number(values, filled)
+        normalized = values.copy()
+        normalized[numbers] = values[numbers].astype(float).astype(object)
+        others = filled & ~numbers
+        if others.any():
+            normalized[others] = _map_values(values[others], _clean_numeric_string)
+        batch.set_column(field, normalized)
+
+
+def _normalize_text_fields(batch: ColumnBatch,
+                           fields: Iterable[str] = ('event_title', 'event_url', 'market_id', 'outcome_name',
+                                                    'location_name', 'weather_description')):
+    def normalize(value: Any) -> Any:
+        if not value:
+            return value
+        try:
+            return value.strip() if isinstance(value, str) else str(value).strip()
+        except Exception as e:
+            logger.warning(f"Could not normalize text value: {e}")
+            return ""
+
+    for field in fields:
+        values, filled = _present_values(batch, field)
+        if filled.any():
+            values = values.copy()
+            values[filled] = _map_values(values[filled], normalize)
+            batch.set_column(field, values)
+
+
+def _normalize_coordinates(batch: ColumnBatch):
+    limits = {'latitude': 90.0, 'longitude': 180.0}
+    for field, limit in limits.items():
+        def normalize(value: Any, limit: float = limit) -> Optional[float]:
+            try:
+                return round(max(-limit, min(limit, float(value))), 6)
+            except (ValueError, TypeError):
+                return None
+
+        values, filled = _present_values(batch, field)
+        if not filled.any():
+            continue
+        values = values.copy()
+        floats = _float_values(values[filled])
+        if floats is not None:
+            values[filled] = _map_floats(floats, normalize)
+        else:
+            values[filled] = np.fromiter(map(normalize, values[filled]), dtype=object, count=int(filled.sum()))
+        batch.set_column(field, values)
+
+
+def _missing_mask(batch: ColumnBatch, field: str) -> np.ndarray:
+    values, filled = _present_values(batch, field)
+    return ~filled | _is_blank(values, filled)
+
+
+def _number_values(batch: ColumnBatch, field: str) -> Tuple[np.ndarray, np.ndarray]:
+    """The numeric values of a field and a mask of the records holding them."""
+    values, filled = _present_values(batch, field)
+    numbers = filled & _is_number(values, filled)
+    return values[numbers], numbers
+
+
+def _fill(batch: ColumnBatch, field: str, mask: np.ndarray, value: Any):
+    """Set a field to value where mask is set."""
+    values = batch.column(field).copy()
+    scalar = np.empty(1, dtype=object)
+    scalar[0] = value  # Keeps tuples and lists whole
+    values[mask] = scalar
+    batch.set_column(field, values, batch.present_mask(field) | mask)
+
+
+def _forward_fill(batch: ColumnBatch, fields: List[str], reverse: bool = False):
+    """Fill missing values with the last (or, reversed, the next) known value."""
+    order = np.arange(len(batch))
+    if reverse:
+        order = order[::-1]
+    for field in fields:
+        missing = _missing_mask(batch, field)[order]
+        last = np.maximum.accumulate(np.where(~missing, np.arange(len(batch)), -1))
+        fillable = missing & (last >= 0)
+        if not fillable.any():
+            continue
+        targets, sources = order[fillable], order[last[fillable]]
+        values = batch.column(field).copy()
+        values[targets] = values[sources]
+        present = batch.present_mask(field).copy()
+        present[targets] = True
+        batch.set_column(field, values, present)
+
+
+def handle_missing_columns(batch: ColumnBatch, strategy: str, fields: List[str]) -> ColumnBatch:
+    """MissingValueHandler.handle_missing_values over a batch."""
+    if strategy not in ('drop', 'mean', 'median', 'mode', 'forward_fill', 'backward_fill',
+                        'interpolate', 'constant'):
+        raise ValueError(f"Unknown strategy: {strategy}")
+
+    if strategy == 'drop':
+        missing = np.zeros(len(batch), dtype=bool)
+        for field in fields:
+            missing |= _missing_mask(batch, field)
+        return batch.take(np.flatnonzero(~missing))
+
+    if strategy in ('forward_fill', 'backward_fill'):
+        _forward_fill(batch, fields, reverse=strategy == 'backward_fill')
+        return batch
+
+    if strategy == 'constant':
+        fills = {field: 0 for field in fields}
+    else:
+        fills = {}
+        for field in fields:
+            if strategy == 'mode':
+                values, filled = _present_values(batch, field)
+                values = values[filled]
+            else:
+                values, _ = _number_values(batch, field)
+            if len(values):
+                fills[field] = {'mean': _mean, 'interpolate': _mean, 'median': _median,
+                                'mode': _mode}[strategy](values)
+
+    for field, value in fills.items():
+        missing = _missing_mask(batch, field)
+        if missing.any():
+            _fill(batch, field, missing, value)
+    return batch
+
+
+def outlier_rows(batch: ColumnBatch, method: str, fields: List[str]) -> np.ndarray:
+    """Mask of records OutlierDetector.detect_outliers reports for any field."""
+    if method not in ('iqr', 'zscore', 'isolation_forest', 'percentile'):
+        raise ValueError(f"Unknown method: {method}")
+
+    outliers = np.zeros(len(batch), dtype=bool)
+    if method == 'isolation_forest':
+        if not fields:
+            return outliers
+        rows = np.ones(len(batch), dtype=bool)
+        columns = []
+        for field in fields:
+            _, numbers = _number_values(batch, field)
+            rows &= numbers
+            columns.append(_as_float(batch.column(field), numbers))
+        matrix = np.column_stack(columns)
+        rows &= np.isfinite(matrix).all(axis=1)
+        if rows.sum() >= 2:
+            outliers[rows] = isolation_forest_scores(matrix[rows]) > ISOLATION_FOREST_THRESHOLD
+        return outliers
+
+    for field in fields:
+        _, numbers = _number_values(batch, field)
+        floats = _as_float(batch.column(field), numbers)
+        mask, _ = outlier_mask(floats[numbers], method)
+        outliers[numbers] |= mask
+    return outliers
+
+
+def clean_columns(batch: ColumnBatch, source: str, config: Dict = None) -> Dict:
+    """Clean a batch; same result as the source's cleaner over its records.
+
+    The batch is modified in place and returned as cleaned_data.
+    """
+    if source == 'polymarket':
+        cleaner_class, missing_defaults = PolymarketDataCleaner, ('mean', ['probability', 'volume'])
+        outlier_defaults = ('iqr', ['probability', 'volume'])
+    elif source == 'weather':
+        cleaner_class, missing_defaults = WeatherDataCleaner, ('interpolate', ['temperature', 'humidity', 'wind_speed'])
+        outlier_defaults = ('zscore', ['temperature', 'humidity', 'pressure', 'wind_speed'])
+    else:
+        raise ValueError(f"Unsupported data source: {source}")
+
+    if config is None:
+        config = cleaner_class()._get_default_config()
+
+    original_count = len(batch)
+    cleaning_steps = []
+
+    # Step 1: Normalize data formats
+    logger.info(f"Normalizing {source} data formats")
+    normalizer = DataNormalizer()
+    _normalize_timestamps(batch, normalizer)
+    _normalize_numeric_fields(batch)
+    _normalize_text_fields(batch)
+    if source == 'weather':
+        _normalize_coordinates(batch)
+    cleaning_steps.append("format_normalization")
+
+    # Step 2: Handle missing values
+    if config.get('handle_missing', True):
+        strategy = config.get('missing_strategy', missing_defaults[0])
+        fields = config.get('missing_fields', missing_defaults[1])
+        logger.info(f"Handling missing values using {strategy} strategy")
+        batch = handle_missing_columns(batch, strategy, fields or [])
+        cleaning_steps.append(f"missing_values_{strategy}")
+
+    # Step 3: Detect outliers
+    if config.get('detect_outliers', True):
+        method = config.get('outlier_method', outlier_defaults[0])
+        fields = config.get('outlier_fields', outlier_defaults[1])
+        logger.info(f"Detecting outliers using {method} method")
+        outliers = outlier_rows(batch, method, fields or [])
+        cleaning_steps.append(f"outlier_detection_{method}")
+
+        # Optionally remove outliers
+        if config.get('remove_outliers', False):
+            batch = batch.take(np.flatnonzero(~outliers))
+            cleaning_steps.append("outlier_removal")
+
+    return {
+        'cleaned_data': batch,
+        'original_count': original_count,
+        'cleaned_count': len(batch),
+        'cleaning_steps': cleaning_steps,
+        'config': config
+    }
+
+
+# Quality metrics
+
+def completeness_score(batch: ColumnBatch) -> float:
+    """DataQualityPipeline._calculate_completeness over a batch."""
+    if not len(batch):
+        return 0.0
+    total_fields = 0
+    filled_fields = 0
+    for field in batch.keys():
+        values, filled = _present_values(batch, field)
+        total_fields += int(batch.present_mask(field).sum())
+        filled_fields += int((filled & ~_is_blank(values, filled)).sum())
+    return (filled_fields / total_fields * 100) if total_fields > 0 else 0.0
+
+
+def consistency_score(batch: ColumnBatch) -> float:
+    """DataQualityPipeline._calculate_consistency over a batch."""
+    if not len(batch):
+        return 100.0
+    consistency = 100.0
+    for field in batch.keys():
+        present = np.flatnonzero(batch.present_mask(field))
+        if not len(present):
+            continue
+        values = batch.column(field)
+        first = values[present[0]]
+        if first is None:
+            continue  # A field first seen as None is never checked
+        rest = values[present[1:]][batch.filled(field)[present[1:]]]
+        field_type = type(first)
+        types = np.fromiter(map(type, rest), dtype=object, count=len(rest))
+        consistency -= int(np.count_nonzero(types != field_type))
+    return max(0.0, consistency)
+
+
+def _subtract_in_order(score: float, penalties: np.ndarray) -> float:
+    """score minus each penalty in turn (the same rounding as a loop)."""
+    penalties = penalties[penalties != 0]
+    if not len(penalties):
+        return score
+    return float(np.subtract.accumulate(np.r_[score, penalties])[-1])
+
+
+def accuracy_score(batch: ColumnBatch, source: str) -> float:
+    """DataQualityPipeline._calculate_accuracy over a batch."""
+    if not len(batch):
+        return 100.0
+    ranges = {'weather': {'temperature': (-100, 60), 'humidity': (0, 100)},
+              'polymarket': {'probability': (0, 1)}}.get(source, {})
+    invalid = 0
+    for field, (low, high) in ranges.items():
+        _, numbers = _number_values(batch, field)
+        floats = _as_float(batch.column(field), numbers)
+        with np.errstate(invalid='ignore'):
+            invalid += int(np.count_nonzero(numbers & ~((floats >= low) & (floats <= high))))
+    return max(0.0, _subtract_in_order(100.0, np.full(invalid, 0.1)))
+
+
+def timeliness_score(batch: ColumnBatch) -> float:
+    """DataQualityPipeline._calculate_timeliness over a batch."""
+    if not len(batch):
+        return 100.0
+    current_time = datetime.now().timestamp()
+
+    def penalty(timestamp: Any) -> float:
+        try:
+            if isinstance(timestamp, str):
+                record_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp()
+            elif isinstance(timestamp, (int, float)):
+                record_time = timestamp
+            else:
+                return 0.0
+            age_hours = (current_time - record_time) / 3600
+            return min(1.0, age_hours / 24) if age_hours > 24 else 0.0
+        except (ValueError, AttributeError):
+            return 0.5
+
+    # record.get('timestamp') or record.get('scraped_at')
+    timestamps = batch.column('timestamp').copy()
+    fallback = ~np.fromiter(map(bool, timestamps), dtype=bool, count=len(timestamps))
+    timestamps[fallback] = batch.column('scraped_at')[fallback]
+    given = np.fromiter(map(bool, timestamps), dtype=bool, count=len(timestamps))
+    penalties = _map_values(timestamps[given], penalty).astype(float)
+    return max(0.0, _subtract_in_order(100.0, penalties))
@@ -7,15 +7,23 @@ Handles missing values, normalization, outlier detection, and data consistency.
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Union, Callable
-from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Tuple, Union, Callable
+from datetime import datetime
 from statistics import mean, median, stdev
 import re
 import json
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+import numpy as np
+
+from .outlier_detection import ISOLATION_FOREST_THRESHOLD, isolation_forest_scores, outlier_mask
+from .timestamp_parsing import NORMALIZER_FORMATS, shared_parser
 
 logger = logging.getLogger(__name__)
 
+# Characters stripped from numeric strings ("$1,000" -> "1000")
+NON_NUMERIC_CHARS = re.compile(r'[^\d.-]')
+
 class DataCleaner:
     """Base class for data cleaning operations."""
 
@@ -52,6 +60,20 @@ class MissingValueHandler:
             'constant': self._fill_with_constant
         }
 
+    @staticmethod
+    def is_missing(value: Any) -> bool:
+        """Whether a field value counts as missing (None or a blank string)."""
+        return value is None or (isinstance(value, str) and not value.strip())
+
+    @staticmethod
+    def fill_statistic(strategy: str, values: List[Any]) -> Any:
+        """Fill value of a mean, median, interpolate or mode strategy from a field's values."""
+        if strategy in ('mean', 'interpolate'):
+            return mean(values)
+        if strategy == 'median':
+            return median(values)
+        return Counter(values).most_common(1)[0][0]
+
     def handle_missing_values(self, data: List[Dict], strategy: str = 'drop',
                             fields: List[str] = None, **kwargs) -> List[Dict]:
         """Apply missing value handling strategy to data."""
@@ -201,260 +223,310 @@ class OutlierDetector:
 
         return self.methods[method](data, fields or [], **kwargs)
 
-    def _iqr_method(self, data: List[Dict], fields: List[str], multiplier: float = 1.5) -> Dict:
-        """Detect outliers using Interquartile Range (IQR) method."""
+    @staticmethod
+    def _numeric_columns(data: List[Dict], fields: List[str]) -> Dict[str, Tuple[List[int], List[Any]]]:
+        """Indices of the records holding a number in each field, and the numbers, in one pass."""
+        columns = {field: ([], []) for field in fields}
+        for i, record in enumerate(data):
+            for field, (indices, values) in columns.items():
+                value = record.get(field)
+                if value is not None and isinstance(value, (int, float)):
+                    indices.append(i)
+                    values.append(value)
+        return columns
+
+    def _bounds_method(self, data: List[Dict], fields: List[str], method: str, **kwargs) -> Dict:
+        """Outliers outside per-field bounds computed over the whole batch."""
         outliers = []
         bounds = {}
 
-        for field in fields:
-            values = [r[field] for r in data if r.get(field) is not None and
-                     isinstance(r[field], (int, float))]
-
-            if len(values) < 4:  # Need at least 4 values for quartiles
+        for field, (indices, values) in self._numeric_columns(data, fields).items():
+            mask, field_bounds = outlier_mask(np.asarray(values, dtype=float), method, **kwargs)
+            if not field_bounds:
                 continue
 
-            values.sort()
-            q1 = values[len(values) // 4]
-            q3 = values[3 * len(values) // 4]
-            iqr = q3 - q1
-
-            lower_bound = q1 - multiplier * iqr
-            upper_bound = q3 + multiplier * iqr
-
-            bounds[field] = {'lower': lower_bound, 'upper': upper_bound}
-
-            # Find outliers
-            for i, record in enumerate(data):
-                value = record.get(field)
-                if value is not None and isinstance(value, (int, float)):
-                    if value < lower_bound or value > upper_bound:
-                        outliers.append({
-                            'index': i,
-                            'field': field,
-                            'value': value,
-                            'bounds': (lower_bound, upper_bound)
-                        })
+            bounds[field] = field_bounds
+            for position in np.flatnonzero(mask).tolist():
+                outlier = {'index': indices[position], 'field': field, 'value': values[position]}
+                if method == 'zscore':
+                    outlier['z_score'] = abs((values[position] - field_bounds['mean']) / field_bounds['std'])
+                    outlier['threshold'] = kwargs.get('threshold', 3.0)
+                else:
+                    outlier['bounds'] = (field_bounds['lower'], field_bounds['upper'])
+                outliers.append(outlier)
 
         return {
             'outliers': outliers,
-            'bounds': bounds,
-            'method': 'iqr',
+            'stats' if method == 'zscore' else 'bounds': bounds,
+            'method': method,
             'total_outliers': len(outliers)
         }
 
+    def _iqr_method(self, data: List[Dict], fields: List[str], multiplier: float = 1.5) -> Dict:
+        """Detect outliers using Interquartile Range (IQR) method."""
+        return self._bounds_method(data, fields, 'iqr', multiplier=multiplier)
+
     def _zscore_method(self, data: List[Dict], fields: List[str], threshold: float = 3.0) -> Dict:
         """Detect outliers using Z-score method."""
-        outliers = []
-        stats = {}
+        return self._bounds_method(data, fields, 'zscore', threshold=threshold)
 
-        for field in fields:
-            values = [r[field] for r in data if r.get(field) is not None and
-                     isinstance(r[field], (int, float))]
+    def _isolation_forest_method(self, data: List[Dict], fields: List[str],
+                                 threshold: float = ISOLATION_FOREST_THRESHOLD,
+                                 n_trees: int = 100, sample_size: int = 256, random_state: int = 0) -> Dict:
+        """Detect records that are anomalous across fields using an Isolation Forest.
 
-            if len(values) < 2:  # Need at least 2 values for standard deviation
-                continue
-
-            mean_val = mean(values)
-            std_val = stdev(values)
-
-            stats[field] = {'mean': mean_val, 'std': std_val}
-
-            # Find outliers
-            for i, record in enumerate(data):
-                value = record.get(field)
-                if value is not None and isinstance(value, (int, float)) and std_val > 0:
-                    z_score = abs((value - mean_val) / std_val)
-                    if z_score > threshold:
-                        outliers.append({
-                            'index': i,
-                            'field': field,
-                            'value': value,
-                            'z_score': z_score,
-                            'threshold': threshold
-                        })
+        Records with a finite number in every field are scored; a score above
+        threshold (scores run from 0 to 1, ordinary points stay below 0.5) is
+        reported once per record.
+        """
+        outliers = []
+        rows, matrix = self._isolation_forest_matrix(data, fields)
+        if len(rows) >= 2:
+            scores = isolation_forest_scores(matrix, n_trees, sample_size, random_state)
+            for position in np.flatnonzero(scores > threshold).tolist():
+                record = data[rows[position]]
+                outliers.append({
+                    'index': rows[position],
+                    'fields': fields,
+                    'values': {field: record[field] for field in fields},
+                    'score': float(scores[position])
+                })
 
         return {
             'outliers': outliers,
-            'stats': stats,
-            'method': 'zscore',
+            'threshold': threshold,
+            'method': 'isolation_forest',
             'total_outliers': len(outliers)
         }
 
-    def _isolation_forest_method(self, data: List[Dict], fields: List[str], **kwargs) -> Dict:
-        """Detect outliers using Isolation Forest (placeholder for advanced implementation)."""
-        # This would require scikit-learn, simplified version for now
-        logger.warning("Isolation Forest method not fully implemented - using IQR as fallback")
-        return self._iqr_method(data, fields, **kwargs)
+    @staticmethod
+    def _isolation_forest_matrix(data: List[Dict], fields: List[str]) -> Tuple[List[int], np.ndarray]:
+        """Indices of the records with a finite number in every field, and those numbers."""
+        rows, matrix = [], []
+        if fields:
+            for i, record in enumerate(data):
+                values = [record.get(field) for field in fields]
+                if all(value is not None and isinstance(value, (int, float)) for value in values):
+                    rows.append(i)
+                    matrix.append(values)
+        matrix = np.asarray(matrix, dtype=float).reshape(len(rows), len(fields))
+        finite = np.isfinite(matrix).all(axis=1)
+        return [row for row, keep in zip(rows, finite.tolist()) if keep], matrix[finite]
 
     def _percentile_method(self, data: List[Dict], fields: List[str],
                           lower_percentile: float = 5.0, upper_percentile: float = 95.0) -> Dict:
         """Detect outliers using percentile method."""
-        outliers = []
-        bounds = {}
-
-        for field in fields:
-            values = [r[field] for r in data if r.get(field) is not None and
-                     isinstance(r[field], (int, float))]
-
-            if len(values) < 10:  # Need reasonable sample size
-                continue
-
-            values.sort()
-            lower_idx = int(len(values) * lower_percentile / 100)
-            upper_idx = int(len(values) * upper_percentile / 100)
-
-            lower_bound = values[lower_idx]
-            upper_bound = values[upper_idx]
-
-            bounds[field] = {'lower': lower_bound, 'upper': upper_bound}
-
-            # Find outliers
-            for i, record in enumerate(data):
-                value = record.get(field)
-                if value is not None and isinstance(value, (int, float)):
-                    if value < lower_bound or value > upper_bound:
-                        outliers.append({
-                            'index': i,
-                            'field': field,
-                            'value': value,
-                            'bounds': (lower_bound, upper_bound)
-                        })
-
-        return {
-            'outliers': outliers,
-            'bounds': bounds,
-            'method': 'percentile',
-            'total_outliers': len(outliers)
-        }
+        return self._bounds_method(data, fields, 'percentile', lower_percentile=lower_percentile,
+                                   upper_percentile=upper_percentile)
 
 
 class DataNormalizer:
     """Normalizes data formats and values."""
 
+    # Fields normalized when no field list is given
+    TIMESTAMP_FIELDS = ['timestamp', 'scraped_at', 'created_at']
+    NUMERIC_FIELDS = ['probability', 'volume', 'temperature', 'humidity',
+                      'wind_speed', 'pressure', 'latitude', 'longitude']
+    TEXT_FIELDS = ['event_title', 'event_url', 'market_id', 'outcome_name',
+                   'location_name', 'weather_description']
+
     def __init__(self):
-        pass
+        self.timestamp_parser = shared_parser(NORMALIZER_FORMATS)
 
     def normalize_timestamps(self, data: List[Dict], timestamp_fields: List[str] = None) -> List[Dict]:
         """Normalize timestamp fields to ISO 8601 UTC format."""
         if timestamp_fields is None:
-            timestamp_fields = ['timestamp', 'scraped_at', 'created_at']
-
-        cleaned_data = []
-        for record in data:
-            cleaned_record = record.copy()
-            for field in timestamp_fields:
-                if field in cleaned_record and cleaned_record[field]:
-                    try:
-                        # Try to parse various timestamp formats
-                        timestamp_str = str(cleaned_record[field])
-                        dt = self._parse_timestamp(timestamp_str)
-                        if dt:
-                            cleaned_record[field] = dt.isoformat()
-                    except Exception as e:
-                        logger.warning(f"Could not normalize timestamp {cleaned_record[field]}: {e}")
-            cleaned_data.append(cleaned_record)
-
-        return cleaned_data
+            timestamp_fields = self.TIMESTAMP_FIELDS
+
+        return [self.normalize_record_timestamps(record.copy(), timestamp_fields) for record in data]
+
+    def normalize_record_timestamps(self, record: Dict, timestamp_fields: List[str]) -> Dict:
+        """Normalize a record's timestamp fields in place."""
+        for field in timestamp_fields:
+            if field in record and record[field]:
+                try:
+                    normalized = self.timestamp_parser.isoformat(str(record[field]))
+                    if normalized:
+                        record[field] = normalized
+                except Exception as e:
+                    logger.warning(f"Could not normalize timestamp {record[field]}: {e}")
+        return record
 
     def _parse_timestamp(self, timestamp_str: str) -> Optional[datetime]:
         """Parse timestamp string into datetime object."""
-        formats = [
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%dT%H:%M:%S%z',
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%d',
-            '%Y/%m/%d %H:%M:%S',
-            '%Y/%m/%d'
-        ]
-
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(timestamp_str, fmt)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return dt
-            except ValueError:
-                continue
-        return None
+        return self.timestamp_parser.parse(timestamp_str)
 
     def normalize_numeric_fields(self, data: List[Dict], numeric_fields: List[str] = None) -> List[Dict]:
         """Normalize numeric fields to proper types and handle invalid values."""
         if numeric_fields is None:
-            numeric_fields = ['probability', 'volume', 'temperature', 'humidity',
-                            'wind_speed', 'pressure', 'latitude', 'longitude']
-
-        cleaned_data = []
-        for record in data:
-            cleaned_record = record.copy()
-            for field in numeric_fields:
-                if field in cleaned_record and cleaned_record[field] is not None:
-                    try:
-                        value = cleaned_record[field]
-                        if isinstance(value, str):
-                            # Remove common non-numeric characters
-                            clean_value = re.sub(r'[^\d.-]', '', value.strip())
-                            if clean_value:
-                                cleaned_record[field] = float(clean_value)
-                            else:
-                                cleaned_record[field] = None
-                        elif isinstance(value, (int, float)):
-                            cleaned_record[field] = float(value)
+            numeric_fields = self.NUMERIC_FIELDS
+
+        return [self.normalize_record_numeric_fields(record.copy(), numeric_fields) for record in data]
+
+    def normalize_record_numeric_fields(self, record: Dict, numeric_fields: List[str]) -> Dict:
+        """Normalize a record's numeric fields in place."""
+        for field in numeric_fields:
+            if field in record and record[field] is not None:
+                try:
+                    value = record[field]
+                    if isinstance(value, str):
+                        # Remove common non-numeric characters
+                        clean_value = NON_NUMERIC_CHARS.sub('', value.strip())
+                        if clean_value:
+                            record[field] = float(clean_value)
                         else:
-                            cleaned_record[field] = None
-                    except (ValueError, TypeError):
-                        logger.warning(f"Could not convert {field} value {cleaned_record[field]} to numeric")
-                        cleaned_record[field] = None
-            cleaned_data.append(cleaned_record)
-
-        return cleaned_data
+                            record[field] = None
+                    elif isinstance(value, (int, float)):
+                        record[field] = float(value)
+                    else:
+                        record[field] = None
+                except (ValueError, TypeError):
+                    logger.warning(f"Could not convert {field} value {record[field]} to numeric")
+                    record[field] = None
+        return record
 
     def normalize_text_fields(self, data: List[Dict], text_fields: List[str] = None) -> List[Dict]:
         """Normalize text fields (trim whitespace, handle encoding issues)."""
         if text_fields is None:
-            text_fields = ['event_title', 'event_url', 'market_id', 'outcome_name',
-                         'location_name', 'weather_description']
-
-        cleaned_data = []
-        for record in data:
-            cleaned_record = record.copy()
-            for field in text_fields:
-                if field in cleaned_record and cleaned_record[field]:
-                    try:
-                        if isinstance(cleaned_record[field], str):
-                            # Trim whitespace and normalize
-                            cleaned_record[field] = cleaned_record[field].strip()
-                        else:
-                            cleaned_record[field] = str(cleaned_record[field]).strip()
-                    except Exception as e:
-                        logger.warning(f"Could not normalize text field {field}: {e}")
-                        cleaned_record[field] = ""
-            cleaned_data.append(cleaned_record)
-
-        return cleaned_data
+            text_fields = self.TEXT_FIELDS
+
+        return [self.normalize_record_text_fields(record.copy(), text_fields) for record in data]
+
+    def normalize_record_text_fields(self, record: Dict, text_fields: List[str]) -> Dict:
+        """Normalize a record's text fields in place."""
+        for field in text_fields:
+            if field in record and record[field]:
+                try:
+                    if isinstance(record[field], str):
+                        # Trim whitespace and normalize
+                        record[field] = record[field].strip()
+                    else:
+                        record[field] = str(record[field]).strip()
+                except Exception as e:
+                    logger.warning(f"Could not normalize text field {field}: {e}")
+                    record[field] = ""
+        return record
 
     def normalize_coordinates(self, data: List[Dict]) -> List[Dict]:
         """Normalize latitude and longitude coordinates."""
+        return [self.normalize_record_coordinates(record.copy()) for record in data]
+
+    def normalize_record_coordinates(self, record: Dict) -> Dict:
+        """Normalize a record's latitude and longitude in place."""
+        for coord_field in ['latitude', 'longitude']:
+            if coord_field in record and record[coord_field] is not None:
+                try:
+                    value = float(record[coord_field])
+                    # Ensure coordinates are within valid ranges
+                    if coord_field == 'latitude':
+                        value = max(-90.0, min(90.0, value))
+                    elif coord_field == 'longitude':
+                        value = max(-180.0, min(180.0, value))
+                    record[coord_field] = round(value, 6)  # Round to 6 decimal places
+                except (ValueError, TypeError):
+                    logger.warning(f"Invalid coordinate value for {coord_field}: {record[coord_field]}")
+                    record[coord_field] = None
+        return record
+
+
+class FusedCleaner:
+    """Runs a cleaner's stages over each record in a single pass.
+
+    Running the stages one after another copies every record into a new list at
+    each stage. Here each record is copied once and the normalization, missing
+    value stages are applied to that copy in stage order. Statistics that need the
+    whole batch (fill means, medians and modes, backward fill) are gathered in the
+    same pass and applied in a second pass only when the configured strategy needs
+    them, and outliers are removed by their index in the cleaned records. The result
+    is the same as running the stages in turn with DataNormalizer,
+    MissingValueHandler and OutlierDetector.
+    """
+
+    def __init__(self, normalizer: DataNormalizer, missing_handler: MissingValueHandler,
+                 outlier_detector: OutlierDetector, normalize_coordinates: bool = False):
+        self.normalizer = normalizer
+        self.missing_handler = missing_handler
+        self.outlier_detector = outlier_detector
+        self.normalize_coordinates = normalize_coordinates
+
+    def clean(self, data: List[Dict], missing_strategy: Optional[str] = None, missing_fields: List[str] = None,
+              outlier_method: Optional[str] = None, outlier_fields: List[str] = None,
+              remove_outliers: bool = False) -> List[Dict]:
+        """Clean records; a None strategy or method skips that stage."""
+        missing_fields = missing_fields or []
+        outlier_fields = outlier_fields or []
+        if missing_strategy is not None and missing_strategy not in self.missing_handler.strategies:
+            raise ValueError(f"Unknown strategy: {missing_strategy}")
+        if outlier_method is not None and outlier_method not in self.outlier_detector.methods:
+            raise ValueError(f"Unknown method: {outlier_method}")
+
+        is_missing = self.missing_handler.is_missing
+        fill_from_statistics = missing_strategy in ('mean', 'median', 'mode', 'interpolate')
+        second_pass = fill_from_statistics or missing_strategy == 'backward_fill'
+        # Detection alone doesn't change the records, so bounds are only needed for removal
+        find_outliers = outlier_method is not None and remove_outliers
+
+        fill_values = {field: [] for field in missing_fields}
+        last_values = {}
+
         cleaned_data = []
         for record in data:
-            cleaned_record = record.copy()
-            for coord_field in ['latitude', 'longitude']:
-                if coord_field in cleaned_record and cleaned_record[coord_field] is not None:
-                    try:
-                        value = float(cleaned_record[coord_field])
-                        # Ensure coordinates are within valid ranges
-                        if coord_field == 'latitude':
-                            value = max(-90.0, min(90.0, value))
-                        elif coord_field == 'longitude':
-                            value = max(-180.0, min(180.0, value))
-                        cleaned_record[coord_field] = round(value, 6)  # Round to 6 decimal places
-                    except (ValueError, TypeError):
-                        logger.warning(f"Invalid coordinate value for {coord_field}: {cleaned_record[coord_field]}")
-                        cleaned_record[coord_field] = None
-            cleaned_data.append(cleaned_record)
+            record = self._normalize(record.copy())
+
+            if missing_strategy == 'drop':
+                if any(is_missing(record.get(field)) for field in missing_fields):
+                    continue
+            elif missing_strategy == 'forward_fill':
+                self._fill_from_last(record, missing_fields, last_values)
+            elif missing_strategy == 'constant':
+                for field in missing_fields:
+                    if is_missing(record.get(field)):
+                        record[field] = 0
+            elif fill_from_statistics:
+                for field in missing_fields:
+                    value = record.get(field)
+                    if value is not None and (missing_strategy == 'mode' or isinstance(value, (int, float))):
+                        fill_values[field].append(value)
+
+            cleaned_data.append(record)
+
+        if second_pass:
+            if missing_strategy == 'backward_fill':
+                for record in reversed(cleaned_data):
+                    self._fill_from_last(record, missing_fields, last_values)
+            else:
+                fills = {field: self.missing_handler.fill_statistic(missing_strategy, values)
+                         for field, values in fill_values.items() if values}
+                for record in cleaned_data:
+                    for field in missing_fields:
+                        if field in fills and is_missing(record.get(field)):
+                            record[field] = fills[field]
+
+        if find_outliers:
+            outliers = self.outlier_detector.detect_outliers(cleaned_data, outlier_method, outlier_fields)
+            outlier_indices = {outlier['index'] for outlier in outliers['outliers']}
+            cleaned_data = [record for i, record in enumerate(cleaned_data) if i not in outlier_indices]
 
         return cleaned_data
 
+    def _normalize(self, record: Dict) -> Dict:
+        normalizer = self.normalizer
+        normalizer.normalize_record_timestamps(record, normalizer.TIMESTAMP_FIELDS)
+        normalizer.normalize_record_numeric_fields(record, normalizer.NUMERIC_FIELDS)
+        normalizer.normalize_record_text_fields(record, normalizer.TEXT_FIELDS)
+        if self.normalize_coordinates:
+            normalizer.normalize_record_coordinates(record)
+        return record
+
+    def _fill_from_last(self, record: Dict, fields: List[str], last_values: Dict[str, Any]):
+        """Fill missing fields with the last known value, remembering known ones."""
+        for field in fields:
+            if self.missing_handler.is_missing(record.get(field)):
+                if field in last_values:
+                    record[field] = last_values[field]
+            else:
+                last_values[field] = record[field]
+
 
 class PolymarketDataCleaner(DataCleaner):
     """Data cleaner specifically for Polymarket data."""
@@ -470,42 +542,38 @@ class PolymarketDataCleaner(DataCleaner):
         if config is None:
             config = self._get_default_config()
 
-        cleaned_data = data.copy()
         cleaning_steps = []
+        missing_strategy = missing_fields = None
+        outlier_method = outlier_fields = None
 
         # Step 1: Normalize data formats
         logger.info("Normalizing Polymarket data formats")
-        cleaned_data = self.normalizer.normalize_timestamps(cleaned_data)
-        cleaned_data = self.normalizer.normalize_numeric_fields(cleaned_data)
-        cleaned_data = self.normalizer.normalize_text_fields(cleaned_data)
         cleaning_steps.append("format_normalization")
 
         # Step 2: Handle missing values
         if config.get('handle_missing', True):
-            strategy = config.get('missing_strategy', 'drop')
-            fields = config.get('missing_fields', ['probability', 'volume'])
-            logger.info(f"Handling missing values using {strategy} strategy")
-            cleaned_data = self.missing_handler.handle_missing_values(
-                cleaned_data, strategy, fields
-            )
-            cleaning_steps.append(f"missing_values_{strategy}")
+            missing_strategy = config.get('missing_strategy', 'drop')
+            missing_fields = config.get('missing_fields', ['probability', 'volume'])
+            logger.info(f"Handling missing values using {missing_strategy} strategy")
+            cleaning_steps.append(f"missing_values_{missing_strategy}")
 
         # Step 3: Detect outliers
         if config.get('detect_outliers', True):
-            method = config.get('outlier_method', 'iqr')
-            fields = config.get('outlier_fields', ['probability', 'volume'])
-            logger.info(f"Detecting outliers using {method} method")
-            outlier_results = self.outlier_detector.detect_outliers(
-                cleaned_data, method, fields
-            )
-            cleaning_steps.append(f"outlier_detection_{method}")
+            outlier_method = config.get('outlier_method', 'iqr')
+            outlier_fields = config.get('outlier_fields', ['probability', 'volume'])
+            logger.info(f"Detecting outliers using {outlier_method} method")
+            cleaning_steps.append(f"outlier_detection_{outlier_method}")
 
             # Optionally remove outliers
             if config.get('remove_outliers', False):
-                outlier_indices = {o['index'] for o in outlier_results['outliers']}
-                cleaned_data = [r for i, r in enumerate(cleaned_data) if i not in outlier_indices]
                 cleaning_steps.append("outlier_removal")
 
+        # All steps run together, copying each record once
+        cleaned_data = FusedCleaner(
+            self.normalizer, self.missing_handler, self.outlier_detector, normalize_coordinates=False
+        ).clean(data, missing_strategy, missing_fields, outlier_method, outlier_fields,
+                config.get('remove_outliers', False))
+
         return {
             'cleaned_data': cleaned_data,
             'original_count': len(data),
@@ -541,43 +609,38 @@ class WeatherDataCleaner(DataCleaner):
         if config is None:
             config = self._get_default_config()
 
-        cleaned_data = data.copy()
         cleaning_steps = []
+        missing_strategy = missing_fields = None
+        outlier_method = outlier_fields = None
 
         # Step 1: Normalize data formats
         logger.info("Normalizing weather data formats")
-        cleaned_data = self.normalizer.normalize_timestamps(cleaned_data)
-        cleaned_data = self.normalizer.normalize_numeric_fields(cleaned_data)
-        cleaned_data = self.normalizer.normalize_text_fields(cleaned_data)
-        cleaned_data = self.normalizer.normalize_coordinates(cleaned_data)
         cleaning_steps.append("format_normalization")
 
         # Step 2: Handle missing values
         if config.get('handle_missing', True):
-            strategy = config.get('missing_strategy', 'interpolate')
-            fields = config.get('missing_fields', ['temperature', 'humidity', 'wind_speed'])
-            logger.info(f"Handling missing values using {strategy} strategy")
-            cleaned_data = self.missing_handler.handle_missing_values(
-                cleaned_data, strategy, fields
-            )
-            cleaning_steps.append(f"missing_values_{strategy}")
+            missing_strategy = config.get('missing_strategy', 'interpolate')
+            missing_fields = config.get('missing_fields', ['temperature', 'humidity', 'wind_speed'])
+            logger.info(f"Handling missing values using {missing_strategy} strategy")
+            cleaning_steps.append(f"missing_values_{missing_strategy}")
 
         # Step 3: Detect outliers
         if config.get('detect_outliers', True):
-            method = config.get('outlier_method', 'zscore')
-            fields = config.get('outlier_fields', ['temperature', 'humidity', 'pressure', 'wind_speed'])
-            logger.info(f"Detecting outliers using {method} method")
-            outlier_results = self.outlier_detector.detect_outliers(
-                cleaned_data, method, fields
-            )
-            cleaning_steps.append(f"outlier_detection_{method}")
+            outlier_method = config.get('outlier_method', 'zscore')
+            outlier_fields = config.get('outlier_fields', ['temperature', 'humidity', 'pressure', 'wind_speed'])
+            logger.info(f"Detecting outliers using {outlier_method} method")
+            cleaning_steps.append(f"outlier_detection_{outlier_method}")
 
             # Optionally remove outliers
             if config.get('remove_outliers', False):
-                outlier_indices = {o['index'] for o in outlier_results['outliers']}
-                cleaned_data = [r for i, r in enumerate(cleaned_data) if i not in outlier_indices]
                 cleaning_steps.append("outlier_removal")
 
+        # All steps run together, copying each record once
+        cleaned_data = FusedCleaner(
+            self.normalizer, self.missing_handler, self.outlier_detector, normalize_coordinates=True
+        ).clean(data, missing_strategy, missing_fields, outlier_method, outlier_fields,
+                config.get('remove_outliers', False))
+
         return {
             'cleaned_data': cleaned_data,
             'original_count': len(data),
@@ -15,8 +15,13 @@ import csv
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+import numpy as np
+import pandas as pd
+
 from .data_validation import validate_polymarket_data, validate_weather_data
 from .data_cleaning import clean_polymarket_data, clean_weather_data
+from . import columnar_quality
+from .columnar_quality import ColumnBatch
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +93,7 @@ class DataQualityPipeline:
             'report_format': 'json',
             'log_level': 'INFO',
             'quality_threshold': 80.0,  # Minimum quality score to pass
+            'execution_mode': 'records',  # 'columnar' runs the stages over columns
         }
 
         if self.source == DataSource.POLYMARKET:
@@ -113,13 +119,24 @@ class DataQualityPipeline:
 
         return base_config
 
-    def process_data(self, data: List[Dict], metadata: Dict = None) -> Dict:
-        """Process data through the complete quality pipeline."""
+    def process_data(self, data: Union[List[Dict], pd.DataFrame], metadata: Dict = None) -> Dict:
+        """Process data through the complete quality pipeline.
+
+        With 'execution_mode': 'columnar' (always, for a DataFrame) the stages run
+        as column operations over a ColumnBatch; the results are the same, and
+        cleaned_data comes back in the input's form.
+        """
         start_time = datetime.now()
         pipeline_stages = []
         quality_score = 100.0
 
         try:
+            frame_input = isinstance(data, pd.DataFrame)
+            if frame_input:
+                data = ColumnBatch.from_frame(data)
+            elif self.config.get('execution_mode', 'records') == 'columnar' and not isinstance(data, ColumnBatch):
+                data = ColumnBatch.from_records(data)
+
             logger.info(f"Starting data quality pipeline for {self.source.value}")
             logger.info(f"Processing {len(data)} records")
 
@@ -146,6 +163,10 @@ class DataQualityPipeline:
             quality_result = self._run_quality_check(cleaning_result)
             pipeline_stages.append(PipelineStage.QUALITY_CHECK.value)
 
+            if isinstance(cleaning_result['cleaned_data'], ColumnBatch):
+                batch = cleaning_result['cleaned_data']
+                cleaning_result['cleaned_data'] = batch.to_frame() if frame_input else batch.to_records()
+
             # Calculate final quality score
             if cleaning_result['original_count'] > 0:
                 cleaning_efficiency = (cleaning_result['cleaned_count'] / cleaning_result['original_count']) * 100
@@ -199,17 +220,20 @@ class DataQualityPipeline:
                 'pipeline_stages': pipeline_stages
             }
 
-    def _run_validation(self, data: List[Dict]) -> Dict:
+    def _run_validation(self, data: Union[List[Dict], ColumnBatch]) -> Dict:
         """Run validation on the data."""
         try:
-            validation_result = self.validator(data)
+            if isinstance(data, ColumnBatch):
+                validation_result = columnar_quality.validate_columns(data, self.source.value)
+            else:
+                validation_result = self.validator(data)
             logger.info(f"Validation completed: {validation_result['valid_records']}/{validation_result['total_records']} records valid")
             return validation_result
         except Exception as e:
             logger.error(f"Validation failed: {e}")
             raise
 
-    def _run_cleaning(self, original_data: List[Dict], validation_result: Dict) -> Dict:
+    def _run_cleaning(self, original_data: Union[List[Dict], ColumnBatch], validation_result: Dict) -> Dict:
         """Run cleaning on the data."""
         try:
             # Use only valid records for cleaning if validation was performed
@@ -217,10 +241,16 @@ class DataQualityPipeline:
             if 'results' in validation_result:
                 # Filter out invalid records if needed
                 valid_indices = [r['index'] for r in validation_result['results'] if r['is_valid']]
-                data_to_clean = [original_data[i] for i in valid_indices]
+                if isinstance(original_data, ColumnBatch):
+                    data_to_clean = original_data.take(np.array(valid_indices, dtype=np.intp))
+                else:
+                    data_to_clean = [original_data[i] for i in valid_indices]
 
             cleaning_config = self.config.get('cleaning_config', {})
-            cleaning_result = self.cleaner(data_to_clean, cleaning_config)
+            if isinstance(data_to_clean, ColumnBatch):
+                cleaning_result = columnar_quality.clean_columns(data_to_clean, self.source.value, cleaning_config)
+            else:
+                cleaning_result = self.cleaner(data_to_clean, cleaning_config)
 
             logger.info(f"Cleaning completed: {cleaning_result['original_count']} -> {cleaning_result['cleaned_count']} records")
             return cleaning_result
@@ -252,6 +282,8 @@ class DataQualityPipeline:
 
     def _calculate_completeness(self, data: List[Dict]) -> float:
         """Calculate data completeness score (0-100)."""
+        if isinstance(data, ColumnBatch):
+            return columnar_quality.completeness_score(data)
         if not data:
             return 0.0
 
@@ -268,6 +300,8 @@ class DataQualityPipeline:
 
     def _calculate_consistency(self, data: List[Dict]) -> float:
         """Calculate data consistency score (0-100)."""
+        if isinstance(data, ColumnBatch):
+            return columnar_quality.consistency_score(data)
         if not data:
             return 100.0
 
@@ -287,6 +321,8 @@ class DataQualityPipeline:
 
     def _calculate_accuracy(self, data: List[Dict]) -> float:
         """Calculate data accuracy score (0-100)."""
+        if isinstance(data, ColumnBatch):
+            return columnar_quality.accuracy_score(data, self.source.value)
         # This is a simplified accuracy check - in practice, this would involve
         # more sophisticated validation rules
         if not data:
@@ -317,6 +353,8 @@ class DataQualityPipeline:
 
     def _calculate_timeliness(self, data: List[Dict]) -> float:
         """Calculate data timeliness score (0-100)."""
+        if isinstance(data, ColumnBatch):
+            return columnar_quality.timeliness_score(data)
         if not data:
             return 100.0
 
@@ -8,37 +8,47 @@ Validates data integrity, formats, ranges, and consistency across different data
 
 import logging
 from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime, timezone
 import re
 import json
+import time
+
+from .timestamp_parsing import TIMESTAMP_FORMATS, shared_parser
 
 logger = logging.getLogger(__name__)
 
+# Market IDs are alphanumeric with possible hyphens
+MARKET_ID_PATTERN = re.compile(r'^[a-zA-Z0-9\-]+$')
+
 class DataValidator:
     """Base class for data validation with common validation methods."""
 
     def __init__(self):
         self.validation_errors = []
         self.validation_warnings = []
+        self.timestamp_parser = shared_parser(TIMESTAMP_FORMATS)
 
     def reset_errors(self):
         """Reset validation errors and warnings."""
         self.validation_errors = []
         self.validation_warnings = []
 
+    @staticmethod
+    def format_message(field: str, message: str, value: Any = None) -> str:
+        """Format an error or warning message for a field."""
+        formatted = f"Field '{field}': {message}"
+        if value is not None:
+            formatted += f" (value: {value})"
+        return formatted
+
     def add_error(self, field: str, message: str, value: Any = None):
         """Add a validation error."""
-        error_msg = f"Field '{field}': {message}"
-        if value is not None:
-            error_msg += f" (value: {value})"
+        error_msg = self.format_message(field, message, value)
         self.validation_errors.append(error_msg)
         logger.error(error_msg)
 
     def add_warning(self, field: str, message: str, value: Any = None):
         """Add a validation warning."""
-        warning_msg = f"Field '{field}': {message}"
-        if value is not None:
-            warning_msg += f" (value: {value})"
+        warning_msg = self.format_message(field, message, value)
         self.validation_warnings.append(warning_msg)
         logger.warning(warning_msg)
 
@@ -97,24 +107,8 @@ class DataValidator:
         if not timestamp_str:
             return False
 
-        # Common timestamp formats to try
-        formats = [
-            '%Y-%m-%dT%H:%M:%SZ',  # ISO 8601 UTC
-            '%Y-%m-%dT%H:%M:%S%z', # ISO 8601 with timezone
-            '%Y-%m-%d %H:%M:%S',   # Standard format
-            '%Y-%m-%dT%H:%M:%S',   # ISO without timezone
-            '%Y-%m-%d',            # Date only
-        ]
-
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(timestamp_str, fmt)
-                # Ensure timezone awareness
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return True
-            except ValueError:
-                continue
+        if self.timestamp_parser.parse(timestamp_str) is not None:
+            return True
 
         self.add_error(field_name, f"Invalid timestamp format: {timestamp_str}")
         return False
@@ -174,17 +168,12 @@ class PolymarketDataValidator(DataValidator):
 
         # Validate market_id format (should be alphanumeric with possible hyphens)
         market_id = record.get('market_id', '')
-        if not re.match(r'^[a-zA-Z0-9\-]+$', market_id):
+        if not MARKET_ID_PATTERN.match(market_id):
             self.add_error('market_id', f"Invalid market ID format: {market_id}")
 
-        # Validate scraped_at is not in the future
-        try:
-            scraped_dt = datetime.fromisoformat(record['scraped_at'].replace('Z', '+00:00'))
-            now = datetime.now(timezone.utc)
-            if scraped_dt > now:
-                self.add_warning('scraped_at', "Scraped timestamp is in the future", record['scraped_at'])
-        except (ValueError, AttributeError):
-            pass  # Already validated format above
+        # Validate scraped_at is not in the future (naive timestamps are UTC)
+        if self.timestamp_parser.epoch(record['scraped_at']) > time.time():
+            self.add_warning('scraped_at', "Scraped timestamp is in the future", record['scraped_at'])
 
         return len(self.validation_errors) == 0
 
@@ -22,6 +22,7 @@ import statistics
 import json
 
 from .data_validation import DataValidator, PolymarketDataValidator, WeatherDataValidator
+from .timestamp_parsing import TIMESTAMP_FORMATS, shared_parser
 
 logger = logging.getLogger(__name__)
 
@@ -137,11 +138,14 @@ class CrossSourceConsistencyChecker:
         self.consistency_checks: List[ConsistencyCheck] = []
         self.source_data_cache: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
 
-    def add_source_data(self, source: str, data: Dict, timestamp: datetime):
-        """Add data from a source for consistency checking."""
+    def add_source_data(self, source: str, data: Dict, timestamp: Union[datetime, int, float]):
+        """Add data from a source for consistency checking.
+
+        timestamp is a datetime or seconds since the epoch; it is kept as epoch seconds.
+        """
         self.source_data_cache[source].append({
             'data': data,
-            'timestamp': timestamp
+            'timestamp': timestamp.timestamp() if isinstance(timestamp, datetime) else timestamp
         })
 
     def check_weather_consistency(self, sources: List[str], location: str,
@@ -151,7 +155,7 @@ class CrossSourceConsistencyChecker:
 
         # Get recent data for each source
         recent_data = {}
-        cutoff = datetime.now(timezone.utc) - timedelta(minutes=time_window_minutes)
+        cutoff = time.time() - time_window_minutes * 60
 
         for source in sources:
             source_data = [
@@ -204,7 +208,7 @@ class CrossSourceConsistencyChecker:
 
         # Get recent data for each source
         recent_data = {}
-        cutoff = datetime.now(timezone.utc) - timedelta(minutes=time_window_minutes)
+        cutoff = time.time() - time_window_minutes * 60
 
         for source in sources:
             source_data = [
@@ -280,6 +284,8 @@ class RealTimeValidator:
         self.metrics = ValidationMetrics()
         self.is_running = False
         self.validation_thread: Optional[threading.Thread] = None
+        # Stream items carry any ISO 8601 timestamp, fractional seconds included
+        self.timestamp_parser = shared_parser(TIMESTAMP_FORMATS, iso_fallback=True)
 
     async def validate_stream(self, data_stream: AsyncGenerator[Dict, None],
                             source: DataSource, validator: DataValidator) -> AsyncGenerator[Dict, None]:
@@ -319,13 +325,12 @@ class RealTimeValidator:
                     )
                     self.alert_manager.raise_alert(alert)
 
-                # Add to consistency checker
-                timestamp = datetime.now(timezone.utc)
-                if 'timestamp' in data_item:
-                    try:
-                        timestamp = datetime.fromisoformat(data_item['timestamp'].replace('Z', '+00:00'))
-                    except:
-                        pass
+                # Add to consistency checker (epoch seconds, now if missing or unparseable)
+                timestamp = None
+                if isinstance(data_item.get('timestamp'), str):
+                    timestamp = self.timestamp_parser.epoch(data_item['timestamp'])
+                if timestamp is None:
+                    timestamp = time.time()
 
                 self.consistency_checker.add_source_data(source.value, data_item, timestamp)
 
@@ -12,25 +12,49 @@ import logging
 from pathlib import Path
 from datetime import datetime
 import sys
+import time
+from functools import partial
+
+try:
+    from .bulk_insert import DEFAULT_BATCH_SIZE, BatchInsertResult, configure_connection, insert_batched
+    from .parallel_ingest import ingest_files
+except ImportError:
+    from bulk_insert import DEFAULT_BATCH_SIZE, BatchInsertResult, configure_connection, insert_batched
+    from parallel_ingest import ingest_files
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 # Import data quality modules
 try:
-    from data_quality_pipeline import process_polymarket_data
-    from data_validation import validate_polymarket_data
+    try:
+        from .data_quality_pipeline import process_polymarket_data
+        from .data_validation import validate_polymarket_data
+    except ImportError:
+        from data_quality_pipeline import process_polymarket_data
+        from data_validation import validate_polymarket_data
     DATA_QUALITY_AVAILABLE = True
 except ImportError:
     logger.warning("Data quality modules not available. Running without validation/cleaning.")
     DATA_QUALITY_AVAILABLE = False
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
+# Import materialized rollups maintained alongside the raw tables
+try:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from backtesting_framework.data.rollups import refresh_rollups
+    ROLLUPS_AVAILABLE = True
+except ImportError:
+    logger.warning("Rollup module not available. Aggregates will not be refreshed on ingest.")
+    ROLLUPS_AVAILABLE = False
 
 class PolymarketDataIngester:
     """Handles ingestion of Polymarket data into the database."""
 
-    def __init__(self, db_path: str = "data/climatetrade.db"):
+    def __init__(self, db_path: str = "data/climatetrade.db", batch_size: int = DEFAULT_BATCH_SIZE):
         self.db_path = db_path
+        self.batch_size = batch_size
+        self.last_directory_stats = None
         self.ensure_db_exists()
 
     def ensure_db_exists(self):
@@ -40,8 +64,21 @@ class PolymarketDataIngester:
             sys.exit(1)
 
     def connect_db(self):
-        """Connect to the database."""
-        return sqlite3.connect(self.db_path)
+        """Connect to the database with bulk-load pragmas applied."""
+        conn = sqlite3.connect(self.db_path)
+        configure_connection(conn)
+        return conn
+
+    def refresh_rollups(self):
+        """Fold newly inserted rows into the hourly/daily rollups."""
+        if not ROLLUPS_AVAILABLE:
+            return
+
+        try:
+            refresh_rollups(self.db_path)
+        except Exception as e:
+            # Rollups are derived data; the loader falls back to raw rows
+            logger.warning(f"Failed to refresh rollups: {e}")
 
     def validate_csv_row(self, row: dict) -> bool:
         """Validate a CSV row has required fields."""
@@ -61,38 +98,32 @@ class PolymarketDataIngester:
             'scraped_at': row.get('scraped_at', '').strip()
         }
 
-    def insert_polymarket_data(self, data: list, conn: sqlite3.Connection) -> int:
-        """Insert Polymarket data into the database."""
-        cursor = conn.cursor()
-
+    def insert_polymarket_data(self, data: list, conn: sqlite3.Connection) -> BatchInsertResult:
+        """Insert Polymarket data into the database in executemany batches."""
         insert_sql = """
         INSERT OR IGNORE INTO polymarket_data
         (event_title, event_url, market_id, outcome_name, probability, volume, timestamp, scraped_at)
         VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """
 
-        inserted_count = 0
-        for record in data:
-            try:
-                cursor.execute(insert_sql, (
-                    record['event_title'],
-                    record['event_url'],
-                    record['market_id'],
-                    record['outcome_name'],
-                    record['probability'],
-                    record['volume'],
-                    record['timestamp'],
-                    record['scraped_at']
-                ))
-                if cursor.rowcount > 0:
-                    inserted_count += 1
-            except sqlite3.Error as e:
-                logger.error(f"Error inserting record for market {record['market_id']}: {e}")
-
-        return inserted_count
+        rows = ((
+            record['event_title'],
+            record['event_url'],
+            record['market_id'],
+            record['outcome_name'],
+            record['probability'],
+            record['volume'],
+            record['timestamp'],
+            record['scraped_at']
+        ) for record in data)
 
-    def ingest_csv_file(self, csv_path: str, enable_quality_pipeline: bool = True) -> dict:
-        """Ingest data from a single CSV file with optional quality processing."""
+        def log_error(row, e):
+            logger.error(f"Error inserting record for market {row[2]}: {e}")
+
+        return insert_batched(conn, insert_sql, rows, self.batch_size, on_error=log_error)
+
+    def prepare_csv_file(self, csv_path: str, enable_quality_pipeline: bool = True) -> dict:
+        """Parse and optionally clean a CSV file without touching the database."""
         if not Path(csv_path).exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
@@ -101,6 +132,7 @@ class PolymarketDataIngester:
         invalid_rows = 0
 
         logger.info(f"Reading CSV file: {csv_path}")
+        parse_started = time.perf_counter()
 
         with open(csv_path, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
@@ -118,10 +150,12 @@ class PolymarketDataIngester:
                     logger.warning(f"Invalid row {row_num}: missing required fields")
                     invalid_rows += 1
 
+        parse_seconds = time.perf_counter() - parse_started
         logger.info(f"Parsed {valid_rows} valid rows, {invalid_rows} invalid rows")
 
         # Apply data quality pipeline if available and enabled
         quality_result = None
+        quality_started = time.perf_counter()
         if DATA_QUALITY_AVAILABLE and enable_quality_pipeline and data:
             logger.info("Applying data quality pipeline to Polymarket data")
             try:
@@ -146,58 +180,94 @@ class PolymarketDataIngester:
                 logger.error(f"Error in data quality pipeline: {e}")
                 logger.warning("Proceeding with original data")
 
-        # Insert data into database
-        conn = self.connect_db()
+        return {
+            'file': csv_path,
+            'data': data,
+            'quality_result': quality_result,
+            'parse_seconds': parse_seconds,
+            'quality_seconds': time.perf_counter() - quality_started
+        }
+
+    def write_prepared_file(self, prepared: dict, conn: sqlite3.Connection) -> dict:
+        """Insert a prepared CSV file and commit it as one transaction."""
+        data = prepared['data']
+        quality_result = prepared['quality_result']
+
         try:
-            inserted_count = self.insert_polymarket_data(data, conn)
+            insert_result = self.insert_polymarket_data(data, conn)
             conn.commit()
-            logger.info(f"Successfully inserted {inserted_count} new records")
-
-            result = {
-                'file': csv_path,
-                'total_rows': len(data),
-                'inserted': inserted_count,
-                'duplicates': len(data) - inserted_count,
-                'quality_processed': quality_result is not None,
-                'quality_score': quality_result.get('quality_score') if quality_result else None
-            }
-
-            if quality_result:
-                result.update({
-                    'original_records': quality_result['original_records'],
-                    'processed_records': quality_result['processed_records'],
-                    'validation_errors': quality_result['validation_result'].get('invalid_records', 0),
-                    'cleaning_steps': quality_result['cleaning_result'].get('cleaning_steps', [])
-                })
-
-            return result
-
         except sqlite3.Error as e:
             logger.error(f"Database error: {e}")
             conn.rollback()
             raise
+
+        logger.info(f"Successfully inserted {insert_result.inserted} new records")
+
+        result = {
+            'file': prepared['file'],
+            'total_rows': len(data),
+            'inserted': insert_result.inserted,
+            'duplicates': insert_result.duplicates,
+            'failed': insert_result.failed,
+            'quality_processed': quality_result is not None,
+            'quality_score': quality_result.get('quality_score') if quality_result else None
+        }
+
+        if quality_result:
+            result.update({
+                'original_records': quality_result['original_records'],
+                'processed_records': quality_result['processed_records'],
+                'validation_errors': quality_result['validation_result'].get('invalid_records', 0),
+                'cleaning_steps': quality_result['cleaning_result'].get('cleaning_steps', [])
+            })
+
+        return result
+
+    def ingest_csv_file(self, csv_path: str, enable_quality_pipeline: bool = True) -> dict:
+        """Ingest data from a single CSV file with optional quality processing."""
+        prepared = self.prepare_csv_file(csv_path, enable_quality_pipeline)
+
+        conn = self.connect_db()
+        try:
+            result = self.write_prepared_file(prepared, conn)
         finally:
             conn.close()
 
-    def ingest_directory(self, directory_path: str) -> list:
-        """Ingest all CSV files from a directory."""
+        if result['inserted']:
+            self.refresh_rollups()
+        return result
+
+    def ingest_directory(self, directory_path: str, enable_quality_pipeline: bool = True, n_jobs: int = 1) -> list:
+        """
+        Ingest all CSV files from a directory.
+
+        With n_jobs > 1, files are parsed and cleaned in a pool of worker
+        processes while this process writes them to the database one at a
+        time. Per-stage timings are kept in last_directory_stats.
+        """
         directory = Path(directory_path)
         if not directory.exists():
             raise FileNotFoundError(f"Directory not found: {directory_path}")
 
-        csv_files = list(directory.glob("*.csv"))
+        csv_files = sorted(directory.glob("*.csv"))
         if not csv_files:
             logger.warning(f"No CSV files found in {directory_path}")
             return []
 
-        results = []
-        for csv_file in csv_files:
-            try:
-                result = self.ingest_csv_file(str(csv_file))
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error processing {csv_file}: {e}")
+        prepare = partial(self.prepare_csv_file, enable_quality_pipeline=enable_quality_pipeline)
+        conn = self.connect_db()
+        try:
+            results, self.last_directory_stats = ingest_files(
+                [str(csv_file) for csv_file in csv_files],
+                prepare,
+                lambda prepared: self.write_prepared_file(prepared, conn),
+                n_jobs=n_jobs
+            )
+        finally:
+            conn.close()
 
+        if any(result['inserted'] for result in results):
+            self.refresh_rollups()
         return results
 
 def main():
@@ -211,6 +281,18 @@ def main():
         default="data/climatetrade.db",
         help="Path to the database file"
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Rows per executemany batch"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Worker processes for parsing and cleaning files in a directory"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -253,7 +335,7 @@ def main():
             logger.error(f"Error loading quality configuration: {e}")
             quality_config = None
 
-    ingester = PolymarketDataIngester(args.db_path)
+    ingester = PolymarketDataIngester(args.db_path, batch_size=args.batch_size)
 
     try:
         input_path = Path(args.input)
@@ -266,7 +348,8 @@ def main():
                 if result.get('cleaning_steps'):
                     print(f"Cleaning Steps: {', '.join(result['cleaning_steps'])}")
         elif input_path.is_dir():
-            results = ingester.ingest_directory(args.input)
+            results = ingester.ingest_directory(args.input, enable_quality_pipeline=enable_quality,
+                                                n_jobs=args.jobs)
             total_inserted = sum(r['inserted'] for r in results)
             total_duplicates = sum(r['duplicates'] for r in results)
             total_quality_processed = sum(1 for r in results if r.get('quality_processed', False))
@@ -277,6 +360,10 @@ def main():
                     avg_quality_score = sum(quality_scores) / len(quality_scores)
 
             print(f"Processed {len(results)} files: {total_inserted} inserted, {total_duplicates} duplicates")
+            if ingester.last_directory_stats:
+                throughput = ingester.last_directory_stats.throughput()
+                print(f"Throughput (records/s): parse {throughput['parse']:.0f}, quality {throughput['quality']:.0f}, "
+                      f"write {throughput['write']:.0f}, overall {throughput['overall']:.0f}")
             if total_quality_processed > 0:
                 print(f"Files with quality processing: {total_quality_processed}")
                 if avg_quality_score is not None:
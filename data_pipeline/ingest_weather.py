@@ -14,6 +14,15 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 import sys
+import time
+from functools import partial
+
+try:
+    from .bulk_insert import DEFAULT_BATCH_SIZE, BatchInsertResult, configure_connection, insert_batched
+    from .parallel_ingest import ingest_files
+except ImportError:
+    from bulk_insert import DEFAULT_BATCH_SIZE, BatchInsertResult, configure_connection, insert_batched
+    from parallel_ingest import ingest_files
 
 # Import centralized logging
 try:
@@ -30,18 +39,33 @@ except ImportError:
 
 # Import data quality modules
 try:
-    from data_quality_pipeline import process_weather_data
-    from data_validation import validate_weather_data
+    try:
+        from .data_quality_pipeline import process_weather_data
+        from .data_validation import validate_weather_data
+    except ImportError:
+        from data_quality_pipeline import process_weather_data
+        from data_validation import validate_weather_data
     DATA_QUALITY_AVAILABLE = True
 except ImportError:
     logger.warning("Data quality modules not available. Running without validation/cleaning.")
     DATA_QUALITY_AVAILABLE = False
 
+# Import materialized rollups and the climatology index maintained alongside the raw tables
+try:
+    from backtesting_framework.data.rollups import refresh_rollups
+    from backtesting_framework.data.climatology import refresh_climatology
+    ROLLUPS_AVAILABLE = True
+except ImportError:
+    logger.warning("Rollup module not available. Aggregates will not be refreshed on ingest.")
+    ROLLUPS_AVAILABLE = False
+
 class WeatherDataIngester:
     """Handles ingestion of weather data from various sources into the database."""
 
-    def __init__(self, db_path: str = "data/climatetrade.db"):
+    def __init__(self, db_path: str = "data/climatetrade.db", batch_size: int = DEFAULT_BATCH_SIZE):
         self.db_path = db_path
+        self.batch_size = batch_size
+        self.last_directory_stats = None
         self.ensure_db_exists()
 
     def ensure_db_exists(self):
@@ -51,8 +75,26 @@ class WeatherDataIngester:
             sys.exit(1)
 
     def connect_db(self):
-        """Connect to the database."""
-        return sqlite3.connect(self.db_path)
+        """Connect to the database with bulk-load pragmas applied."""
+        conn = sqlite3.connect(self.db_path)
+        configure_connection(conn)
+        return conn
+
+    def refresh_rollups(self):
+        """Fold newly inserted rows into the hourly/daily rollups and the climatology index."""
+        if not ROLLUPS_AVAILABLE:
+            return
+
+        try:
+            refresh_rollups(self.db_path)
+        except Exception as e:
+            # Rollups are derived data; the loader falls back to raw rows
+            logger.warning(f"Failed to refresh rollups: {e}")
+
+        try:
+            refresh_climatology(self.db_path)
+        except Exception as e:
+            logger.warning(f"Failed to refresh climatology: {e}")
 
     def get_source_id(self, source_name: str, conn: sqlite3.Connection) -> int:
         """Get or create source ID for a weather source."""
@@ -204,12 +246,11 @@ class WeatherDataIngester:
             'raw_data': item.get('raw_data') if isinstance(item.get('raw_data'), str) else json.dumps(item)
         }
 
-    def insert_weather_data(self, data: List[Dict], source_name: str, conn: sqlite3.Connection) -> int:
-        """Insert weather data into the database."""
+    def insert_weather_data(self, data: List[Dict], source_name: str, conn: sqlite3.Connection) -> BatchInsertResult:
+        """Insert weather data into the database in executemany batches."""
         if not data:
-            return 0
+            return BatchInsertResult()
 
-        cursor = conn.cursor()
         source_id = self.get_source_id(source_name, conn)
 
         insert_sql = """
@@ -221,54 +262,53 @@ class WeatherDataIngester:
         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
 
-        inserted_count = 0
-        for record in data:
-            try:
-                cursor.execute(insert_sql, (
-                    source_id,
-                    record.get('location_name'),
-                    record.get('latitude'),
-                    record.get('longitude'),
-                    record.get('timestamp'),
-                    record.get('temperature'),
-                    record.get('temperature_min'),
-                    record.get('temperature_max'),
-                    record.get('feels_like'),
-                    record.get('humidity'),
-                    record.get('pressure'),
-                    record.get('wind_speed'),
-                    record.get('wind_direction'),
-                    record.get('precipitation'),
-                    record.get('weather_code'),
-                    record.get('weather_description'),
-                    record.get('visibility'),
-                    record.get('uv_index'),
-                    record.get('alerts'),
-                    record.get('raw_data')
-                ))
-                if cursor.rowcount > 0:
-                    inserted_count += 1
-            except sqlite3.Error as e:
-                logger.error(f"Error inserting weather record: {e}")
-
-        return inserted_count
-
-    def ingest_json_file(self, json_path: str, source: str, location: str, enable_quality_pipeline: bool = True) -> dict:
-        """Ingest weather data from a JSON file with optional quality processing."""
+        rows = ((
+            source_id,
+            record.get('location_name'),
+            record.get('latitude'),
+            record.get('longitude'),
+            record.get('timestamp'),
+            record.get('temperature'),
+            record.get('temperature_min'),
+            record.get('temperature_max'),
+            record.get('feels_like'),
+            record.get('humidity'),
+            record.get('pressure'),
+            record.get('wind_speed'),
+            record.get('wind_direction'),
+            record.get('precipitation'),
+            record.get('weather_code'),
+            record.get('weather_description'),
+            record.get('visibility'),
+            record.get('uv_index'),
+            record.get('alerts'),
+            record.get('raw_data')
+        ) for record in data)
+
+        def log_error(row, e):
+            logger.error(f"Error inserting weather record: {e}")
+
+        return insert_batched(conn, insert_sql, rows, self.batch_size, on_error=log_error)
+
+    def prepare_json_file(self, json_path: str, source: str, location: str, enable_quality_pipeline: bool = True) -> dict:
+        """Normalize and optionally clean a JSON file without touching the database."""
         if not Path(json_path).exists():
             raise FileNotFoundError(f"JSON file not found: {json_path}")
 
         logger.info(f"Reading JSON file: {json_path}")
+        parse_started = time.perf_counter()
 
         with open(json_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
 
         normalized_data = self.normalize_generic_weather_data(data, location, source)
 
+        parse_seconds = time.perf_counter() - parse_started
         logger.info(f"Normalized {len(normalized_data)} weather records")
 
         # Apply data quality pipeline if available and enabled
         quality_result = None
+        quality_started = time.perf_counter()
         if DATA_QUALITY_AVAILABLE and enable_quality_pipeline and normalized_data:
             logger.info("Applying data quality pipeline to weather data")
             try:
@@ -293,46 +333,114 @@ class WeatherDataIngester:
                 logger.error(f"Error in data quality pipeline: {e}")
                 logger.warning("Proceeding with original normalized data")
 
-        # Insert data into database
-        conn = self.connect_db()
-        try:
-            inserted_count = self.insert_weather_data(normalized_data, source, conn)
-            conn.commit()
-            logger.info(f"Successfully inserted {inserted_count} new weather records")
-
-            result = {
-                'file': json_path,
-                'source': source,
-                'location': location,
-                'total_records': len(normalized_data),
-                'inserted': inserted_count,
-                'duplicates': len(normalized_data) - inserted_count,
-                'quality_processed': quality_result is not None,
-                'quality_score': quality_result.get('quality_score') if quality_result else None
-            }
-
-            if quality_result:
-                result.update({
-                    'original_records': quality_result['original_records'],
-                    'processed_records': quality_result['processed_records'],
-                    'validation_errors': quality_result['validation_result'].get('invalid_records', 0),
-                    'cleaning_steps': quality_result['cleaning_result'].get('cleaning_steps', [])
-                })
+        return {
+            'file': json_path,
+            'source': source,
+            'location': location,
+            'data': normalized_data,
+            'quality_result': quality_result,
+            'parse_seconds': parse_seconds,
+            'quality_seconds': time.perf_counter() - quality_started
+        }
 
-            return result
+    def write_prepared_file(self, prepared: dict, conn: sqlite3.Connection) -> dict:
+        """Insert a prepared JSON file and commit it as one transaction."""
+        normalized_data = prepared['data']
+        quality_result = prepared['quality_result']
 
+        try:
+            insert_result = self.insert_weather_data(normalized_data, prepared['source'], conn)
+            conn.commit()
         except sqlite3.Error as e:
             logger.error(f"Database error: {e}")
             conn.rollback()
             raise
+
+        logger.info(f"Successfully inserted {insert_result.inserted} new weather records")
+
+        result = {
+            'file': prepared['file'],
+            'source': prepared['source'],
+            'location': prepared['location'],
+            'total_records': len(normalized_data),
+            'inserted': insert_result.inserted,
+            'duplicates': insert_result.duplicates,
+            'failed': insert_result.failed,
+            'quality_processed': quality_result is not None,
+            'quality_score': quality_result.get('quality_score') if quality_result else None
+        }
+
+        if quality_result:
+            result.update({
+                'original_records': quality_result['original_records'],
+                'processed_records': quality_result['processed_records'],
+                'validation_errors': quality_result['validation_result'].get('invalid_records', 0),
+                'cleaning_steps': quality_result['cleaning_result'].get('cleaning_steps', [])
+            })
+
+        return result
+
+    def ingest_json_file(self, json_path: str, source: str, location: str, enable_quality_pipeline: bool = True) -> dict:
+        """Ingest weather data from a JSON file with optional quality processing."""
+        prepared = self.prepare_json_file(json_path, source, location, enable_quality_pipeline)
+
+        conn = self.connect_db()
+        try:
+            result = self.write_prepared_file(prepared, conn)
+        finally:
+            conn.close()
+
+        if result['inserted']:
+            self.refresh_rollups()
+        return result
+
+    def _prepare_directory_file(self, json_path: str, source: str, location: Optional[str],
+                                enable_quality_pipeline: bool) -> dict:
+        """Prepare one file of a directory, naming the location after the file if not given."""
+        return self.prepare_json_file(json_path, source, location or Path(json_path).stem, enable_quality_pipeline)
+
+    def ingest_json_directory(self, directory_path: str, source: str, location: Optional[str] = None,
+                              enable_quality_pipeline: bool = True, n_jobs: int = 1) -> list:
+        """
+        Ingest all JSON dumps from a directory.
+
+        Files share one source; the location defaults to each file's name
+        without extension. With n_jobs > 1, files are normalized and cleaned
+        in a pool of worker processes while this process writes them to the
+        database one at a time. Per-stage timings are kept in
+        last_directory_stats.
+        """
+        directory = Path(directory_path)
+        if not directory.exists():
+            raise FileNotFoundError(f"Directory not found: {directory_path}")
+
+        json_files = sorted(directory.glob("*.json"))
+        if not json_files:
+            logger.warning(f"No JSON files found in {directory_path}")
+            return []
+
+        prepare = partial(self._prepare_directory_file, source=source, location=location,
+                          enable_quality_pipeline=enable_quality_pipeline)
+        conn = self.connect_db()
+        try:
+            results, self.last_directory_stats = ingest_files(
+                [str(json_file) for json_file in json_files],
+                prepare,
+                lambda prepared: self.write_prepared_file(prepared, conn),
+                n_jobs=n_jobs
+            )
         finally:
             conn.close()
 
+        if any(result['inserted'] for result in results):
+            self.refresh_rollups()
+        return results
+
 def main():
     parser = argparse.ArgumentParser(description="Ingest weather data from JSON files")
     parser.add_argument(
         "json_file",
-        help="Path to JSON file containing weather data"
+        help="Path to JSON file or directory of JSON files containing weather data"
     )
     parser.add_argument(
         "--source",
@@ -341,14 +449,25 @@ def main():
     )
     parser.add_argument(
         "--location",
-        required=True,
-        help="Location name for the weather data"
+        help="Location name for the weather data (defaults to each file's name for directories)"
     )
     parser.add_argument(
         "--db-path",
         default="data/climatetrade.db",
         help="Path to the database file"
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Rows per executemany batch"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Worker processes for normalizing and cleaning files in a directory"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -396,18 +515,32 @@ def main():
             logger.error(f"Error loading quality configuration: {e}")
             quality_config = None
 
-    ingester = WeatherDataIngester(args.db_path)
+    ingester = WeatherDataIngester(args.db_path, batch_size=args.batch_size)
 
     try:
-        result = ingester.ingest_json_file(args.json_file, args.source, args.location,
-                                         enable_quality_pipeline=enable_quality)
-        print(f"Processed {result['file']}: {result['inserted']} inserted, {result['duplicates']} duplicates")
-        print(f"Source: {result['source']}, Location: {result['location']}")
-        if result.get('quality_processed'):
-            print(f"Quality Score: {result.get('quality_score', 'N/A')}%")
-            print(f"Validation Errors: {result.get('validation_errors', 0)}")
-            if result.get('cleaning_steps'):
-                print(f"Cleaning Steps: {', '.join(result['cleaning_steps'])}")
+        if Path(args.json_file).is_dir():
+            results = ingester.ingest_json_directory(args.json_file, args.source, args.location,
+                                                     enable_quality_pipeline=enable_quality, n_jobs=args.jobs)
+            total_inserted = sum(r['inserted'] for r in results)
+            total_duplicates = sum(r['duplicates'] for r in results)
+            print(f"Processed {len(results)} files: {total_inserted} inserted, {total_duplicates} duplicates")
+            if ingester.last_directory_stats:
+                throughput = ingester.last_directory_stats.throughput()
+                print(f"Throughput (records/s): parse {throughput['parse']:.0f}, quality {throughput['quality']:.0f}, "
+                      f"write {throughput['write']:.0f}, overall {throughput['overall']:.0f}")
+        else:
+            if not args.location:
+                parser.error("--location is required when ingesting a single file")
+
+            result = ingester.ingest_json_file(args.json_file, args.source, args.location,
+                                             enable_quality_pipeline=enable_quality)
+            print(f"Processed {result['file']}: {result['inserted']} inserted, {result['duplicates']} duplicates")
+            print(f"Source: {result['source']}, Location: {result['location']}")
+            if result.get('quality_processed'):
+                print(f"Quality Score: {result.get('quality_score', 'N/A')}%")
+                print(f"Validation Errors: {result.get('validation_errors', 0)}")
+                if result.get('cleaning_steps'):
+                    print(f"Cleaning Steps: {', '.join(result['cleaning_steps'])}")
 
     except Exception as e:
         logger.error(f"Ingestion failed: {e}")
@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+"""
+Outlier Detection Module
+
+This module provides the numeric side of outlier detection for the cleaning
+stages: IQR, percentile and z-score bounds for an in-memory batch of values
+(order statistics found with np.partition rather than a full sort), a NumPy
+isolation forest for anomalies across several fields, and mergeable summaries
+(a t-digest quantile sketch and running moments) that keep bounds per market
+or location across ingestion runs without holding the values seen so far.
+"""
+
+import json
+import logging
+import math
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Fewest values each method needs before it reports outliers
+MIN_VALUES = {'iqr': 4, 'percentile': 10, 'zscore': 2}
+
+# Isolation forest scores above this are reported; ordinary points score below 0.5
+ISOLATION_FOREST_THRESHOLD = 0.6
+
+EULER_GAMMA = 0.5772156649015329
+
+
+def iqr_bounds(values: np.ndarray, multiplier: float = 1.5) -> Tuple[float, float]:
+    """Bounds multiplier * IQR beyond the quartiles.
+
+    The quartiles are the values at positions n // 4 and 3n // 4 of the sorted
+    values, as in the sort-based detector, found in linear time.
+    """
+    n = len(values)
+    q1, q3 = np.partition(values, [n // 4, 3 * n // 4])[[n // 4, 3 * n // 4]].tolist()
+    iqr = q3 - q1
+    return q1 - multiplier * iqr, q3 + multiplier * iqr
+
+
+def percentile_bounds(values: np.ndarray, lower_percentile: float = 5.0,
+                      upper_percentile: float = 95.0) -> Tuple[float, float]:
+    """Values at the lower and upper percentiles of the sorted values."""
+    n = len(values)
+    positions = [int(n * lower_percentile / 100), int(n * upper_percentile / 100)]
+    lower, upper = np.partition(values, positions)[positions].tolist()
+    return lower, upper
+
+
+def zscore_stats(values: np.ndarray) -> Tuple[float, float]:
+    """Mean and sample standard deviation of the values."""
+    return float(np.mean(values)), float(np.std(values, ddof=1))
+
+
+def outlier_mask(values: np.ndarray, method: str, **kwargs) -> Tuple[np.ndarray, Dict[str, float]]:
+    """Mask of values outside the method's bounds, with the bounds (or z-score stats).
+
+    Returns an all-False mask and empty stats when there are too few values.
+    """
+    if len(values) < MIN_VALUES[method]:
+        return np.zeros(len(values), dtype=bool), {}
+
+    if method == 'zscore':
+        mean_val, std_val = zscore_stats(values)
+        if std_val > 0:
+            mask = np.abs((values - mean_val) / std_val) > kwargs.get('threshold', 3.0)
+        else:
+            mask = np.zeros(len(values), dtype=bool)
+        return mask, {'mean': mean_val, 'std': std_val}
+
+    if method == 'iqr':
+        lower_bound, upper_bound = iqr_bounds(values, kwargs.get('multiplier', 1.5))
+    else:
+        lower_bound, upper_bound = percentile_bounds(values, kwargs.get('lower_percentile', 5.0),
+                                                     kwargs.get('upper_percentile', 95.0))
+    return (values < lower_bound) | (values > upper_bound), {'lower': lower_bound, 'upper': upper_bound}
+
+
+class RunningMoments:
+    """Count, mean and sum of squared deviations, updated a batch at a time.
+
+    Batches are combined with the parallel form of Welford's update (Chan et
+    al.), so two summaries merge exactly and no values are kept.
+    """
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def update(self, values: Iterable[float]) -> 'RunningMoments':
+        values = np.asarray(values, dtype=float)
+        if len(values):
+            batch_mean = float(np.mean(values))
+            self._combine(len(values), batch_mean, float(np.sum((values - batch_mean) ** 2)))
+        return self
+
+    def merge(self, other: 'RunningMoments') -> 'RunningMoments':
+        if other.count:
+            self._combine(other.count, other.mean, other.m2)
+        return self
+
+    def _combine(self, count: int, mean: float, m2: float):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0.0 below two values)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'count': self.count, 'mean': self.mean, 'm2': self.m2}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'RunningMoments':
+        return cls(state['count'], state['mean'], state['m2'])
+
+
+class TDigest:
+    """Mergeable quantile sketch (a merging t-digest).
+
+    Values are summarized by weighted centroids: small near the tails and
+    larger around the median, under the arcsine scale function, so the
+    quantiles outlier bounds use (quartiles, 5th and 95th percentiles) stay
+    accurate while the sketch holds at most about `compression` centroids.
+    Batches are sorted into the centroids with NumPy, and merging two digests
+    re-compresses their centroids together, so per-run digests combine in
+    any order.
+    """
+
+    def __init__(self, compression: float = 200.0):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = math.inf
+        self.max = -math.inf
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    def update(self, values: Iterable[float]) -> 'TDigest':
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if len(values):
+            self.min = min(self.min, float(values.min()))
+            self.max = max(self.max, float(values.max()))
+            self._compress(np.concatenate([self.means, values]),
+                           np.concatenate([self.weights, np.ones(len(values))]))
+        return self
+
+    def merge(self, other: 'TDigest') -> 'TDigest':
+        if len(other.means):
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+            self._compress(np.concatenate([self.means, other.means]),
+                           np.concatenate([self.weights, other.weights]))
+        return self
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray):
+        """Merge centroids whose midpoints share a unit of the scale function."""
+        order = np.argsort(means, kind='stable')
+        means, weights = means[order], weights[order]
+        cumulative = np.cumsum(weights)
+        midpoints = (cumulative - weights / 2) / cumulative[-1]
+        scale = self.compression * (np.arcsin(2 * midpoints - 1) / np.pi + 0.5)
+        groups = np.floor(scale)
+
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    def quantile(self, q: float) -> float:
+        return float(self.quantiles([q])[0])
+
+    def quantiles(self, qs: Iterable[float]) -> np.ndarray:
+        """Estimated values at quantiles qs (NaN for an empty digest)."""
+        qs = np.asarray(qs, dtype=float)
+        if not len(self.means):
+            return np.full(len(qs), np.nan)
+        cumulative = np.cumsum(self.weights)
+        centers = cumulative - self.weights / 2
+        positions = np.r_[0.0, centers, cumulative[-1]]
+        values = np.r_[self.min, self.means, self.max]
+        return np.interp(qs * cumulative[-1], positions, values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'compression': self.compression, 'means': self.means.tolist(),
+                'weights': self.weights.tolist(), 'min': self.min, 'max': self.max}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'TDigest':
+        digest = cls(state['compression'])
+        digest.means = np.asarray(state['means'], dtype=float)
+        digest.weights = np.asarray(state['weights'], dtype=float)
+        digest.min, digest.max = state['min'], state['max']
+        return digest
+
+
+def _average_path_length(n: np.ndarray) -> np.ndarray:
+    """Average path length of an unsuccessful binary search tree lookup among n points."""
+    n = np.asarray(n, dtype=float)
+    lengths = np.zeros_like(n)
+    large = n > 2
+    lengths[n == 2] = 1.0
+    lengths[large] = (2.0 * (np.log(n[large] - 1.0) + EULER_GAMMA)
+                      - 2.0 * (n[large] - 1.0) / n[large])
+    return lengths
+
+
+class IsolationForest:
+    """Isolation forest (Liu, Ting and Zhou, 2008) in NumPy.
+
+    Each tree splits a random subsample on a random field at a uniform random
+    threshold until points are isolated or the height limit log2(sample_size)
+    is reached. Anomalies are isolated in fewer splits, so a point's score,
+    2 ** (-mean path length / c(sample_size)), approaches 1 for anomalies and
+    stays below 0.5 for ordinary points. Trees are stored as arrays in heap
+    order (children of node i are 2i + 1 and 2i + 2) and all trees are grown
+    and traversed together, one level per step.
+    """
+
+    def __init__(self, n_trees: int = 100, sample_size: int = 256, random_state: Optional[int] = 0):
+        self.n_trees = n_trees
+        self.sample_size = sample_size
+        self.random_state = random_state
+
+    def fit(self, X: np.ndarray) -> 'IsolationForest':
+        X = np.asarray(X, dtype=float)
+        n_points, n_fields = X.shape
+        rng = np.random.default_rng(self.random_state)
+
+        self.sample_size_ = min(self.sample_size, n_points)
+        self.height_ = max(int(math.ceil(math.log2(max(self.sample_size_, 2)))), 1)
+        n_nodes = 2 ** (self.height_ + 1) - 1
+        self.feature_ = np.zeros((self.n_trees, n_nodes), dtype=np.intp)
+        self.threshold_ = np.zeros((self.n_trees, n_nodes))
+        self.leaf_ = np.ones((self.n_trees, n_nodes), dtype=bool)
+
+        samples = np.stack([rng.choice(n_points, self.sample_size_, replace=False)
+                            for _ in range(self.n_trees)])
+        points = X[samples].reshape(-1, n_fields)
+        trees = np.repeat(np.arange(self.n_trees), self.sample_size_)
+        nodes = np.zeros(len(points), dtype=np.intp)
+
+        for depth in range(self.height_):
+            # Points still in a node at this depth (the rest sit in earlier leaves)
+            active = np.flatnonzero(nodes >= 2 ** depth - 1)
+            if not len(active):
+                break
+            keys = trees[active] * n_nodes + nodes[active]
+            order = np.argsort(keys, kind='stable')
+            active, keys = active[order], keys[order]
+            starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+            lows = np.minimum.reduceat(points[active], starts, axis=0)
+            highs = np.maximum.reduceat(points[active], starts, axis=0)
+
+            splittable = highs > lows
+            split = splittable.any(axis=1)
+            if not split.any():
+                break
+            # A random field among those that still vary within the node
+            fields = np.where(splittable, rng.random(splittable.shape), -1.0).argmax(axis=1)[split]
+            low = lows[split, fields]
+            thresholds = low + rng.random(len(fields)) * (highs[split, fields] - low)
+            split_trees, split_nodes = np.divmod(keys[starts][split], n_nodes)
+            self.feature_[split_trees, split_nodes] = fields
+            self.threshold_[split_trees, split_nodes] = thresholds
+            self.leaf_[split_trees, split_nodes] = False
+
+            moving = active[~self.leaf_[trees[active], nodes[active]]]
+            node = nodes[moving]
+            right = (points[moving, self.feature_[trees[moving], node]]
+                     >= self.threshold_[trees[moving], node])
+            nodes[moving] = 2 * node + 1 + right
+
+        # Flattened for scoring: leaves lead back to themselves (their threshold is
+        # infinite) and carry their depth plus the expected depth below them
+        sizes = np.bincount(trees * n_nodes + nodes, minlength=self.n_trees * n_nodes)
+        offsets = (np.arange(self.n_trees) * n_nodes)[:, None]
+        local = np.arange(n_nodes)[None, :]
+        internal = ~self.leaf_
+        # Children of flat node i are at 2i (left) and 2i + 1 (right)
+        self._children = np.stack([np.where(internal, offsets + 2 * local + 1, offsets + local),
+                                   np.where(internal, offsets + 2 * local + 2, offsets + local)],
+                                  axis=-1).ravel()
+        self._feature = self.feature_.ravel()
+        self._threshold = np.where(internal, self.threshold_, np.inf).ravel()
+        self._path_length = (np.floor(np.log2(local + 1)) + _average_path_length(sizes).reshape(
+            self.n_trees, n_nodes)).ravel()
+        return self
+
+    def path_lengths(self, X: np.ndarray, chunk_size: int = 1 << 18) -> np.ndarray:
+        """Mean path length of each point over the trees."""
+        X = np.asarray(X, dtype=float)
+        lengths = np.empty(len(X))
+        roots = np.arange(self.n_trees)[:, None] * len(self.leaf_[0])
+        step = max(chunk_size // self.n_trees, 1)
+        for start in range(0, len(X), step):
+            chunk = X[start:start + step]
+            values = np.ascontiguousarray(chunk.T).ravel()  # field-major, so field * n + point
+            columns = np.arange(len(chunk))
+            nodes = np.repeat(roots, len(chunk), axis=1)
+            for _ in range(self.height_):
+                right = values[self._feature[nodes] * len(chunk) + columns] >= self._threshold[nodes]
+                nodes = self._children[2 * nodes + right]
+            lengths[start:start + step] = self._path_length[nodes].mean(axis=0)
+        return lengths
+
+    def score_samples(self, X: np.ndarray) -> np.ndarray:
+        """Anomaly scores in (0, 1]; higher is more anomalous."""
+        normalizer = _average_path_length(np.array([self.sample_size_]))[0] or 1.0
+        return 2.0 ** (-self.path_lengths(X) / normalizer)
+
+
+def isolation_forest_scores(X: np.ndarray, n_trees: int = 100, sample_size: int = 256,
+                            random_state: Optional[int] = 0) -> np.ndarray:
+    """Scores of rows of X from a forest fit on X itself."""
+    return IsolationForest(n_trees, sample_size, random_state).fit(X).score_samples(X)
+
+
+class FieldSummary:
+    """Quantile sketch and running moments of one field's values."""
+
+    def __init__(self, digest: TDigest = None, moments: RunningMoments = None, compression: float = 200.0):
+        self.digest = digest or TDigest(compression)
+        self.moments = moments or RunningMoments()
+
+    def update(self, values: np.ndarray):
+        self.digest.update(values)
+        self.moments.update(values)
+
+    def merge(self, other: 'FieldSummary'):
+        self.digest.merge(other.digest)
+        self.moments.merge(other.moments)
+
+    def bounds(self, method: str, **kwargs) -> Optional[Tuple[float, float]]:
+        """Lower and upper bounds for the method; None with too few values."""
+        if self.moments.count < MIN_VALUES[method]:
+            return None
+        if method == 'zscore':
+            std_val = self.moments.std
+            if std_val <= 0:
+                return None
+            spread = kwargs.get('threshold', 3.0) * std_val
+            return self.moments.mean - spread, self.moments.mean + spread
+        if method == 'iqr':
+            q1, q3 = self.digest.quantiles([0.25, 0.75])
+            spread = kwargs.get('multiplier', 1.5) * (q3 - q1)
+            return float(q1 - spread), float(q3 + spread)
+        lower, upper = self.digest.quantiles([kwargs.get('lower_percentile', 5.0) / 100,
+                                              kwargs.get('upper_percentile', 95.0) / 100])
+        return float(lower), float(upper)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'digest': self.digest.to_dict(), 'moments': self.moments.to_dict()}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'FieldSummary':
+        return cls(TDigest.from_dict(state['digest']), RunningMoments.from_dict(state['moments']))
+
+
+class StreamingOutlierDetector:
+    """Outlier bounds per group (market, location) maintained across batches.
+
+    Each group keeps a FieldSummary per field, so bounds reflect every batch
+    seen so far without keeping the values. IQR and percentile bounds come
+    from the t-digest quantiles and z-score bounds from the running mean and
+    standard deviation. The state serializes to JSON between ingestion runs,
+    and detectors built on different shards merge.
+    """
+
+    def __init__(self, method: str = 'iqr', fields: List[str] = None, group_field: Optional[str] = None,
+                 compression: float = 200.0, **kwargs):
+        if method not in MIN_VALUES:
+            raise ValueError(f"Unknown method: {method}")
+        self.method = method
+        self.fields = fields or []
+        self.group_field = group_field
+        self.compression = compression
+        self.options = kwargs
+        self.summaries: Dict[Any, Dict[str, FieldSummary]] = {}
+
+    def _numbers_by_group(self, data: List[Dict]) -> Dict[Any, Dict[str, Tuple[List[int], List[float]]]]:
+        """Record indices and numeric values of each field, by group."""
+        grouped = defaultdict(lambda: {field: ([], []) for field in self.fields})
+        group_field = self.group_field
+        for i, record in enumerate(data):
+            columns = grouped[record.get(group_field) if group_field else None]
+            for field in self.fields:
+                value = record.get(field)
+                if value is not None and isinstance(value, (int, float)):
+                    indices, values = columns[field]
+                    indices.append(i)
+                    values.append(value)
+        return grouped
+
+    def update(self, data: List[Dict]) -> 'StreamingOutlierDetector':
+        """Fold a batch of records into the group summaries."""
+        for group, columns in self._numbers_by_group(data).items():
+            self._fold(group, columns)
+        return self
+
+    def _fold(self, group: Any, columns: Dict[str, Tuple[List[int], List[float]]]):
+        summaries = self.summaries.setdefault(group, {})
+        for field, (_, values) in columns.items():
+            if values:
+                summaries.setdefault(field, FieldSummary(compression=self.compression)).update(
+                    np.asarray(values, dtype=float))
+
+    def bounds(self, group: Any = None) -> Dict[str, Tuple[float, float]]:
+        """Current bounds of each field of a group with enough values."""
+        bounds = {}
+        for field, summary in self.summaries.get(group, {}).items():
+            field_bounds = summary.bounds(self.method, **self.options)
+            if field_bounds is not None:
+                bounds[field] = field_bounds
+        return bounds
+
+    def detect_outliers(self, data: List[Dict], update: bool = True) -> Dict:
+        """Outliers in a batch against each group's bounds.
+
+        With update (the default) the batch is folded in first, as batch
+        detection counts the batch itself; otherwise it is checked against
+        earlier batches only. Same result layout as OutlierDetector.
+        """
+        outliers = []
+        all_bounds = {}
+        for group, columns in self._numbers_by_group(data).items():
+            if update:
+                self._fold(group, columns)
+            group_bounds = self.bounds(group)
+            all_bounds[group] = {field: {'lower': lower, 'upper': upper}
+                                 for field, (lower, upper) in group_bounds.items()}
+            for field, (lower, upper) in group_bounds.items():
+                indices, values = columns[field]
+                if not values:
+                    continue
+                array = np.asarray(values, dtype=float)
+                for position in np.flatnonzero((array < lower) | (array > upper)).tolist():
+                    outliers.append({
+                        'index': indices[position],
+                        'group': group,
+                        'field': field,
+                        'value': values[position],
+                        'bounds': (lower, upper)
+                    })
+
+        outliers.sort(key=lambda outlier: outlier['index'])
+        return {
+            'outliers': outliers,
+            'bounds': all_bounds,
+            'method': self.method,
+            'total_outliers': len(outliers)
+        }
+
+    def merge(self, other: 'StreamingOutlierDetector') -> 'StreamingOutlierDetector':
+        """Fold another detector's summaries (e.g. from another shard) into this one."""
+        for group, summaries in other.summaries.items():
+            mine = self.summaries.setdefault(group, {})
+            for field, summary in summaries.items():
+                mine.setdefault(field, FieldSummary(compression=self.compression)).merge(summary)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable state; groups are keyed by their JSON encoding."""
+        return {
+            'method': self.method,
+            'fields': self.fields,
+            'group_field': self.group_field,
+            'compression': self.compression,
+            'options': self.options,
+            'summaries': {json.dumps(group): {field: summary.to_dict() for field, summary in summaries.items()}
+                          for group, summaries in self.summaries.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'StreamingOutlierDetector':
+        detector = cls(state['method'], state['fields'], state['group_field'], state['compression'],
+                       **state['options'])
+        detector.summaries = {json.loads(group): {field: FieldSummary.from_dict(summary)
+                                                  for field, summary in summaries.items()}
+                              for group, summaries in state['summaries'].items()}
+        return detector
+
+    def save(self, path: str):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> 'StreamingOutlierDetector':
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for Batched Bulk Insertion
+
+Covers inserted/duplicate accounting, the row-by-row fallback for failing
+batches, the connection pragmas applied for bulk loads and the counts the
+ingesters report from a real database.
+"""
+
+import pytest
+import sqlite3
+from pathlib import Path
+
+from ..bulk_insert import BatchInsertResult, configure_connection, insert_batched, iter_batches
+from ..ingest_polymarket import PolymarketDataIngester
+
+
+INSERT_SQL = "INSERT OR IGNORE INTO prices (market_id, timestamp, probability) VALUES (?, ?, ?)"
+
+
+@pytest.fixture
+def conn(tmp_path):
+    connection = sqlite3.connect(str(tmp_path / 'bulk.db'))
+    connection.execute("""
+        CREATE TABLE prices (
+            market_id TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            probability REAL,
+            UNIQUE(market_id, timestamp)
+        )
+    """)
+    yield connection
+    connection.close()
+
+
+def _rows(n, market_id='m1'):
+    return [(market_id, f'2024-01-01T{i // 60:02d}:{i % 60:02d}:00Z', 0.5) for i in range(n)]
+
+
+class TestBulkInsert:
+    """Test cases for insert_batched"""
+
+    def test_iter_batches(self):
+        """Rows are split into batches of at most batch_size"""
+        assert [len(b) for b in iter_batches(iter(range(7)), 3)] == [3, 3, 1]
+        assert list(iter_batches([], 3)) == []
+
+    def test_counts_inserted_and_duplicates(self, conn):
+        """Rows ignored by the uniqueness constraint count as duplicates"""
+        insert_batched(conn, INSERT_SQL, _rows(50), batch_size=20)
+        conn.commit()
+
+        result = insert_batched(conn, INSERT_SQL, _rows(120), batch_size=20)
+        conn.commit()
+
+        assert result == BatchInsertResult(inserted=70, duplicates=50, failed=0, batches=6, fallback_batches=0)
+        assert conn.execute("SELECT COUNT(*) FROM prices").fetchone()[0] == 120
+
+    def test_failed_batch_falls_back_to_rows(self, conn):
+        """Only the failing batch is replayed row by row, keeping its valid rows"""
+        rows = _rows(30)
+        rows[25] = ('m1', 'bad', [0.5])  # can't be bound as a parameter
+        errors = []
+
+        result = insert_batched(conn, INSERT_SQL, rows, batch_size=10, on_error=lambda row, e: errors.append(row))
+        conn.commit()
+
+        assert result.inserted == 29
+        assert result.failed == 1
+        assert result.fallback_batches == 1
+        assert result.total == 30
+        assert errors == [('m1', 'bad', [0.5])]
+        assert conn.execute("SELECT COUNT(*) FROM prices").fetchone()[0] == 29
+
+    def test_single_transaction(self, conn):
+        """Batches are left uncommitted for the caller"""
+        insert_batched(conn, INSERT_SQL, _rows(25), batch_size=10)
+        assert conn.in_transaction
+
+        conn.rollback()
+        assert conn.execute("SELECT COUNT(*) FROM prices").fetchone()[0] == 0
+
+    def test_invalid_batch_size(self, conn):
+        with pytest.raises(ValueError):
+            insert_batched(conn, INSERT_SQL, _rows(1), batch_size=0)
+
+    def test_configure_connection(self, conn):
+        """Bulk-load pragmas switch the database to WAL"""
+        configure_connection(conn)
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+
+class TestIngesterInsert:
+    """Test cases for the insert results returned by the ingesters"""
+
+    @pytest.fixture
+    def ingester(self, tmp_path):
+        db_path = str(tmp_path / 'pipeline.db')
+        schema = (Path(__file__).parent.parent / 'schema.sql').read_text()
+        with sqlite3.connect(db_path) as connection:
+            connection.executescript(schema)
+        return PolymarketDataIngester(db_path, batch_size=4)
+
+    @staticmethod
+    def _records(hours, probability=0.5):
+        return [{'event_title': 'Rain in London?', 'event_url': '', 'market_id': 'rain-london',
+                 'outcome_name': 'Yes', 'probability': probability, 'volume': 100.0,
+                 'timestamp': f'2024-01-01T{hour:02d}:00:00Z', 'scraped_at': '2024-01-02T00:00:00Z'}
+                for hour in hours]
+
+    def test_insert_polymarket_data_counts(self, ingester):
+        """Inserted, duplicate and failed rows are counted against the real schema"""
+        connection = ingester.connect_db()
+        try:
+            first = ingester.insert_polymarket_data(self._records(range(6)), connection)
+            connection.commit()
+
+            records = self._records(range(10))
+            records[8]['probability'] = [0.5]  # can't be bound as a parameter
+            second = ingester.insert_polymarket_data(records, connection)
+            connection.commit()
+
+            stored = connection.execute("SELECT COUNT(*) FROM polymarket_data").fetchone()[0]
+        finally:
+            connection.close()
+
+        assert (first.inserted, first.duplicates, first.failed) == (6, 0, 0)
+        assert (second.inserted, second.duplicates, second.failed) == (3, 6, 1)
+        assert second.fallback_batches == 1
+        assert stored == 9
+
+    def test_write_prepared_file_reports_counts(self, ingester):
+        """write_prepared_file reports the counts of its own insert"""
+        connection = ingester.connect_db()
+        try:
+            ingester.write_prepared_file({'file': 'a.csv', 'data': self._records(range(5)), 'quality_result': None},
+                                         connection)
+            result = ingester.write_prepared_file({'file': 'b.csv', 'data': self._records(range(3, 8)),
+                                                   'quality_result': None}, connection)
+        finally:
+            connection.close()
+
+        assert (result['total_rows'], result['inserted'], result['duplicates'], result['failed']) == (5, 3, 2, 0)
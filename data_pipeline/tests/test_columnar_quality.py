@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Tests for the Columnar Data Quality Pipeline
+
+Runs messy Polymarket and weather batches through the pipeline in both
+execution modes and checks the columnar stages give the same validation
+results, cleaned records and quality metrics as the record-at-a-time ones,
+and that the compiled validator reports the same failing records.
+Timestamps are in 2024, so timeliness penalties are capped and the scores
+don't depend on the clock.
+"""
+
+import copy
+import math
+import random
+import statistics
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ..columnar_quality import ColumnBatch, CompiledValidator, exact_mean
+from ..data_quality_pipeline import DataQualityPipeline, DataSource
+from ..data_validation import DataValidator, PolymarketDataValidator, WeatherDataValidator
+
+RESULT_KEYS = ('success', 'error', 'original_records', 'processed_records', 'quality_score',
+               'pipeline_stages', 'validation_result', 'quality_result', 'cleaned_data')
+
+
+def _polymarket(n, seed=0):
+    rng = random.Random(seed)
+    records = []
+    for i in range(n):
+        record = {
+            'event_title': rng.choice(['Rain? ', ' Snow', 'Heat']),
+            'market_id': rng.choice(['m-1', 'm-2', 'bad id', 'm-3\n']),
+            'outcome_name': rng.choice(['Yes', 'No', '  ']),
+            'probability': rng.choice([rng.random(), None, 1.5, 0.3, True, 1]),
+            'volume': rng.choice([rng.random() * 1e4, None, -5.0, 100, 1e9]),
+            'timestamp': rng.choice(['2024-01-0%dT12:00:00Z' % (i % 9 + 1), '2024-01-01 10:00:00',
+                                     '2024/01/01', 'bad', '2024-01-02']),
+            'scraped_at': rng.choice(['2024-01-01T12:30:00Z', '2024-01-01T12:30:00+0000',
+                                      '2099-01-01T00:00:00Z'])
+        }
+        if rng.random() < 0.1:
+            del record['volume']
+        if rng.random() < 0.02:
+            del record['event_title']
+        records.append(record)
+    return records
+
+
+def _weather(n, seed=0):
+    rng = random.Random(seed)
+    records = []
+    for _ in range(n):
+        record = {
+            'location_name': rng.choice(['London ', ' Paris', '']),
+            'latitude': rng.choice([51.5074123, 0.0, 95.0, None, 48]),
+            'longitude': rng.choice([-0.1278, 0.0, 2.35, 200]),
+            'timestamp': rng.choice(['2024-01-01T12:00:00Z', '2024-01-01', 'x']),
+            'temperature': rng.choice([rng.gauss(15, 5), None, 80.0, 12, rng.gauss(15, 5)]),
+            'humidity': rng.choice([50, 72.5, None, 120]),
+            'wind_speed': rng.choice([0, 3.5, None, 10.0]),
+            'pressure': rng.choice([1013.2, 700.0, None])
+        }
+        if rng.random() < 0.5:
+            record['wind_direction'] = rng.choice([None, 180.0])
+        if rng.random() < 0.2:
+            record['temperature_min'] = rng.choice([10.0, 30.0])
+            record['temperature_max'] = rng.choice([20.0, 5.0])
+        if rng.random() < 0.1:
+            record['weather_code'] = rng.choice([800, '801', 'x'])
+        if rng.random() < 0.1:
+            record['raw_data'] = rng.choice(['{"a": 1}', '{bad', ''])
+        records.append(record)
+    return records
+
+
+def _same(a, b):
+    """Equal, with matching types and NaN equal to NaN"""
+    if isinstance(a, float) and isinstance(b, float):
+        return a == b or (math.isnan(a) and math.isnan(b))
+    if isinstance(a, dict):
+        return isinstance(b, dict) and a.keys() == b.keys() and all(_same(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return isinstance(b, list) and len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    return type(a) == type(b) and a == b
+
+
+def _run_both(source, records, cleaning_config):
+    config = DataQualityPipeline(source)._get_default_config()
+    config['cleaning_config'] = cleaning_config
+    expected = DataQualityPipeline(source, dict(config)).process_data(copy.deepcopy(records))
+    config['execution_mode'] = 'columnar'
+    actual = DataQualityPipeline(source, dict(config)).process_data(copy.deepcopy(records))
+    return expected, actual
+
+
+class TestColumnBatch:
+    """Test cases for ColumnBatch"""
+
+    def test_records_round_trip(self):
+        """Missing keys stay missing and values keep their types"""
+        records = [{'a': 1, 'b': 'x'}, {'a': None, 'c': (1, 2)}, {'b': [3], 'a': 2.5}]
+        batch = ColumnBatch.from_records(records)
+
+        assert batch.keys() == ['a', 'b', 'c']
+        assert batch.to_records() == records
+        assert batch.record(1) == records[1]
+        assert batch.take(np.array([2, 0])).to_records() == [records[2], records[0]]
+
+    def test_from_frame(self):
+        """Missing cells become None and datetimes become ISO strings"""
+        frame = pd.DataFrame({'value': [1.5, np.nan],
+                              'timestamp': pd.to_datetime(['2024-01-01 12:00', None], utc=True)})
+        assert ColumnBatch.from_frame(frame).to_records() == [
+            {'value': 1.5, 'timestamp': '2024-01-01T12:00:00Z'},
+            {'value': None, 'timestamp': None}
+        ]
+
+    def test_exact_mean(self):
+        """Same correctly rounded result as statistics.mean"""
+        rng = np.random.default_rng(0)
+        for values in (rng.normal(size=1001), rng.lognormal(10, 5, size=500), np.array([1e16, 1.0, -1e16]),
+                       np.array([0.1] * 10), np.array([5e-324, 1e308, -1e308])):
+            assert exact_mean(values) == statistics.mean(values.tolist())
+
+
+class TestColumnarPipeline:
+    """Test cases for the columnar execution mode of DataQualityPipeline"""
+
+    @pytest.mark.parametrize('strategy', ['mean', 'median', 'mode', 'forward_fill', 'backward_fill',
+                                          'interpolate', 'constant', 'drop'])
+    @pytest.mark.parametrize('method', ['iqr', 'zscore', 'percentile', 'isolation_forest'])
+    @pytest.mark.parametrize('source,generate', [(DataSource.POLYMARKET, _polymarket),
+                                                 (DataSource.WEATHER, _weather)])
+    def test_matches_records(self, source, generate, strategy, method):
+        """Same report and cleaned records as the record-at-a-time stages"""
+        expected, actual = _run_both(source, generate(300, seed=len(strategy) + len(method)), {
+            'missing_strategy': strategy, 'outlier_method': method, 'remove_outliers': True})
+
+        assert expected['success']
+        for key in RESULT_KEYS:
+            assert _same(expected.get(key), actual.get(key)), key
+
+    def test_default_config_matches(self):
+        """Default cleaning (detect outliers only) gives the same results"""
+        expected, actual = _run_both(DataSource.WEATHER, _weather(200),
+                                     DataQualityPipeline(DataSource.WEATHER).config['cleaning_config'])
+        for key in RESULT_KEYS:
+            assert _same(expected.get(key), actual.get(key)), key
+
+    def test_record_errors_match(self):
+        """Records the validator raises on fail the pipeline the same way"""
+        records = _polymarket(50)
+        records[10]['probability'] = '0.4'  # Type errors raise in the record validator
+        expected, actual = _run_both(DataSource.POLYMARKET, records, {})
+
+        assert not expected['success']
+        assert (actual['success'], actual['error']) == (expected['success'], expected['error'])
+
+    def test_dataframe_input(self):
+        """A DataFrame runs columnar and gets a DataFrame back"""
+        records = [r for r in _polymarket(200) if 'volume' in r and 'event_title' in r]
+        pipeline = DataQualityPipeline(DataSource.POLYMARKET)
+        expected, _ = _run_both(DataSource.POLYMARKET, records, pipeline.config['cleaning_config'])
+        actual = pipeline.process_data(pd.DataFrame(records))
+
+        assert isinstance(actual['cleaned_data'], pd.DataFrame)
+        assert actual['quality_score'] == expected['quality_score']
+        assert actual['validation_result']['valid_records'] == expected['validation_result']['valid_records']
+        pd.testing.assert_frame_equal(actual['cleaned_data'], pd.DataFrame(expected['cleaned_data']),
+                                      check_like=True, check_dtype=False)
+
+    def test_unknown_strategy(self):
+        """Unknown strategies fail the pipeline with the same error"""
+        expected, actual = _run_both(DataSource.WEATHER, _weather(20), {'missing_strategy': 'guess'})
+        assert not actual['success']
+        assert actual['error'] == expected['error'] == 'Unknown strategy: guess'
+
+
+class TestCompiledValidator:
+    """Test cases for CompiledValidator"""
+
+    @pytest.mark.parametrize('validator_class,generate', [(PolymarketDataValidator, _polymarket),
+                                                          (WeatherDataValidator, _weather)])
+    def test_matches_validate_batch(self, validator_class, generate):
+        """Same results as validate_batch for the records with errors or warnings"""
+        records = generate(500, seed=3)
+        expected = validator_class().validate_batch(copy.deepcopy(records))
+        actual = CompiledValidator(validator_class()).validate(records)
+
+        assert actual['results'] == [r for r in expected['results'] if r['errors'] or r['warnings']]
+        assert (actual['valid_records'], actual['invalid_records']) == (expected['valid_records'],
+                                                                        expected['invalid_records'])
+
+    def test_early_return_and_fallback(self):
+        """Later checks are skipped after a failed stage; values the rules can't describe go to validate_record"""
+        records = [
+            {'location_name': ' ', 'timestamp': 'bad', 'temperature': 99.0},
+            {'location_name': 'A', 'timestamp': 'bad', 'temperature_min': 5, 'temperature_max': 1},
+            {'location_name': 'A', 'timestamp': '2024-01-01', 'latitude': 0, 'longitude': 0.0, 'wind_speed': 2},
+            {'location_name': 'A', 'timestamp': 0, 'temperature': float('nan')},
+            {'location_name': 'A', 'timestamp': '2024-01-01', 'humidity': 50}
+        ]
+        expected = WeatherDataValidator().validate_batch(copy.deepcopy(records))
+        actual = CompiledValidator(WeatherDataValidator()).validate(records)
+
+        assert [r['index'] for r in actual['results']] == [0, 1, 2, 3]
+        assert actual['results'] == expected['results'][:4]
+        assert actual['results'][0]['errors'] == ["Field 'location_name': Required field is empty or null"]
+
+    def test_rule_timings(self):
+        compiled = CompiledValidator(PolymarketDataValidator())
+        result = compiled.validate(pd.DataFrame(_polymarket(50)))
+
+        assert result['rule_timings'] is compiled.rule_timings
+        assert {'columns', 'required:market_id', 'type:volume', 'range:probability', 'timestamp:scraped_at',
+                'market_id', 'scraped_at_future', 'messages', 'record_fallback'} <= set(result['rule_timings'])
+        assert all(seconds >= 0 for seconds in result['rule_timings'].values())
+
+    def test_unsupported_validator(self):
+        with pytest.raises(ValueError):
+            CompiledValidator(DataValidator())
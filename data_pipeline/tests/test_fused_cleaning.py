@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for Fused Cleaning
+
+Checks that clean_data, which runs all cleaning stages in one pass over the
+records, gives the same records as running DataNormalizer, MissingValueHandler
+and OutlierDetector over the whole batch one after another, and leaves its
+input untouched.
+"""
+
+import copy
+
+import pytest
+
+from ..data_cleaning import FusedCleaner, PolymarketDataCleaner, WeatherDataCleaner
+from .test_columnar_quality import _polymarket, _same, _weather
+
+
+def _clean_staged(cleaner, data, config, coordinates):
+    normalizer = cleaner.normalizer
+    cleaned_data = normalizer.normalize_timestamps(data.copy())
+    cleaned_data = normalizer.normalize_numeric_fields(cleaned_data)
+    cleaned_data = normalizer.normalize_text_fields(cleaned_data)
+    if coordinates:
+        cleaned_data = normalizer.normalize_coordinates(cleaned_data)
+    cleaned_data = cleaner.missing_handler.handle_missing_values(
+        cleaned_data, config['missing_strategy'], config['missing_fields'])
+    outliers = cleaner.outlier_detector.detect_outliers(cleaned_data, config['outlier_method'],
+                                                        config['outlier_fields'])
+    if config['remove_outliers']:
+        outlier_indices = {o['index'] for o in outliers['outliers']}
+        cleaned_data = [r for i, r in enumerate(cleaned_data) if i not in outlier_indices]
+    return cleaned_data
+
+
+class TestFusedCleaning:
+    """Test cases for FusedCleaner through clean_data"""
+
+    @pytest.mark.parametrize('strategy', ['mean', 'median', 'mode', 'forward_fill', 'backward_fill',
+                                          'interpolate', 'constant', 'drop'])
+    @pytest.mark.parametrize('method', ['iqr', 'zscore', 'percentile', 'isolation_forest'])
+    @pytest.mark.parametrize('cleaner_class,generate,coordinates', [
+        (PolymarketDataCleaner, _polymarket, False),
+        (WeatherDataCleaner, _weather, True)
+    ])
+    def test_matches_staged(self, cleaner_class, generate, coordinates, strategy, method):
+        """Same records as running the stages one after another"""
+        data = generate(250, seed=len(strategy) * 7 + len(method))
+        original = copy.deepcopy(data)
+        config = cleaner_class()._get_default_config()
+        config.update(missing_strategy=strategy, outlier_method=method, remove_outliers=True)
+
+        expected = _clean_staged(cleaner_class(), copy.deepcopy(data), config, coordinates)
+        result = cleaner_class().clean_data(data, config)
+
+        assert _same(result['cleaned_data'], expected)
+        assert result['cleaned_count'] == len(expected)
+        assert _same(data, original)
+
+    def test_steps_and_detection_only(self):
+        """Detection without removal keeps every record and reports the same steps"""
+        data = _weather(100)
+        config = WeatherDataCleaner()._get_default_config()
+        expected = _clean_staged(WeatherDataCleaner(), copy.deepcopy(data), config, True)
+        result = WeatherDataCleaner().clean_data(data, config)
+
+        assert _same(result['cleaned_data'], expected)
+        assert result['cleaning_steps'] == ['format_normalization', 'missing_values_interpolate',
+                                            'outlier_detection_zscore']
+
+    def test_records_copied_once(self):
+        """Cleaned records are new dicts, one per kept input record"""
+        data = _polymarket(50)
+        cleaned = PolymarketDataCleaner().clean_data(data, {'missing_strategy': 'mean'})['cleaned_data']
+        assert len(cleaned) == len(data)
+        assert not {id(r) for r in cleaned} & {id(r) for r in data}
+
+    def test_unknown_strategy_and_method(self):
+        cleaner = PolymarketDataCleaner()
+        fused = FusedCleaner(cleaner.normalizer, cleaner.missing_handler, cleaner.outlier_detector)
+        with pytest.raises(ValueError, match="Unknown strategy: guess"):
+            fused.clean(_polymarket(5), missing_strategy='guess')
+        with pytest.raises(ValueError, match="Unknown method: guess"):
+            fused.clean(_polymarket(5), outlier_method='guess')
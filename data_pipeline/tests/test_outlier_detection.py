@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Tests for Outlier Detection
+
+Checks batch bounds against the sort-based definitions, the accuracy and
+merging of the t-digest and running moments, the isolation forest on planted
+anomalies, and streaming bounds kept per group across saved runs.
+"""
+
+import random
+import statistics
+
+import numpy as np
+import pytest
+
+from ..data_cleaning import OutlierDetector
+from ..outlier_detection import (
+    IsolationForest,
+    RunningMoments,
+    StreamingOutlierDetector,
+    TDigest,
+    isolation_forest_scores
+)
+
+
+def _mixed_records(n, seed=0):
+    rng = random.Random(seed)
+    return [{'value': rng.choice([rng.gauss(0, 1), rng.gauss(0, 1) * 50, None, 7, True, 'x']),
+             'other': rng.choice([rng.random(), None])} for _ in range(n)]
+
+
+def _sorted_bounds(values, method):
+    ordered = sorted(values)
+    n = len(ordered)
+    if method == 'iqr':
+        q1, q3 = ordered[n // 4], ordered[3 * n // 4]
+        return q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+    return ordered[int(n * 0.05)], ordered[int(n * 0.95)]
+
+
+class TestBatchBounds:
+    """Test cases for OutlierDetector bounds"""
+
+    @pytest.mark.parametrize('method', ['iqr', 'percentile'])
+    @pytest.mark.parametrize('n', [3, 4, 10, 11, 997])
+    def test_matches_sorted_values(self, method, n):
+        """Same bounds and outliers as sorting the values"""
+        data = _mixed_records(n, seed=n)
+        result = OutlierDetector().detect_outliers(data, method, ['value', 'other', 'missing'])
+
+        for field in ('value', 'other'):
+            numbers = [(i, r[field]) for i, r in enumerate(data)
+                       if r.get(field) is not None and isinstance(r[field], (int, float))]
+            if len(numbers) < (4 if method == 'iqr' else 10):
+                assert field not in result['bounds']
+                continue
+            lower, upper = _sorted_bounds([value for _, value in numbers], method)
+            assert result['bounds'][field] == {'lower': lower, 'upper': upper}
+            assert [o['index'] for o in result['outliers'] if o['field'] == field] == \
+                [i for i, value in numbers if value < lower or value > upper]
+        assert result['total_outliers'] == len(result['outliers'])
+
+    def test_zscore(self):
+        """Same stats (to rounding) and outliers as the statistics module"""
+        data = _mixed_records(2000)
+        values = [r['value'] for r in data if r['value'] is not None and isinstance(r['value'], (int, float))]
+        mean_val, std_val = statistics.mean(values), statistics.stdev(values)
+        result = OutlierDetector().detect_outliers(data, 'zscore', ['value'], threshold=2.0)
+
+        assert result['stats']['value']['mean'] == pytest.approx(mean_val)
+        assert result['stats']['value']['std'] == pytest.approx(std_val)
+        expected = [i for i, r in enumerate(data) if r['value'] is not None and isinstance(r['value'], (int, float))
+                    and abs((r['value'] - mean_val) / std_val) > 2.0]
+        assert [o['index'] for o in result['outliers']] == expected
+        assert all(o['z_score'] > 2.0 for o in result['outliers'])
+
+
+class TestTDigest:
+    """Test cases for TDigest"""
+
+    QUANTILES = [0.001, 0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99, 0.999]
+
+    def _rank_errors(self, digest, values):
+        ordered = np.sort(values)
+        estimates = digest.quantiles(self.QUANTILES)
+        ranks = np.searchsorted(ordered, estimates) / len(ordered)
+        return np.abs(ranks - self.QUANTILES)
+
+    def test_accuracy(self):
+        """Quantile estimates within a small rank error, tighter in the tails"""
+        values = np.random.default_rng(0).lognormal(0, 1, 200_000)
+        digest = TDigest().update(values)
+
+        errors = self._rank_errors(digest, values)
+        assert errors.max() < 0.002
+        assert errors[[0, 1, -2, -1]].max() < 0.0005
+        assert len(digest.means) <= 200
+        assert digest.count == len(values)
+        assert (digest.min, digest.max) == (values.min(), values.max())
+
+    def test_merge_and_round_trip(self):
+        """Digests built on shards merge into one as accurate as a single digest"""
+        values = np.random.default_rng(1).normal(size=100_000)
+        shards = [TDigest().update(chunk) for chunk in np.array_split(values, 8)]
+        merged = TDigest()
+        for shard in reversed(shards):
+            merged.merge(TDigest.from_dict(shard.to_dict()))
+
+        assert merged.count == len(values)
+        assert self._rank_errors(merged, values).max() < 0.002
+        restored = TDigest.from_dict(merged.to_dict())
+        assert np.array_equal(restored.quantiles(self.QUANTILES), merged.quantiles(self.QUANTILES))
+
+    def test_small_and_empty(self):
+        """Exact for a handful of values, NaN when empty"""
+        digest = TDigest().update([3.0, 1.0, 2.0, float('nan')])
+        assert digest.quantiles([0.0, 0.5, 1.0]).tolist() == [1.0, 2.0, 3.0]
+        assert np.isnan(TDigest().quantile(0.5))
+
+
+class TestRunningMoments:
+    """Test cases for RunningMoments"""
+
+    def test_batches_and_merge(self):
+        """Mean and sample standard deviation match the whole array"""
+        values = np.random.default_rng(2).normal(1e6, 3.0, 50_000)
+        moments = RunningMoments()
+        for chunk in np.array_split(values, 7):
+            moments.update(chunk)
+        shards = [RunningMoments().update(chunk) for chunk in np.array_split(values, 3)]
+        merged = RunningMoments.from_dict(shards[0].to_dict()).merge(shards[1]).merge(shards[2])
+
+        for summary in (moments, merged):
+            assert summary.count == len(values)
+            assert summary.mean == pytest.approx(values.mean(), rel=1e-12)
+            assert summary.std == pytest.approx(values.std(ddof=1), rel=1e-9)
+        assert RunningMoments().update([5.0]).variance == 0.0
+
+
+class TestIsolationForest:
+    """Test cases for IsolationForest"""
+
+    def test_planted_anomalies(self):
+        """Points far from the bulk of the data score highest"""
+        rng = np.random.default_rng(3)
+        X = np.vstack([rng.normal(0, 1, (6000, 3)), [[8, 8, 8], [-8, -8, 8], [9, -9, -9]]])
+        scores = isolation_forest_scores(X)
+
+        assert scores.shape == (len(X),)
+        assert set(np.argsort(scores)[-3:].tolist()) == {6000, 6001, 6002}
+        assert scores[6000:].min() > 0.7
+        assert np.median(scores[:6000]) < 0.5
+
+    def test_deterministic_and_degenerate(self):
+        """A fixed random state gives fixed scores; identical points don't split"""
+        X = np.random.default_rng(4).normal(size=(500, 2))
+        assert np.array_equal(isolation_forest_scores(X), isolation_forest_scores(X))
+        same = IsolationForest(n_trees=10).fit(np.ones((50, 2)))
+        assert np.allclose(same.score_samples(np.ones((3, 2))), same.score_samples(np.zeros((3, 2))))
+
+    def test_detect_outliers(self):
+        """detect_outliers reports each anomalous record once, skipping incomplete ones"""
+        rng = random.Random(5)
+        data = [{'temperature': rng.gauss(15, 3), 'humidity': rng.gauss(60, 5)} for _ in range(1000)]
+        data[10] = {'temperature': 45.0, 'humidity': 5.0}
+        data[20]['humidity'] = None
+        data[30]['temperature'] = float('nan')
+
+        result = OutlierDetector().detect_outliers(data, 'isolation_forest', ['temperature', 'humidity'])
+        indices = [o['index'] for o in result['outliers']]
+
+        assert 10 in indices and 20 not in indices and 30 not in indices
+        assert indices == sorted(set(indices))
+        assert result['outliers'][indices.index(10)]['values'] == data[10]
+        assert result['total_outliers'] == len(indices) < 0.1 * len(data)
+
+
+class TestStreamingOutlierDetector:
+    """Test cases for StreamingOutlierDetector"""
+
+    def _batch(self, rng, n, spike=None):
+        records = [{'market_id': f'm-{i % 3}', 'volume': rng.gauss(100 * (i % 3 + 1), 5)} for i in range(n)]
+        if spike is not None:
+            records[spike]['volume'] = 10_000.0
+        return records
+
+    @pytest.mark.parametrize('method', ['iqr', 'zscore', 'percentile'])
+    def test_saved_runs_match_single_run(self, method, tmp_path):
+        """Bounds after saving and reloading between runs match one run over all batches"""
+        rng = random.Random(6)
+        batches = [self._batch(rng, 600) for _ in range(4)]
+
+        single = StreamingOutlierDetector(method, ['volume'], group_field='market_id')
+        single.update([record for batch in batches for record in batch])
+
+        path = tmp_path / 'state.json'
+        for batch in batches:
+            streaming = StreamingOutlierDetector.load(path) if path.exists() else \
+                StreamingOutlierDetector(method, ['volume'], group_field='market_id')
+            streaming.update(batch)
+            streaming.save(path)
+
+        for group in ('m-0', 'm-1', 'm-2'):
+            for expected, actual in zip(single.bounds(group)['volume'], streaming.bounds(group)['volume']):
+                assert actual == pytest.approx(expected, rel=1e-3)
+
+    def test_detect_per_group(self):
+        """A value ordinary for one market is flagged in another"""
+        rng = random.Random(7)
+        detector = StreamingOutlierDetector('iqr', ['volume'], group_field='market_id')
+        detector.update(self._batch(rng, 900))
+
+        batch = [{'market_id': 'm-0', 'volume': 300.0}, {'market_id': 'm-2', 'volume': 300.0},
+                 {'market_id': 'm-9', 'volume': 1e9}, {'market_id': 'm-1', 'volume': None}]
+        result = detector.detect_outliers(batch, update=False)
+
+        assert [(o['index'], o['group']) for o in result['outliers']] == [(0, 'm-0')]
+        assert result['bounds']['m-9'] == {}
+        assert 'm-9' not in detector.summaries
+
+        spiked = detector.detect_outliers(self._batch(rng, 30, spike=4))
+        assert [o['index'] for o in spiked['outliers']] == [4]
+        assert detector.summaries['m-1']['volume'].moments.count == 310
+
+    def test_merge_and_errors(self):
+        """Shards merge into the same counts; unknown methods are rejected"""
+        rng = random.Random(8)
+        shards = [StreamingOutlierDetector('zscore', ['volume']).update(self._batch(rng, 100)) for _ in range(3)]
+        merged = StreamingOutlierDetector('zscore', ['volume'])
+        for shard in shards:
+            merged.merge(StreamingOutlierDetector.from_dict(shard.to_dict()))
+
+        assert merged.summaries[None]['volume'].moments.count == 300
+        assert set(merged.bounds()) == {'volume'}
+        with pytest.raises(ValueError, match="Unknown method: isolation_forest"):
+            StreamingOutlierDetector('isolation_forest')
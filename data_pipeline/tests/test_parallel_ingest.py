@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Tests for Parallel Directory Ingestion
+
+Checks that pooled preparation writes the same records as sequential
+ingestion, that failing files are skipped, and that stage statistics are
+collected.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from ..parallel_ingest import IngestStageStats, ingest_files
+from ..ingest_weather import WeatherDataIngester
+from ..ingest_polymarket import PolymarketDataIngester
+
+CSV_HEADER = 'event_title,event_url,market_id,outcome_name,probability,volume,timestamp,scraped_at'
+
+
+def _prepare_numbers(path: str) -> dict:
+    """Module-level so worker processes can unpickle it"""
+    text = Path(path).read_text()
+    return {'file': path, 'data': [int(x) for x in text.split()], 'parse_seconds': 0.01, 'quality_seconds': 0.0}
+
+
+@pytest.fixture
+def number_files(tmp_path):
+    paths = []
+    for i in range(6):
+        path = tmp_path / f'file{i}.txt'
+        path.write_text(' '.join(str(i * 10 + j) for j in range(i + 1)))
+        paths.append(str(path))
+    return paths
+
+
+def _pipeline_db(tmp_path) -> str:
+    """Empty database with the pipeline schema"""
+    db_path = str(tmp_path / 'pipeline.db')
+    schema = (Path(__file__).parent.parent / 'schema.sql').read_text()
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(schema)
+    return db_path
+
+
+@pytest.fixture
+def weather_dir(tmp_path):
+    """Database with the pipeline schema and a directory of JSON dumps"""
+    db_path = _pipeline_db(tmp_path)
+
+    dump_dir = tmp_path / 'dumps'
+    dump_dir.mkdir()
+    for city in ('London', 'Paris', 'Berlin'):
+        records = [{'timestamp': f'2024-01-01T{hour:02d}:00:00Z', 'temperature': 10.0 + hour, 'humidity': 70}
+                   for hour in range(12)]
+        (dump_dir / f'{city}.json').write_text(json.dumps(records))
+    (dump_dir / 'broken.json').write_text('{not json')
+
+    return db_path, str(dump_dir)
+
+
+@pytest.fixture
+def polymarket_dir(tmp_path):
+    """Database with the pipeline schema and a directory of market CSV exports"""
+    db_path = _pipeline_db(tmp_path)
+
+    export_dir = tmp_path / 'exports'
+    export_dir.mkdir()
+    for market in ('rain-london', 'heat-paris', 'snow-berlin'):
+        lines = [CSV_HEADER] + [
+            f'Will it {market}?,https://polymarket.com/{market},{market},{outcome},0.{hour + 10},{1000 + hour},'
+            f'2024-01-01T{hour:02d}:00:00Z,2024-01-01T{hour:02d}:05:00Z'
+            for hour in range(6) for outcome in ('Yes', 'No')
+        ]
+        (export_dir / f'{market}.csv').write_text('\n'.join(lines) + '\n')
+    (export_dir / 'broken.csv').write_bytes(CSV_HEADER.encode() + b'\n\xff\xfe\n')
+
+    return db_path, str(export_dir)
+
+
+class TestIngestFiles:
+    """Test cases for ingest_files"""
+
+    @pytest.mark.parametrize('n_jobs', [1, 2])
+    def test_writes_every_prepared_file(self, number_files, n_jobs):
+        """Each prepared file is written exactly once, from the calling process"""
+        written = []
+
+        def write(prepared):
+            written.extend(prepared['data'])
+            return {'file': prepared['file'], 'inserted': len(prepared['data'])}
+
+        results, stats = ingest_files(number_files, _prepare_numbers, write, n_jobs=n_jobs)
+
+        assert sorted(r['file'] for r in results) == sorted(number_files)
+        assert sorted(written) == sorted(i * 10 + j for i in range(6) for j in range(i + 1))
+        assert stats.files == 6
+        assert stats.records == 21
+        assert stats.parse_seconds == pytest.approx(0.06)
+
+    @pytest.mark.parametrize('n_jobs', [1, 2])
+    def test_failed_files_are_skipped(self, number_files, n_jobs):
+        """Files that fail to prepare or write don't stop the others"""
+        paths = number_files + [number_files[0] + '.missing']
+
+        def write(prepared):
+            if prepared['file'] == number_files[1]:
+                raise ValueError("write failed")
+            return {'file': prepared['file']}
+
+        results, stats = ingest_files(paths, _prepare_numbers, write, n_jobs=n_jobs)
+
+        assert len(results) == 5
+        assert stats.failed_files == 2
+
+    def test_throughput(self):
+        stats = IngestStageStats(records=1000, parse_seconds=2.0, quality_seconds=0.0,
+                                 write_seconds=0.5, wall_seconds=4.0)
+
+        assert stats.throughput() == {'parse': 500.0, 'quality': 0.0, 'write': 2000.0, 'overall': 250.0}
+        assert stats.to_dict()['records_per_second']['overall'] == 250.0
+
+
+class TestWeatherDirectoryIngestion:
+    """Test cases for WeatherDataIngester.ingest_json_directory"""
+
+    @pytest.mark.parametrize('n_jobs', [1, 2])
+    def test_ingests_directory(self, weather_dir, n_jobs):
+        """All readable dumps are inserted, each under its file's location"""
+        db_path, dump_dir = weather_dir
+        ingester = WeatherDataIngester(db_path)
+
+        results = ingester.ingest_json_directory(dump_dir, 'openweather', n_jobs=n_jobs,
+                                                 enable_quality_pipeline=False)
+
+        assert sorted(r['location'] for r in results) == ['Berlin', 'London', 'Paris']
+        assert sum(r['inserted'] for r in results) == 36
+        assert ingester.last_directory_stats.failed_files == 1
+
+        with sqlite3.connect(db_path) as conn:
+            counts = dict(conn.execute(
+                "SELECT location_name, COUNT(*) FROM weather_data GROUP BY location_name"
+            ).fetchall())
+        assert counts == {'Berlin': 12, 'London': 12, 'Paris': 12}
+
+        # Re-ingesting finds only duplicates
+        results = ingester.ingest_json_directory(dump_dir, 'openweather', n_jobs=n_jobs,
+                                                 enable_quality_pipeline=False)
+        assert sum(r['duplicates'] for r in results) == 36
+
+
+class TestPolymarketDirectoryIngestion:
+    """Test cases for PolymarketDataIngester.ingest_directory"""
+
+    @pytest.mark.parametrize('n_jobs', [1, 2])
+    def test_ingests_directory(self, polymarket_dir, n_jobs):
+        """All readable exports are inserted once, and re-ingesting finds only duplicates"""
+        db_path, export_dir = polymarket_dir
+        ingester = PolymarketDataIngester(db_path)
+
+        results = ingester.ingest_directory(export_dir, enable_quality_pipeline=False, n_jobs=n_jobs)
+
+        assert sorted(Path(r['file']).stem for r in results) == ['heat-paris', 'rain-london', 'snow-berlin']
+        assert sum(r['inserted'] for r in results) == 36
+        assert not any(r['failed'] for r in results)
+        assert ingester.last_directory_stats.failed_files == 1
+
+        with sqlite3.connect(db_path) as conn:
+            counts = dict(conn.execute(
+                "SELECT market_id, COUNT(*) FROM polymarket_data GROUP BY market_id"
+            ).fetchall())
+        assert counts == {'heat-paris': 12, 'rain-london': 12, 'snow-berlin': 12}
+
+        results = ingester.ingest_directory(export_dir, enable_quality_pipeline=False, n_jobs=n_jobs)
+        assert sum(r['inserted'] for r in results) == 0
+        assert sum(r['duplicates'] for r in results) == 36
+
+    def test_prepare_then_write(self, polymarket_dir):
+        """prepare_csv_file leaves the database alone until write_prepared_file runs"""
+        db_path, export_dir = polymarket_dir
+        ingester = PolymarketDataIngester(db_path)
+
+        prepared = ingester.prepare_csv_file(str(Path(export_dir) / 'rain-london.csv'), enable_quality_pipeline=False)
+        assert len(prepared['data']) == 12
+
+        conn = ingester.connect_db()
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM polymarket_data").fetchone()[0] == 0
+            result = ingester.write_prepared_file(prepared, conn)
+        finally:
+            conn.close()
+
+        assert (result['total_rows'], result['inserted'], result['duplicates']) == (12, 12, 0)
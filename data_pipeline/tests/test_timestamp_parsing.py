@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Tests for Timestamp Parsing
+
+Checks TimestampParser against trying each strptime format in turn, its cache
+and epoch output, and that validation, normalization and real-time validation
+share one parser.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ..data_cleaning import DataNormalizer
+from ..data_validation import PolymarketDataValidator, WeatherDataValidator
+from ..enhanced_data_validation import AlertManager, CrossSourceConsistencyChecker, DataSource, RealTimeValidator
+from ..timestamp_parsing import NORMALIZER_FORMATS, TIMESTAMP_FORMATS, TimestampParser, shared_parser
+
+VALUES = [
+    '2024-01-02T03:04:05Z', '2024-01-02T03:04:05z', '2024-01-02t03:04:05Z', '2024-01-02T03:04:05+00:00',
+    '2024-01-02T03:04:05+0530', '2024-01-02T03:04:05-05:30', '2024-01-02T03:04:05+05:75',
+    '2024-01-02T03:04:05+24:00', '2024-01-02T03:04:05+05', '2024-01-02T03:04:05.123Z',
+    '2024-01-02 03:04:05', '2024-01-02 03:04:05Z', '2024-01-02T03:04:05', '2024-01-02T24:00:00',
+    '2024-02-30T00:00:00Z', '2024-01-02', '2024-1-2', '2024-01-02Z', '2024/01/02 03:04:05', '2024/01/02',
+    '2024/1/2', '24-01-02', '20240102', '2024-01-02T03:04', ' 2024-01-02', '2024-01-02 ', 'bad', ''
+]
+
+
+def _strptime_in_turn(value, formats):
+    for fmt in formats:
+        try:
+            dt = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
+    return None
+
+
+class TestTimestampParser:
+    """Test cases for TimestampParser"""
+
+    @pytest.mark.parametrize('formats', [TIMESTAMP_FORMATS, NORMALIZER_FORMATS, ['%Y-%m-%dT%H:%M:%S%z'],
+                                         ['%Y/%m/%d', '%Y-%m-%d %H:%M:%S']])
+    def test_matches_strptime(self, formats):
+        """Same datetime and ISO form as strptime over the formats in order, in any parse order"""
+        for values in (VALUES, VALUES[::-1]):
+            parser = TimestampParser(formats)
+            for value in values:
+                expected = _strptime_in_turn(value, formats)
+                actual = parser.parse(value)
+                assert actual == expected, value
+                if expected is not None:
+                    assert actual.utcoffset() == expected.utcoffset(), value
+                    assert parser.isoformat(value) == expected.isoformat()
+                    assert parser.epoch(value) == int(expected.timestamp())
+                else:
+                    assert parser.isoformat(value) is None and parser.epoch(value) is None
+
+    def test_naive_is_utc_and_offsets_kept(self):
+        parser = TimestampParser(NORMALIZER_FORMATS)
+        assert parser.isoformat('2024-01-02 03:04:05') == '2024-01-02T03:04:05+00:00'
+        assert parser.isoformat('2024-01-02T03:04:05-0530') == '2024-01-02T03:04:05-05:30'
+        assert parser.epoch('1970-01-02') == 86400
+        assert parser.epoch_column(['1970-01-01T00:01:00Z', 'x']) == [60, None]
+
+    def test_non_strings_raise(self):
+        parser = TimestampParser()
+        for method in (parser.parse, parser.isoformat, parser.epoch):
+            with pytest.raises(TypeError):
+                method(1704164645)
+
+    def test_bounded_cache(self):
+        """Repeated strings are served from the cache, which holds at most cache_size values"""
+        parser = TimestampParser(cache_size=2)
+        for value in ['2024-01-01', '2024-01-01', '2024-01-02', '2024-01-03', '2024-01-03']:
+            parser.parse(value)
+        info = parser.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (2, 3, 2)
+        parser.cache_clear()
+        assert parser.cache_info().currsize == 0
+
+    def test_iso_fallback(self):
+        """Fractional seconds and HH:MM times parse only with iso_fallback"""
+        strict, lenient = TimestampParser(), TimestampParser(iso_fallback=True)
+        for value, expected in [('2024-05-01T12:00:00.123456+00:00', 1714564800),
+                                ('2024-05-01T12:00:00.123Z', 1714564800),
+                                ('2024-05-01T12:00+00:00', 1714564800),
+                                ('2024-05-01T12:00:00.5', 1714564800)]:
+            assert strict.epoch(value) is None, value
+            assert lenient.epoch(value) == expected, value
+        assert lenient.parse('bad') is None
+        assert shared_parser(iso_fallback=True) is not shared_parser()
+
+    def test_column_format_is_tried_first(self):
+        """After a slash-separated value, the next is parsed with that format first"""
+        parser = TimestampParser(NORMALIZER_FORMATS)
+        assert parser.parse_column(['2024/01/02', '2024/01/03']) == [
+            datetime(2024, 1, 2, tzinfo=timezone.utc), datetime(2024, 1, 3, tzinfo=timezone.utc)]
+        assert parser._last_format == '%Y/%m/%d'
+        assert parser.parse('2024-01-04T00:00:00') == datetime(2024, 1, 4, tzinfo=timezone.utc)
+
+
+class TestSharedParsing:
+    """Test cases for the stages using the shared parser"""
+
+    def test_stages_share_parsers(self):
+        assert shared_parser() is shared_parser(TIMESTAMP_FORMATS)
+        assert PolymarketDataValidator().timestamp_parser is WeatherDataValidator().timestamp_parser
+        assert DataNormalizer().timestamp_parser is shared_parser(NORMALIZER_FORMATS)
+
+    def test_validator(self):
+        """Format errors are unchanged; naive future scraped_at warns instead of raising"""
+        validator = PolymarketDataValidator()
+        record = {'event_title': 'Rain', 'market_id': 'm-1', 'outcome_name': 'Yes', 'probability': 0.5,
+                  'volume': 10.0, 'timestamp': '2024-01-01T00:00:00Z', 'scraped_at': '2099-01-01 00:00:00'}
+        assert validator.validate_record(record)
+        assert validator.validation_warnings == [
+            "Field 'scraped_at': Scraped timestamp is in the future (value: 2099-01-01 00:00:00)"]
+
+        validator.reset_errors()
+        assert not validator.validate_record(dict(record, timestamp='2024-01-01T00:00:00.5Z'))
+        assert validator.validation_errors == ["Field 'timestamp': Invalid timestamp format: 2024-01-01T00:00:00.5Z"]
+
+    def test_normalizer(self):
+        records = DataNormalizer().normalize_timestamps([
+            {'timestamp': '2024/01/02', 'scraped_at': '2024-01-02T03:04:05+0200', 'created_at': 'bad'}])
+        assert records == [{'timestamp': '2024-01-02T00:00:00+00:00', 'scraped_at': '2024-01-02T03:04:05+02:00',
+                            'created_at': 'bad'}]
+
+    def test_realtime_validator_stores_epochs(self):
+        """Stream timestamps reach the consistency checker as epoch seconds"""
+        recent = (datetime.now(timezone.utc) - timedelta(minutes=1)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        items = [{'location_name': 'London', 'latitude': 51.5, 'longitude': -0.1, 'timestamp': recent,
+                  'temperature': 15.0, 'humidity': 60.0},
+                 {'location_name': 'London', 'latitude': 51.5, 'longitude': -0.1, 'timestamp': 'bad',
+                  'temperature': 16.0, 'humidity': 61.0}]
+
+        async def stream():
+            for item in items:
+                yield item
+
+        async def collect(validator):
+            return [item async for item in validator.validate_stream(stream(), DataSource.WEATHER,
+                                                                      WeatherDataValidator())]
+
+        validator = RealTimeValidator(AlertManager())
+        before = time.time()
+        validated = asyncio.run(collect(validator))
+
+        assert [item['_validation']['is_valid'] for item in validated] == [True, False]
+        cached = [item['timestamp'] for item in validator.consistency_checker.source_data_cache['weather']]
+        assert cached[0] == int(datetime.strptime(recent, '%Y-%m-%dT%H:%M:%SZ')
+                                .replace(tzinfo=timezone.utc).timestamp())
+        assert cached[1] >= before  # Unparseable: the time it was seen
+
+    def test_realtime_validator_reads_fractional_seconds(self):
+        """An old microsecond timestamp keeps its time rather than falling back to now"""
+        item = {'location_name': 'London', 'latitude': 51.5, 'longitude': -0.1,
+                'timestamp': '2024-05-01T12:00:00.123456+00:00', 'temperature': 15.0, 'humidity': 60.0}
+
+        async def stream():
+            yield item
+
+        async def collect(validator):
+            return [item async for item in validator.validate_stream(stream(), DataSource.WEATHER,
+                                                                      WeatherDataValidator())]
+
+        validator = RealTimeValidator(AlertManager())
+        asyncio.run(collect(validator))
+
+        cached = validator.consistency_checker.source_data_cache['weather']
+        assert [entry['timestamp'] for entry in cached] == [1714564800]
+        assert not WeatherDataValidator().validate_timestamp_format(item['timestamp'], 'timestamp')
+
+    def test_consistency_checker_accepts_datetimes(self):
+        checker = CrossSourceConsistencyChecker()
+        now = datetime.now(timezone.utc)
+        checker.add_source_data('a', {'market_id': 'm-1', 'probability': 0.50}, now)
+        checker.add_source_data('b', {'market_id': 'm-1', 'probability': 0.70}, time.time())
+        checker.add_source_data('c', {'market_id': 'm-1', 'probability': 0.10}, now - timedelta(hours=1))
+
+        checks = checker.check_market_consistency(['a', 'b', 'c'], 'm-1')
+        assert [(check.actual_values, check.is_consistent) for check in checks] == [
+            ({'a': 0.50, 'b': 0.70}, False)]
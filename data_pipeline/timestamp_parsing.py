@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Timestamp Parsing Module
+
+This module provides the timestamp parser shared by validation, cleaning and
+real-time validation, so a timestamp string is parsed once however many stages
+look at it. Common ISO 8601 shapes are read with one regular expression match
+instead of trying strptime formats in turn, other strings try the format that
+last matched before the rest, and results are kept in a bounded cache so
+repeated values (every record of a scrape shares its scraped_at) are parsed
+once per process.
+"""
+
+import re
+import threading
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Formats DataValidator accepts, in the order they are tried
+TIMESTAMP_FORMATS = [
+    '%Y-%m-%dT%H:%M:%SZ',  # ISO 8601 UTC
+    '%Y-%m-%dT%H:%M:%S%z', # ISO 8601 with timezone
+    '%Y-%m-%d %H:%M:%S',   # Standard format
+    '%Y-%m-%dT%H:%M:%S',   # ISO without timezone
+    '%Y-%m-%d',            # Date only
+]
+
+# DataNormalizer also reads slash-separated dates
+NORMALIZER_FORMATS = TIMESTAMP_FORMATS + [
+    '%Y/%m/%d %H:%M:%S',
+    '%Y/%m/%d'
+]
+
+# Two-digit ISO 8601 fields with a 'T' or space separator and an optional UTC offset
+ISO_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}(?:([T ])\d{2}:\d{2}:\d{2}(Z|[+-]\d{2}:?[0-5]\d)?)?')
+
+UTC_FORMATS = ('%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%dT%H:%M:%S%z')
+
+
+class TimestampParser:
+    """Parses timestamp strings that match one of a list of strptime formats.
+
+    parse gives the same datetime as trying each format with strptime in order,
+    with naive results taken as UTC, provided no two formats read the same
+    string differently (true of TIMESTAMP_FORMATS and NORMALIZER_FORMATS).
+    Strings in a shape ISO_PATTERN covers (and whose format is in the list) are
+    built from the match directly; the others try the last format that matched
+    first, since a batch or column rarely mixes formats. Parsed values are
+    cached up to cache_size distinct strings.
+
+    With iso_fallback, strings no format matches are also read with
+    datetime.fromisoformat ('Z' taken as UTC), which accepts fractional seconds
+    and HH:MM times, for callers that read any ISO 8601 timestamp rather than
+    check a format.
+    """
+
+    def __init__(self, formats: List[str] = None, cache_size: int = 65536, iso_fallback: bool = False):
+        self.formats = list(formats or TIMESTAMP_FORMATS)
+        self.iso_fallback = iso_fallback
+        self._last_format = self.formats[0] if self.formats else None
+
+        # ISO shapes (separator, offset kind) this parser may read without strptime
+        self._iso_shapes = {shape for shape, accepted in {
+            (None, None): '%Y-%m-%d' in self.formats,
+            ('T', None): '%Y-%m-%dT%H:%M:%S' in self.formats,
+            (' ', None): '%Y-%m-%d %H:%M:%S' in self.formats,
+            ('T', 'Z'): any(fmt in self.formats for fmt in UTC_FORMATS),
+            ('T', '+'): '%Y-%m-%dT%H:%M:%S%z' in self.formats
+        }.items() if accepted}
+
+        self._parse_cached = lru_cache(maxsize=cache_size)(self._parse)
+        self._isoformat_cached = lru_cache(maxsize=cache_size)(self._isoformat)
+        self._epoch_cached = lru_cache(maxsize=cache_size)(self._epoch)
+
+    def parse(self, value: str) -> Optional[datetime]:
+        """Timezone-aware datetime for a timestamp string, or None if no format matches.
+
+        Raises TypeError for non-strings, as strptime does.
+        """
+        if not isinstance(value, str):
+            raise TypeError(f"timestamp must be str, not {type(value).__name__}")
+        return self._parse_cached(value)
+
+    def isoformat(self, value: str) -> Optional[str]:
+        """ISO 8601 form of a timestamp string (offset kept), or None."""
+        if not isinstance(value, str):
+            raise TypeError(f"timestamp must be str, not {type(value).__name__}")
+        return self._isoformat_cached(value)
+
+    def epoch(self, value: str) -> Optional[int]:
+        """Whole seconds since the Unix epoch for a timestamp string, or None."""
+        if not isinstance(value, str):
+            raise TypeError(f"timestamp must be str, not {type(value).__name__}")
+        return self._epoch_cached(value)
+
+    def parse_column(self, values: Iterable[str]) -> List[Optional[datetime]]:
+        """parse for each value of a column; the column's format is found on its first values."""
+        return [self.parse(value) for value in values]
+
+    def epoch_column(self, values: Iterable[str]) -> List[Optional[int]]:
+        return [self.epoch(value) for value in values]
+
+    def cache_info(self):
+        return self._parse_cached.cache_info()
+
+    def cache_clear(self):
+        self._parse_cached.cache_clear()
+        self._isoformat_cached.cache_clear()
+        self._epoch_cached.cache_clear()
+
+    def _isoformat(self, value: str) -> Optional[str]:
+        dt = self._parse_cached(value)
+        return dt.isoformat() if dt else None
+
+    def _epoch(self, value: str) -> Optional[int]:
+        dt = self._parse_cached(value)
+        return int(dt.timestamp()) if dt else None
+
+    def _parse(self, value: str) -> Optional[datetime]:
+        match = ISO_PATTERN.fullmatch(value)
+        if match is not None:
+            dt = self._from_iso(value, *match.groups())
+            if dt is not None:
+                return dt
+        dt = self._parse_with_formats(value)
+        if dt is None and self.iso_fallback:
+            dt = self._parse_any_iso(value)
+        return dt
+
+    @staticmethod
+    def _parse_any_iso(value: str) -> Optional[datetime]:
+        try:
+            dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
+
+    def _from_iso(self, value: str, separator: Optional[str], offset: Optional[str]) -> Optional[datetime]:
+        if (separator, offset if offset in (None, 'Z') else '+') not in self._iso_shapes:
+            return None
+        # fromisoformat reads 'Z' and '+HHMM' only from Python 3.11, so they are rewritten
+        # as '+HH:MM'; building the UTC offset into the string beats datetime.replace
+        if offset is None:
+            value += '+00:00' if separator else 'T00:00:00+00:00'
+        elif offset == 'Z':
+            value = value[:-1] + '+00:00'
+        elif len(offset) == 5:
+            value = f'{value[:-2]}:{value[-2:]}'
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None  # Out of range fields fail every format too, but let strptime decide
+
+    def _parse_with_formats(self, value: str) -> Optional[datetime]:
+        last_format = self._last_format
+        for fmt in [last_format] + [fmt for fmt in self.formats if fmt != last_format]:
+            try:
+                dt = datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+            self._last_format = fmt
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            return dt
+        return None
+
+
+_parsers: Dict[Tuple[Tuple[str, ...], bool], TimestampParser] = {}
+_parsers_lock = threading.Lock()
+
+
+def shared_parser(formats: List[str] = None, iso_fallback: bool = False) -> TimestampParser:
+    """The process-wide parser for a list of formats, so stages share its cache."""
+    key = (tuple(formats or TIMESTAMP_FORMATS), iso_fallback)
+    with _parsers_lock:
+        parser = _parsers.get(key)
+        if parser is None:
+            parser = _parsers[key] = TimestampParser(list(key[0]), iso_fallback=iso_fallback)
+        return parser
@@ -192,7 +192,8 @@ class BufferedHandler(logging.Handler):
 
         self.buffer: List[logging.LogRecord] = []
         self.last_flush = time.time()
-        self.lock = threading.Lock()
+        # Separate from Handler.lock, which logging already holds around emit and close
+        self.buffer_lock = threading.Lock()
 
         # Start flush timer
         self.timer = threading.Timer(self.flush_interval, self._periodic_flush)
@@ -206,26 +207,29 @@ class BufferedHandler(logging.Handler):
         Args:
             record: Log record to buffer
         """
-        with self.lock:
+        with self.buffer_lock:
             self.buffer.append(record)
+            full = len(self.buffer) >= self.buffer_size
 
-            # Flush if buffer is full
-            if len(self.buffer) >= self.buffer_size:
-                self._flush_buffer()
+        # Flush if buffer is full
+        if full:
+            self._flush_buffer()
 
     def _flush_buffer(self):
         """Flush all buffered records to the target handler."""
-        with self.lock:
-            if self.buffer:
-                for record in self.buffer:
-                    try:
-                        self.target_handler.emit(record)
-                    except Exception:
-                        # Continue processing other records even if one fails
-                        pass
-                self.buffer.clear()
+        # Take the records under the lock but emit them outside it, so a
+        # target handler that logs (or a full buffer in emit) cannot deadlock
+        with self.buffer_lock:
+            records, self.buffer = self.buffer, []
             self.last_flush = time.time()
 
+        for record in records:
+            try:
+                self.target_handler.emit(record)
+            except Exception:
+                # Continue processing other records even if one fails
+                pass
+
     def _periodic_flush(self):
         """Periodically flush the buffer."""
         self._flush_buffer()
@@ -265,8 +269,8 @@ class AsyncHandler(logging.Handler):
         self.queue_size = queue_size
 
         self.queue = []
-        self.lock = threading.Lock()
-        self.condition = threading.Condition(self.lock)
+        # Separate from Handler.lock, which logging already holds around emit
+        self.condition = threading.Condition(threading.Lock())
 
         # Start worker thread
         self.worker_thread = threading.Thread(target=self._worker, daemon=True)